@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark du dessin du fond (GameBackground.draw)
+Compare le fond complet avec l'ancienne grille (surface plein écran recréée
+et redessinée à chaque frame) et avec la couche de grille pré-rendue, et
+vérifie que les deux rendus sont identiques au pixel près.
+
+    python benchmarks/background_draw.py [--frames 300]
+"""
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+
+from src.core.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from src.world.background import GameBackground
+
+FRAME_BUDGET_MS = 1000 / 60
+
+def legacy_grid_draw(grid, surface, camera_x, camera_y):
+    """Ancien GridBackground.draw : surface plein écran allouée et remplie à chaque frame"""
+    grid_surface = pygame.Surface((grid.screen_width, grid.screen_height))
+    grid_surface.set_alpha(grid.alpha)
+    grid_surface.fill((0, 0, 0))
+    offset_x = int(camera_x) % grid.grid_size
+    offset_y = int(camera_y) % grid.grid_size
+    for x in range(-offset_x, grid.screen_width + grid.grid_size, grid.grid_size):
+        pygame.draw.line(grid_surface, grid.color, (x, 0), (x, grid.screen_height), 1)
+    for y in range(-offset_y, grid.screen_height + grid.grid_size, grid.grid_size):
+        pygame.draw.line(grid_surface, grid.color, (0, y), (grid.screen_width, y), 1)
+    surface.blit(grid_surface, (0, 0))
+
+def camera_path(frames):
+    """Trajectoire de caméra déterministe (offsets variés, négatifs compris)"""
+    return [(-350 + i * 7.3, 120 - i * 3.1) for i in range(frames)]
+
+def build_background(legacy):
+    """Fond avec étoiles reproductibles, grille ancienne ou pré-rendue"""
+    random.seed(7)
+    background = GameBackground(SCREEN_WIDTH, SCREEN_HEIGHT)
+    if legacy:
+        grid = background.grid
+        grid.draw = lambda surface, camera_x, camera_y: legacy_grid_draw(grid, surface, camera_x, camera_y)
+    return background
+
+def run_case(legacy, cameras):
+    """Temps moyen (ms) de GameBackground.draw et rendu de la dernière frame"""
+    background = build_background(legacy)
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    start = time.perf_counter()
+    for camera_x, camera_y in cameras:
+        background.draw(screen, camera_x, camera_y)
+    return (time.perf_counter() - start) / len(cameras) * 1000, screen
+
+def same_pixels(cameras):
+    """Les deux grilles donnent-elles la même image pour chaque position de caméra ?"""
+    legacy, cached = build_background(True), build_background(False)
+    legacy_screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    cached_screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    for camera_x, camera_y in cameras:
+        legacy.draw(legacy_screen, camera_x, camera_y)
+        cached.draw(cached_screen, camera_x, camera_y)
+        if pygame.image.tostring(legacy_screen, "RGB") != pygame.image.tostring(cached_screen, "RGB"):
+            return False
+    return True
+
+def main():
+    parser = argparse.ArgumentParser(description="Dessin du fond de jeu")
+    parser.add_argument("--frames", type=int, default=300, help="frames mesurées par cas")
+    args = parser.parse_args()
+
+    pygame.init()
+    cameras = camera_path(args.frames)
+    print(f"{'fond':<16} | {'draw ms':>8} | budget 60 FPS: {FRAME_BUDGET_MS:.1f} ms")
+    print("-" * 44)
+    results = {}
+    for name, legacy in (("grille ancienne", True), ("grille en cache", False)):
+        results[name], _ = run_case(legacy, cameras)
+        print(f"{name:<16} | {results[name]:>8.3f}")
+    print(f"\nGameBackground.draw : {results['grille ancienne'] / results['grille en cache']:.2f}x")
+    print(f"Rendu identique : {same_pixels(cameras[:60])}")
+
+if __name__ == "__main__":
+    main()
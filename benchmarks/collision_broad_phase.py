@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark de la phase large des collisions
+Compare le nombre de paires testées (et le temps) entre le parcours complet
+projectiles x ennemis et la grille de hachage spatial du CollisionSystem
+"""
+import os
+import sys
+import time
+import random
+import contextlib
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.constants import WORLD_WIDTH, WORLD_HEIGHT
+from src.systems.entity_manager import EntityManager
+from src.systems.collision_system import CollisionSystem
+
+class BenchEnemy:
+    def __init__(self, x, y):
+        self.x, self.y = x, y
+        self.width, self.height = 24, 24
+        self.health = 10 ** 9  # Ne meurt jamais pour garder des passes comparables
+        self.damage = 10
+
+    def take_damage(self, damage):
+        self.health -= damage
+
+class BenchProjectile:
+    def __init__(self, x, y):
+        self.x, self.y = x, y
+        self.radius = 3
+        self.damage = 1
+
+class BenchPlayer:
+    def __init__(self, x, y):
+        self.x, self.y = x, y
+        self.width, self.height = 32, 32
+        self.health = 10 ** 9
+
+def build_scene(projectile_count, enemy_count, seed=40000):
+    """Construit un EntityManager peuplé de façon déterministe"""
+    rng = random.Random(seed)
+    with contextlib.redirect_stdout(open(os.devnull, "w")):
+        entity_manager = EntityManager()
+        entity_manager.add_player(BenchPlayer(WORLD_WIDTH // 2, WORLD_HEIGHT // 2))
+    for _ in range(enemy_count):
+        entity_manager.add_enemy(BenchEnemy(rng.uniform(0, WORLD_WIDTH), rng.uniform(0, WORLD_HEIGHT)))
+    for _ in range(projectile_count):
+        entity_manager.add_projectile(BenchProjectile(rng.uniform(0, WORLD_WIDTH), rng.uniform(0, WORLD_HEIGHT)))
+    return entity_manager
+
+def run_case(projectile_count, enemy_count, use_spatial_hash, cell_size=None, ticks=5):
+    """Exécute quelques ticks de collisions et retourne (paires testées par tick, ms par tick)"""
+    entity_manager = build_scene(projectile_count, enemy_count)
+    kwargs = {"use_spatial_hash": use_spatial_hash}
+    if cell_size:
+        kwargs["cell_size"] = cell_size
+    collision_system = CollisionSystem(**kwargs)
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(open(os.devnull, "w")):
+        for _ in range(ticks):
+            collision_system.update(entity_manager)
+            entity_manager.end_of_frame_compact()
+    elapsed = time.perf_counter() - start
+
+    pair_tests = collision_system.get_collision_statistics()["pair_tests"]
+    return pair_tests / ticks, elapsed * 1000 / ticks
+
+def main():
+    cases = [(100, 50), (500, 200), (1000, 400), (2000, 800)]
+    print(f"{'P':>6} {'E':>6} | {'P*E':>9} | {'brute paires':>12} {'ms':>8} | {'grille paires':>13} {'ms':>8}")
+    print("-" * 74)
+    for projectile_count, enemy_count in cases:
+        brute_pairs, brute_ms = run_case(projectile_count, enemy_count, use_spatial_hash=False)
+        grid_pairs, grid_ms = run_case(projectile_count, enemy_count, use_spatial_hash=True)
+        print(f"{projectile_count:>6} {enemy_count:>6} | {projectile_count * enemy_count:>9} | "
+              f"{brute_pairs:>12.0f} {brute_ms:>8.2f} | {grid_pairs:>13.0f} {grid_ms:>8.2f}")
+
+    print("\nInfluence de la taille de cellule (P=2000, E=800):")
+    for cell_size in (32, 64, 128, 256):
+        grid_pairs, grid_ms = run_case(2000, 800, use_spatial_hash=True, cell_size=cell_size)
+        print(f"  cellule {cell_size:>4}px: {grid_pairs:>8.0f} paires, {grid_ms:>7.2f} ms/tick")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark des sprites translucides des effets
+Joue les particules d'environnement, les effets de moralité (particules et
+auras) et des zones d'alerte, puis mesure le temps de dessin et les Surfaces
+allouées par image, avec le cache de sprites et sans (capacité 0 : une
+Surface par élément et par image, comme avant le cache). Les particules
+passent dans les deux cas par ParticleSystem, qui garde ses propres sprites.
+
+    python benchmarks/effect_sprites.py [--frames 300] [--zones 10]
+"""
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+
+from src.core.constants import SCREEN_WIDTH, SCREEN_HEIGHT, WORLD_WIDTH, WORLD_HEIGHT
+from src.gameplay.camera import Camera
+from src.gameplay.morality_effects import MoralityEffects
+from src.world.environment_effects import EnvironmentEffects
+from src.world.warning_zone import WarningZone
+from src.utils.profiler import profiler
+from src.utils.sprite_cache import sprite_cache, SPRITE_CACHE_MAX_ENTRIES
+
+FRAME_BUDGET_MS = 1000 / 60
+
+class BenchPlayer:
+    def __init__(self, x, y):
+        self.x, self.y = x, y
+        self.width, self.height = 32, 32
+        self.rect = pygame.Rect(x, y, 32, 32)
+
+class BenchMorality:
+    faith = 70
+    corruption = 80
+
+def run_case(max_entries, frames, zone_count):
+    """Temps de dessin moyen (ms) et Surfaces allouées par image"""
+    random.seed(3)
+    sprite_cache.clear()
+    sprite_cache.stats.update(hits=0, misses=0, evictions=0)
+    sprite_cache.max_entries = max_entries
+    profiler.reset()
+    profiler.enable()
+
+    camera = Camera(SCREEN_WIDTH, SCREEN_HEIGHT, WORLD_WIDTH, WORLD_HEIGHT)
+    player = BenchPlayer(WORLD_WIDTH // 2, WORLD_HEIGHT // 2)
+    camera.x, camera.y = player.x - SCREEN_WIDTH // 2, player.y - SCREEN_HEIGHT // 2
+    environment = EnvironmentEffects()
+    morality = MoralityEffects()
+    zones = [WarningZone(player.x + random.randint(-400, 400), player.y + random.randint(-300, 300),
+                         random.choice((40, 60, 80)), 60, 10 ** 6) for _ in range(zone_count)]
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    draw_time = 0.0
+    for _ in range(frames):
+        environment.update("chaos_temple")
+        # Particules d'environnement autour de la caméra pour qu'elles soient visibles
+        for emitter in environment.particles.emitters.values():
+            emitter.x[:emitter.count] = camera.x + emitter.x[:emitter.count] % SCREEN_WIDTH
+            emitter.y[:emitter.count] = camera.y + emitter.y[:emitter.count] % SCREEN_HEIGHT
+        morality.update_visual_effects(player, BenchMorality)
+        for zone in zones:
+            zone.update()
+
+        start = time.perf_counter()
+        environment.draw(screen, camera)
+        morality.draw_morality_effects(screen, camera, player, BenchMorality)
+        for zone in zones:
+            zone.draw(screen, camera)
+        draw_time += time.perf_counter() - start
+        profiler.end_frame()
+
+    allocated = profiler.get_counter_statistics().get("surfaces.allocated", {"per_frame": 0.0})
+    profiler.enable(False)
+    return draw_time / frames * 1000, allocated["per_frame"], sprite_cache.get_statistics()
+
+def main():
+    parser = argparse.ArgumentParser(description="Sprites translucides des effets")
+    parser.add_argument("--frames", type=int, default=300, help="images mesurées par cas")
+    parser.add_argument("--zones", type=int, default=10, help="zones d'alerte affichées")
+    args = parser.parse_args()
+
+    pygame.init()
+    print(f"{'cas':<10} | {'draw ms':>8} | {'Surfaces/img':>12} | {'réutilisation':>13} | "
+          f"budget 60 FPS: {FRAME_BUDGET_MS:.1f} ms")
+    print("-" * 56)
+    results = {}
+    for name, max_entries in (("sans cache", 0), ("cache", SPRITE_CACHE_MAX_ENTRIES)):
+        draw_ms, allocated, stats = run_case(max_entries, args.frames, args.zones)
+        results[name] = draw_ms
+        print(f"{name:<10} | {draw_ms:>8.3f} | {allocated:>12.1f} | {stats['hit_ratio']:>12.0%}")
+    print(f"\nDessin des effets : {results['sans cache'] / results['cache']:.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Benchmark du dispatch update/draw des entités
+Compare le temps d'une frame (update + draw de N entités) entre l'ancienne
+boucle (signatures devinées par try/except TypeError, position écran posée
+sur l'entité le temps du dessin) et la table de dispatch résolue au spawn.
+
+    python benchmarks/entity_dispatch.py [--count 500] [--frames 60]
+"""
+import os
+import sys
+import random
+import argparse
+import contextlib
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import time
+import pygame
+
+from scenarios import load_enemies
+from src.core.constants import SCREEN_WIDTH, SCREEN_HEIGHT, WORLD_WIDTH, WORLD_HEIGHT
+from src.entities.player import Player
+from src.entities.bullet import Bullet
+from src.entities.weapon_projectile import WeaponProjectile
+from src.systems.entity_manager import EntityManager
+from src.systems.entity_dispatch import draw_entity
+from src.gameplay.pathfinding import NeighborGrid
+
+FRAME_BUDGET_MS = 1000 / 60
+
+WEAPON_DATA = {
+    "name": "Bolter",
+    "stats": {"damage": 1, "projectile_speed": 2},
+    "projectile": {"size": 3, "color": [255, 255, 0], "lifetime": 10 ** 6},
+    "effects": ["piercing"]  # Hors du pool NumPy : objets WeaponProjectile
+}
+
+EFFECTS_DATA = {"special_effects": {"piercing": {"parameters": {"max_pierce": 10 ** 6}}}}
+
+def build_scene(count, seed=5):
+    """Moitié ennemis (trois types de vague), moitié projectiles objets, autour du joueur"""
+    enemies = load_enemies()
+    rng = random.Random(seed)
+    entity_manager = EntityManager()
+    player = Player(WORLD_WIDTH // 2, WORLD_HEIGHT // 2)
+    entity_manager.add_player(player)
+    enemy_types = (enemies.BasicEnemy, enemies.FastEnemy, enemies.ShooterEnemy)
+    for i in range(count // 2):
+        entity_manager.add_enemy(enemy_types[i % 3](player.x + rng.uniform(-500, 500),
+                                                    player.y + rng.uniform(-350, 350)))
+    for i in range(count - count // 2):
+        x, y = player.x + rng.uniform(-500, 500), player.y + rng.uniform(-350, 350)
+        if i % 2:
+            projectile = Bullet(x, y, rng.uniform(-1, 1), rng.uniform(-1, 1), is_player_bullet=False)
+        else:
+            projectile = WeaponProjectile(x, y, rng.uniform(-1, 1), rng.uniform(-1, 1), WEAPON_DATA, EFFECTS_DATA)
+        entity_manager.add_projectile(projectile)
+    return entity_manager, player
+
+def legacy_update(entity_manager, player, walls, neighbors):
+    """Ancienne boucle de GameScene : signatures devinées à chaque appel"""
+    for enemy in entity_manager.get_enemies():
+        if not hasattr(enemy, 'update'):
+            continue
+        try:
+            enemy.update(player, walls, neighbors)
+        except TypeError:
+            try:
+                enemy.update(player, walls)
+            except TypeError:
+                enemy.update()
+    for projectile in entity_manager.get_projectiles():
+        if not hasattr(projectile, 'update'):
+            continue
+        try:
+            enemies = entity_manager.get_enemies()
+            projectile.update(walls, WORLD_WIDTH, WORLD_HEIGHT, enemies)
+        except TypeError:
+            projectile.update(walls)
+
+def legacy_draw(entity_manager, screen, camera):
+    """Ancien dessin : position écran posée sur l'entité si draw() ne la prend pas"""
+    for entity in entity_manager.get_enemies() + entity_manager.get_projectiles():
+        screen_x, screen_y = entity.x - camera[0], entity.y - camera[1]
+        if not hasattr(entity, 'draw'):
+            continue
+        try:
+            entity.draw(screen, screen_x, screen_y)
+        except TypeError:
+            original_x, original_y = entity.x, entity.y
+            entity.x, entity.y = screen_x, screen_y
+            try:
+                entity.draw(screen)
+            finally:
+                entity.x, entity.y = original_x, original_y
+
+def dispatch_update(entity_manager, player, walls, neighbors):
+    """Boucle actuelle : formes d'appel résolues au spawn"""
+    dispatch = entity_manager.dispatch
+    enemy_calls = dispatch.tables["enemy"]
+    update_args = (player, walls, neighbors)
+    for enemy in entity_manager.get_enemies():
+        enemy.update(*update_args[:enemy_calls[enemy.__class__].update_arity])
+    projectile_calls = dispatch.tables["projectile"]
+    update_args = (walls, WORLD_WIDTH, WORLD_HEIGHT, entity_manager.get_enemies())
+    for projectile in entity_manager.get_projectiles():
+        projectile.update(*update_args[:projectile_calls[projectile.__class__].update_arity])
+
+def dispatch_draw(entity_manager, screen, camera):
+    """Dessin actuel : forme de draw() résolue au spawn, aucune position modifiée"""
+    enemy_calls = entity_manager.dispatch.tables["enemy"]
+    projectile_calls = entity_manager.dispatch.tables["projectile"]
+    for entity in entity_manager.get_enemies():
+        draw_entity(entity, enemy_calls[entity.__class__], screen,
+                    entity.x - camera[0], entity.y - camera[1], (255, 0, 0), 8)
+    for entity in entity_manager.get_projectiles():
+        draw_entity(entity, projectile_calls[entity.__class__], screen,
+                    entity.x - camera[0], entity.y - camera[1], (255, 255, 0), 3)
+
+def run_case(update, draw, count, frames):
+    """Temps moyens (ms) de la partie update et de la partie draw d'une frame"""
+    with contextlib.redirect_stdout(open(os.devnull, "w")):
+        entity_manager, player = build_scene(count)
+        walls = entity_manager.get_wall_index()
+        walls.get_flow_field().set_target(player.x, player.y)
+        neighbors = NeighborGrid()
+        screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        camera = (player.x - SCREEN_WIDTH // 2, player.y - SCREEN_HEIGHT // 2)
+        update_time = draw_time = 0.0
+        for _ in range(frames):
+            neighbors.rebuild(entity_manager.get_enemies())
+            start = time.perf_counter()
+            update(entity_manager, player, walls, neighbors)
+            middle = time.perf_counter()
+            draw(entity_manager, screen, camera)
+            draw_time += time.perf_counter() - middle
+            update_time += middle - start
+    return update_time / frames * 1000, draw_time / frames * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description="Dispatch update/draw des entités")
+    parser.add_argument("--count", type=int, default=500, help="entités (moitié ennemis, moitié projectiles)")
+    parser.add_argument("--frames", type=int, default=60, help="frames mesurées par cas")
+    args = parser.parse_args()
+
+    pygame.init()
+    print(f"{'boucle':<16} | {'update ms':>9} | {'draw ms':>8} | {'frame ms':>8} | budget 60 FPS: {FRAME_BUDGET_MS:.1f} ms")
+    print("-" * 52)
+    results = {}
+    for name, update, draw in (("ancienne", legacy_update, legacy_draw),
+                               ("dispatch", dispatch_update, dispatch_draw)):
+        update_ms, draw_ms = run_case(update, draw, args.count, args.frames)
+        results[name] = update_ms + draw_ms
+        print(f"{name:<16} | {update_ms:>9.2f} | {draw_ms:>8.2f} | {update_ms + draw_ms:>8.2f}")
+    print(f"\n{args.count} entités : {results['ancienne'] / results['dispatch']:.2f}x")
+
+if __name__ == "__main__":
+    main()
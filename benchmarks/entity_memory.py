@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Benchmark mémoire des entités
+Crée N instances de chaque classe d'entité et mesure avec tracemalloc les
+octets alloués par entité (attributs, rect, conteneurs propres), ainsi que le
+coût d'une lecture d'attribut. --baseline compare à un fichier précédent.
+
+    python benchmarks/entity_memory.py [--count 1000] [--output fichier.json] [--baseline ancien.json]
+"""
+import os
+import sys
+import gc
+import json
+import time
+import timeit
+import argparse
+import platform
+import tracemalloc
+import contextlib
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+
+from scenarios import load_enemies
+from src.entities.player import Player
+from src.entities.bullet import Bullet
+from src.entities.weapon_projectile import WeaponProjectile
+from src.entities.weapon_blueprint import WeaponBlueprint
+from src.gameplay.items import Item
+from src.scenes.game_scene import SimpleWall
+
+DEFAULT_OUTPUT = os.path.join(ROOT, "benchmarks", "results", "entity_memory.json")
+
+WEAPON_DATA = {
+    "name": "Bolter",
+    "stats": {"damage": 10, "projectile_speed": 8},
+    "projectile": {"size": 3, "color": [255, 255, 0], "lifetime": 120},
+    "effects": []
+}
+
+def entity_factories():
+    """Fabriques (index -> entité) des classes mesurées"""
+    enemies = load_enemies()
+    blueprint = WeaponBlueprint("bolter", WEAPON_DATA, {})  # Partagé, comme dans WeaponManager
+    return {
+        "BasicEnemy": lambda i: enemies.BasicEnemy(i % 2000, i % 1500),
+        "FastEnemy": lambda i: enemies.FastEnemy(i % 2000, i % 1500),
+        "ShooterEnemy": lambda i: enemies.ShooterEnemy(i % 2000, i % 1500),
+        "CultistEnemy": lambda i: enemies.CultistEnemy(i % 2000, i % 1500),
+        "WeaponProjectile": lambda i: WeaponProjectile(i % 2000, i % 1500, 1, 0, WEAPON_DATA, {},
+                                                        blueprint=blueprint),
+        "Bullet": lambda i: Bullet(i % 2000, i % 1500, 1, 0, is_player_bullet=False),
+        "Item": lambda i: Item(i % 2000, i % 1500, "health", "Medikit", "Soigne", "common"),
+        "SimpleWall": lambda i: SimpleWall(i % 2000, i % 1500, 32, 32),
+        "Player": lambda i: Player(i % 2000, i % 1500),
+    }
+
+def measure(factory, count):
+    """Octets alloués par entité pour count instances (objets partagés exclus)"""
+    factory(0)  # Caches et imports paresseux hors mesure
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    entities = [factory(i) for i in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    allocated -= sys.getsizeof(entities)  # La liste de la mesure elle-même
+
+    # Lecture d'un attribut courant (x), en ns
+    entity = entities[0]
+    read_ns = min(timeit.repeat(lambda: entity.x, number=200000, repeat=5)) / 200000 * 1e9
+    return {
+        "bytes_per_entity": allocated / count,
+        "has_dict": hasattr(entity, "__dict__"),
+        "attr_read_ns": read_ns,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Mémoire par entité")
+    parser.add_argument("--count", type=int, default=1000, help="instances par classe")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="fichier JSON des résultats")
+    parser.add_argument("--baseline", help="résultats précédents à comparer")
+    args = parser.parse_args()
+
+    pygame.init()
+    with contextlib.redirect_stdout(open(os.devnull, "w")):
+        factories = entity_factories()
+        results = {name: measure(factory, args.count) for name, factory in factories.items()}
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["entities"]
+
+    print(f"{'entité':<18} | {'octets/entité':>13} | {'__dict__':>8} | {'lecture ns':>10} | {'vs base':>8}")
+    print("-" * 70)
+    for name, result in results.items():
+        ratio = ""
+        previous = baseline.get(name, {})
+        if previous.get("bytes_per_entity"):
+            ratio = f"{result['bytes_per_entity'] / previous['bytes_per_entity']:.2f}x"
+        print(f"{name:<18} | {result['bytes_per_entity']:>13.0f} | {str(result['has_dict']):>8} | "
+              f"{result['attr_read_ns']:>10.1f} | {ratio:>8}")
+    total = sum(results[name]["bytes_per_entity"] for name in ("BasicEnemy", "FastEnemy", "ShooterEnemy")) / 3
+    print(f"\n{args.count} ennemis de vague : {total * args.count / 1024:.0f} Kio")
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "count": args.count,
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "entities": results
+        }, f, indent=2)
+    print(f"\nRésultats écrits dans {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Benchmark du système de particules
+Compare, pour un nombre de particules vivantes donné, l'ancienne approche
+(liste de dicts filtrée et mise à jour en Python, une Surface créée et
+blittée par particule) et ParticleSystem (tableaux NumPy, culling vectorisé,
+sprites partagés envoyés en un Surface.fblits).
+
+    python benchmarks/particle_system.py [--frames 60] [--counts 50 1000 10000]
+"""
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+
+from src.core.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from src.systems.particle_system import ParticleSystem
+
+FRAME_BUDGET_MS = 1000 / 60
+LIFE = 120
+
+# Monde de 3 x 3 écrans, caméra au centre : environ 1/9 des particules visibles
+WORLD = (3 * SCREEN_WIDTH, 3 * SCREEN_HEIGHT)
+CAMERA = (SCREEN_WIDTH, SCREEN_HEIGHT)
+
+DEFINITION = {
+    "max_particles": 0,  # Fixé par cas
+    "overflow": "drop_oldest",
+    "velocity": ((-2, 2), (-2, 2)),
+    "size": (2, 4),
+    "alpha": (255, 255),
+    "fade": 255 / LIFE,
+    "color_range": ((150, 255), (0, 0), (150, 255)),
+}
+
+class LegacyParticles:
+    """Ancienne approche (EnvironmentEffects) : dicts et une Surface par particule"""
+
+    def __init__(self):
+        self.particles = []
+
+    def emit(self, count):
+        for _ in range(count):
+            self.particles.append({
+                'x': random.randint(0, WORLD[0]), 'y': random.randint(0, WORLD[1]),
+                'vx': random.uniform(-2, 2), 'vy': random.uniform(-2, 2), 'life': LIFE,
+                'color': (random.randint(150, 255), 0, random.randint(150, 255)),
+                'size': random.randint(2, 4)
+            })
+
+    def update(self):
+        self.particles = [p for p in self.particles if p['life'] > 0]
+        for particle in self.particles:
+            particle['x'] += particle['vx']
+            particle['y'] += particle['vy']
+            particle['life'] -= 1
+
+    def draw(self, screen):
+        for particle in self.particles:
+            screen_x, screen_y = particle['x'] - CAMERA[0], particle['y'] - CAMERA[1]
+            if -50 <= screen_x <= SCREEN_WIDTH + 50 and -50 <= screen_y <= SCREEN_HEIGHT + 50:
+                size = particle['size']
+                particle_surface = pygame.Surface((size * 2, size * 2))
+                particle_surface.set_alpha(max(0, min(255, int(255 * particle['life'] / LIFE))))
+                particle_surface.fill(particle['color'])
+                screen.blit(particle_surface, (screen_x - size, screen_y - size))
+
+class ArrayParticles:
+    """ParticleSystem avec un émetteur plafonné au nombre visé"""
+
+    def __init__(self, count):
+        self.system = ParticleSystem()
+        self.system.add_emitter("bench", dict(DEFINITION, max_particles=count))
+
+    def emit(self, count):
+        self.system.emit("bench", count, 0, 0, WORLD[0], WORLD[1])
+
+    def update(self):
+        self.system.update()
+
+    def draw(self, screen):
+        self.system.draw(screen, CAMERA[0], CAMERA[1])
+
+def run_case(particles, count, frames):
+    """Temps moyens (ms) de update et de draw ; la population est maintenue autour de count"""
+    random.seed(9)
+    per_frame = max(1, count // LIFE)
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    for _ in range(LIFE):  # Population stable avant la mesure
+        particles.emit(per_frame)
+        particles.update()
+    update_time = draw_time = 0.0
+    for _ in range(frames):
+        start = time.perf_counter()
+        particles.emit(per_frame)
+        particles.update()
+        middle = time.perf_counter()
+        particles.draw(screen)
+        draw_time += time.perf_counter() - middle
+        update_time += middle - start
+    return update_time / frames * 1000, draw_time / frames * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description="Particules : dicts contre émetteurs NumPy")
+    parser.add_argument("--frames", type=int, default=60, help="frames mesurées par cas")
+    parser.add_argument("--counts", type=int, nargs="+", default=[50, 1000, 10000], help="particules vivantes")
+    args = parser.parse_args()
+
+    pygame.init()
+    print(f"{'particules':>10} | {'version':<8} | {'update ms':>9} | {'draw ms':>8} | {'total ms':>8} | "
+          f"budget 60 FPS: {FRAME_BUDGET_MS:.1f} ms")
+    print("-" * 66)
+    for count in args.counts:
+        results = {}
+        for name, particles in (("dicts", LegacyParticles()), ("numpy", ArrayParticles(count))):
+            update_ms, draw_ms = run_case(particles, count, args.frames)
+            results[name] = update_ms + draw_ms
+            print(f"{count:>10} | {name:<8} | {update_ms:>9.3f} | {draw_ms:>8.3f} | {update_ms + draw_ms:>8.3f}")
+        print(f"{'':>10} | gain : {results['dicts'] / results['numpy']:.1f}x")
+
+if __name__ == "__main__":
+    main()
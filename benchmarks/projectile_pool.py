@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark du pool de projectiles vectorisé
+Compare le coût par frame (mise à jour + collisions ennemis) entre des objets
+WeaponProjectile et le ProjectilePool pour des milliers de tirs simples
+"""
+import os
+import sys
+import time
+import math
+import random
+import contextlib
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.constants import WORLD_WIDTH, WORLD_HEIGHT
+from src.entities.weapon_projectile import WeaponProjectile
+from src.systems.entity_manager import EntityManager
+from src.systems.collision_system import CollisionSystem
+
+FRAME_BUDGET_MS = 1000 / 60
+
+WEAPON_DATA = {
+    "name": "Bolter",
+    "stats": {"damage": 1, "projectile_speed": 4},
+    "projectile": {"size": 3, "color": [255, 255, 0], "lifetime": 10 ** 6},
+    "effects": []
+}
+
+class BenchEnemy:
+    def __init__(self, x, y):
+        self.x, self.y = x, y
+        self.width, self.height = 24, 24
+        self.health = 10 ** 9  # Ne meurt jamais pour garder des frames comparables
+
+    def take_damage(self, damage):
+        self.health -= damage
+
+def build_scene(projectile_count, enemy_count, pooled, seed=3):
+    """Construit une scène déterministe (tirs dans toutes les directions)"""
+    rng = random.Random(seed)
+    entity_manager = EntityManager()
+    if pooled:
+        entity_manager.enable_projectile_pool(capacity=projectile_count)
+    for _ in range(enemy_count):
+        entity_manager.add_enemy(BenchEnemy(rng.uniform(0, WORLD_WIDTH), rng.uniform(0, WORLD_HEIGHT)))
+    for _ in range(projectile_count):
+        angle = rng.uniform(0, 6.283)
+        projectile = WeaponProjectile(rng.uniform(100, WORLD_WIDTH - 100), rng.uniform(100, WORLD_HEIGHT - 100),
+                                      math.cos(angle), math.sin(angle), WEAPON_DATA, {})
+        entity_manager.add_projectile(projectile)
+    return entity_manager
+
+def run_case(projectile_count, enemy_count, pooled, frames=30):
+    """Retourne le temps moyen (ms) d'une frame de projectiles"""
+    with contextlib.redirect_stdout(open(os.devnull, "w")):
+        entity_manager = build_scene(projectile_count, enemy_count, pooled)
+        collision_system = CollisionSystem()
+        walls = entity_manager.get_wall_index()
+        enemies = entity_manager.get_enemies()
+
+        start = time.perf_counter()
+        for _ in range(frames):
+            for projectile in entity_manager.get_projectiles():
+                if projectile.update(walls, WORLD_WIDTH, WORLD_HEIGHT, enemies) is False:
+                    entity_manager.remove_projectile(projectile)
+            pool = entity_manager.get_projectile_pool()
+            if pool is not None:
+                pool.update(walls)
+            collision_system.check_projectile_enemy_collisions(entity_manager)
+            collision_system.check_pooled_projectile_collisions(entity_manager)
+            entity_manager.end_of_frame_compact()
+        elapsed = time.perf_counter() - start
+    return elapsed / frames * 1000, entity_manager.get_projectiles_count()
+
+def main():
+    cases = [(500, 100), (2000, 200), (5000, 300), (10000, 300)]
+    print(f"{'P':>6} {'E':>5} | {'objets ms':>10} | {'pool ms':>8} | {'x':>6} | budget 60 FPS: {FRAME_BUDGET_MS:.1f} ms")
+    print("-" * 62)
+    for projectile_count, enemy_count in cases:
+        object_ms, _ = run_case(projectile_count, enemy_count, pooled=False)
+        pool_ms, _ = run_case(projectile_count, enemy_count, pooled=True)
+        print(f"{projectile_count:>6} {enemy_count:>5} | {object_ms:>10.2f} | {pool_ms:>8.2f} | {object_ms / pool_ms:>5.1f}x")
+
+if __name__ == "__main__":
+    main()
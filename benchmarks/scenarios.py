@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Benchmarks de scénarios de jeu complets (sans fenêtre)
+Chaque scénario joue une partie déterministe avec HeadlessRunner et mesure
+ticks/s, temps par système et nombre d'entités. Les résultats sont écrits en
+JSON pour suivre les régressions ; --baseline compare à un fichier précédent.
+
+    python benchmarks/scenarios.py [--only wave_1] [--output fichier.json] [--baseline ancien.json]
+"""
+import os
+import sys
+import json
+import math
+import time
+import platform
+import argparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np
+import pygame
+
+from src.core.constants import TICK_RATE
+from src.core.headless import HeadlessRunner
+
+DEFAULT_OUTPUT = os.path.join(ROOT, "benchmarks", "results", "scenarios.json")
+SEED = 40000
+
+BOSS_CLASSES = {
+    "boss_chaos_sorcerer": "ChaosSorcererBoss",
+    "boss_inquisitor_lord": "InquisitorLordBoss",
+    "boss_daemon_prince": "DaemonPrinceBoss",
+}
+
+SWARM_CLASSES = ("BasicEnemy", "FastEnemy", "ShooterEnemy")
+
+def load_enemies():
+    """Importe le paquet des ennemis"""
+    from src.entities import enemies
+    return enemies
+
+def load_bosses():
+    """Importe les boss"""
+    enemies = load_enemies()
+    return {name: getattr(enemies, class_name) for name, class_name in BOSS_CLASSES.items()}
+
+# === SCÉNARIOS ===
+
+def scenario_wave_1():
+    """Première vague complète jouée par le pilote automatique"""
+    runner = HeadlessRunner(seed=SEED)
+    return runner.run(waves=1, ticks=TICK_RATE * 120)
+
+def scenario_wave_10_swarm():
+    """Vague 10 : essaim d'ennemis, joueur invulnérable pour une durée fixe"""
+    runner = HeadlessRunner(seed=SEED, invulnerable=True)
+    runner.start_wave(10)
+    return runner.run(ticks=TICK_RATE * 20)
+
+def make_boss_scenario(boss_name):
+    def scenario():
+        boss_class = load_bosses()[boss_name]
+        runner = HeadlessRunner(seed=SEED, invulnerable=True)
+        player = runner.scene.player
+        runner.set_enemies([boss_class(player.x + 300, player.y)])
+        return runner.run(waves=1, ticks=TICK_RATE * 30)
+    scenario.__doc__ = f"Combat contre {BOSS_CLASSES[boss_name]}, joueur invulnérable"
+    return scenario
+
+def make_swarm_scenario(count, batched):
+    def scenario():
+        enemies = load_enemies()
+        runner = HeadlessRunner(seed=SEED, invulnerable=True)
+        if not batched:
+            runner.scene.entity_manager.enemy_batch = None  # Un update() objet par ennemi
+        rng = runner.rng
+        swarm = []
+        for _ in range(count):
+            enemy_class = getattr(enemies, rng.choice(SWARM_CLASSES))
+            swarm.append(enemy_class(rng.uniform(50, 1998), rng.choice((50.0, 1486.0))))
+        runner.set_enemies(swarm)
+        return runner.run(ticks=TICK_RATE * 10)
+    mode = "EnemyBatch vectorisé" if batched else "update() par objet"
+    scenario.__doc__ = f"{count} ennemis simples (Basic/Fast/Shooter), {mode}"
+    return scenario
+
+def scenario_projectile_stress_2000(target=2000):
+    """2000 projectiles maintenus en vol pendant une vague 5"""
+    runner = HeadlessRunner(seed=SEED, invulnerable=True)
+    runner.start_wave(5)
+    player = runner.scene.player
+    weapon_manager = player.weapon_manager
+
+    def top_up(runner):
+        entity_manager = runner.scene.entity_manager
+        missing = target - entity_manager.get_projectiles_count()
+        rng = runner.rng
+        while missing > 0:
+            angle = rng.uniform(0, 2 * math.pi)
+            for projectile in weapon_manager.create_projectiles(
+                    "bolter_basic", player.x, player.y,
+                    player.x + math.cos(angle) * 100, player.y + math.sin(angle) * 100, player):
+                entity_manager.add_projectile(projectile)
+                missing -= 1
+
+    return runner.run(ticks=TICK_RATE * 10, before_tick=top_up)
+
+SCENARIOS = {
+    "wave_1": scenario_wave_1,
+    "wave_10_swarm": scenario_wave_10_swarm,
+    **{name: make_boss_scenario(name) for name in BOSS_CLASSES},
+    "swarm_300_batched": make_swarm_scenario(300, batched=True),
+    "swarm_300_objects": make_swarm_scenario(300, batched=False),
+    "projectile_stress_2000": scenario_projectile_stress_2000,
+}
+
+# === EXÉCUTION ===
+
+def run_scenarios(names):
+    results = {}
+    for name in names:
+        try:
+            results[name] = SCENARIOS[name]()
+        except Exception as e:
+            results[name] = {"error": f"{type(e).__name__}: {e}"}
+    return results
+
+def print_summary(results, baseline=None):
+    print(f"{'scénario':<24} | {'ticks/s':>9} | {'ms/tick':>8} | {'ennemis max':>11} | {'proj. max':>9} | {'vs base':>8}")
+    print("-" * 84)
+    for name, result in results.items():
+        if "error" in result:
+            print(f"{name:<24} | erreur: {result['error']}")
+            continue
+        entities = result["entities"]
+        ratio = ""
+        previous = (baseline or {}).get(name, {})
+        if previous.get("ms_per_tick"):
+            ratio = f"{result['ms_per_tick'] / previous['ms_per_tick']:.2f}x"
+        print(f"{name:<24} | {result['ticks_per_second']:>9.0f} | {result['ms_per_tick']:>8.3f} | "
+              f"{entities['enemies']['max']:>11} | {entities['projectiles']['max']:>9} | {ratio:>8}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks de scénarios sans fenêtre")
+    parser.add_argument("--only", nargs="*", choices=sorted(SCENARIOS), help="scénarios à lancer")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="fichier JSON des résultats")
+    parser.add_argument("--baseline", help="résultats précédents à comparer (ms/tick)")
+    args = parser.parse_args()
+
+    results = run_scenarios(args.only or list(SCENARIOS))
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["scenarios"]
+    print_summary(results, baseline)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "seed": SEED,
+            "tick_rate": TICK_RATE,
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "numpy": np.__version__,
+            "scenarios": results
+        }, f, indent=2)
+    print(f"\nRésultats écrits dans {args.output}")
+
+if __name__ == "__main__":
+    main()
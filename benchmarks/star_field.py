@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark du champ d'étoiles
+Compare update + draw de l'ancien StarField (une liste de dicts par couche,
+set_at / draw.circle et tuple de couleur par étoile) et du StarField à
+tableaux NumPy, pour plusieurs densités d'étoiles.
+
+    python benchmarks/star_field.py [--frames 60] [--counts 350 5000 20000]
+"""
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+
+from src.core.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from src.world.background import StarField, STAR_COUNTS
+
+FRAME_BUDGET_MS = 1000 / 60
+
+class LegacyStarField:
+    """Ancien StarField : un dict par étoile, mis à jour et dessiné en Python"""
+
+    def __init__(self, screen_width, screen_height, star_counts):
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.star_layers = [
+            {"stars": [], "speed": 0.1, "color": (100, 100, 100), "size": 1},
+            {"stars": [], "speed": 0.3, "color": (150, 150, 150), "size": 1},
+            {"stars": [], "speed": 0.6, "color": (200, 200, 200), "size": 2},
+        ]
+        for layer, count in zip(self.star_layers, star_counts):
+            for _ in range(count):
+                layer["stars"].append({"x": random.randint(0, screen_width * 2),
+                                       "y": random.randint(0, screen_height * 2),
+                                       "brightness": random.uniform(0.3, 1.0)})
+
+    def update(self, camera_x, camera_y):
+        for layer in self.star_layers:
+            for star in layer["stars"]:
+                star["x"] -= camera_x * layer["speed"] * 0.01
+                star["y"] -= camera_y * layer["speed"] * 0.01
+                if star["x"] < -50:
+                    star["x"] = self.screen_width + 50
+                    star["y"] = random.randint(0, self.screen_height)
+                elif star["x"] > self.screen_width + 50:
+                    star["x"] = -50
+                    star["y"] = random.randint(0, self.screen_height)
+                if star["y"] < -50:
+                    star["y"] = self.screen_height + 50
+                    star["x"] = random.randint(0, self.screen_width)
+                elif star["y"] > self.screen_height + 50:
+                    star["y"] = -50
+                    star["x"] = random.randint(0, self.screen_width)
+
+    def draw(self, surface):
+        for layer in self.star_layers:
+            for star in layer["stars"]:
+                color = tuple(int(c * star["brightness"]) for c in layer["color"])
+                if layer["size"] == 1:
+                    surface.set_at((int(star["x"]), int(star["y"])), color)
+                else:
+                    pygame.draw.circle(surface, color, (int(star["x"]), int(star["y"])), layer["size"])
+
+def scaled_counts(total):
+    """Répartit total étoiles entre les couches dans les proportions par défaut"""
+    base = sum(STAR_COUNTS)
+    return tuple(total * count // base for count in STAR_COUNTS)
+
+def run_case(field_class, total, frames):
+    """Temps moyens (ms) de update et de draw par frame"""
+    random.seed(11)
+    field = field_class(SCREEN_WIDTH, SCREEN_HEIGHT, scaled_counts(total))
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    update_time = draw_time = 0.0
+    for frame in range(frames):
+        camera_x, camera_y = 600 + frame * 9.0, 400 - frame * 4.0
+        start = time.perf_counter()
+        field.update(camera_x, camera_y)
+        middle = time.perf_counter()
+        field.draw(screen)
+        draw_time += time.perf_counter() - middle
+        update_time += middle - start
+    return update_time / frames * 1000, draw_time / frames * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description="Champ d'étoiles : dicts contre tableaux NumPy")
+    parser.add_argument("--frames", type=int, default=60, help="frames mesurées par cas")
+    parser.add_argument("--counts", type=int, nargs="+", default=[350, 5000, 20000], help="nombres d'étoiles")
+    args = parser.parse_args()
+
+    pygame.init()
+    print(f"{'étoiles':>8} | {'version':<8} | {'update ms':>9} | {'draw ms':>8} | {'total ms':>8} | "
+          f"budget 60 FPS: {FRAME_BUDGET_MS:.1f} ms")
+    print("-" * 64)
+    for total in args.counts:
+        results = {}
+        for name, field_class in (("dicts", LegacyStarField), ("numpy", StarField)):
+            update_ms, draw_ms = run_case(field_class, total, args.frames)
+            results[name] = update_ms + draw_ms
+            print(f"{total:>8} | {name:<8} | {update_ms:>9.3f} | {draw_ms:>8.3f} | {update_ms + draw_ms:>8.3f}")
+        print(f"{'':>8} | gain : {results['dicts'] / results['numpy']:.1f}x")
+
+if __name__ == "__main__":
+    main()
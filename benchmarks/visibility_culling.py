@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark de la passe de visibilité
+Compare le dessin monde d'une frame (ennemis, projectiles objets, barres de
+vie) sans culling, comme l'ancienne boucle de GameScene, et avec la passe de
+visibilité, ennemis trouvés par parcours complet ou forcés par la grille des
+collisions, pour N ennemis répartis sur tout le monde.
+
+    python benchmarks/visibility_culling.py [--count 2000] [--frames 60]
+"""
+import os
+import sys
+import random
+import argparse
+import contextlib
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import time
+import pygame
+
+from scenarios import load_enemies
+from src.core.constants import SCREEN_WIDTH, SCREEN_HEIGHT, WORLD_WIDTH, WORLD_HEIGHT
+from src.entities.player import Player
+from src.entities.bullet import Bullet
+from src.gameplay.camera import Camera
+from src.systems.entity_manager import EntityManager
+from src.systems.collision_system import CollisionSystem
+from src.systems.entity_dispatch import draw_entity
+from src.systems.visibility import VisibilityPass
+from src.ui.hud_manager import HUDManager
+
+FRAME_BUDGET_MS = 1000 / 60
+
+def build_scene(count, seed=7):
+    """count ennemis (trois types de vague) et count // 4 projectiles, sur tout le monde"""
+    enemies = load_enemies()
+    rng = random.Random(seed)
+    entity_manager = EntityManager()
+    player = Player(WORLD_WIDTH // 2, WORLD_HEIGHT // 2)
+    entity_manager.add_player(player)
+    enemy_types = (enemies.BasicEnemy, enemies.FastEnemy, enemies.ShooterEnemy)
+    for i in range(count):
+        enemy = enemy_types[i % 3](rng.uniform(0, WORLD_WIDTH - 40), rng.uniform(0, WORLD_HEIGHT - 40))
+        enemy.health = enemy.max_health // 2  # Barre de vie affichée
+        entity_manager.add_enemy(enemy)
+    for _ in range(count // 4):
+        entity_manager.add_projectile(Bullet(rng.uniform(0, WORLD_WIDTH), rng.uniform(0, WORLD_HEIGHT),
+                                             rng.uniform(-1, 1), rng.uniform(-1, 1), is_player_bullet=False))
+    camera = Camera(SCREEN_WIDTH, SCREEN_HEIGHT, WORLD_WIDTH, WORLD_HEIGHT)
+    camera.update(player)
+    camera.x = camera.prev_x = player.x - SCREEN_WIDTH // 2
+    camera.y = camera.prev_y = player.y - SCREEN_HEIGHT // 2
+    return entity_manager, camera
+
+def draw_world(screen, hud, entity_manager, enemies, projectiles, camera_x, camera_y, culled):
+    """Dessin des entités et des barres de vie, comme GameScene.draw"""
+    enemy_calls = entity_manager.dispatch.tables["enemy"]
+    projectile_calls = entity_manager.dispatch.tables["projectile"]
+    for enemy in enemies:
+        draw_entity(enemy, enemy_calls[enemy.__class__], screen,
+                    enemy.x - camera_x, enemy.y - camera_y, (255, 0, 0), 8)
+    for projectile in projectiles:
+        draw_entity(projectile, projectile_calls[projectile.__class__], screen,
+                    projectile.x - camera_x, projectile.y - camera_y, (255, 255, 0), 3)
+    hud.draw_enemy_health_bars(screen, enemies, camera_x, camera_y, culled=culled)
+
+def run_case(mode, count, frames):
+    """Temps moyen (ms) de la passe et du dessin d'une frame, et nombre d'ennemis dessinés"""
+    with contextlib.redirect_stdout(open(os.devnull, "w")):
+        entity_manager, camera = build_scene(count)
+        collision_system = CollisionSystem()
+        collision_system.optimize_collision_checks(entity_manager)
+        # "grille" : requête forcée, même si la zone couvre une grande part du monde
+        visibility = VisibilityPass(SCREEN_WIDTH, SCREEN_HEIGHT, index_max_share=1.0 if mode == "grille" else 0.0)
+        hud = HUDManager(SCREEN_WIDTH, SCREEN_HEIGHT)
+        screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        start = time.perf_counter()
+        for _ in range(frames):
+            if mode == "sans culling":
+                enemies, projectiles = entity_manager.get_enemies(), entity_manager.get_projectiles()
+                draw_world(screen, hud, entity_manager, enemies, projectiles, camera.x, camera.y, False)
+            else:
+                visibility.update(camera, entity_manager, collision_system)
+                draw_world(screen, hud, entity_manager, visibility.enemies, visibility.projectiles,
+                           visibility.camera_x, visibility.camera_y, True)
+        elapsed = time.perf_counter() - start
+    drawn = count if mode == "sans culling" else len(visibility.enemies)
+    return elapsed / frames * 1000, drawn
+
+def main():
+    parser = argparse.ArgumentParser(description="Passe de visibilité du dessin monde")
+    parser.add_argument("--count", type=int, default=2000, help="ennemis répartis sur le monde")
+    parser.add_argument("--frames", type=int, default=60, help="frames mesurées par cas")
+    args = parser.parse_args()
+
+    pygame.init()
+    print(f"{'dessin':<14} | {'frame ms':>8} | {'ennemis dessinés':>16} | budget 60 FPS: {FRAME_BUDGET_MS:.1f} ms")
+    print("-" * 48)
+    results = {}
+    for mode in ("sans culling", "parcours", "grille"):
+        frame_ms, drawn = run_case(mode, args.count, args.frames)
+        results[mode] = frame_ms
+        print(f"{mode:<14} | {frame_ms:>8.2f} | {drawn:>16}")
+    print(f"\n{args.count} ennemis : {results['sans culling'] / results['parcours']:.2f}x avec la passe")
+
+if __name__ == "__main__":
+    main()
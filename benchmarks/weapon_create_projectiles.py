@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark de WeaponManager.create_projectiles
+Mesure le débit de création de projectiles (par arme, avec et sans tir
+multiple bonus) et vérifie qu'aucun thread n'est créé pendant les tirs
+"""
+import os
+import sys
+import time
+import threading
+import contextlib
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.systems.weapon_manager import WeaponManager
+from src.utils.game_log import advance_frame
+
+class BenchPlayer:
+    def __init__(self, multi_shot_bonus=0):
+        self.global_upgrades = {"multi_shot_bonus": multi_shot_bonus}
+
+def run_case(weapon_manager, weapon_id, player, calls=20000):
+    """Retourne (projectiles/s, µs par appel, threads créés)"""
+    threads_before = threading.active_count()
+    created = 0
+    start = time.perf_counter()
+    for i in range(calls):
+        if i % 4 == 0:
+            advance_frame()  # ~4 tirs par frame
+        created += len(weapon_manager.create_projectiles(weapon_id, 100, 100, 400, 300, player))
+    elapsed = time.perf_counter() - start
+    return created / elapsed, elapsed / calls * 1e6, threading.active_count() - threads_before
+
+def main():
+    with contextlib.redirect_stdout(open(os.devnull, "w")):
+        weapon_manager = WeaponManager()
+    weapon_ids = sorted(weapon_manager.weapons)[:6]
+
+    print(f"{'arme':<22} {'bonus':>5} | {'projectiles/s':>14} | {'µs/appel':>9} | {'threads':>7}")
+    print("-" * 68)
+    for weapon_id in weapon_ids:
+        for bonus in (0, 4):
+            with contextlib.redirect_stdout(open(os.devnull, "w")):
+                rate, per_call, threads = run_case(weapon_manager, weapon_id, BenchPlayer(bonus))
+            print(f"{weapon_id:<22} {bonus:>5} | {rate:>14.0f} | {per_call:>9.2f} | {threads:>7}")
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,12 @@ SCREEN_WIDTH = 1200
 SCREEN_HEIGHT = 800
 FPS = 60
 
+# === BOUCLE DE JEU ===
+TICK_RATE = 60  # Ticks de simulation par seconde (la logique compte en ticks)
+MAX_CATCH_UP_TICKS = 5  # Ticks simulés au plus par image avant de lâcher du temps
+MAX_FRAME_TIME = 0.25  # Temps réel pris en compte au plus par image (secondes)
+MAX_RENDER_FPS = 144  # Limite d'images par seconde (0 = pas de limite)
+
 # === DIMENSIONS DU MONDE ===
 WORLD_WIDTH = 2400  # Double de l'écran pour effet de caméra
 WORLD_HEIGHT = 1600
@@ -77,4 +83,5 @@ CORRUPTION_GROWTH_RATE = 0.05  # Croissance de corruption passive
 # === PHYSICS ===
 COLLISION_MARGIN = 2  # Marge pour les collisions
 MIN_SPAWN_DISTANCE = 100  # Distance minimum du joueur pour spawn
-WALL_THICKNESS = 10
\ No newline at end of file
+WALL_THICKNESS = 10
+COLLISION_CELL_SIZE = 64  # Taille des cellules de la grille spatiale (pixels)
\ No newline at end of file
@@ -0,0 +1,82 @@
+"""
+Pas de temps fixe - Découple la simulation du rendu
+La simulation avance par ticks de durée constante (TICK_RATE par seconde),
+quel que soit le nombre d'images affichées. Le temps réel s'accumule et
+est consommé tick par tick ; le reste (fraction de tick) sert à interpoler
+les positions au rendu entre l'état précédent et l'état courant.
+"""
+from .constants import TICK_RATE, MAX_CATCH_UP_TICKS, MAX_FRAME_TIME
+
+# Tolérance des arrondis flottants (1/60 accumulé 60 fois ≠ 1.0 exactement)
+_EPSILON = 1e-9
+
+class FixedTimestep:
+    """Accumulateur de temps réel converti en ticks de simulation"""
+
+    def __init__(self, tick_rate=TICK_RATE, max_catch_up_ticks=MAX_CATCH_UP_TICKS,
+                 max_frame_time=MAX_FRAME_TIME):
+        self.tick_rate = tick_rate
+        self.tick_dt = 1.0 / tick_rate
+        self.max_catch_up_ticks = max_catch_up_ticks
+        self.max_frame_time = max_frame_time
+        self.accumulator = 0.0
+
+        # Statistiques
+        self.total_ticks = 0
+        self.total_frames = 0
+        self.dropped_ticks = 0
+
+    def advance(self, frame_time):
+        """Ajoute le temps réel d'une image et retourne le nombre de ticks à simuler"""
+        self.total_frames += 1
+        # Une pause (fenêtre déplacée, point d'arrêt...) ne doit pas tout rattraper
+        self.accumulator += min(max(frame_time, 0.0), self.max_frame_time)
+
+        ticks = int((self.accumulator + _EPSILON) // self.tick_dt)
+        if ticks > self.max_catch_up_ticks:
+            # Budget de rattrapage dépassé : le jeu ralentit au lieu de s'effondrer
+            self.dropped_ticks += ticks - self.max_catch_up_ticks
+            ticks = self.max_catch_up_ticks
+            self.accumulator = 0.0
+        else:
+            self.accumulator = max(0.0, self.accumulator - ticks * self.tick_dt)
+
+        self.total_ticks += ticks
+        return ticks
+
+    @property
+    def alpha(self):
+        """Fraction du tick suivant déjà écoulée (0..1), pour l'interpolation"""
+        return min(1.0, self.accumulator / self.tick_dt)
+
+    def reset(self):
+        """Vide l'accumulateur (changement de scène, reprise après chargement)"""
+        self.accumulator = 0.0
+
+    def get_statistics(self):
+        """Retourne les compteurs de ticks et d'images"""
+        return {
+            "tick_rate": self.tick_rate,
+            "ticks": self.total_ticks,
+            "frames": self.total_frames,
+            "dropped_ticks": self.dropped_ticks,
+            "alpha": self.alpha
+        }
+
+# === INTERPOLATION ===
+
+def snapshot_positions(entities):
+    """Mémorise la position de début de tick de chaque entité"""
+    for entity in entities:
+        entity.prev_x = entity.x
+        entity.prev_y = entity.y
+
+def interpolate_position(entity, alpha):
+    """Position d'affichage entre le tick précédent et le tick courant"""
+    x = entity.x
+    y = entity.y
+    prev_x = getattr(entity, 'prev_x', None)
+    if prev_x is None or alpha >= 1.0:
+        return x, y
+    prev_y = entity.prev_y
+    return prev_x + (x - prev_x) * alpha, prev_y + (y - prev_y) * alpha
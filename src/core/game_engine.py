@@ -4,14 +4,18 @@ Gère l'initialisation, la boucle de jeu et les scènes
 """
 import pygame
 import sys
-from .constants import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+import time
+from .constants import SCREEN_WIDTH, SCREEN_HEIGHT, TICK_RATE, MAX_CATCH_UP_TICKS, MAX_RENDER_FPS
+from .fixed_timestep import FixedTimestep
+from ..utils.profiler import profiler
 from .scene_manager import SceneManager
 from ..scenes.game_scene import GameScene
 
 class GameEngine:
     """Moteur principal du jeu"""
     
-    def __init__(self):
+    def __init__(self, tick_rate=TICK_RATE, max_catch_up_ticks=MAX_CATCH_UP_TICKS,
+                 max_render_fps=MAX_RENDER_FPS):
         # Initialisation de Pygame
         pygame.init()
         
@@ -20,6 +24,13 @@ class GameEngine:
         pygame.display.set_caption("Roguelike Warhammer 40K")
         self.clock = pygame.time.Clock()
         
+        # Simulation à pas fixe, rendu libre (limité à max_render_fps, 0 = sans limite)
+        self.timestep = FixedTimestep(tick_rate, max_catch_up_ticks)
+        self.max_render_fps = max_render_fps
+        
+        # Temps moyens (ms) de la simulation par tick et du rendu par image
+        self.timing = {"sim_ms": 0.0, "render_ms": 0.0}
+        
         # Gestionnaire de scènes
         self.scene_manager = SceneManager()
         
@@ -59,26 +70,49 @@ class GameEngine:
         # Gérer les transitions de scènes
         self._handle_scene_transitions()
     
-    def draw(self):
-        """Dessine tout à l'écran"""
+    def draw(self, alpha=1.0):
+        """Dessine tout à l'écran (alpha : fraction de tick pour l'interpolation)"""
         self.screen.fill((0, 0, 0))  # Fond noir
         
-        self.scene_manager.render(self.screen)
+        with profiler.section("engine.render"):
+            self.scene_manager.render(self.screen, alpha)
         
-        pygame.display.flip()
+        with profiler.section("engine.present"):
+            pygame.display.flip()
     
     def run(self):
         """Boucle principale du jeu"""
         print("🚀 Démarrage du moteur de jeu Warhammer 40K...")
         
+        timestep = self.timestep
+        last_time = time.perf_counter()
+        
         while self.running:
-            # Calculer le delta time
-            dt = self.clock.tick(FPS) / 1000.0  # en secondes
+            # Limiter le rendu (la simulation ne dépend pas de cette cadence)
+            self.clock.tick(self.max_render_fps)
+            now = time.perf_counter()
+            frame_time = now - last_time
+            last_time = now
+            
+            with profiler.section("engine.events"):
+                self.handle_events()
             
-            # Cycle principal
-            self.handle_events()
-            self.update(dt)
-            self.draw()
+            # Simulation : autant de ticks fixes que le temps réel écoulé en demande
+            ticks = timestep.advance(frame_time)
+            sim_start = time.perf_counter()
+            with profiler.section("engine.simulation"):
+                for _ in range(ticks):
+                    self.update(timestep.tick_dt)
+                    if not self.running:
+                        break
+            render_start = time.perf_counter()
+            
+            # Rendu : positions interpolées entre les deux derniers ticks
+            self.draw(timestep.alpha)
+            render_end = time.perf_counter()
+            
+            self._record_timing(render_start - sim_start, ticks, render_end - render_start)
+            profiler.end_frame()
         
         # Nettoyage
         self.cleanup()
@@ -103,6 +137,18 @@ class GameEngine:
         """Retourne l'horloge du jeu"""
         return self.clock
     
+    def _record_timing(self, sim_time, ticks, render_time, smoothing=0.1):
+        """Met à jour les moyennes glissantes des temps de simulation et de rendu"""
+        timing = self.timing
+        if ticks:
+            sim_ms = sim_time * 1000.0 / ticks
+            timing["sim_ms"] += (sim_ms - timing["sim_ms"]) * smoothing
+        timing["render_ms"] += (render_time * 1000.0 - timing["render_ms"]) * smoothing
+    
+    def get_timing_statistics(self):
+        """Retourne les temps de simulation/rendu et les compteurs du pas fixe"""
+        return {**self.timestep.get_statistics(), **self.timing, "fps": self.clock.get_fps()}
+    
     def quit_game(self):
         """Méthode pour quitter le jeu proprement"""
         self.running = False
@@ -0,0 +1,220 @@
+"""
+Mode sans fenêtre - Fait tourner GameScene sans affichage ni son
+Pilotes SDL factices, aucun appel à draw(), module random initialisé par
+une graine : deux exécutions avec la même graine jouent la même partie.
+Un pilote automatique remplace le joueur (déplacements et level-ups).
+Sert aux tests et aux benchmarks (voir benchmarks/scenarios.py).
+"""
+import os
+import sys
+import time
+import random
+import contextlib
+
+import pygame
+
+from .constants import SCREEN_WIDTH, SCREEN_HEIGHT, WORLD_WIDTH, WORLD_HEIGHT, TICK_RATE
+from ..utils.game_log import set_console
+from ..utils.profiler import profiler
+from ..scenes.game_scene import GameScene
+
+def init_headless():
+    """Initialise pygame avec les pilotes vidéo/audio factices"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    if not pygame.get_init():
+        pygame.init()
+    if pygame.display.get_surface() is None:
+        # Surface nécessaire aux convert() des sprites, jamais affichée
+        pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+@contextlib.contextmanager
+def quiet_output():
+    """Coupe la console (journal et print) le temps du bloc"""
+    set_console(False)
+    try:
+        with contextlib.redirect_stdout(open(os.devnull, "w")):
+            yield
+    finally:
+        set_console(True)
+
+class AutoPilot:
+    """Joueur scripté : garde ses distances avec l'ennemi le plus proche"""
+
+    def __init__(self, rng, keep_distance=220, edge_margin=150, invulnerable=False):
+        self.rng = rng
+        self.keep_distance = keep_distance
+        self.edge_margin = edge_margin
+        self.invulnerable = invulnerable
+        self.level_ups = 0
+
+    def control(self, scene):
+        """Choisit les touches du tick et résout les level-ups en attente"""
+        player = scene.player
+        if player is None:
+            return
+        if self.invulnerable and hasattr(player, 'max_health'):
+            player.health = player.max_health
+
+        # Level-up : choix aléatoire (graine) au lieu du clic souris
+        exp_system = scene.exp_system
+        if getattr(exp_system, 'is_leveling_up', False) and exp_system.level_up_choices:
+            exp_system.selected_choice = self.rng.randrange(len(exp_system.level_up_choices))
+            scene.apply_level_up_choice()
+            self.level_ups += 1
+
+        dx, dy = 0.0, 0.0
+        enemies = scene.entity_manager.get_enemies()
+        if enemies:
+            nearest = min(enemies, key=lambda e: (e.x - player.x) ** 2 + (e.y - player.y) ** 2)
+            away_x, away_y = player.x - nearest.x, player.y - nearest.y
+            if away_x * away_x + away_y * away_y < self.keep_distance * self.keep_distance:
+                dx, dy = away_x, away_y
+
+        # Ne pas se coincer contre les bords : revenir vers le centre
+        if player.x < self.edge_margin or player.x > WORLD_WIDTH - self.edge_margin:
+            dx = WORLD_WIDTH / 2 - player.x
+        if player.y < self.edge_margin or player.y > WORLD_HEIGHT - self.edge_margin:
+            dy = WORLD_HEIGHT / 2 - player.y
+
+        keys = {}
+        if dx < -1:
+            keys[pygame.K_a] = True
+        elif dx > 1:
+            keys[pygame.K_d] = True
+        if dy < -1:
+            keys[pygame.K_w] = True
+        elif dy > 1:
+            keys[pygame.K_s] = True
+        scene.keys_pressed = keys
+
+class HeadlessRunner:
+    """Simule une partie tick par tick et mesure la simulation"""
+
+    def __init__(self, seed=0, archetype=None, tick_rate=TICK_RATE, pilot=None,
+                 invulnerable=False, quiet=True):
+        init_headless()
+        self.seed = seed
+        self.quiet = quiet
+        self.tick_dt = 1.0 / tick_rate
+        random.seed(seed)
+        # Générateur propre aux outils (pilote, scénarios) : ne décale pas celui du jeu
+        self.rng = random.Random(seed + 1)
+        self.pilot = pilot or AutoPilot(random.Random(seed + 2), invulnerable=invulnerable)
+
+        with self._output():
+            self.scene = GameScene(selected_archetype=archetype)
+        # Vagues créées par lots de taille fixe, pas selon le temps mesuré : reproductible
+        self.scene.wave_director.budget_ms = None
+
+        profiler.reset()
+        self.ticks = 0
+        self.sim_time = 0.0
+        self.first_wave = self.scene.wave_number
+        self.entity_samples = {"enemies": [0, 0, 0], "projectiles": [0, 0, 0], "pooled_projectiles": [0, 0, 0]}
+
+    def _output(self):
+        return quiet_output() if self.quiet else contextlib.nullcontext()
+
+    def start_wave(self, wave_number):
+        """Saute directement à une vague (génère niveau et ennemis)"""
+        with self._output():
+            self.scene.wave_number = wave_number
+            self.scene.generate_level()
+        self.first_wave = wave_number
+
+    def set_enemies(self, enemies):
+        """Remplace les ennemis de la vague courante (boss, cas de test)"""
+        entity_manager = self.scene.entity_manager
+        with self._output():
+            self.scene.wave_director.clear()
+            entity_manager.clear_enemies()
+            for enemy in enemies:
+                entity_manager.add_enemy(enemy)
+        self.scene.enemies_remaining = len(enemies)
+
+    def step(self, before_tick=None):
+        """Simule un tick ; seul scene.update est chronométré"""
+        scene = self.scene
+        self.pilot.control(scene)
+        if before_tick is not None:
+            before_tick(self)
+        start = time.perf_counter()
+        scene.update(self.tick_dt)
+        self.sim_time += time.perf_counter() - start
+        profiler.end_frame()  # Un tick = une image de l'historique du profileur
+        self.ticks += 1
+        self._sample_entities()
+
+    def _sample_entities(self):
+        entity_manager = self.scene.entity_manager
+        pool = entity_manager.get_projectile_pool()
+        pooled = len(pool) if pool is not None else 0
+        for name, value in (("enemies", len(entity_manager.get_enemies())),
+                            ("projectiles", entity_manager.get_projectiles_count()),
+                            ("pooled_projectiles", pooled)):
+            sample = self.entity_samples[name]
+            sample[0] = max(sample[0], value)
+            sample[1] += value
+            sample[2] = value
+
+    def run(self, waves=None, ticks=None, before_tick=None):
+        """Joue jusqu'à `waves` vagues terminées, `ticks` ticks ou la fin de partie"""
+        if waves is None and ticks is None:
+            raise ValueError("run() demande waves ou ticks")
+        target_wave = self.scene.wave_number + waves if waves is not None else None
+        last_tick = self.ticks + ticks if ticks is not None else None
+
+        was_enabled = profiler.enabled
+        profiler.enable()
+        try:
+            with self._output():
+                while self.scene.game_state != "game_over":
+                    if target_wave is not None and self.scene.wave_number >= target_wave:
+                        break
+                    if last_tick is not None and self.ticks >= last_tick:
+                        break
+                    self.step(before_tick)
+        finally:
+            profiler.enable(was_enabled)
+        return self.get_report()
+
+    def get_report(self):
+        """Résumé de la simulation : débit, temps par système et entités"""
+        scene = self.scene
+        ticks = max(1, self.ticks)
+        return {
+            "seed": self.seed,
+            "ticks": self.ticks,
+            "sim_seconds": self.sim_time,
+            "ticks_per_second": self.ticks / self.sim_time if self.sim_time else 0.0,
+            "ms_per_tick": self.sim_time * 1000.0 / ticks,
+            "wave": scene.wave_number,
+            "waves_completed": scene.wave_number - self.first_wave,
+            "enemies_killed": scene.enemies_killed,
+            "level_ups": self.pilot.level_ups,
+            "game_state": scene.game_state,
+            "player_health": getattr(scene.player, 'health', None),
+            "entities": {
+                name: {"max": sample[0], "mean": sample[1] / ticks, "final": sample[2]}
+                for name, sample in self.entity_samples.items()
+            },
+            "ai_lod": scene.ai_scheduler.get_statistics(),
+            "pools": {name: pool.get_statistics() for name, pool in scene.entity_manager.object_pools.items()},
+            "systems": profiler.get_statistics(),
+            "recent_frames": profiler.get_frame_statistics(),
+            "counters": profiler.get_counter_statistics()
+        }
+
+def main(argv=None):
+    """python -m src.core.headless [vagues] [graine] : joue sans fenêtre et affiche le rapport"""
+    import json
+    argv = sys.argv[1:] if argv is None else argv
+    waves = int(argv[0]) if len(argv) > 0 else 3
+    seed = int(argv[1]) if len(argv) > 1 else 0
+    runner = HeadlessRunner(seed=seed)
+    report = runner.run(waves=waves, ticks=TICK_RATE * 60 * waves)
+    print(json.dumps(report, indent=2))
+
+if __name__ == "__main__":
+    main()
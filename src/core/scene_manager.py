@@ -118,9 +118,10 @@ class SceneManager:
             pygame.quit()
             exit()
     
-    def render(self, screen):
-        """Dessine la scène active"""
+    def render(self, screen, alpha=1.0):
+        """Dessine la scène active (alpha : interpolation entre les deux derniers ticks)"""
         if self.active_scene:
+            self.active_scene.render_alpha = alpha
             if hasattr(self.active_scene, 'render'):
                 self.active_scene.render(screen)
             elif hasattr(self.active_scene, 'draw'):
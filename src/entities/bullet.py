@@ -5,6 +5,12 @@ YELLOW = (255, 255, 0)
 RED = (255, 0, 0)
 
 class Bullet:
+    __slots__ = (
+        "x", "y", "dx", "dy", "radius", "color", "rect", "damage", "is_player_bullet",
+        "piercing", "homing", "explosive", "has_hit", "holy_damage", "cursed", "chaos_power",
+        "prev_x", "prev_y", "object_pool",  # Interpolation et ObjectPool
+    )
+    
     def __init__(self, x, y, dx, dy, is_player_bullet=True, damage=10, 
                  piercing=False, size_multiplier=1.0, homing=False, explosive=False,
                  holy_damage=False, cursed=False, chaos_power=False):
@@ -92,10 +98,14 @@ class Bullet:
         self.rect.x = self.x - self.radius
         self.rect.y = self.y - self.radius
         
-        # Vérifier collision avec les murs
-        for wall in walls:
-            if self.rect.colliderect(wall.rect):
+        # Vérifier collision avec les murs (index statique du niveau si fourni)
+        if hasattr(walls, 'first_hit'):
+            if walls.first_hit(self.rect):
                 return False  # Le projectile doit être détruit
+        else:
+            for wall in walls:
+                if self.rect.colliderect(wall.rect):
+                    return False
         
         # Vérifier si hors écran
         if (self.x < 0 or self.x > screen_width or 
@@ -104,23 +114,26 @@ class Bullet:
         
         return True  # Le projectile continue
     
-    def draw(self, screen):
-        pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), self.radius)
+    def draw(self, screen, screen_x=None, screen_y=None):
+        # Coordonnées écran fournies par la scène, sinon position monde
+        x = self.x if screen_x is None else screen_x
+        y = self.y if screen_y is None else screen_y
+        pygame.draw.circle(screen, self.color, (int(x), int(y)), self.radius)
         
         # Effets visuels selon le type
         if self.explosive and self.is_player_bullet:
-            pygame.draw.circle(screen, (255, 200, 0), (int(self.x), int(self.y)), self.radius + 2, 1)
+            pygame.draw.circle(screen, (255, 200, 0), (int(x), int(y)), self.radius + 2, 1)
         
         if self.holy_damage and self.is_player_bullet:
             # Aura dorée pour les projectiles sacrés
-            pygame.draw.circle(screen, (255, 255, 150), (int(self.x), int(self.y)), self.radius + 1, 1)
+            pygame.draw.circle(screen, (255, 255, 150), (int(x), int(y)), self.radius + 1, 1)
         
         if self.cursed and self.is_player_bullet:
             # Aura rouge sombre pour les projectiles maudits
-            pygame.draw.circle(screen, (150, 0, 0), (int(self.x), int(self.y)), self.radius + 1, 1)
+            pygame.draw.circle(screen, (150, 0, 0), (int(x), int(y)), self.radius + 1, 1)
         
         if self.chaos_power and self.is_player_bullet:
             # Aura chaotique qui change
             import random
             chaos_color = (random.randint(200, 255), random.randint(0, 100), random.randint(200, 255))
-            pygame.draw.circle(screen, chaos_color, (int(self.x), int(self.y)), self.radius + 1, 1)
\ No newline at end of file
+            pygame.draw.circle(screen, chaos_color, (int(x), int(y)), self.radius + 1, 1)
\ No newline at end of file
@@ -5,11 +5,30 @@ Classes de base pour tous les ennemis
 
 import pygame
 import math
-from pathfinding import PathfindingHelper, FlockingBehavior
+from ...gameplay.pathfinding import PathfindingHelper, FlockingBehavior
+from ...utils.game_log import get_logger
+
+_log = get_logger("entities.enemies")
 
 class BaseEnemy:
     """Classe de base pour tous les ennemis - Évite la duplication de code"""
     
+    # Attributs déclarés : pas de __dict__ par instance pour les ennemis de vague.
+    # Une sous-classe sans __slots__ retrouve un __dict__ pour son état propre.
+    __slots__ = (
+        "x", "y", "width", "height", "speed", "health", "max_health", "color", "rect",
+        "animation_timer", "stuck_timer", "last_pos",
+        # Posés par les systèmes : interpolation et ObjectPool
+        "prev_x", "prev_y", "object_pool",
+    )
+    
+    # Capacités optionnelles, absentes par défaut (redéfinies par les ennemis concernés)
+    enemy_type = None  # 'demon', 'chaos'... (bonus des dégâts sacrés)
+    armor = 0  # Points d'armure (pénétration des armes à énergie)
+    apply_slow = None  # apply_slow(réduction, durée)
+    apply_burn = None  # apply_burn(dégâts par tick, durée)
+    apply_corruption = None  # apply_corruption(quantité)
+    
     def __init__(self, x, y, width, height, health, speed, color):
         self.x = x
         self.y = y
@@ -29,6 +48,10 @@ class BaseEnemy:
         # Pathfinding commun
         self.stuck_timer = 0
         self.last_pos = (x, y)
+        
+        # Interpolation : un ennemi recyclé repart de sa nouvelle position, pas de sa mort
+        self.prev_x = x
+        self.prev_y = y
     
     def update_position(self, new_x, new_y):
         """Met à jour la position et le rectangle"""
@@ -37,11 +60,16 @@ class BaseEnemy:
         self.rect.x = self.x
         self.rect.y = self.y
     
+    def get_draw_position(self, screen_x=None, screen_y=None):
+        """Position de dessin : coordonnées écran fournies, sinon position monde"""
+        return (self.x if screen_x is None else screen_x,
+                self.y if screen_y is None else screen_y)
+    
     def move_towards_player(self, player, walls):
         """Mouvement de base vers le joueur"""
         old_x, old_y = self.x, self.y
         
-        move_dx, move_dy = PathfindingHelper.get_movement_direction(
+        move_dx, move_dy = PathfindingHelper.get_chase_direction(
             self.x, self.y, player.x, player.y,
             self.width, self.height, walls, self.speed
         )
@@ -49,11 +77,7 @@ class BaseEnemy:
         self.update_position(self.x + move_dx, self.y + move_dy)
         
         # Gestion collisions
-        collision_detected = False
-        for wall in walls:
-            if self.rect.colliderect(wall.rect):
-                collision_detected = True
-                break
+        collision_detected = PathfindingHelper.find_wall_collision(self.rect, walls) is not None
         
         if collision_detected:
             self.update_position(old_x, old_y)
@@ -65,6 +89,7 @@ class BaseEnemy:
             self.stuck_timer += 1
         
         # Si vraiment bloqué longtemps, téléportation d'urgence
+        # (dernier recours : le champ de flux contourne déjà les obstacles concaves)
         if self.stuck_timer > 120:  # 2 secondes
             new_x, new_y = PathfindingHelper.find_free_spawn_position(
                 2048, 1536, self.width, self.height, walls, player, 50
@@ -88,17 +113,18 @@ class BaseEnemy:
         self.health -= damage
         return self.health <= 0
     
-    def draw_health_bar(self, screen, bar_height=3, y_offset=-6):
+    def draw_health_bar(self, screen, bar_height=3, y_offset=-6, screen_x=None, screen_y=None):
         """Dessine la barre de vie standard"""
+        x, y = self.get_draw_position(screen_x, screen_y)
         bar_width = self.width
         health_ratio = self.health / self.max_health
         
         # Fond rouge foncé
         pygame.draw.rect(screen, (100, 0, 0), 
-                        (self.x, self.y + y_offset, bar_width, bar_height))
+                        (x, y + y_offset, bar_width, bar_height))
         # Barre verte
         pygame.draw.rect(screen, (0, 255, 0), 
-                        (self.x, self.y + y_offset, bar_width * health_ratio, bar_height))
+                        (x, y + y_offset, bar_width * health_ratio, bar_height))
     
     def update(self, player, walls, other_enemies=None):
         """Méthode de base - À override dans les classes filles"""
@@ -106,15 +132,18 @@ class BaseEnemy:
         self.move_towards_player(player, walls)
         self.apply_separation(other_enemies)
     
-    def draw(self, screen):
+    def draw(self, screen, screen_x=None, screen_y=None):
         """Dessin de base - À override dans les classes filles"""
-        pygame.draw.rect(screen, self.color, (self.x, self.y, self.width, self.height))
-        self.draw_health_bar(screen)
+        x, y = self.get_draw_position(screen_x, screen_y)
+        pygame.draw.rect(screen, self.color, (x, y, self.width, self.height))
+        self.draw_health_bar(screen, screen_x=x, screen_y=y)
 
 
 class BaseBoss(BaseEnemy):
     """Classe de base pour tous les boss - Fonctionnalités communes"""
     
+    ai_lod = False  # IA à pleine cadence même hors écran (voir AILodScheduler)
+    
     def __init__(self, x, y, width, height, health, speed, color, name):
         super().__init__(x, y, width, height, health, speed, color)
         self.name = name
@@ -145,7 +174,7 @@ class BaseBoss(BaseEnemy):
     
     def on_phase_change(self, new_phase):
         """Appelé lors d'un changement de phase - À override"""
-        print(f"{self.name} entre en phase {new_phase} !")
+        _log.info("%s entre en phase %s !", self.name, new_phase)
     
     def take_damage(self, damage):
         """Dégâts avec résistance pour les boss"""
@@ -174,15 +203,16 @@ class BaseBoss(BaseEnemy):
         """Déclenche une capacité et son cooldown"""
         self.ability_timers[ability_name] = cooldown
     
-    def draw_boss_health_bar(self, screen):
+    def draw_boss_health_bar(self, screen, screen_x=None, screen_y=None):
         """Barre de vie spéciale pour boss"""
+        x, y = self.get_draw_position(screen_x, screen_y)
         bar_width = self.width * 2
         bar_height = 8
         health_ratio = self.health / self.max_health
         
         # Position centrée
-        bar_x = self.x - self.width // 2
-        bar_y = self.y - 25
+        bar_x = x - self.width // 2
+        bar_y = y - 25
         
         # Fond
         pygame.draw.rect(screen, (50, 0, 0), (bar_x, bar_y, bar_width, bar_height))
@@ -203,22 +233,24 @@ class BaseBoss(BaseEnemy):
         font = pygame.font.Font(None, 24)
         phase_text = f" - PHASE {self.phase}" if self.phase > 1 else ""
         name_text = font.render(f"{self.name}{phase_text}", True, (255, 215, 0))
-        name_rect = name_text.get_rect(center=(self.x + self.width//2, bar_y - 20))
+        name_rect = name_text.get_rect(center=(x + self.width//2, bar_y - 20))
         screen.blit(name_text, name_rect)
     
-    def draw_casting_indicator(self, screen, ability_name, progress, radius=80, color=(255, 255, 0)):
+    def draw_casting_indicator(self, screen, ability_name, progress, radius=80, color=(255, 255, 0),
+                               screen_x=None, screen_y=None):
         """Dessine un indicateur d'incantation générique"""
+        x, y = self.get_draw_position(screen_x, screen_y)
         if progress > 0:
             warning_radius = int(radius + progress * 40)
-            center_x = int(self.x + self.width // 2)
-            center_y = int(self.y + self.height // 2)
+            center_x = int(x + self.width // 2)
+            center_y = int(y + self.height // 2)
             
             pygame.draw.circle(screen, color, (center_x, center_y), warning_radius, 3)
             
             # Texte d'avertissement
             font = pygame.font.Font(None, 32)
             warning_text = font.render(ability_name, True, color)
-            text_rect = warning_text.get_rect(center=(center_x, self.y - 30))
+            text_rect = warning_text.get_rect(center=(center_x, y - 30))
             screen.blit(warning_text, text_rect)
     
     def update(self, player, walls, other_enemies=None):
@@ -226,15 +258,18 @@ class BaseBoss(BaseEnemy):
         super().update(player, walls, other_enemies)
         self.update_ability_timers()
     
-    def draw(self, screen):
+    def draw(self, screen, screen_x=None, screen_y=None):
         """Dessin de base pour boss"""
-        pygame.draw.rect(screen, self.color, (self.x, self.y, self.width, self.height))
-        self.draw_boss_health_bar(screen)
+        x, y = self.get_draw_position(screen_x, screen_y)
+        pygame.draw.rect(screen, self.color, (x, y, self.width, self.height))
+        self.draw_boss_health_bar(screen, screen_x=x, screen_y=y)
 
 
 class BaseShooter(BaseEnemy):
     """Classe de base pour les ennemis qui tirent"""
     
+    __slots__ = ("shoot_timer", "shoot_delay", "range")
+    
     def __init__(self, x, y, width, height, health, speed, color, shoot_delay=90, range_distance=200):
         super().__init__(x, y, width, height, health, speed, color)
         self.shoot_timer = 0
@@ -272,10 +307,8 @@ class BaseShooter(BaseEnemy):
             self.update_position(self.x + move_dx, self.y + move_dy)
             
             # Vérifier collisions
-            for wall in walls:
-                if self.rect.colliderect(wall.rect):
-                    self.update_position(old_x, old_y)
-                    break
+            if PathfindingHelper.find_wall_collision(self.rect, walls):
+                self.update_position(old_x, old_y)
     
     def can_shoot(self):
         """Vérifie si peut tirer"""
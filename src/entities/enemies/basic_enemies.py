@@ -6,9 +6,9 @@ BasicEnemy, ShooterEnemy, FastEnemy - Les 3 premiers types d'ennemis
 import pygame
 import math
 import random
-from bullet import Bullet
+from ..bullet import Bullet
 from .base_enemy import BaseEnemy, BaseShooter
-from pathfinding import PathfindingHelper, FlockingBehavior
+from ...gameplay.pathfinding import PathfindingHelper, FlockingBehavior
 
 # Couleurs
 BLUE = (0, 0, 255)
@@ -21,18 +21,28 @@ DARK_RED = (100, 0, 0)
 class BasicEnemy(BaseEnemy):
     """Ennemi basique qui suit le joueur"""
     
+    __slots__ = ()
+    
+    ai_batch = "basic"  # IA avancée par EnemyBatch (voir src/systems/enemy_batch.py)
+    
     def __init__(self, x, y):
         super().__init__(x, y, 24, 24, 30, 2, BLUE)
     
-    def draw(self, screen):
+    def draw(self, screen, screen_x=None, screen_y=None):
+        x, y = self.get_draw_position(screen_x, screen_y)
+        
         # Dessiner l'ennemi
-        pygame.draw.rect(screen, self.color, (self.x, self.y, self.width, self.height))
-        self.draw_health_bar(screen)
+        pygame.draw.rect(screen, self.color, (x, y, self.width, self.height))
+        self.draw_health_bar(screen, screen_x=x, screen_y=y)
 
 
 class ShooterEnemy(BaseShooter):
     """Ennemi qui tire sur le joueur"""
     
+    __slots__ = ()
+    
+    ai_batch = "shooter"
+    
     def __init__(self, x, y):
         super().__init__(x, y, 20, 20, 20, 1.5, PURPLE, shoot_delay=90, range_distance=200)
     
@@ -66,22 +76,28 @@ class ShooterEnemy(BaseShooter):
         # Force de séparation spécifique
         self.apply_separation(other_enemies)
     
-    def draw(self, screen):
+    def draw(self, screen, screen_x=None, screen_y=None):
+        x, y = self.get_draw_position(screen_x, screen_y)
+        
         # Dessiner l'ennemi
-        pygame.draw.rect(screen, self.color, (self.x, self.y, self.width, self.height))
+        pygame.draw.rect(screen, self.color, (x, y, self.width, self.height))
         
         # Indicateur de tir (cercle rouge quand prêt à tirer)
         if self.shoot_timer <= 10:
             pygame.draw.circle(screen, (255, 0, 0), 
-                             (int(self.x + self.width//2), int(self.y + self.height//2)), 3)
+                             (int(x + self.width//2), int(y + self.height//2)), 3)
         
         # Barre de vie
-        self.draw_health_bar(screen)
+        self.draw_health_bar(screen, screen_x=x, screen_y=y)
 
 
 class FastEnemy(BaseEnemy):
     """Ennemi rapide mais fragile"""
     
+    __slots__ = ("direction_timer", "target_offset_x", "target_offset_y")
+    
+    ai_batch = "fast"
+    
     def __init__(self, x, y):
         super().__init__(x, y, 16, 16, 15, 4, ORANGE)
         
@@ -107,7 +123,7 @@ class FastEnemy(BaseEnemy):
         target_y = player.y + self.target_offset_y
         
         # Utiliser le pathfinding intelligent
-        move_dx, move_dy = PathfindingHelper.get_movement_direction(
+        move_dx, move_dy = PathfindingHelper.get_chase_direction(
             self.x, self.y, target_x, target_y,
             self.width, self.height, walls, self.speed
         )
@@ -115,11 +131,7 @@ class FastEnemy(BaseEnemy):
         self.update_position(self.x + move_dx, self.y + move_dy)
         
         # Gestion collisions
-        collision = False
-        for wall in walls:
-            if self.rect.colliderect(wall.rect):
-                collision = True
-                break
+        collision = PathfindingHelper.find_wall_collision(self.rect, walls) is not None
                 
         if collision:
             self.update_position(old_x, old_y)
@@ -140,9 +152,11 @@ class FastEnemy(BaseEnemy):
             self.rect.x = self.x
             self.rect.y = self.y
     
-    def draw(self, screen):
+    def draw(self, screen, screen_x=None, screen_y=None):
+        x, y = self.get_draw_position(screen_x, screen_y)
+        
         # Corps de l'ennemi
-        pygame.draw.rect(screen, self.color, (self.x, self.y, self.width, self.height))
+        pygame.draw.rect(screen, self.color, (x, y, self.width, self.height))
         
         # Barre de vie plus petite
-        self.draw_health_bar(screen, bar_height=2, y_offset=-5)
\ No newline at end of file
+        self.draw_health_bar(screen, bar_height=2, y_offset=-5, screen_x=x, screen_y=y)
\ No newline at end of file
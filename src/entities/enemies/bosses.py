@@ -6,9 +6,14 @@ ChaosSorcererBoss, InquisitorLordBoss, DaemonPrinceBoss - Ennemis de fin de nive
 import pygame
 import math
 import random
-from bullet import Bullet
-from pathfinding import PathfindingHelper, FlockingBehavior
+from ..bullet import Bullet
+from ...gameplay.pathfinding import PathfindingHelper, FlockingBehavior
 from .base_enemy import BaseBoss
+from ...utils.game_log import get_logger
+from ...utils.profiler import profiler
+from ...utils.sprite_cache import sprite_cache
+
+_log = get_logger("entities.enemies.bosses")
 
 # Couleurs pour les boss
 CHAOS_RED = (139, 0, 0)
@@ -61,10 +66,10 @@ class ChaosSorcererBoss(BaseBoss):
         if new_phase == 2:
             self.become_more_aggressive()
             self.rage_mode = True
-            print("🔥 PHASE 2: Le Sorcier entre en rage !")
+            _log.info("🔥 PHASE 2: Le Sorcier entre en rage !")
         elif new_phase == 3:
             self.become_berserk()
-            print("💀 PHASE 3: BERSERK ! Le Sorcier est désespéré !")
+            _log.info("💀 PHASE 3: BERSERK ! Le Sorcier est désespéré !")
     
     def become_more_aggressive(self):
         """Phase 2: Plus agressif"""
@@ -100,15 +105,15 @@ class ChaosSorcererBoss(BaseBoss):
         retreat_dx = -dx
         retreat_dy = -dy
         
-        move_dx, move_dy = PathfindingHelper.get_movement_direction(
-            self.x, self.y, self.x + retreat_dx * 100, self.y + retreat_dy * 100,
-            self.width, self.height, walls, self.speed
+        # Chemin planifié : contourne les murs au lieu de s'y coincer
+        move_dx, move_dy = PathfindingHelper.follow_path(
+            self, self.x + retreat_dx * 100, self.y + retreat_dy * 100, walls, self.speed
         )
         self.update_position(self.x + move_dx, self.y + move_dy)
     
     def move_towards_player(self, player, walls):
         """Se rapproche du joueur"""
-        move_dx, move_dy = PathfindingHelper.get_movement_direction(
+        move_dx, move_dy = PathfindingHelper.get_chase_direction(
             self.x, self.y, player.x, player.y,
             self.width, self.height, walls, self.speed * 0.7
         )
@@ -125,10 +130,7 @@ class ChaosSorcererBoss(BaseBoss):
             target_x = player.x + math.cos(angle) * target_distance
             target_y = player.y + math.sin(angle) * target_distance
             
-            move_dx, move_dy = PathfindingHelper.get_movement_direction(
-                self.x, self.y, target_x, target_y,
-                self.width, self.height, walls, self.speed
-            )
+            move_dx, move_dy = PathfindingHelper.follow_path(self, target_x, target_y, walls, self.speed)
             self.update_position(self.x + move_dx, self.y + move_dy)
     
     def handle_teleportation(self, player):
@@ -222,7 +224,9 @@ class ChaosSorcererBoss(BaseBoss):
             else:  # Distance idéale, tourner autour
                 self.circle_player(player, walls)
     
-    def draw(self, screen):
+    def draw(self, screen, screen_x=None, screen_y=None):
+        x, y = self.get_draw_position(screen_x, screen_y)
+        
         # Corps du sorcier
         color = self.color
         if self.rage_mode:
@@ -233,48 +237,43 @@ class ChaosSorcererBoss(BaseBoss):
         if self.is_teleporting:
             # Effet de téléportation
             alpha = int(255 * (1 - self.teleport_animation / 60))
-            boss_surface = pygame.Surface((self.width * 2, self.height * 2))
-            boss_surface.set_alpha(alpha)
-            boss_surface.fill(color)
-            screen.blit(boss_surface, (self.x - self.width//2, self.y - self.height//2))
+            boss_surface = sprite_cache.rect(self.width * 2, self.height * 2, color, alpha)
+            screen.blit(boss_surface, (x - self.width//2, y - self.height//2))
             
             # Particules de téléportation
             for i in range(16):
                 angle = (i / 16) * 2 * math.pi + self.teleport_animation * 0.2
                 radius = 30 + self.teleport_animation
-                particle_x = self.x + self.width//2 + math.cos(angle) * radius
-                particle_y = self.y + self.height//2 + math.sin(angle) * radius
+                particle_x = x + self.width//2 + math.cos(angle) * radius
+                particle_y = y + self.height//2 + math.sin(angle) * radius
                 pygame.draw.circle(screen, (255, 0, 255), (int(particle_x), int(particle_y)), 3)
         else:
             # Corps normal
-            pygame.draw.rect(screen, color, (self.x, self.y, self.width, self.height))
+            pygame.draw.rect(screen, color, (x, y, self.width, self.height))
             
             # Ornements du sorcier
-            center_x = self.x + self.width // 2
-            center_y = self.y + self.height // 2
+            center_x = x + self.width // 2
+            center_y = y + self.height // 2
             
             # Robe + Staff
             pygame.draw.rect(screen, (100, 0, 100), 
-                           (self.x + 8, self.y + 8, self.width - 16, self.height - 16))
+                           (x + 8, y + 8, self.width - 16, self.height - 16))
             pygame.draw.circle(screen, (255, 215, 0), (center_x, center_y), 8)
             
             # Aura de puissance
             aura_radius = int(25 + math.sin(self.animation_timer * 0.1) * 5)
-            aura_surface = pygame.Surface((aura_radius * 2, aura_radius * 2))
             aura_intensity = 30 if self.phase == 1 else 50 if self.phase == 2 else 80
-            aura_surface.set_alpha(aura_intensity)
             aura_color = (150, 0, 150) if self.phase < 3 else (255, 0, 0)
-            pygame.draw.circle(aura_surface, aura_color, 
-                             (aura_radius, aura_radius), aura_radius)
+            aura_surface = sprite_cache.circle(aura_radius, aura_color, aura_intensity)
             screen.blit(aura_surface, (center_x - aura_radius, center_y - aura_radius))
         
         # Indicateur d'incantation
         if self.is_casting_area:
             cast_progress = self.area_cast_timer / 120
-            self.draw_casting_indicator(screen, "SORT PUISSANT !", cast_progress, 80, (255, 255, 0))
+            self.draw_casting_indicator(screen, "SORT PUISSANT !", cast_progress, 80, (255, 255, 0), screen_x=x, screen_y=y)
         
         # Barre de vie du boss
-        self.draw_boss_health_bar(screen)
+        self.draw_boss_health_bar(screen, screen_x=x, screen_y=y)
 
 
 class InquisitorLordBoss(BaseBoss):
@@ -323,7 +322,7 @@ class InquisitorLordBoss(BaseBoss):
         
         if new_phase == 2:
             self.become_righteous()
-            print("⚡ COLÈRE SAINTE ! L'Inquisiteur devient redoutable !")
+            _log.info("⚡ COLÈRE SAINTE ! L'Inquisiteur devient redoutable !")
     
     def become_righteous(self):
         """Mode colère sainte"""
@@ -343,7 +342,7 @@ class InquisitorLordBoss(BaseBoss):
     
     def advance_on_heretic(self, player, walls):
         """Avance inexorablement vers l'hérétique"""
-        move_dx, move_dy = PathfindingHelper.get_movement_direction(
+        move_dx, move_dy = PathfindingHelper.get_chase_direction(
             self.x, self.y, player.x, player.y,
             self.width, self.height, walls, self.speed
         )
@@ -357,17 +356,18 @@ class InquisitorLordBoss(BaseBoss):
             angle = math.atan2(dy, dx)
             angle += 1.0  # Mouvement latéral
             
-            move_x = math.cos(angle) * self.speed * 0.8
-            move_y = math.sin(angle) * self.speed * 0.8
+            # Point de passage un peu plus loin sur le côté, rejoint par un chemin planifié
+            move_x, move_y = PathfindingHelper.follow_path(
+                self, self.x + math.cos(angle) * 64, self.y + math.sin(angle) * 64,
+                walls, self.speed * 0.8
+            )
             
             old_x, old_y = self.x, self.y
             self.update_position(self.x + move_x, self.y + move_y)
             
             # Vérifier collisions
-            for wall in walls:
-                if self.rect.colliderect(wall.rect):
-                    self.update_position(old_x, old_y)
-                    break
+            if PathfindingHelper.find_wall_collision(self.rect, walls):
+                self.update_position(old_x, old_y)
     
     def handle_purification(self):
         """Gère l'incantation de purification"""
@@ -487,7 +487,9 @@ class InquisitorLordBoss(BaseBoss):
         # Mise à jour du bouclier
         self.update_shield()
     
-    def draw(self, screen):
+    def draw(self, screen, screen_x=None, screen_y=None):
+        x, y = self.get_draw_position(screen_x, screen_y)
+        
         # Corps de l'Inquisiteur
         color = self.color
         if self.righteous_fury:
@@ -495,15 +497,15 @@ class InquisitorLordBoss(BaseBoss):
             flash = (self.animation_timer // 8) % 2
             color = (255, 255, 200) if flash else self.color
         
-        pygame.draw.rect(screen, color, (self.x, self.y, self.width, self.height))
+        pygame.draw.rect(screen, color, (x, y, self.width, self.height))
         
         # Ornements impériaux
-        center_x = self.x + self.width // 2
-        center_y = self.y + self.height // 2
+        center_x = x + self.width // 2
+        center_y = y + self.height // 2
         
         # Armure détaillée
         pygame.draw.rect(screen, (200, 200, 200), 
-                        (self.x + 5, self.y + 5, self.width - 10, self.height - 10), 3)
+                        (x + 5, y + 5, self.width - 10, self.height - 10), 3)
         
         # Symbole de l'Inquisition (Crâne)
         pygame.draw.circle(screen, (255, 255, 255), (center_x, center_y), 8)
@@ -513,10 +515,7 @@ class InquisitorLordBoss(BaseBoss):
         # Bouclier de foi
         if self.shield_active:
             shield_radius = int(30 + math.sin(self.animation_timer * 0.2) * 3)
-            shield_surface = pygame.Surface((shield_radius * 2, shield_radius * 2))
-            shield_surface.set_alpha(80)
-            pygame.draw.circle(shield_surface, (255, 255, 200), 
-                             (shield_radius, shield_radius), shield_radius)
+            shield_surface = sprite_cache.circle(shield_radius, (255, 255, 200), 80)
             screen.blit(shield_surface, (center_x - shield_radius, center_y - shield_radius))
             
             # Bordure du bouclier
@@ -525,7 +524,7 @@ class InquisitorLordBoss(BaseBoss):
         # Aura de purification
         if self.is_purifying:
             purif_progress = self.purification_timer / 150
-            self.draw_casting_indicator(screen, "PURIFICATION !", purif_progress, 120, (255, 255, 0))
+            self.draw_casting_indicator(screen, "PURIFICATION !", purif_progress, 120, (255, 255, 0), screen_x=x, screen_y=y)
             
             # Rayons de purification
             warning_radius = int(120 + purif_progress * 80)
@@ -541,15 +540,13 @@ class InquisitorLordBoss(BaseBoss):
             # Traînée de charge dorée
             for i in range(8):
                 trail_alpha = int(255 * (1 - i / 8))
-                trail_surface = pygame.Surface((self.width, self.height))
-                trail_surface.set_alpha(trail_alpha)
-                trail_surface.fill((255, 215, 0))
-                trail_x = self.x - (i * 3)
-                trail_y = self.y - (i * 3)
+                trail_surface = sprite_cache.rect(self.width, self.height, (255, 215, 0), trail_alpha)
+                trail_x = x - (i * 3)
+                trail_y = y - (i * 3)
                 screen.blit(trail_surface, (trail_x, trail_y))
         
         # Barre de vie du boss
-        self.draw_boss_health_bar(screen)
+        self.draw_boss_health_bar(screen, screen_x=x, screen_y=y)
 
 
 class DaemonPrinceBoss(BaseBoss):
@@ -625,7 +622,7 @@ class DaemonPrinceBoss(BaseBoss):
         self.ability_delays['chaos_teleport'] = 80
         self.ability_delays['corruption_wave'] = 150
         
-        print("💀🔥 LE PRINCE DAEMON SE TRANSFORME ! FORME ULTIME !")
+        _log.info("💀🔥 LE PRINCE DAEMON SE TRANSFORME ! FORME ULTIME !")
     
     def handle_regeneration(self):
         """Régénération chaotique"""
@@ -657,7 +654,7 @@ class DaemonPrinceBoss(BaseBoss):
     
     def aggressive_pursuit(self, player, walls):
         """Poursuite agressive"""
-        move_dx, move_dy = PathfindingHelper.get_movement_direction(
+        move_dx, move_dy = PathfindingHelper.get_chase_direction(
             self.x, self.y, player.x, player.y,
             self.width, self.height, walls, self.speed * 1.2
         )
@@ -792,14 +789,16 @@ class DaemonPrinceBoss(BaseBoss):
             # Mouvement chaotique et imprévisible
             self.chaotic_movement(player, walls, distance)
     
-    def draw(self, screen):
-        center_x = self.x + self.width // 2
-        center_y = self.y + self.height // 2
+    def draw(self, screen, screen_x=None, screen_y=None):
+        x, y = self.get_draw_position(screen_x, screen_y)
+        center_x = x + self.width // 2
+        center_y = y + self.height // 2
         
         if self.is_teleporting:
             # Effet de téléportation chaotique
             alpha = int(255 * (1 - self.teleport_animation / 40))
             chaos_surface = pygame.Surface((self.width * 3, self.height * 3))
+            profiler.count("surfaces.allocated")  # Contenu aléatoire : pas de cache
             chaos_surface.set_alpha(alpha)
             
             # Distorsion chaotique
@@ -811,34 +810,34 @@ class DaemonPrinceBoss(BaseBoss):
                 pygame.draw.circle(chaos_surface, color, 
                                  (self.width + offset_x, self.height + offset_y), size)
             
-            screen.blit(chaos_surface, (self.x - self.width, self.y - self.height))
+            screen.blit(chaos_surface, (x - self.width, y - self.height))
         else:
             # Corps du Prince Daemon
             form_color = self.color if self.chaos_form == 1 else (100, 0, 100)
             
             # Effet de distorsion permanente
             distortion_offset = math.sin(self.animation_timer * 0.1) * 2
-            daemon_rect = (self.x + distortion_offset, self.y, self.width, self.height)
+            daemon_rect = (x + distortion_offset, y, self.width, self.height)
             pygame.draw.rect(screen, form_color, daemon_rect)
             
             # Ornements daemoniques
             if self.chaos_form == 2:
                 # Forme transformée - plus imposante
                 pygame.draw.rect(screen, (150, 0, 150), 
-                               (self.x + 10, self.y + 10, self.width - 20, self.height - 20))
+                               (x + 10, y + 10, self.width - 20, self.height - 20))
                 
                 # Cornes
                 horn_points = [
-                    (center_x - 15, self.y + 10),
-                    (center_x - 20, self.y - 10),
-                    (center_x - 10, self.y)
+                    (center_x - 15, y + 10),
+                    (center_x - 20, y - 10),
+                    (center_x - 10, y)
                 ]
                 pygame.draw.polygon(screen, (200, 0, 0), horn_points)
                 
                 horn_points_2 = [
-                    (center_x + 15, self.y + 10),
-                    (center_x + 20, self.y - 10),
-                    (center_x + 10, self.y)
+                    (center_x + 15, y + 10),
+                    (center_x + 20, y - 10),
+                    (center_x + 10, y)
                 ]
                 pygame.draw.polygon(screen, (200, 0, 0), horn_points_2)
             
@@ -848,14 +847,10 @@ class DaemonPrinceBoss(BaseBoss):
                 aura_radius += 20
             
             # Multiples auras chaotiques
+            colors = [(150, 0, 150), (200, 0, 200), (100, 0, 100)]
             for i in range(3):
-                aura_surface = pygame.Surface(((aura_radius + i*10) * 2, (aura_radius + i*10) * 2))
                 alpha = 40 - i*10
-                aura_surface.set_alpha(alpha)
-                
-                colors = [(150, 0, 150), (200, 0, 200), (100, 0, 100)]
-                pygame.draw.circle(aura_surface, colors[i], 
-                                 (aura_radius + i*10, aura_radius + i*10), aura_radius + i*10)
+                aura_surface = sprite_cache.circle(aura_radius + i*10, colors[i], alpha)
                 
                 screen.blit(aura_surface, 
                            (center_x - aura_radius - i*10, center_y - aura_radius - i*10))
@@ -863,7 +858,7 @@ class DaemonPrinceBoss(BaseBoss):
         # Tempête Warp
         if self.is_summoning_storm:
             storm_progress = self.storm_cast_timer / 180
-            self.draw_casting_indicator(screen, "TEMPÊTE WARP !", storm_progress, 150, (255, 0, 255))
+            self.draw_casting_indicator(screen, "TEMPÊTE WARP !", storm_progress, 150, (255, 0, 255), screen_x=x, screen_y=y)
             
             # Éclairs chaotiques
             storm_radius = int(150 + storm_progress * 100)
@@ -877,11 +872,11 @@ class DaemonPrinceBoss(BaseBoss):
                 pygame.draw.line(screen, lightning_color, (center_x, center_y), (end_x, end_y), 4)
         
         # Barre de vie massive
-        self.draw_boss_health_bar(screen)
+        self.draw_boss_health_bar(screen, screen_x=x, screen_y=y)
         
         # Indicateur de régénération
         if self.regeneration_timer > 30:
             font = pygame.font.Font(None, 24)
             regen_text = font.render("RÉGÉNÉRATION", True, (150, 255, 150))
-            regen_rect = regen_text.get_rect(center=(center_x, self.y + self.height + 20))
+            regen_rect = regen_text.get_rect(center=(center_x, y + self.height + 20))
             screen.blit(regen_text, regen_rect)
\ No newline at end of file
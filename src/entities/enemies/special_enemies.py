@@ -6,8 +6,8 @@ CultistEnemy, RenegadeMarineEnemy, DaemonEnemy - Ennemis avec capacités uniques
 import pygame
 import math
 import random
-from bullet import Bullet
-from pathfinding import PathfindingHelper, FlockingBehavior
+from ..bullet import Bullet
+from ...gameplay.pathfinding import PathfindingHelper, FlockingBehavior
 from .base_enemy import BaseEnemy
 
 # Couleurs pour les ennemis spéciaux
@@ -84,7 +84,7 @@ class CultistEnemy(BaseEnemy):
             self.attempt_sacrifice(player)
         else:
             # Mouvement normal vers le joueur avec bonus de groupe
-            move_dx, move_dy = PathfindingHelper.get_movement_direction(
+            move_dx, move_dy = PathfindingHelper.get_chase_direction(
                 self.x, self.y, player.x, player.y,
                 self.width, self.height, walls, self.speed * self.group_bonus
             )
@@ -92,11 +92,7 @@ class CultistEnemy(BaseEnemy):
             self.update_position(self.x + move_dx, self.y + move_dy)
         
         # Gestion collisions
-        collision_detected = False
-        for wall in walls:
-            if self.rect.colliderect(wall.rect):
-                collision_detected = True
-                break
+        collision_detected = PathfindingHelper.find_wall_collision(self.rect, walls) is not None
         
         if collision_detected:
             self.update_position(old_x, old_y)
@@ -117,7 +113,9 @@ class CultistEnemy(BaseEnemy):
         
         self.animation_timer += 1
     
-    def draw(self, screen):
+    def draw(self, screen, screen_x=None, screen_y=None):
+        x, y = self.get_draw_position(screen_x, screen_y)
+        
         # Corps du cultiste
         color = self.color
         if self.is_summoning:
@@ -125,11 +123,11 @@ class CultistEnemy(BaseEnemy):
             flash = (self.summon_animation // 5) % 2
             color = (255, 0, 255) if flash else self.color
         
-        pygame.draw.rect(screen, color, (self.x, self.y, self.width, self.height))
+        pygame.draw.rect(screen, color, (x, y, self.width, self.height))
         
         # Symbole du chaos au centre
-        center_x = self.x + self.width // 2
-        center_y = self.y + self.height // 2
+        center_x = x + self.width // 2
+        center_y = y + self.height // 2
         pygame.draw.circle(screen, (255, 255, 255), (center_x, center_y), 3)
         
         # Cercle d'invocation si en train d'invoquer
@@ -138,7 +136,7 @@ class CultistEnemy(BaseEnemy):
             pygame.draw.circle(screen, (150, 0, 150), (center_x, center_y), circle_radius, 2)
         
         # Barre de vie
-        self.draw_health_bar(screen)
+        self.draw_health_bar(screen, screen_x=x, screen_y=y)
 
 
 class RenegadeMarineEnemy(BaseEnemy):
@@ -181,13 +179,22 @@ class RenegadeMarineEnemy(BaseEnemy):
         self.charge_target_y = player.y
         self.charge_duration = 40  # Durée de la charge
         self.charge_cooldown = self.charge_delay
+        self.path_goal = None  # Nouvelle charge : replanifier même vers la même case
     
-    def perform_charge(self):
-        """Exécute la charge"""
+    def perform_charge(self, walls=None):
+        """Exécute la charge (le long d'un chemin planifié si les murs sont connus)"""
         if self.charge_duration <= 0:
             self.is_charging = False
             return
         
+        if walls is not None:
+            move_dx, move_dy = PathfindingHelper.follow_path(
+                self, self.charge_target_x, self.charge_target_y, walls, self.charge_speed
+            )
+            self.update_position(self.x + move_dx, self.y + move_dy)
+            self.charge_duration -= 1
+            return
+        
         # Direction vers la cible
         dx = self.charge_target_x - self.x
         dy = self.charge_target_y - self.y
@@ -211,12 +218,12 @@ class RenegadeMarineEnemy(BaseEnemy):
         
         # Gestion de la charge
         if self.is_charging:
-            self.perform_charge()
+            self.perform_charge(walls)
         elif self.can_charge(player):
             self.start_charge(player)
         else:
             # Mouvement normal (lent mais inexorable)
-            move_dx, move_dy = PathfindingHelper.get_movement_direction(
+            move_dx, move_dy = PathfindingHelper.get_chase_direction(
                 self.x, self.y, player.x, player.y,
                 self.width, self.height, walls, self.speed
             )
@@ -232,14 +239,12 @@ class RenegadeMarineEnemy(BaseEnemy):
             self.rect.y = self.y
         
         # Gestion collisions
-        for wall in walls:
-            if self.rect.colliderect(wall.rect):
-                if self.is_charging:
-                    # Arrêter la charge si on touche un mur
-                    self.is_charging = False
-                    self.charge_duration = 0
-                self.update_position(old_x, old_y)
-                break
+        if PathfindingHelper.find_wall_collision(self.rect, walls):
+            if self.is_charging:
+                # Arrêter la charge si on touche un mur
+                self.is_charging = False
+                self.charge_duration = 0
+            self.update_position(old_x, old_y)
         
         # Timers
         if self.charge_cooldown > 0:
@@ -253,23 +258,25 @@ class RenegadeMarineEnemy(BaseEnemy):
         self.health -= reduced_damage
         return self.health <= 0
     
-    def draw(self, screen):
+    def draw(self, screen, screen_x=None, screen_y=None):
+        x, y = self.get_draw_position(screen_x, screen_y)
+        
         # Corps du marine (plus gros)
         color = self.color
         if self.is_charging:
             # Rouge pendant la charge
             color = CRIMSON
         
-        pygame.draw.rect(screen, color, (self.x, self.y, self.width, self.height))
+        pygame.draw.rect(screen, color, (x, y, self.width, self.height))
         
         # Armure détaillée
         pygame.draw.rect(screen, (150, 150, 150), 
-                        (self.x + 5, self.y + 5, self.width - 10, self.height - 10), 2)
+                        (x + 5, y + 5, self.width - 10, self.height - 10), 2)
         
         # Indicateur de charge
         if self.charge_cooldown <= 60 and not self.is_charging:  # Prêt à charger
-            center_x = self.x + self.width // 2
-            center_y = self.y + self.height // 2
+            center_x = x + self.width // 2
+            center_y = y + self.height // 2
             pygame.draw.circle(screen, (255, 0, 0), (center_x, center_y), 5)
         
         # Effet de charge
@@ -280,12 +287,12 @@ class RenegadeMarineEnemy(BaseEnemy):
                 trail_surface = pygame.Surface((self.width, self.height))
                 trail_surface.set_alpha(alpha)
                 trail_surface.fill(CRIMSON)
-                trail_x = self.x - (i * 3)
-                trail_y = self.y - (i * 3)
+                trail_x = x - (i * 3)
+                trail_y = y - (i * 3)
                 screen.blit(trail_surface, (trail_x, trail_y))
         
         # Barre de vie (plus épaisse pour les marines)
-        self.draw_health_bar(screen, bar_height=4, y_offset=-8)
+        self.draw_health_bar(screen, bar_height=4, y_offset=-8, screen_x=x, screen_y=y)
 
 
 class DaemonEnemy(BaseEnemy):
@@ -358,9 +365,8 @@ class DaemonEnemy(BaseEnemy):
         test_rect = pygame.Rect(x, y, self.width, self.height)
         
         # Vérifier qu'on n'est pas dans un mur
-        for wall in walls:
-            if test_rect.colliderect(wall.rect):
-                return False
+        if PathfindingHelper.find_wall_collision(test_rect, walls):
+            return False
         
         # Vérifier qu'on n'est pas hors du monde
         if x < 30 or y < 30 or x > 2018 or y > 1506:
@@ -374,16 +380,19 @@ class DaemonEnemy(BaseEnemy):
         max_attempts = 10
         
         while attempts < max_attempts:
-            # Choisir une position à une distance raisonnable
-            angle = random.uniform(0, 2 * math.pi)
-            # Distance entre 60 et 120 pixels (ni trop près ni trop loin)
-            distance = random.uniform(60, 120)
-            
-            new_x = player.x + math.cos(angle) * distance
-            new_y = player.y + math.sin(angle) * distance
+            # Position libre tirée entre 60 et 120 pixels (ni trop près ni trop loin)
+            position = PathfindingHelper.find_free_position_near(
+                player.x, player.y, 60, 120, self.width, self.height, walls, margin=30
+            )
+            if position is None:
+                attempts = max_attempts
+                break
+            new_x, new_y = position
             
-            # Vérifier que la position est valide
-            if self.is_valid_teleport_position(new_x, new_y, walls):
+            # Vérifier que la position est valide et qu'on peut rejoindre le joueur depuis là
+            if (self.is_valid_teleport_position(new_x, new_y, walls) and
+                    PathfindingHelper.is_reachable(new_x, new_y, player.x, player.y,
+                                                   self.width, self.height, walls)):
                 self.update_position(new_x, new_y)
                 break
             
@@ -437,7 +446,7 @@ class DaemonEnemy(BaseEnemy):
             # Mouvement normal mais moins agressif
             if distance > self.preferred_distance:
                 # S'approcher si trop loin
-                move_dx, move_dy = PathfindingHelper.get_movement_direction(
+                move_dx, move_dy = PathfindingHelper.get_chase_direction(
                     self.x, self.y, player.x, player.y,
                     self.width, self.height, walls, self.speed
                 )
@@ -456,12 +465,10 @@ class DaemonEnemy(BaseEnemy):
         
         # Gestion collisions (phase réduite)
         if not self.is_teleporting:
-            for wall in walls:
-                if self.rect.colliderect(wall.rect):
-                    # 20% de chance d'ignorer les murs (réduit de 30%)
-                    if random.random() > 0.2:
-                        self.update_position(old_x, old_y)
-                    break
+            if PathfindingHelper.find_wall_collision(self.rect, walls):
+                # 20% de chance d'ignorer les murs (réduit de 30%)
+                if random.random() > 0.2:
+                    self.update_position(old_x, old_y)
         
         # Timers
         if self.teleport_cooldown > 0:
@@ -473,9 +480,10 @@ class DaemonEnemy(BaseEnemy):
         self.last_teleport_time += 1
         self.animation_timer += 1
     
-    def draw(self, screen):
-        center_x = self.x + self.width // 2
-        center_y = self.y + self.height // 2
+    def draw(self, screen, screen_x=None, screen_y=None):
+        x, y = self.get_draw_position(screen_x, screen_y)
+        center_x = x + self.width // 2
+        center_y = y + self.height // 2
         
         if self.is_teleporting:
             # Effet de téléportation plus visible
@@ -483,7 +491,7 @@ class DaemonEnemy(BaseEnemy):
             demon_surface = pygame.Surface((self.width * 2, self.height * 2))
             demon_surface.set_alpha(alpha)
             demon_surface.fill(self.color)
-            screen.blit(demon_surface, (self.x - self.width//2, self.y - self.height//2))
+            screen.blit(demon_surface, (x - self.width//2, y - self.height//2))
             
             # Particules de téléportation plus visibles
             for i in range(12):
@@ -499,12 +507,12 @@ class DaemonEnemy(BaseEnemy):
             if self.teleport_animation < 30:
                 font = pygame.font.Font(None, 24)
                 warning_text = font.render("TÉLÉPORTATION", True, (255, 255, 0))
-                text_rect = warning_text.get_rect(center=(center_x, self.y - 20))
+                text_rect = warning_text.get_rect(center=(center_x, y - 20))
                 screen.blit(warning_text, text_rect)
         else:
             # Corps du démon avec effet de phase
             phase_offset = math.sin(self.phase_timer * 0.1) * 1
-            demon_rect = (self.x + phase_offset, self.y, self.width, self.height)
+            demon_rect = (x + phase_offset, y, self.width, self.height)
             pygame.draw.rect(screen, self.color, demon_rect)
             
             # Aura démoniaque moins agressive
@@ -517,9 +525,9 @@ class DaemonEnemy(BaseEnemy):
             screen.blit(aura_surface, (center_x - aura_radius, center_y - aura_radius))
             
             # Yeux brillants
-            eye_y = self.y + 6
-            pygame.draw.circle(screen, (255, 0, 0), (int(self.x + 6), int(eye_y)), 2)
-            pygame.draw.circle(screen, (255, 0, 0), (int(self.x + 14), int(eye_y)), 2)
+            eye_y = y + 6
+            pygame.draw.circle(screen, (255, 0, 0), (int(x + 6), int(eye_y)), 2)
+            pygame.draw.circle(screen, (255, 0, 0), (int(x + 14), int(eye_y)), 2)
             
             # Indicateur de téléportation imminente
             if self.teleport_cooldown <= 30 and not self.is_teleporting:
@@ -528,10 +536,10 @@ class DaemonEnemy(BaseEnemy):
         
         # Barre de vie
         if not self.is_teleporting:
-            self.draw_health_bar(screen, bar_height=2, y_offset=-5)
+            self.draw_health_bar(screen, bar_height=2, y_offset=-5, screen_x=x, screen_y=y)
             
             # Indicateur de durée de vie si invoqué
             if self.is_summoned and self.lifespan > 0:
                 life_ratio = self.lifespan / 600
                 life_width = int(self.width * life_ratio)
-                pygame.draw.rect(screen, (255, 255, 0), (self.x, self.y - 8, life_width, 1))
\ No newline at end of file
+                pygame.draw.rect(screen, (255, 255, 0), (x, y - 8, life_width, 1))
\ No newline at end of file
@@ -1,6 +1,10 @@
 import pygame
 import math
 from ..systems.weapon_manager import WeaponManager, Weapon
+from ..gameplay.pathfinding import PathfindingHelper
+from ..utils.game_log import get_logger
+
+_log = get_logger("entities.player")
 
 # Couleurs
 RED = (255, 0, 0)
@@ -8,6 +12,15 @@ GREEN = (0, 255, 0)
 DARK_RED = (100, 0, 0)
 
 class Player:
+    __slots__ = (
+        "x", "y", "width", "height", "speed", "health", "max_health", "rect",
+        "weapon_manager", "weapons", "current_weapon_index", "current_weapon", "obtained_weapon_ids",
+        "global_upgrades", "invincible_timer", "invincible_duration", "flash_timer", "health_regen",
+        "base_max_health", "morality_speed_modifier", "_last_weapon_keys", "_reload_key_pressed",
+        # Posés par les objets (ItemManager) et l'interpolation
+        "base_damage", "shoot_delay", "unstable", "prev_x", "prev_y",
+    )
+    
     def __init__(self, x, y):
         self.x = x
         self.y = y
@@ -104,7 +117,7 @@ class Player:
                     self.current_weapon.start_reload()
                     weapon_info = self.current_weapon.get_info()
                     if weapon_info.get('max_ammo', -1) > 0:
-                        print(f"🔄 Rechargement manuel: {weapon_info['name']}")
+                        _log.info("🔄 Rechargement manuel: %s", weapon_info['name'])
         else:
             self._reload_key_pressed = False
         
@@ -113,13 +126,11 @@ class Player:
         self.rect.y = self.y
         
         # Vérifier les collisions avec les murs
-        for wall in walls:
-            if self.rect.colliderect(wall.rect):
-                # Collision détectée, revenir à l'ancienne position
-                self.x, self.y = old_x, old_y
-                self.rect.x = self.x
-                self.rect.y = self.y
-                break
+        if PathfindingHelper.find_wall_collision(self.rect, walls):
+            # Collision détectée, revenir à l'ancienne position
+            self.x, self.y = old_x, old_y
+            self.rect.x = self.x
+            self.rect.y = self.y
         
         # Timer de tir legacy supprimé - maintenant géré par chaque arme individuellement
             
@@ -161,7 +172,11 @@ class Player:
                 return True  # Joueur mort
         return False
     
-    def draw(self, screen):
+    def draw(self, screen, screen_x=None, screen_y=None):
+        # Coordonnées écran fournies par la scène, sinon position monde
+        x = self.x if screen_x is None else screen_x
+        y = self.y if screen_y is None else screen_y
+        
         # Effet de clignotement si invincible
         should_draw = True
         if self.invincible_timer > 0:
@@ -170,7 +185,7 @@ class Player:
         
         if should_draw:
             # Dessiner le joueur en rouge
-            pygame.draw.rect(screen, RED, (self.x, self.y, self.width, self.height))
+            pygame.draw.rect(screen, RED, (x, y, self.width, self.height))
         
         # Barre de vie (toujours visible)
         bar_width = self.width
@@ -179,10 +194,10 @@ class Player:
         
         # Fond de la barre (rouge foncé)
         pygame.draw.rect(screen, DARK_RED, 
-                        (self.x, self.y - 8, bar_width, bar_height))
+                        (x, y - 8, bar_width, bar_height))
         # Barre de vie (vert)
         pygame.draw.rect(screen, GREEN, 
-                        (self.x, self.y - 8, bar_width * health_ratio, bar_height))
+                        (x, y - 8, bar_width * health_ratio, bar_height))
     
     # === NOUVELLES MÉTHODES POUR LE SYSTÈME MULTI-ARMES ===
     
@@ -190,12 +205,12 @@ class Player:
         """Ajoute une nouvelle arme à l'inventaire du joueur"""
         # Vérifier si déjà possédée
         if weapon_id in self.obtained_weapon_ids:
-            print(f"❌ Arme {weapon_id} déjà possédée")
+            _log.warning("❌ Arme %s déjà possédée", weapon_id)
             return False
         
         # Vérifier disponibilité
         if not self.weapon_manager.is_weapon_available(weapon_id, morality_system):
-            print(f"❌ Arme {weapon_id} non disponible avec moralité actuelle")
+            _log.warning("❌ Arme %s non disponible avec moralité actuelle", weapon_id)
             return False
         
         try:
@@ -206,10 +221,10 @@ class Player:
             # Appliquer les améliorations globales à la nouvelle arme
             self._apply_global_upgrades_to_weapon(new_weapon)
             
-            print(f"🔫 Nouvelle arme obtenue: {new_weapon.weapon_data['name']} (#{len(self.weapons)})")
+            _log.info("🔫 Nouvelle arme obtenue: %s (#%s)", new_weapon.weapon_data['name'], len(self.weapons))
             return True
         except ValueError as e:
-            print(f"❌ Erreur ajout d'arme: {e}")
+            _log.error("❌ Erreur ajout d'arme: %s", e)
             return False
     
     def switch_weapon(self, weapon_index: int):
@@ -219,7 +234,7 @@ class Player:
             self.current_weapon_index = weapon_index
             self.current_weapon = self.weapons[weapon_index]
             new_weapon = self.current_weapon.weapon_data['name']
-            print(f"🔄 Changement d'arme: {old_weapon} → {new_weapon}")
+            _log.info("🔄 Changement d'arme: %s → %s", old_weapon, new_weapon)
     
     def change_weapon(self, weapon_id: str, morality_system=None) -> bool:
         """LEGACY: Change l'arme du joueur (remplacé par add_weapon)"""
@@ -274,8 +289,11 @@ class Player:
         for weapon in self.weapons:
             self._apply_global_upgrades_to_weapon(weapon)
         
-        print(f"🌟 Amélioration globale appliquée: {upgrade_type} (+{value})")
-        print(f"   Affecte {len(self.weapons)} arme(s)")
+        # Les plans compilés dépendant des améliorations sont à recompiler
+        self.weapon_manager.invalidate_blueprints()
+        
+        _log.info("🌟 Amélioration globale appliquée: %s (+%s)", upgrade_type, value)
+        _log.info("   Affecte %s arme(s)", len(self.weapons))
     
     def _apply_global_upgrades_to_weapon(self, weapon):
         """Applique les améliorations globales à une arme spécifique"""
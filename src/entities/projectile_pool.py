@@ -0,0 +1,404 @@
+"""
+Pool de projectiles en structure de tableaux (NumPy)
+Alternative aux objets WeaponProjectile pour les tirs simples : position,
+vitesse, rayon, dégâts, âge, durée de vie et drapeaux sont stockés dans des
+tableaux préalloués et mis à jour en une seule passe vectorisée par frame.
+Les projectiles spéciaux (autoguidés, mêlée, explosifs) restent des objets.
+"""
+import numpy as np
+import pygame
+from ..core.constants import WORLD_WIDTH, WORLD_HEIGHT, COLLISION_CELL_SIZE
+from .weapon_blueprint import FLAG_PIERCING, FLAG_TRAIL, FLAG_EXPLOSIVE, FLAG_HOMING, FLAG_MELEE
+from ..utils.object_pool import release_to_pool
+
+# Comportements qui imposent le chemin objet (WeaponProjectile)
+OBJECT_ONLY_FLAGS = FLAG_EXPLOSIVE | FLAG_HOMING | FLAG_MELEE
+
+# Longueur de la traînée dessinée, en frames de déplacement
+TRAIL_FRAMES = 8
+
+# Marge hors du monde avant élimination (px), la même que WeaponProjectile.update
+WORLD_MARGIN = 100
+
+class ProjectilePool:
+    """Stockage vectorisé des projectiles simples"""
+
+    def __init__(self, capacity=1024, world_width=WORLD_WIDTH, world_height=WORLD_HEIGHT,
+                 cell_size=COLLISION_CELL_SIZE):
+        self.world_width = world_width
+        self.world_height = world_height
+        self.cell_size = cell_size
+        self.count = 0
+        self.capacity = 0
+
+        self.stats = {
+            "spawned": 0,
+            "expired": 0,
+            "culled": 0,
+            "wall_hits": 0,
+            "enemy_hits": 0,
+            "grown": 0
+        }
+
+        self._allocate(capacity)
+
+        # Sprites pré-rendus par (rayon, couleur, couleur d'anneau)
+        self._sprites = {}
+
+    # === STOCKAGE ===
+
+    def _allocate(self, capacity):
+        """(Ré)alloue les tableaux en conservant les projectiles vivants"""
+        old_count = self.count
+        old = None
+        if self.capacity:
+            old = (self.x, self.y, self.dx, self.dy, self.radius, self.damage, self.age,
+                   self.lifetime, self.flags, self.pierce_left, self.damage_reduction,
+                   self.last_hit, self.color, self.ring_color)
+
+        self.x = np.zeros(capacity, dtype=np.float64)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        self.dx = np.zeros(capacity, dtype=np.float64)
+        self.dy = np.zeros(capacity, dtype=np.float64)
+        self.radius = np.zeros(capacity, dtype=np.float64)
+        self.damage = np.zeros(capacity, dtype=np.float64)
+        self.age = np.zeros(capacity, dtype=np.int32)
+        self.lifetime = np.zeros(capacity, dtype=np.int32)
+        self.flags = np.zeros(capacity, dtype=np.uint8)
+        self.pierce_left = np.zeros(capacity, dtype=np.int32)
+        self.damage_reduction = np.zeros(capacity, dtype=np.float64)
+        self.last_hit = np.zeros(capacity, dtype=np.int64)  # id() du dernier ennemi touché
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self.ring_color = np.zeros((capacity, 3), dtype=np.int16)  # -1 = pas d'anneau
+
+        if old is not None:
+            for new_array, old_array in zip((self.x, self.y, self.dx, self.dy, self.radius, self.damage,
+                                             self.age, self.lifetime, self.flags, self.pierce_left,
+                                             self.damage_reduction, self.last_hit, self.color,
+                                             self.ring_color), old):
+                new_array[:old_count] = old_array[:old_count]
+            self.sources.extend([None] * (capacity - self.capacity))
+        else:
+            # Objet partagé par projectile (données d'arme) pour les effets au contact
+            self.sources = [None] * capacity
+
+        self.capacity = capacity
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        """Supprime tous les projectiles du pool"""
+        for source in self.sources[:self.count]:
+            if source is not None:
+                release_to_pool(source)
+        self.sources[:self.count] = [None] * self.count
+        self.count = 0
+
+    def forget_targets(self, enemies):
+        """Oublie les ennemis retirés comme derniers touchés (un ennemi recyclé garde son id())"""
+        n = self.count
+        if not n:
+            return
+        ids = np.fromiter((id(enemy) for enemy in enemies), dtype=np.int64, count=len(enemies))
+        last_hit = self.last_hit[:n]
+        last_hit[np.isin(last_hit, ids)] = 0
+
+    def spawn(self, x, y, dx, dy, radius, damage, lifetime, color=(255, 255, 0),
+              flags=0, max_pierce=0, damage_reduction=0.0, ring_color=None, source=None):
+        """Ajoute un projectile et retourne son emplacement"""
+        if self.count >= self.capacity:
+            self._allocate(self.capacity * 2)
+            self.stats["grown"] += 1
+
+        slot = self.count
+        self.x[slot] = x
+        self.y[slot] = y
+        self.dx[slot] = dx
+        self.dy[slot] = dy
+        self.radius[slot] = radius
+        self.damage[slot] = damage
+        self.age[slot] = 0
+        self.lifetime[slot] = lifetime
+        self.flags[slot] = flags
+        self.pierce_left[slot] = max_pierce if flags & FLAG_PIERCING else 0
+        self.damage_reduction[slot] = damage_reduction
+        self.last_hit[slot] = 0
+        self.color[slot] = color
+        self.ring_color[slot] = ring_color if ring_color is not None else (-1, -1, -1)
+        self.sources[slot] = source
+
+        self.count += 1
+        self.stats["spawned"] += 1
+        return slot
+
+    @staticmethod
+    def can_adopt(projectile):
+        """Un projectile peut être géré par le pool s'il n'a pas de comportement spécial"""
+        blueprint = getattr(projectile, 'blueprint', None)
+        if blueprint is None:
+            return False
+        return not blueprint.flags & OBJECT_ONLY_FLAGS
+
+    def adopt(self, projectile):
+        """Reprend un WeaponProjectile simple dans le pool ; False s'il doit rester un objet"""
+        if not self.can_adopt(projectile):
+            return False
+
+        blueprint = projectile.blueprint
+        self.spawn(
+            projectile.x, projectile.y, projectile.dx, projectile.dy,
+            projectile.radius, projectile.damage, blueprint.lifetime,
+            color=blueprint.color,
+            flags=blueprint.flags & (FLAG_PIERCING | FLAG_TRAIL),
+            max_pierce=blueprint.max_pierce_count,
+            damage_reduction=blueprint.pierce_damage_reduction,
+            ring_color=blueprint.ring_color,
+            source=projectile
+        )
+        return True
+
+    def _compact(self, keep):
+        """Retire les projectiles morts en tassant les tableaux (ordre conservé)"""
+        count = self.count
+        indices = np.flatnonzero(keep)
+        kept = len(indices)
+        if kept == count:
+            return 0
+
+        for array in (self.x, self.y, self.dx, self.dy, self.radius, self.damage, self.age,
+                      self.lifetime, self.flags, self.pierce_left, self.damage_reduction,
+                      self.last_hit, self.color, self.ring_color):
+            array[:kept] = array[indices]
+
+        sources = self.sources
+        # Les objets d'origine des projectiles retirés retournent à leur pool
+        for i in np.flatnonzero(~keep).tolist():
+            if sources[i] is not None:
+                release_to_pool(sources[i])
+        sources[:kept] = [sources[i] for i in indices]
+        sources[kept:count] = [None] * (count - kept)
+
+        self.count = kept
+        return count - kept
+
+    # === MISE À JOUR ===
+
+    def update(self, walls=None):
+        """Intègre, vieillit et élimine les projectiles ; retourne le nombre retirés"""
+        n = self.count
+        if n == 0:
+            return 0
+
+        x = self.x[:n]
+        y = self.y[:n]
+        radius = self.radius[:n]
+
+        # Durée de vie (vérifiée avant le déplacement, comme WeaponProjectile)
+        age = self.age[:n]
+        age += 1
+        keep = age < self.lifetime[:n]
+        self.stats["expired"] += int(n - np.count_nonzero(keep))
+
+        # Intégration
+        x += self.dx[:n]
+        y += self.dy[:n]
+
+        # Limites du monde, marge comprise
+        inside = ((x >= -WORLD_MARGIN) & (x <= self.world_width + WORLD_MARGIN) &
+                  (y >= -WORLD_MARGIN) & (y <= self.world_height + WORLD_MARGIN))
+        culled = keep & ~inside
+        self.stats["culled"] += int(np.count_nonzero(culled))
+        keep &= inside
+
+        # Murs : rectangle du projectile contre les murs des cases touchées (index des murs)
+        if walls:
+            left = x - radius
+            top = y - radius
+            right = x + radius
+            bottom = y + radius
+            if hasattr(walls, 'candidate_rects'):
+                rects = walls.candidate_rects(left, top, right, bottom)
+            else:
+                rects = [wall.rect if hasattr(wall, 'rect') else wall for wall in walls]
+            hit = np.zeros(n, dtype=bool)
+            for rect in rects:
+                hit |= ((left < rect.right) & (right > rect.left) &
+                        (top < rect.bottom) & (bottom > rect.top))
+            wall_hits = keep & hit
+            self.stats["wall_hits"] += int(np.count_nonzero(wall_hits))
+            keep &= ~hit
+
+        return self._compact(keep)
+
+    def collide_enemies(self, enemies, on_hit):
+        """Résout les collisions projectiles/ennemis en une passe vectorisée
+
+        on_hit(source, enemy, damage) est appelé pour chaque impact ; le pool
+        gère lui-même le percement et la suppression des projectiles.
+        Retourne le nombre d'impacts.
+        """
+        n = self.count
+        if n == 0 or not enemies:
+            return 0
+
+        enemy_count = len(enemies)
+        enemy_radius = np.fromiter((getattr(e, 'width', 20) // 2 for e in enemies),
+                                   dtype=np.float64, count=enemy_count)
+        enemy_cx = np.fromiter((e.x for e in enemies), dtype=np.float64, count=enemy_count) + enemy_radius
+        enemy_cy = np.fromiter((e.y for e in enemies), dtype=np.float64, count=enemy_count) + enemy_radius
+
+        pairs = self._candidate_pairs(enemy_cx, enemy_cy, enemy_radius)
+        if pairs is None:
+            return 0
+        proj_idx, enemy_idx = pairs
+
+        # Phase fine : cercle contre cercle
+        ddx = self.x[proj_idx] - enemy_cx[enemy_idx]
+        ddy = self.y[proj_idx] - enemy_cy[enemy_idx]
+        reach = self.radius[proj_idx] + enemy_radius[enemy_idx]
+        touching = ddx * ddx + ddy * ddy < reach * reach
+        if not touching.any():
+            return 0
+        proj_idx = proj_idx[touching]
+        enemy_idx = enemy_idx[touching]
+
+        # Un projectile ne touche que le premier ennemi (ordre de la liste)
+        order = np.lexsort((enemy_idx, proj_idx))
+        proj_idx = proj_idx[order]
+        enemy_idx = enemy_idx[order]
+        first = np.ones(len(proj_idx), dtype=bool)
+        first[1:] = proj_idx[1:] != proj_idx[:-1]
+        proj_idx = proj_idx[first]
+        enemy_idx = enemy_idx[first]
+
+        keep = np.ones(n, dtype=bool)
+        hits = 0
+        for slot, e_index in zip(proj_idx.tolist(), enemy_idx.tolist()):
+            enemy = enemies[e_index]
+            enemy_id = id(enemy)
+            if self.last_hit[slot] == enemy_id:
+                continue  # Déjà touché (percement en cours)
+            self.last_hit[slot] = enemy_id
+
+            on_hit(self.sources[slot], enemy, self.damage[slot])
+            hits += 1
+
+            if self.flags[slot] & FLAG_PIERCING and self.pierce_left[slot] > 0:
+                self.pierce_left[slot] -= 1
+                reduction = self.damage_reduction[slot]
+                if reduction > 0:
+                    self.damage[slot] = max(1, int(self.damage[slot] * (1 - reduction)))
+            else:
+                keep[slot] = False
+
+        self.stats["enemy_hits"] += hits
+        self._compact(keep)
+        return hits
+
+    def _candidate_pairs(self, enemy_cx, enemy_cy, enemy_radius):
+        """Phase large vectorisée : paires (projectile, ennemi) partageant une cellule"""
+        n = self.count
+        size = self.cell_size
+        cols = int(self.world_width // size) + 1
+        rows = int(self.world_height // size) + 1
+
+        # Chaque projectile (point) tombe dans une seule cellule
+        pcol = np.clip((self.x[:n] // size).astype(np.int64), 0, cols - 1)
+        prow = np.clip((self.y[:n] // size).astype(np.int64), 0, rows - 1)
+        pkeys = prow * cols + pcol
+        sort_order = np.argsort(pkeys, kind='stable')
+        sorted_keys = pkeys[sort_order]
+
+        # Chaque ennemi couvre les cellules de sa boîte élargie du plus grand rayon de projectile
+        reach = enemy_radius + self.radius[:n].max()
+        col0 = np.clip(((enemy_cx - reach) // size).astype(np.int64), 0, cols - 1)
+        col1 = np.clip(((enemy_cx + reach) // size).astype(np.int64), 0, cols - 1)
+        row0 = np.clip(((enemy_cy - reach) // size).astype(np.int64), 0, rows - 1)
+        row1 = np.clip(((enemy_cy + reach) // size).astype(np.int64), 0, rows - 1)
+
+        span_cols = col1 - col0 + 1
+        span_rows = row1 - row0 + 1
+        cells_per_enemy = span_cols * span_rows
+        enemy_of_cell = np.repeat(np.arange(len(enemy_cx)), cells_per_enemy)
+        local = np.arange(len(enemy_of_cell)) - np.repeat(np.cumsum(cells_per_enemy) - cells_per_enemy,
+                                                          cells_per_enemy)
+        cell_col = col0[enemy_of_cell] + local % span_cols[enemy_of_cell]
+        cell_row = row0[enemy_of_cell] + local // span_cols[enemy_of_cell]
+        cell_keys = cell_row * cols + cell_col
+
+        # Plage de projectiles de chaque cellule dans l'ordre trié
+        lo = np.searchsorted(sorted_keys, cell_keys, side='left')
+        hi = np.searchsorted(sorted_keys, cell_keys, side='right')
+        counts = hi - lo
+        total = int(counts.sum())
+        if total == 0:
+            return None
+
+        starts = np.repeat(lo - (np.cumsum(counts) - counts), counts)
+        proj_idx = sort_order[np.arange(total) + starts]
+        enemy_idx = np.repeat(enemy_of_cell, counts)
+        return proj_idx, enemy_idx
+
+    # === RENDU ===
+
+    def _get_sprite(self, radius, color, ring_color):
+        """Sprite pré-rendu d'un projectile (cercle plein + anneau d'effet éventuel)"""
+        key = (radius, color, ring_color)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            size = radius * 2 + 5
+            sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+            center = (size // 2, size // 2)
+            pygame.draw.circle(sprite, color, center, radius)
+            if ring_color is not None:
+                pygame.draw.circle(sprite, ring_color, center, radius + 2, 1)
+            self._sprites[key] = sprite
+        return sprite
+
+    def draw(self, screen, camera_offset=(0, 0), alpha=1.0):
+        """Dessine les projectiles visibles en un seul appel blits()"""
+        n = self.count
+        if n == 0:
+            return
+
+        screen_w, screen_h = screen.get_size()
+        if alpha < 1.0:
+            # Interpolation : mouvement rectiligne, position précédente = courante - vitesse
+            back = 1.0 - alpha
+            sx = (self.x[:n] - self.dx[:n] * back - camera_offset[0]).astype(np.int32)
+            sy = (self.y[:n] - self.dy[:n] * back - camera_offset[1]).astype(np.int32)
+        else:
+            sx = (self.x[:n] - camera_offset[0]).astype(np.int32)
+            sy = (self.y[:n] - camera_offset[1]).astype(np.int32)
+        radius = self.radius[:n].astype(np.int32)
+        visible = (sx + radius + 2 >= 0) & (sx - radius - 2 < screen_w) & \
+                  (sy + radius + 2 >= 0) & (sy - radius - 2 < screen_h)
+        slots = np.flatnonzero(visible)
+        if len(slots) == 0:
+            return
+
+        # Traînées : segment sombre derrière les projectiles concernés
+        trail_slots = slots[(self.flags[slots] & FLAG_TRAIL) != 0]
+        for slot in trail_slots.tolist():
+            trail_color = [max(0, int(c) - 100) for c in self.color[slot]]
+            tail_x = sx[slot] - int(self.dx[slot] * TRAIL_FRAMES)
+            tail_y = sy[slot] - int(self.dy[slot] * TRAIL_FRAMES)
+            pygame.draw.line(screen, trail_color, (tail_x, tail_y), (sx[slot], sy[slot]), 2)
+
+        colors = self.color[slots].tolist()
+        rings = self.ring_color[slots].tolist()
+        radii = radius[slots].tolist()
+        xs = sx[slots].tolist()
+        ys = sy[slots].tolist()
+
+        blit_list = []
+        for r, color, ring, px, py in zip(radii, colors, rings, xs, ys):
+            sprite = self._get_sprite(r, tuple(color), tuple(ring) if ring[0] >= 0 else None)
+            offset = r + 2
+            blit_list.append((sprite, (px - offset, py - offset)))
+        screen.blits(blit_list, doreturn=False)
+
+    def get_statistics(self):
+        """Retourne les statistiques du pool"""
+        return {**self.stats, "live": self.count, "capacity": self.capacity}
@@ -0,0 +1,173 @@
+"""
+Plans d'armes compilés
+Une entrée JSON d'arme + les effets de weapon_effects.json + les améliorations
+globales du joueur sont résolus une seule fois en un objet immuable partagé
+par tous les projectiles tirés avec cette configuration.
+"""
+import math
+from types import MappingProxyType
+
+# Drapeaux (bits) des comportements du projectile
+FLAG_PIERCING = 1
+FLAG_EXPLOSIVE = 2
+FLAG_HOMING = 4
+FLAG_TRAIL = 8
+FLAG_MELEE = 16
+
+# Améliorations globales du joueur qui modifient le plan compilé
+BLUEPRINT_UPGRADE_KEYS = ("damage_bonus", "bullet_size_multiplier", "piercing",
+                          "explosive", "homing", "multi_shot_bonus")
+
+# Effets appliqués à l'impact (voir WeaponProjectile._apply_hit_effects)
+HIT_EFFECTS = ("chaos_corruption", "suppression", "thermal_damage")
+
+def upgrades_key(owner):
+    """Clé des améliorations globales pertinentes (None si le tireur n'en a pas)"""
+    upgrades = getattr(owner, 'global_upgrades', None) if owner else None
+    if upgrades is None:
+        return None
+    return tuple(upgrades.get(key) for key in BLUEPRINT_UPGRADE_KEYS)
+
+class WeaponBlueprint:
+    """Plan immuable d'une arme : paramètres d'effets résolus et valeurs précalculées"""
+
+    def __init__(self, weapon_id, weapon_data, effects_data, global_upgrades=None):
+        upgrades = global_upgrades or {}
+        stats = weapon_data["stats"]
+        projectile = weapon_data["projectile"]
+
+        set_attr = object.__setattr__
+        set_attr(self, "weapon_id", weapon_id)
+        set_attr(self, "weapon_data", weapon_data)
+        set_attr(self, "effects_data", effects_data)
+        set_attr(self, "name", weapon_data.get("name", weapon_id))
+
+        # Effets résolus : liste ordonnée + accès direct aux paramètres par nom
+        effects = []
+        params = {}
+        for effect_name in weapon_data.get("effects", []):
+            for category, category_effects in effects_data.items():
+                if effect_name in category_effects:
+                    effect = dict(category_effects[effect_name])
+                    effect["name"] = effect_name
+                    effect["category"] = category
+                    effects.append(MappingProxyType(effect))
+                    params[effect_name] = MappingProxyType(dict(effect.get("parameters", {})))
+                    break
+        set_attr(self, "effects", tuple(effects))
+        set_attr(self, "effect_params", MappingProxyType(params))
+
+        # Statistiques de base + améliorations globales
+        speed = stats["projectile_speed"]
+        set_attr(self, "speed", speed)
+        set_attr(self, "damage", stats["damage"] + upgrades.get("damage_bonus", 0))
+        radius = projectile["size"]
+        if global_upgrades is not None:  # Tireur avec améliorations, même vides : taille entière
+            radius = int(radius * upgrades.get("bullet_size_multiplier", 1.0))
+        set_attr(self, "radius", radius)
+        set_attr(self, "lifetime", projectile["lifetime"])
+        set_attr(self, "range", stats.get("range", 60))
+        set_attr(self, "accuracy", stats.get("accuracy", 1.0))
+
+        # Drapeaux
+        flags = 0
+        if "piercing" in params or upgrades.get("piercing", False):
+            flags |= FLAG_PIERCING
+        if "explosive" in params or upgrades.get("explosive", False):
+            flags |= FLAG_EXPLOSIVE
+        if "homing" in params or upgrades.get("homing", False):
+            flags |= FLAG_HOMING
+        if projectile.get("trail", False):
+            flags |= FLAG_TRAIL
+        if speed == 0:
+            flags |= FLAG_MELEE
+        set_attr(self, "flags", flags)
+
+        # Paramètres d'effets résolus (valeurs par défaut de WeaponProjectile)
+        get = self.get_effect_param
+        set_attr(self, "max_pierce_count", get("piercing", "pierce_count", 3))
+        set_attr(self, "pierce_damage_reduction", get("piercing", "damage_reduction_per_hit", 0))
+        set_attr(self, "explosion_radius", get("explosive", "explosion_radius", 50))
+        set_attr(self, "explosion_damage_ratio", get("explosive", "explosion_damage", 0.5))
+        set_attr(self, "tracking_range", get("homing", "tracking_range", 150))
+        set_attr(self, "turn_rate", get("homing", "turn_rate", 0.15))
+        set_attr(self, "cone_angle", get("melee_attack", "cone_angle", 60) * math.pi / 180)
+        set_attr(self, "max_targets", get("cleave_attack", "max_targets", 3))
+
+        # Modificateurs de dégâts et effets d'impact, dans l'ordre de l'arme
+        set_attr(self, "damage_effects", tuple(e for e in effects if e["category"] == "damage_effects"))
+        set_attr(self, "hit_effects", tuple(e for e in effects if e["name"] in HIT_EFFECTS))
+
+        # Tir multiple (effets de l'arme puis bonus global)
+        projectile_count = 1
+        spread_angle = 0
+        for effect_name in weapon_data.get("effects", []):
+            if effect_name in ("multi_shot_2", "multi_shot_3") and effect_name in params:
+                projectile_count = params[effect_name]["projectile_count"]
+                spread_angle = params[effect_name]["spread_angle"]
+        bonus_projectiles = upgrades.get("multi_shot_bonus", 0)
+        projectile_count += bonus_projectiles
+        if bonus_projectiles > 0 and spread_angle == 0:
+            spread_angle = 0.4  # Angle de dispersion par défaut pour les projectiles bonus
+        set_attr(self, "bonus_projectiles", bonus_projectiles)
+        set_attr(self, "projectile_count", projectile_count)
+        set_attr(self, "spread_angle", spread_angle)
+
+        # Couleurs précalculées
+        color = tuple(projectile["color"])
+        set_attr(self, "color", color)
+        set_attr(self, "trail_color", tuple(max(0, c - 100) for c in color))
+        set_attr(self, "flash_color", tuple(min(255, c + 100) for c in color))
+        names = [e["name"] for e in effects]
+        set_attr(self, "has_holy", "holy_damage" in names)
+        set_attr(self, "has_chaos", "chaos_corruption" in names)
+        set_attr(self, "has_energy", "energy_damage" in names)
+        # L'anneau d'explosion n'est dessiné que pour les effets sans visuel propre
+        set_attr(self, "explosive_ring", bool(flags & FLAG_EXPLOSIVE) and any(
+            name not in ("holy_damage", "chaos_corruption", "energy_damage") for name in names))
+        ring_color = None
+        if self.has_holy:
+            ring_color = (255, 255, 150)
+        elif self.has_chaos:
+            ring_color = (255, 100, 255)
+        set_attr(self, "ring_color", ring_color)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"WeaponBlueprint est immuable ({name})")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"WeaponBlueprint est immuable ({name})")
+
+    def has_effect(self, effect_name):
+        """Vérifie si l'arme a un effet spécifique"""
+        return effect_name in self.effect_params
+
+    def get_effect_param(self, effect_name, param_name, default_value=None):
+        """Récupère un paramètre d'effet résolu"""
+        params = self.effect_params.get(effect_name)
+        if params is None:
+            return default_value
+        return params.get(param_name, default_value)
+
+    @property
+    def piercing(self):
+        return bool(self.flags & FLAG_PIERCING)
+
+    @property
+    def explosive(self):
+        return bool(self.flags & FLAG_EXPLOSIVE)
+
+    @property
+    def homing(self):
+        return bool(self.flags & FLAG_HOMING)
+
+    @property
+    def has_trail(self):
+        return bool(self.flags & FLAG_TRAIL)
+
+    @property
+    def is_melee(self):
+        return bool(self.flags & FLAG_MELEE)
+
+    def __repr__(self):
+        return f"WeaponBlueprint({self.weapon_id!r}, dégâts={self.damage}, flags={self.flags:#x})"
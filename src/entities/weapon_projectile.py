@@ -6,137 +6,182 @@ import pygame
 import math
 import random
 from typing import Dict, List, Optional, Any
+from ..gameplay.pathfinding import PathfindingHelper
+from ..utils.game_log import get_channel, get_logger
+from .weapon_blueprint import (WeaponBlueprint, FLAG_PIERCING, FLAG_EXPLOSIVE, FLAG_HOMING,
+                               FLAG_TRAIL, FLAG_MELEE)
+
+# Couleurs de l'aura chaotique (cycle par frame)
+CHAOS_COLORS = ((255, 100, 255), (200, 0, 200), (255, 0, 255))
+
+_log = get_logger("entities.weapon_projectile")
+
+# Canal de diagnostic des créations de projectiles (limité en fréquence)
+_creation_channel = get_channel("entities.weapon_projectile.creation", interval_frames=6)
 
 class WeaponProjectile:
     """Projectile créé par le système d'armes modulaire"""
     
+    __slots__ = (
+        "blueprint", "owner", "x", "y", "start_x", "start_y", "dx", "dy", "attack_direction",
+        "damage", "radius", "age", "is_alive", "has_hit_targets", "pierce_count", "rect",
+        "homing_target", "trail_points", "max_trail_length",
+        "prev_x", "prev_y", "object_pool",  # Interpolation et ObjectPool
+    )
+    
     def __init__(self, x: float, y: float, dx: float, dy: float, 
-                 weapon_data: Dict, effects_data: Dict, owner=None):
+                 weapon_data: Dict, effects_data: Dict, owner=None, blueprint=None):
+        # Conteneurs gardés d'un tir à l'autre quand le projectile sort d'un ObjectPool
+        self.has_hit_targets = set()  # Pour le piercing
+        self.trail_points = []
+        self.rect = pygame.Rect(0, 0, 0, 0)  # Rectangle de collision
+        self.reset(x, y, dx, dy, weapon_data, effects_data, owner, blueprint)
+    
+    def reset(self, x: float, y: float, dx: float, dy: float, 
+              weapon_data: Dict, effects_data: Dict, owner=None, blueprint=None):
+        """(Ré)initialise le projectile pour un nouveau tir (crochet de ObjectPool)"""
+        # Plan compilé partagé (WeaponManager) ; compilé ici pour les appels directs
+        if blueprint is None:
+            blueprint = WeaponBlueprint(weapon_data.get("id", weapon_data.get("name")), weapon_data, effects_data,
+                                        getattr(owner, 'global_upgrades', None) if owner else None)
+        self.blueprint = blueprint
+        self.owner = owner
+        
         # Position et mouvement
         self.x = x
         self.y = y
         self.start_x = x
         self.start_y = y
+        self.prev_x = x  # Interpolation : pas de traînée depuis le tir précédent du pool
+        self.prev_y = y
         
         # Direction et vitesse
-        speed = weapon_data["stats"]["projectile_speed"]
+        speed = blueprint.speed
         self.dx = dx * speed
         self.dy = dy * speed
         
         # Spécial pour les armes de corps à corps (speed = 0)
-        self.is_melee = (speed == 0)
-        if self.is_melee:
+        if blueprint.flags & FLAG_MELEE:
             # Sauvegarder la direction pour l'attaque en cône
-            import math
             self.attack_direction = math.atan2(dy, dx) if dx != 0 or dy != 0 else 0
             self.dx = 0  # Pas de mouvement
             self.dy = 0
         
-        # Données de l'arme et effets
-        self.weapon_data = weapon_data
-        self.effects_data = effects_data
-        self.owner = owner
-        
-        # Propriétés du projectile
-        self.damage = weapon_data["stats"]["damage"]
-        self.radius = weapon_data["projectile"]["size"]
-        self.color = tuple(weapon_data["projectile"]["color"])
-        self.lifetime = weapon_data["projectile"]["lifetime"]
+        # Dégâts courants (réduits par le percement)
+        self.damage = blueprint.damage
+        self.radius = blueprint.radius
         self.age = 0
         
-        # Appliquer les améliorations globales du joueur si disponibles
-        if owner and hasattr(owner, 'global_upgrades'):
-            # Bonus de dégâts global
-            self.damage += owner.global_upgrades.get('damage_bonus', 0)
-            
-            # Bonus de taille global
-            size_multiplier = owner.global_upgrades.get('bullet_size_multiplier', 1.0)
-            self.radius = int(self.radius * size_multiplier)
-        
         # État
         self.is_alive = True
-        self.has_hit_targets = set()  # Pour le piercing
+        self.has_hit_targets.clear()
         self.pierce_count = 0
         
         # Rectangle de collision
-        self.rect = pygame.Rect(x - self.radius, y - self.radius, 
-                               self.radius * 2, self.radius * 2)
-        
-        # Effets actifs
-        self.active_effects = self._parse_effects()
-        
-        # Propriétés spéciales selon les effets + améliorations globales
-        self.piercing = self._has_effect("piercing") or (owner and hasattr(owner, 'global_upgrades') and owner.global_upgrades.get('piercing', False))
-        self.explosive = self._has_effect("explosive") or (owner and hasattr(owner, 'global_upgrades') and owner.global_upgrades.get('explosive', False))
-        self.homing = self._has_effect("homing") or (owner and hasattr(owner, 'global_upgrades') and owner.global_upgrades.get('homing', False))
-        self.max_pierce_count = self._get_effect_param("piercing", "pierce_count", 3)  # Valeur par défaut augmentée
+        self.rect.update(x - self.radius, y - self.radius, 
+                         self.radius * 2, self.radius * 2)
         
         # Variables pour le homing
         self.homing_target = None
-        self.tracking_range = self._get_effect_param("homing", "tracking_range", 150)
-        self.turn_rate = self._get_effect_param("homing", "turn_rate", 0.15)
         
-        # Trail et effets visuels
-        self.trail_points = []
-        self.has_trail = weapon_data["projectile"].get("trail", False)
+        # Trail
+        self.trail_points.clear()
         self.max_trail_length = 8
         
-        # Debug info seulement pour le premier projectile d'un groupe
-        if not hasattr(WeaponProjectile, '_debug_printed'):
-            WeaponProjectile._debug_printed = True
-            print(f"🚀 Projectile créé: {weapon_data['name']}, dégâts: {self.damage}, perforant: {self.piercing}, explosif: {self.explosive}")
-        else:
-            # Reset après un délai pour permettre le debug du prochain tir
-            import threading
-            def reset_debug():
-                WeaponProjectile._debug_printed = False
-            threading.Timer(0.1, reset_debug).start()
-    
-    def _parse_effects(self) -> List[Dict]:
-        """Parse les effets de l'arme"""
-        effects = []
-        for effect_name in self.weapon_data.get("effects", []):
-            # Chercher l'effet dans toutes les catégories
-            for category, category_effects in self.effects_data.items():
-                if effect_name in category_effects:
-                    effect_data = category_effects[effect_name].copy()
-                    effect_data["name"] = effect_name
-                    effect_data["category"] = category
-                    effects.append(effect_data)
-                    break
-        return effects
+        # Debug info limitée : au plus un message toutes les 6 frames (~0.1s)
+        if _creation_channel.ready():
+            _creation_channel.emit(f"🚀 Projectile créé: {blueprint.name}, dégâts: {self.damage}, perforant: {self.piercing}, explosif: {self.explosive}")
+    
+    def on_release(self):
+        """Rendu au pool : lâche les références vers les ennemis"""
+        self.has_hit_targets.clear()
+        self.homing_target = None
+        self.is_alive = False
+    
+    # === PROPRIÉTÉS DU PLAN COMPILÉ ===
+    
+    @property
+    def weapon_data(self) -> Dict:
+        return self.blueprint.weapon_data
+    
+    @property
+    def effects_data(self) -> Dict:
+        return self.blueprint.effects_data
+    
+    @property
+    def active_effects(self):
+        return self.blueprint.effects
+    
+    @property
+    def color(self):
+        return self.blueprint.color
+    
+    @property
+    def lifetime(self) -> int:
+        return self.blueprint.lifetime
+    
+    @property
+    def is_melee(self) -> bool:
+        return bool(self.blueprint.flags & FLAG_MELEE)
+    
+    @property
+    def piercing(self) -> bool:
+        return bool(self.blueprint.flags & FLAG_PIERCING)
+    
+    @property
+    def explosive(self) -> bool:
+        return bool(self.blueprint.flags & FLAG_EXPLOSIVE)
+    
+    @property
+    def homing(self) -> bool:
+        return bool(self.blueprint.flags & FLAG_HOMING)
+    
+    @property
+    def has_trail(self) -> bool:
+        return bool(self.blueprint.flags & FLAG_TRAIL)
+    
+    @property
+    def max_pierce_count(self) -> int:
+        return self.blueprint.max_pierce_count
+    
+    @property
+    def tracking_range(self):
+        return self.blueprint.tracking_range
+    
+    @property
+    def turn_rate(self):
+        return self.blueprint.turn_rate
     
     def _has_effect(self, effect_name: str) -> bool:
         """Vérifie si le projectile a un effet spécifique"""
-        return any(effect["name"] == effect_name for effect in self.active_effects)
+        return self.blueprint.has_effect(effect_name)
     
     def _get_effect_param(self, effect_name: str, param_name: str, default_value=None):
         """Récupère un paramètre d'effet"""
-        for effect in self.active_effects:
-            if effect["name"] == effect_name:
-                return effect.get("parameters", {}).get(param_name, default_value)
-        return default_value
+        return self.blueprint.get_effect_param(effect_name, param_name, default_value)
     
     def update(self, walls: List, screen_width: int, screen_height: int, 
                enemies: List = None, game_scene=None) -> bool:
         """Met à jour le projectile"""
         self.age += 1
+        blueprint = self.blueprint
+        flags = blueprint.flags
         
         # Vérifier la durée de vie
-        if self.age >= self.lifetime:
+        if self.age >= blueprint.lifetime:
             self.is_alive = False
             return False
         
         # Pour les attaques de corps à corps, gérer différemment
-        if self.is_melee:
+        if flags & FLAG_MELEE:
             return self._update_melee_attack(enemies, game_scene)
         
         # Homing vers les ennemis
-        if self.homing and enemies and self.owner:
+        if flags & FLAG_HOMING and enemies and self.owner:
             self._update_homing(enemies)
         
         # Sauvegarder l'ancienne position pour le trail
-        if self.has_trail:
+        if flags & FLAG_TRAIL:
             self.trail_points.append((self.x, self.y))
             if len(self.trail_points) > self.max_trail_length:
                 self.trail_points.pop(0)
@@ -148,10 +193,10 @@ class WeaponProjectile:
         self.rect.y = self.y - self.radius
         
         # Vérifier collision avec les murs
-        for wall in walls:
-            if self.rect.colliderect(wall.rect):
-                self._handle_wall_collision(wall, game_scene)
-                return False
+        wall = PathfindingHelper.find_wall_collision(self.rect, walls)
+        if wall:
+            self._handle_wall_collision(wall, game_scene)
+            return False
         
         # Vérifier si hors écran
         margin = 100  # Marge pour permettre aux projectiles de sortir un peu
@@ -217,12 +262,11 @@ class WeaponProjectile:
             return self.is_alive
         
         # Attaque en cône autour de la direction d'attaque
-        import math
-        
-        # Paramètres de l'attaque de mêlée
-        cone_angle = self._get_effect_param("melee_attack", "cone_angle", 60) * math.pi / 180  # Convertir en radians
-        max_range = self.weapon_data["stats"].get("range", 60)
-        max_targets = self._get_effect_param("cleave_attack", "max_targets", 3)
+        # Paramètres de l'attaque de mêlée (résolus dans le plan)
+        blueprint = self.blueprint
+        cone_angle = blueprint.cone_angle
+        max_range = blueprint.range
+        max_targets = blueprint.max_targets
         
         targets_hit = 0
         
@@ -256,7 +300,8 @@ class WeaponProjectile:
                 # Ennemi dans le cône, l'attaquer
                 self.hit_enemy(enemy, game_scene)
                 targets_hit += 1
-                print(f"⚔️  Attaque de mêlée ! Cible {targets_hit}/{max_targets}")
+                if _log.debug_enabled:
+                    _log.debug("⚔️  Attaque de mêlée ! Cible %s/%s", targets_hit, max_targets)
         
         # Les attaques de mêlée se terminent rapidement
         if self.age >= 5:  # Très courte durée de vie
@@ -292,17 +337,20 @@ class WeaponProjectile:
         # Vérifier si le projectile doit être détruit
         if self.piercing and self.pierce_count < self.max_pierce_count:
             self.pierce_count += 1
-            print(f"🏹 Projectile perforant traverse l'ennemi (hits: {self.pierce_count}/{self.max_pierce_count})")
+            if _log.debug_enabled:
+                _log.debug("🏹 Projectile perforant traverse l'ennemi (hits: %s/%s)", self.pierce_count, self.max_pierce_count)
             
             # Réduire les dégâts pour le prochain hit si configuré
-            damage_reduction = self._get_effect_param("piercing", "damage_reduction_per_hit", 0)
+            damage_reduction = self.blueprint.pierce_damage_reduction
             if damage_reduction > 0:
                 old_damage = self.damage
                 self.damage = max(1, int(self.damage * (1 - damage_reduction)))
-                print(f"🏹 Dégâts réduits: {old_damage} → {self.damage}")
+                if _log.debug_enabled:
+                    _log.debug("🏹 Dégâts réduits: %s → %s", old_damage, self.damage)
             return False  # Ne pas détruire le projectile
         else:
-            print(f"💥 Projectile détruit (perforant: {self.piercing}, hits: {self.pierce_count}/{self.max_pierce_count})")
+            if _log.debug_enabled:
+                _log.debug("💥 Projectile détruit (perforant: %s, hits: %s/%s)", self.piercing, self.pierce_count, self.max_pierce_count)
             
             # Explosion si nécessaire
             if self.explosive and game_scene:
@@ -311,33 +359,39 @@ class WeaponProjectile:
             self.is_alive = False
             return True  # Détruire le projectile
     
-    def _calculate_damage(self, enemy) -> int:
+    def apply_pooled_hit(self, enemy, damage, game_scene=None):
+        """Applique un impact résolu par le ProjectilePool (dégâts courants fournis par le pool)"""
+        enemy.take_damage(self._calculate_damage(enemy, damage))
+        self._apply_hit_effects(enemy, game_scene)
+    
+    def _calculate_damage(self, enemy, base_damage=None) -> int:
         """Calcule les dégâts finaux avec les modificateurs"""
-        damage = self.damage
-        
-        # Appliquer les modificateurs de dégâts selon les effets
-        for effect in self.active_effects:
-            if effect["category"] == "damage_effects":
-                if effect["name"] == "holy_damage":
-                    # Bonus contre les démons et chaos
-                    if hasattr(enemy, 'enemy_type'):
-                        if enemy.enemy_type in ['demon', 'daemon']:
-                            damage *= effect["parameters"].get("damage_multiplier_vs_demon", 1.0)
-                        elif enemy.enemy_type in ['chaos', 'heretic']:
-                            damage *= effect["parameters"].get("damage_multiplier_vs_chaos", 1.0)
-                
-                elif effect["name"] == "energy_damage":
-                    # Pénétration d'armure
-                    armor_pen = effect["parameters"].get("armor_penetration", 0)
-                    if hasattr(enemy, 'armor'):
-                        effective_armor = enemy.armor * (1 - armor_pen)
-                        damage = damage * (1 - effective_armor * 0.01)
-        
+        damage = self.damage if base_damage is None else base_damage
+        
+        # Appliquer les modificateurs de dégâts (effets de dégâts résolus dans le plan)
+        for effect in self.blueprint.damage_effects:
+            if effect["name"] == "holy_damage":
+                # Bonus contre les démons et chaos
+                enemy_type = getattr(enemy, 'enemy_type', None)
+                if enemy_type is not None:
+                    if enemy_type in ['demon', 'daemon']:
+                        damage *= effect["parameters"].get("damage_multiplier_vs_demon", 1.0)
+                    elif enemy_type in ['chaos', 'heretic']:
+                        damage *= effect["parameters"].get("damage_multiplier_vs_chaos", 1.0)
+            
+            elif effect["name"] == "energy_damage":
+                # Pénétration d'armure
+                armor_pen = effect["parameters"].get("armor_penetration", 0)
+                armor = getattr(enemy, 'armor', 0)
+                if armor:
+                    effective_armor = armor * (1 - armor_pen)
+                    damage = damage * (1 - effective_armor * 0.01)
+            
         return max(1, int(damage))
     
     def _apply_hit_effects(self, enemy, game_scene):
         """Applique les effets spéciaux au contact"""
-        for effect in self.active_effects:
+        for effect in self.blueprint.hit_effects:
             effect_name = effect["name"]
             
             if effect_name == "chaos_corruption":
@@ -345,30 +399,33 @@ class WeaponProjectile:
                 corruption_chance = effect["parameters"].get("corruption_chance", 0)
                 if random.random() < corruption_chance:
                     corruption_amount = effect["parameters"].get("corruption_amount", 5)
-                    if hasattr(enemy, 'apply_corruption'):
-                        enemy.apply_corruption(corruption_amount)
+                    apply_corruption = getattr(enemy, 'apply_corruption', None)
+                    if apply_corruption is not None:
+                        apply_corruption(corruption_amount)
             
             elif effect_name == "suppression":
                 # Ralentir l'ennemi
                 speed_reduction = effect["parameters"].get("speed_reduction", 0.3)
                 duration = effect["parameters"].get("duration", 90)
-                if hasattr(enemy, 'apply_slow'):
-                    enemy.apply_slow(speed_reduction, duration)
+                apply_slow = getattr(enemy, 'apply_slow', None)
+                if apply_slow is not None:
+                    apply_slow(speed_reduction, duration)
             
             elif effect_name == "thermal_damage":
                 # Dégâts sur la durée
                 dot_damage = effect["parameters"].get("damage_over_time", 3)
                 duration = effect["parameters"].get("duration", 60)
-                if hasattr(enemy, 'apply_burn'):
-                    enemy.apply_burn(dot_damage, duration)
+                apply_burn = getattr(enemy, 'apply_burn', None)
+                if apply_burn is not None:
+                    apply_burn(dot_damage, duration)
     
     def _create_explosion(self, game_scene):
         """Crée une explosion"""
         if not game_scene:
             return
         
-        explosion_radius = self._get_effect_param("explosive", "explosion_radius", 50)
-        explosion_damage = int(self.damage * self._get_effect_param("explosive", "explosion_damage", 0.5))
+        explosion_radius = self.blueprint.explosion_radius
+        explosion_damage = int(self.damage * self.blueprint.explosion_damage_ratio)
         
         # Trouver les ennemis dans le rayon d'explosion
         if hasattr(game_scene, 'entity_manager') and hasattr(game_scene.entity_manager, 'enemies'):
@@ -382,7 +439,8 @@ class WeaponProjectile:
                         enemy.take_damage(final_damage)
         
         # Effet visuel d'explosion (sera ajouté plus tard)
-        print(f"💥 Explosion à ({self.x:.0f}, {self.y:.0f}) - Rayon: {explosion_radius}, Dégâts: {explosion_damage}")
+        if _log.debug_enabled:
+            _log.debug("💥 Explosion à (%.0f, %.0f) - Rayon: %s, Dégâts: %s", self.x, self.y, explosion_radius, explosion_damage)
     
     def draw(self, screen, camera_offset=(0, 0)):
         """Dessine le projectile"""
@@ -399,7 +457,7 @@ class WeaponProjectile:
         
         # Dessiner le trail si activé
         if self.has_trail and len(self.trail_points) > 1:
-            trail_color = [max(0, c - 100) for c in self.color]  # Version plus sombre
+            trail_color = self.blueprint.trail_color  # Version plus sombre (précalculée)
             for i in range(len(self.trail_points) - 1):
                 alpha = int(255 * (i + 1) / len(self.trail_points))
                 start_x = int(self.trail_points[i][0] - camera_offset[0])
@@ -423,11 +481,9 @@ class WeaponProjectile:
     
     def _draw_melee_attack(self, screen, screen_x, screen_y):
         """Dessine une attaque de corps à corps sous forme d'arc"""
-        import math
-        
         # Paramètres de l'arc d'attaque
-        cone_angle = self._get_effect_param("melee_attack", "cone_angle", 60) * math.pi / 180
-        max_range = self.weapon_data["stats"].get("range", 60)
+        cone_angle = self.blueprint.cone_angle
+        max_range = self.blueprint.range
         
         # Calculer les points de l'arc
         start_angle = self.attack_direction - cone_angle / 2
@@ -436,7 +492,7 @@ class WeaponProjectile:
         # Dessiner l'arc d'attaque
         arc_color = self.color
         if self.age <= 2:  # Flash initial plus brillant
-            arc_color = tuple(min(255, c + 100) for c in self.color)
+            arc_color = self.blueprint.flash_color
         
         # Dessiner des lignes pour représenter l'arc
         num_lines = 8
@@ -459,32 +515,29 @@ class WeaponProjectile:
     
     def _draw_visual_effects(self, screen, screen_x, screen_y):
         """Dessine les effets visuels du projectile"""
-        for effect in self.active_effects:
-            effect_name = effect["name"]
-            
-            if effect_name == "holy_damage":
-                # Aura dorée
-                pygame.draw.circle(screen, (255, 255, 150), (screen_x, screen_y), self.radius + 2, 1)
-                if self.age % 10 < 5:  # Pulsation
-                    pygame.draw.circle(screen, (255, 255, 200), (screen_x, screen_y), self.radius + 1, 1)
-            
-            elif effect_name == "chaos_corruption":
-                # Aura chaotique
-                chaos_colors = [(255, 100, 255), (200, 0, 200), (255, 0, 255)]
-                color = chaos_colors[self.age % len(chaos_colors)]
-                pygame.draw.circle(screen, color, (screen_x, screen_y), self.radius + 1, 1)
-            
-            elif effect_name == "energy_damage":
-                # Éclairs d'énergie
-                if self.age % 5 == 0:
-                    for _ in range(3):
-                        spark_x = screen_x + random.randint(-self.radius-2, self.radius+2)
-                        spark_y = screen_y + random.randint(-self.radius-2, self.radius+2)
-                        pygame.draw.circle(screen, (0, 255, 255), (spark_x, spark_y), 1)
-            
-            elif self.explosive:
-                # Anneau d'explosion
-                pygame.draw.circle(screen, (255, 200, 0), (screen_x, screen_y), self.radius + 2, 1)
+        blueprint = self.blueprint
+        
+        if blueprint.has_holy:
+            # Aura dorée
+            pygame.draw.circle(screen, (255, 255, 150), (screen_x, screen_y), self.radius + 2, 1)
+            if self.age % 10 < 5:  # Pulsation
+                pygame.draw.circle(screen, (255, 255, 200), (screen_x, screen_y), self.radius + 1, 1)
+        
+        if blueprint.has_chaos:
+            # Aura chaotique
+            color = CHAOS_COLORS[self.age % len(CHAOS_COLORS)]
+            pygame.draw.circle(screen, color, (screen_x, screen_y), self.radius + 1, 1)
+        
+        if blueprint.has_energy and self.age % 5 == 0:
+            # Éclairs d'énergie
+            for _ in range(3):
+                spark_x = screen_x + random.randint(-self.radius-2, self.radius+2)
+                spark_y = screen_y + random.randint(-self.radius-2, self.radius+2)
+                pygame.draw.circle(screen, (0, 255, 255), (spark_x, spark_y), 1)
+        
+        if blueprint.explosive_ring:
+            # Anneau d'explosion
+            pygame.draw.circle(screen, (255, 200, 0), (screen_x, screen_y), self.radius + 2, 1)
     
     def get_rect(self) -> pygame.Rect:
         """Retourne le rectangle de collision"""
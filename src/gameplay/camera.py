@@ -16,10 +16,24 @@ class Camera:
         self.target_x = 0
         self.target_y = 0
         
+        # Position au tick précédent (interpolation du rendu)
+        self.prev_x = 0
+        self.prev_y = 0
+        
         # Deadzone réduite pour un meilleur suivi
         self.deadzone_width = 50
         self.deadzone_height = 40
         
+    def snapshot(self):
+        """Mémorise la position de début de tick"""
+        self.prev_x = self.x
+        self.prev_y = self.y
+    
+    def interpolated(self, alpha):
+        """Position d'affichage entre le tick précédent et le tick courant"""
+        return (self.prev_x + (self.x - self.prev_x) * alpha,
+                self.prev_y + (self.y - self.prev_y) * alpha)
+    
     def update(self, target):
         """Met à jour la position de la caméra pour suivre la cible (joueur)"""
         # Position idéale : centrer le joueur sur l'écran
@@ -12,16 +12,24 @@ PURPLE = (221, 160, 221)
 
 class Item:
     """Classe de base pour tous les objets"""
+    __slots__ = ("x", "y", "width", "height", "rect", "item_type", "name", "description", "rarity",
+                 "color", "float_timer", "base_y")
+    
     def __init__(self, x, y, item_type, name, description, rarity="common"):
-        self.x = x
-        self.y = y
         self.width = 16
         self.height = 16
+        self.rect = pygame.Rect(x, y, self.width, self.height)
+        self.reset(x, y, item_type, name, description, rarity)
+    
+    def reset(self, x, y, item_type, name, description, rarity="common"):
+        """(Ré)initialise l'objet au sol"""
+        self.x = x
+        self.y = y
         self.item_type = item_type
         self.name = name
         self.description = description
         self.rarity = rarity
-        self.rect = pygame.Rect(x, y, self.width, self.height)
+        self.rect.update(x, y, self.width, self.height)
         
         # Couleur selon la rareté
         self.color = {
@@ -464,6 +472,7 @@ class ItemManager:
         for item in self.items_on_ground[:]:
             if item.rect.colliderect(player.rect):
                 self.pickup_item(player, item, morality_system)
+                # Pas de pool : l'objet ramassé reste dans player_items (inventaire, synergies)
                 self.items_on_ground.remove(item)
     
     def pickup_item(self, player, item, morality_system=None):
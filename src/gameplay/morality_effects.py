@@ -1,12 +1,42 @@
 import pygame
 import math
+from ..utils.profiler import profiler
+from ..utils.sprite_cache import sprite_cache, SpriteCache
+from ..systems.particle_system import ParticleSystem
+
+# Lueur divine plein écran : cache dédié (3 Mo par sprite) pour ne pas évincer les auras du cache partagé
+DIVINE_GLOW_CACHE_SIZE = 4
+
+divine_glow_sprites = SpriteCache(max_entries=DIVINE_GLOW_CACHE_SIZE)
+
+# Particules d'aura : alpha = 255 * vie restante / vie totale (30 et 40 frames)
+MORALITY_PARTICLES = {
+    "faith": {  # Or, montent doucement
+        "max_particles": 16,
+        "velocity": ((-0.5, 0.5), (-1, -0.5)),
+        "size": (2, 2),
+        "alpha": (255, 255),
+        "fade": 255 / 30,
+        "color": (255, 215, 0),
+    },
+    "corruption": {  # Pourpre, dispersion chaotique
+        "max_particles": 32,
+        "velocity": ((-1, 1), (-1, 1)),
+        "size": (2, 2),
+        "alpha": (255, 255),
+        "fade": 255 / 40,
+        "color": (150, 0, 150),
+    },
+}
 
 class MoralityEffects:
     """Gère les effets visuels et gameplay selon la moralité"""
     
     def __init__(self):
         self.particle_timer = 0
-        self.aura_particles = []
+        self.aura_particles = ParticleSystem()
+        for name, definition in MORALITY_PARTICLES.items():
+            self.aura_particles.add_emitter(name, definition)
         self.screen_effects = []
         
     def get_size_multiplier(self, morality_system):
@@ -120,69 +150,33 @@ class MoralityEffects:
         """Met à jour les effets visuels selon la moralité"""
         self.particle_timer += 1
         
-        # Nettoyer les anciennes particules
-        self.aura_particles = [p for p in self.aura_particles if p['life'] > 0]
-        
         # Générer des particules selon l'état moral
         if self.particle_timer % 5 == 0:  # Toutes les 5 frames
             faith = morality_system.faith
             corruption = morality_system.corruption
+            center_x = player.x + player.width // 2
+            center_y = player.y + player.height // 2
             
             # Particules de Foi (dorées)
             if faith >= 60:
-                for _ in range(2 if faith >= 80 else 1):
-                    particle = {
-                        'x': player.x + player.width // 2 + (random.randint(-20, 20)),
-                        'y': player.y + player.height // 2 + (random.randint(-20, 20)),
-                        'vx': random.uniform(-0.5, 0.5),
-                        'vy': random.uniform(-1, -0.5),
-                        'life': 30,
-                        'max_life': 30,
-                        'color': (255, 215, 0),  # Or
-                        'type': 'faith'
-                    }
-                    self.aura_particles.append(particle)
+                self.aura_particles.emit("faith", 2 if faith >= 80 else 1,
+                                         center_x - 20, center_y - 20, 40, 40)
             
             # Particules de Corruption (pourpres)
             if corruption >= 50:
                 intensity = 3 if corruption >= 90 else 2 if corruption >= 70 else 1
-                for _ in range(intensity):
-                    particle = {
-                        'x': player.x + player.width // 2 + (random.randint(-25, 25)),
-                        'y': player.y + player.height // 2 + (random.randint(-25, 25)),
-                        'vx': random.uniform(-1, 1),
-                        'vy': random.uniform(-1, 1),
-                        'life': 40,
-                        'max_life': 40,
-                        'color': (150, 0, 150),  # Pourpre
-                        'type': 'corruption'
-                    }
-                    self.aura_particles.append(particle)
+                self.aura_particles.emit("corruption", intensity,
+                                         center_x - 25, center_y - 25, 50, 50)
         
-        # Mettre à jour les particules
-        for particle in self.aura_particles:
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['life'] -= 1
+        # Mettre à jour les particules (les mortes sont retirées)
+        self.aura_particles.update()
     
-    def draw_morality_effects(self, screen, camera, player, morality_system):
-        """Dessine les effets visuels de moralité"""
+    def draw_morality_effects(self, screen, camera, player, morality_system, visibility=None):
+        """Dessine les effets visuels de moralité (particules limitées à la zone de visibility si fournie)"""
         
-        # 1. Dessiner les particules d'aura
-        for particle in self.aura_particles:
-            if particle['life'] > 0:
-                # Convertir en coordonnées écran
-                screen_x, screen_y = camera.apply_pos(particle['x'], particle['y'])
-                
-                # Alpha basé sur la vie restante
-                alpha_ratio = particle['life'] / particle['max_life']
-                alpha = int(255 * alpha_ratio)
-                
-                # Créer une surface avec alpha
-                particle_surface = pygame.Surface((4, 4))
-                particle_surface.set_alpha(alpha)
-                particle_surface.fill(particle['color'])
-                screen.blit(particle_surface, (screen_x - 2, screen_y - 2))
+        # 1. Dessiner les particules d'aura (alpha basé sur la vie restante)
+        visible_area = visibility.area if visibility is not None else None
+        self.aura_particles.draw(screen, camera.x, camera.y, visible_area)
         
         # 2. Aura autour du joueur
         player_screen_rect = camera.apply(player)
@@ -199,12 +193,8 @@ class MoralityEffects:
             aura_radius = int(40 + (faith - 60) * 0.5)
             aura_intensity = int(30 + (faith - 60) * 0.3)
             
-            aura_surface = pygame.Surface((aura_radius * 2, aura_radius * 2))
-            aura_surface.set_alpha(aura_intensity)
-            
-            # Dessiner un cercle doré
-            pygame.draw.circle(aura_surface, (255, 215, 0), 
-                             (aura_radius, aura_radius), aura_radius)
+            # Cercle doré
+            aura_surface = sprite_cache.circle(aura_radius, (255, 215, 0), aura_intensity)
             
             screen.blit(aura_surface, 
                        (player_center[0] - aura_radius, player_center[1] - aura_radius))
@@ -218,12 +208,8 @@ class MoralityEffects:
             pulse = abs(math.sin(self.particle_timer * 0.1))
             current_radius = int(aura_radius * (0.8 + 0.2 * pulse))
             
-            aura_surface = pygame.Surface((current_radius * 2, current_radius * 2))
-            aura_surface.set_alpha(int(aura_intensity * pulse))
-            
-            # Dessiner un cercle pourpre
-            pygame.draw.circle(aura_surface, (150, 0, 150), 
-                             (current_radius, current_radius), current_radius)
+            # Cercle pourpre
+            aura_surface = sprite_cache.circle(current_radius, (150, 0, 150), int(aura_intensity * pulse))
             
             screen.blit(aura_surface, 
                        (player_center[0] - current_radius, player_center[1] - current_radius))
@@ -244,6 +230,7 @@ class MoralityEffects:
             y = random.randint(0, 768)
             
             distortion_surface = pygame.Surface((20, 20))
+            profiler.count("surfaces.allocated")
             distortion_surface.set_alpha(20)
             distortion_surface.fill((random.randint(100, 255), 0, random.randint(100, 255)))
             screen.blit(distortion_surface, (x, y))
@@ -252,10 +239,11 @@ class MoralityEffects:
         """Effet de lueur divine pour les Purs"""
         # Légère lueur dorée sur les bords de l'écran
         glow_intensity = abs(math.sin(self.particle_timer * 0.05)) * 15
+        if not divine_glow_sprites.get_alpha_bucket(glow_intensity):
+            return  # Palier d'alpha nul : rien de visible
         
-        glow_surface = pygame.Surface((1024, 768))
-        glow_surface.set_alpha(int(glow_intensity))
-        glow_surface.fill((255, 250, 200))
+        # Aplat d'une seule couleur, alpha de 0 à 15 : deux paliers, rendus une fois
+        glow_surface = divine_glow_sprites.rect(1024, 768, (255, 250, 200), glow_intensity)
         screen.blit(glow_surface, (0, 0))
 
 # Import nécessaire pour les particules
@@ -1,28 +1,66 @@
 import pygame
 import math
+import heapq
 import random
+from collections import OrderedDict
+import numpy as np
+
+# Taille des cases de NeighborGrid : la distance de séparation standard
+NEIGHBOR_CELL_SIZE = 40
+
+# Chemins gardés en mémoire par PathPlanner (les plus anciens sont évincés)
+PATH_CACHE_SIZE = 256
+
+# Largeur de la bande de spawn le long des bords (au-delà de la marge)
+SPAWN_EDGE_BAND = 32
 
 class PathfindingHelper:
     """Aide au pathfinding pour les ennemis"""
     
+    @staticmethod
+    def find_wall_collision(rect, walls):
+        """Retourne le premier mur touché par le rectangle, ou None
+        
+        walls est normalement le WallIndex du niveau ; une simple liste
+        de murs reste acceptée (parcours linéaire).
+        """
+        if hasattr(walls, 'first_hit'):
+            return walls.first_hit(rect)
+        for wall in walls:
+            if rect.colliderect(wall.rect):
+                return wall
+        return None
+    
     @staticmethod
     def is_position_free(x, y, width, height, walls):
         """Vérifie si une position est libre (pas dans un mur)"""
         test_rect = pygame.Rect(x, y, width, height)
-        for wall in walls:
-            if test_rect.colliderect(wall.rect):
-                return False
-        return True
+        return PathfindingHelper.find_wall_collision(test_rect, walls) is None
     
     @staticmethod
     def find_free_spawn_position(world_width, world_height, entity_width, entity_height, walls, player, min_distance_from_player=100):
-        """Trouve une position de spawn libre pour un ennemi"""
+        """Trouve une position de spawn libre pour un ennemi
+        
+        Avec un WallIndex, la position est tirée parmi les positions libres
+        précalculées du niveau (bande le long des bords) ; une simple liste
+        de murs garde les essais au hasard.
+        """
+        margin = 60  # Plus de marge pour éviter les murs de bordure
+        
+        sampler = walls.get_spawn_sampler() if hasattr(walls, 'get_spawn_sampler') else None
+        if sampler is not None:
+            position = sampler.sample(entity_width, entity_height, near=(player.x, player.y),
+                                      min_distance=min_distance_from_player,
+                                      margin=margin, edge_band=SPAWN_EDGE_BAND)
+            if position is not None:
+                return position
+            return world_width // 2, 50  # Haut centre par défaut
+        
         max_attempts = 50
         
         for _ in range(max_attempts):
             # Position aléatoire sur les bords
             side = random.randint(1, 4)
-            margin = 60  # Plus de marge pour éviter les murs de bordure
             
             if side == 1:  # Haut
                 x = random.randint(margin, world_width - margin - entity_width)
@@ -47,6 +85,28 @@ class PathfindingHelper:
         # Si on ne trouve pas, spawn au centre d'un bord (position safe)
         return world_width // 2, 50  # Haut centre par défaut
     
+    @staticmethod
+    def find_free_position_near(center_x, center_y, min_distance, max_distance,
+                                entity_width, entity_height, walls, margin=0, max_attempts=10):
+        """Position libre à une distance comprise entre min_distance et max_distance du point, ou None
+        
+        Avec un WallIndex, tirée parmi les positions libres précalculées du
+        niveau ; une simple liste de murs garde les essais au hasard.
+        """
+        sampler = walls.get_spawn_sampler() if hasattr(walls, 'get_spawn_sampler') else None
+        if sampler is not None:
+            return sampler.sample(entity_width, entity_height, near=(center_x, center_y),
+                                  min_distance=min_distance, max_distance=max_distance, margin=margin)
+        
+        for _ in range(max_attempts):
+            angle = random.uniform(0, 2 * math.pi)
+            distance = random.uniform(min_distance, max_distance)
+            x = center_x + math.cos(angle) * distance
+            y = center_y + math.sin(angle) * distance
+            if PathfindingHelper.is_position_free(x, y, entity_width, entity_height, walls):
+                return x, y
+        return None
+    
     @staticmethod
     def get_movement_direction(start_x, start_y, target_x, target_y, entity_width, entity_height, walls, speed):
         """Calcule la direction de mouvement avec évitement d'obstacles"""
@@ -93,6 +153,32 @@ class PathfindingHelper:
         # Si rien ne marche, rester sur place
         return 0, 0
     
+    @staticmethod
+    def get_chase_direction(start_x, start_y, target_x, target_y, entity_width, entity_height, walls, speed):
+        """Direction de poursuite lue dans le champ de flux du niveau (mêmes paramètres que get_movement_direction)
+    
+        Le champ (WallIndex.get_flow_field) est ciblé sur le joueur par GameScene ;
+        sans champ ou hors de tout chemin, retombe sur get_movement_direction.
+        """
+        flow_field = walls.get_flow_field() if hasattr(walls, 'get_flow_field') else None
+        if flow_field is not None and flow_field.has_target():
+            # Le champ travaille sur les centres, les entités sur leur coin haut-gauche
+            half_width, half_height = entity_width / 2, entity_height / 2
+            direction = flow_field.direction_at(start_x + half_width, start_y + half_height,
+                                                target_x + half_width, target_y + half_height)
+            if direction is not None:
+                move_dx, move_dy = direction[0] * speed, direction[1] * speed
+                if PathfindingHelper.is_position_free(start_x + move_dx, start_y + move_dy,
+                                                      entity_width, entity_height, walls):
+                    return move_dx, move_dy
+                # Coin de mur : glisser le long plutôt que sonder d'autres directions
+                return PathfindingHelper.wall_slide(start_x, start_y, move_dx, move_dy,
+                                                    entity_width, entity_height, walls)
+    
+        return PathfindingHelper.get_movement_direction(
+            start_x, start_y, target_x, target_y, entity_width, entity_height, walls, speed
+        )
+    
     @staticmethod
     def wall_slide(entity_x, entity_y, desired_dx, desired_dy, entity_width, entity_height, walls):
         """Permet de glisser le long des murs au lieu de se bloquer"""
@@ -109,13 +195,285 @@ class PathfindingHelper:
         
         # Aucun mouvement possible
         return 0, 0
+    
+    @staticmethod
+    def is_reachable(start_x, start_y, goal_x, goal_y, entity_width, entity_height, walls):
+        """Vérifie qu'un chemin relie les deux positions (coins haut-gauche d'une entité)"""
+        half_width, half_height = entity_width / 2, entity_height / 2
+        return path_planner.find_path(walls, start_x + half_width, start_y + half_height,
+                                      goal_x + half_width, goal_y + half_height) is not None
+    
+    @staticmethod
+    def follow_path(entity, goal_x, goal_y, walls, speed):
+        """Déplacement (dx, dy) vers un but en suivant un chemin A* mémorisé sur l'entité
+        
+        Le chemin (entity.path) n'est recalculé que lorsque le but change de
+        case ; sans chemin possible, retombe sur get_movement_direction.
+        """
+        # Le planificateur travaille sur les centres, les entités sur leur coin haut-gauche
+        half_width, half_height = entity.width / 2, entity.height / 2
+        center_x, center_y = entity.x + half_width, entity.y + half_height
+        aim_x, aim_y = goal_x + half_width, goal_y + half_height
+        
+        goal_key = path_planner.get_cell_key(walls, aim_x, aim_y)
+        if not hasattr(entity, 'path') or getattr(entity, 'path_goal', None) != goal_key:
+            entity.path = path_planner.find_path(walls, center_x, center_y, aim_x, aim_y)
+            entity.path_goal = goal_key
+        path = entity.path
+        if not path:
+            return PathfindingHelper.get_movement_direction(
+                entity.x, entity.y, goal_x, goal_y, entity.width, entity.height, walls, speed
+            )
+        
+        # Le but peut bouger à l'intérieur de sa case
+        path[-1] = (aim_x, aim_y)
+        # Points de passage atteints dans ce déplacement
+        while len(path) > 1 and (path[0][0] - center_x) ** 2 + (path[0][1] - center_y) ** 2 <= speed * speed:
+            path.pop(0)
+        
+        dx, dy = path[0][0] - center_x, path[0][1] - center_y
+        distance = math.sqrt(dx * dx + dy * dy)
+        if distance == 0:
+            return 0, 0
+        step = min(speed, distance)
+        move_dx, move_dy = dx / distance * step, dy / distance * step
+        if PathfindingHelper.is_position_free(entity.x + move_dx, entity.y + move_dy,
+                                              entity.width, entity.height, walls):
+            return move_dx, move_dy
+        return PathfindingHelper.wall_slide(entity.x, entity.y, move_dx, move_dy,
+                                            entity.width, entity.height, walls)
+
+class PathPlanner:
+    """Planificateur A* sur la grille de navigation du niveau, avec cache LRU des chemins
+    
+    La grille est celle du champ de flux (WallIndex.get_flow_field) : mêmes
+    cases, mêmes voisins, mêmes coûts. Les chemins sont mémorisés par
+    (case de départ, case d'arrivée, niveau) ; LevelManager.generate_level
+    vide le cache à chaque nouveau niveau.
+    """
+    
+    def __init__(self, capacity=PATH_CACHE_SIZE):
+        self.capacity = capacity
+        self.cache = OrderedDict()  # (départ, arrivée, niveau) -> cases de virage, ou None
+        self.level_id = None
+        
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.expanded = 0  # Cases développées par A*, tous calculs confondus
+    
+    @staticmethod
+    def get_grid(walls):
+        """Grille de navigation des murs, ou None pour une simple liste de murs"""
+        return walls.get_flow_field() if hasattr(walls, 'get_flow_field') else None
+    
+    @staticmethod
+    def get_level_id(walls, grid):
+        """Identifiant du niveau des murs (WallIndex.level_id)"""
+        return getattr(walls, 'level_id', id(grid))
+    
+    def get_cell_key(self, walls, x, y):
+        """Clé (niveau, case) du point, ou None sans grille de navigation"""
+        grid = self.get_grid(walls)
+        if grid is None:
+            return None
+        return self.get_level_id(walls, grid), grid.cell_at(x, y)
+    
+    def invalidate(self):
+        """Oublie tous les chemins (nouveau niveau)"""
+        self.cache.clear()
+        self.level_id = None
+        self.invalidations += 1
+    
+    def find_path(self, walls, start_x, start_y, goal_x, goal_y):
+        """Points de passage de (start) à (goal) : centres des cases de virage puis le but exact
+        
+        Retourne None si le but est inaccessible ; sans grille de navigation
+        (liste de murs), le but seul.
+        """
+        grid = self.get_grid(walls)
+        if grid is None:
+            return [(goal_x, goal_y)]
+        
+        level_id = self.get_level_id(walls, grid)
+        if level_id != self.level_id:
+            # Autre niveau : aucun chemin en cache n'est encore valable
+            self.cache.clear()
+            self.level_id = level_id
+        
+        key = (grid.cell_at(start_x, start_y), grid.cell_at(goal_x, goal_y), level_id)
+        if key in self.cache:
+            self.hits += 1
+            self.cache.move_to_end(key)
+            corners = self.cache[key]
+        else:
+            self.misses += 1
+            corners = self._search(grid, key[0], key[1])
+            self.cache[key] = corners
+            if len(self.cache) > self.capacity:
+                self.cache.popitem(last=False)
+                self.evictions += 1
+        
+        if corners is None:
+            return None
+        size, cols = grid.cell_size, grid.cols
+        path = [((cell % cols + 0.5) * size, (cell // cols + 0.5) * size) for cell in corners]
+        path.append((goal_x, goal_y))
+        return path
+    
+    def _search(self, grid, start, goal):
+        """A* de la case start à la case goal ; retourne les cases de virage ou None"""
+        cols, blocked = grid.cols, grid.blocked
+        straight_cost, diagonal_cost = grid.straight_cost, grid.diagonal_cost
+        # Une case qui touche un mur n'a pas de voisins : partir / arriver par ses sorties
+        starts = grid.wall_exits.get(start, ()) if blocked[start] else (start,)
+        goals = set(grid.wall_exits.get(goal, ())) if blocked[goal] else {goal}
+        if not starts or not goals:
+            return None
+        
+        goal_col, goal_row = goal % cols, goal // cols
+        
+        def heuristic(cell):
+            # Distance octile avec les coûts entiers de la grille
+            d_col = abs(cell % cols - goal_col)
+            d_row = abs(cell // cols - goal_row)
+            if d_col < d_row:
+                d_col, d_row = d_row, d_col
+            return straight_cost * (d_col - d_row) + diagonal_cost * d_row
+        
+        best_cost = {}
+        came_from = {}
+        open_heap = []
+        for cell in starts:
+            cost = 0 if cell == start else straight_cost
+            best_cost[cell] = cost
+            came_from[cell] = None
+            heapq.heappush(open_heap, (cost + heuristic(cell), cost, cell))
+        
+        straight_neighbors, diagonal_neighbors = grid.straight_neighbors, grid.diagonal_neighbors
+        found = None
+        while open_heap:
+            _, cost, cell = heapq.heappop(open_heap)
+            if cost != best_cost[cell]:
+                continue  # Entrée périmée
+            self.expanded += 1
+            if cell in goals:
+                found = cell
+                break
+            for neighbors, step in ((straight_neighbors[cell], straight_cost),
+                                    (diagonal_neighbors[cell], diagonal_cost)):
+                new_cost = cost + step
+                for neighbor in neighbors:
+                    old_cost = best_cost.get(neighbor)
+                    if old_cost is None or new_cost < old_cost:
+                        best_cost[neighbor] = new_cost
+                        came_from[neighbor] = cell
+                        heapq.heappush(open_heap, (new_cost + heuristic(neighbor), new_cost, neighbor))
+        if found is None:
+            return None
+        
+        cells = []
+        while found is not None:
+            cells.append(found)
+            found = came_from[found]
+        cells.reverse()
+        if cells[0] != start:
+            cells.insert(0, start)
+        if cells[-1] != goal:
+            cells.append(goal)
+        
+        # Ne garder que les virages : le reste est en ligne droite
+        return tuple(cells[index] for index in range(1, len(cells) - 1)
+                     if cells[index] - cells[index - 1] != cells[index + 1] - cells[index])
+
+# Planificateur partagé (cache vidé par LevelManager.generate_level)
+path_planner = PathPlanner()
+
+class NeighborGrid:
+    """Ennemis indexés par case (position x, y) pour les requêtes de voisinage
+    
+    Se parcourt comme la liste d'origine : peut être passé tel quel en
+    other_enemies. move() tient l'index à jour quand un ennemi se déplace.
+    """
+    
+    def __init__(self, entities=(), cell_size=NEIGHBOR_CELL_SIZE):
+        self.cell_size = cell_size
+        self.entities = []
+        self.cells = {}  # (col, row) -> liste de (ordre, entité)
+        self.entity_cells = {}  # id(entité) -> (ordre, case)
+        self.rebuild(entities)
+    
+    def rebuild(self, entities):
+        """Réindexe toute la liste (une fois par tick)"""
+        self.entities = entities
+        self.cells.clear()
+        self.entity_cells.clear()
+        size = self.cell_size
+        cells = self.cells
+        for order, entity in enumerate(entities):
+            key = (int(entity.x // size), int(entity.y // size))
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [(order, entity)]
+            else:
+                bucket.append((order, entity))
+            self.entity_cells[id(entity)] = (order, key)
+    
+    def move(self, entity):
+        """Change l'entité de case si elle s'est déplacée ; False si elle n'est pas indexée"""
+        entry = self.entity_cells.get(id(entity))
+        if entry is None:
+            return False
+        order, old_key = entry
+        size = self.cell_size
+        key = (int(entity.x // size), int(entity.y // size))
+        if key != old_key:
+            bucket = self.cells[old_key]
+            bucket.remove((order, entity))
+            if not bucket:
+                del self.cells[old_key]
+            self.cells.setdefault(key, []).append((order, entity))
+            self.entity_cells[id(entity)] = (order, key)
+        return True
+    
+    def query_radius(self, x, y, radius):
+        """Entités dont la case touche le carré de côté 2×radius centré sur (x, y), dans l'ordre de la liste"""
+        size = self.cell_size
+        cells = self.cells
+        found = []
+        for row in range(int((y - radius) // size), int((y + radius) // size) + 1):
+            for col in range(int((x - radius) // size), int((x + radius) // size) + 1):
+                bucket = cells.get((col, row))
+                if bucket:
+                    found.extend(bucket)
+        found.sort(key=lambda item: item[0])
+        return [entity for _, entity in found]
+    
+    # === COMPATIBILITÉ LISTE ===
+    
+    def __iter__(self):
+        return iter(self.entities)
+    
+    def __len__(self):
+        return len(self.entities)
+    
+    def __bool__(self):
+        return bool(self.entities)
 
 class FlockingBehavior:
     """Comportement de groupe pour éviter que les ennemis se superposent"""
     
     @staticmethod
     def get_separation_force(entity, other_entities, separation_distance=40):
-        """Force de séparation pour éviter les collisions entre ennemis"""
+        """Force de séparation pour éviter les collisions entre ennemis
+        
+        other_entities est une liste, ou un NeighborGrid : seuls les voisins
+        des cases proches sont alors examinés.
+        """
+        if hasattr(other_entities, 'query_radius'):
+            other_entities = other_entities.query_radius(entity.x, entity.y, separation_distance)
+        
         force_x, force_y = 0, 0
         count = 0
         
@@ -152,4 +510,68 @@ class FlockingBehavior:
                     force_x = (force_x / force_magnitude) * max_force
                     force_y = (force_y / force_magnitude) * max_force
         
-        return force_x, force_y
\ No newline at end of file
+        return force_x, force_y
+    
+    @staticmethod
+    def get_separation_forces(xs, ys, separation_distance=40, max_force=2.0):
+        """Forces de séparation de toutes les entités en une passe NumPy
+        
+        Même formule que get_separation_force, appliquée aux positions
+        (xs, ys) figées ; separation_distance peut varier par entité.
+        Les paires candidates viennent des 9 cases voisines (cases de la
+        plus grande distance). Retourne deux tableaux (force_x, force_y).
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        count = len(xs)
+        distances = np.broadcast_to(np.asarray(separation_distance, dtype=np.float64), (count,))
+        if count < 2:
+            return np.zeros(count), np.zeros(count)
+        
+        # Cases de la plus grande distance, clés décalées pour rester positives
+        cell_size = float(distances.max())
+        cols = np.floor(xs / cell_size).astype(np.int64)
+        rows = np.floor(ys / cell_size).astype(np.int64)
+        cols -= cols.min() - 1
+        rows -= rows.min() - 1
+        width = int(cols.max()) + 2
+        keys = rows * width + cols
+        order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[order]
+        
+        # Paires (i, j) : chaque entité contre les entités des 9 cases voisines
+        pair_i, pair_j = [], []
+        entity_index = np.arange(count)
+        for d_row in (-1, 0, 1):
+            for d_col in (-1, 0, 1):
+                neighbor_keys = keys + d_row * width + d_col
+                starts = np.searchsorted(sorted_keys, neighbor_keys, side='left')
+                counts = np.searchsorted(sorted_keys, neighbor_keys, side='right') - starts
+                total = int(counts.sum())
+                if not total:
+                    continue
+                offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+                pair_i.append(np.repeat(entity_index, counts))
+                pair_j.append(order[np.repeat(starts, counts) + offsets])
+        pair_i = np.concatenate(pair_i)
+        pair_j = np.concatenate(pair_j)
+        
+        diff_x = xs[pair_i] - xs[pair_j]
+        diff_y = ys[pair_i] - ys[pair_j]
+        distance = np.sqrt(diff_x * diff_x + diff_y * diff_y)
+        limit = distances[pair_i]
+        # distance > 0 exclut l'entité elle-même (et les positions confondues)
+        close = (distance > 0) & (distance < limit)
+        pair_i, diff_x, diff_y = pair_i[close], diff_x[close], diff_y[close]
+        distance, limit = distance[close], limit[close]
+        strength = (limit - distance) / limit / distance
+        
+        neighbors = np.bincount(pair_i, minlength=count)
+        divisor = np.maximum(neighbors, 1)
+        force_x = np.bincount(pair_i, weights=diff_x * strength, minlength=count) / divisor
+        force_y = np.bincount(pair_i, weights=diff_y * strength, minlength=count) / divisor
+        
+        # Limiter la norme à max_force
+        magnitude = np.sqrt(force_x * force_x + force_y * force_y)
+        scale = np.where(magnitude > max_force, max_force / np.maximum(magnitude, 1e-12), 1.0)
+        return force_x * scale, force_y * scale
\ No newline at end of file
@@ -3,6 +3,9 @@ Scène de base - Interface commune pour toutes les scènes
 Définit les méthodes que chaque scène doit implémenter
 """
 import pygame
+from ..utils.game_log import get_logger
+
+_log = get_logger("scenes.base")
 
 class BaseScene:
     """Classe de base pour toutes les scènes du jeu"""
@@ -11,27 +14,30 @@ class BaseScene:
         self.scene_manager = None  # Référence vers le gestionnaire
         self.is_active = False
         self.is_paused = False
+        
+        # Fraction du tick en cours au moment du rendu (fixée par SceneManager.render)
+        self.render_alpha = 1.0
     
     def on_enter(self):
         """Appelé quand la scène devient active"""
         self.is_active = True
         self.is_paused = False
-        print(f"🎬 Entrée dans {self.__class__.__name__}")
+        _log.info("🎬 Entrée dans %s", self.__class__.__name__)
     
     def on_exit(self):
         """Appelé quand la scène est quittée"""
         self.is_active = False
-        print(f"🚪 Sortie de {self.__class__.__name__}")
+        _log.info("🚪 Sortie de %s", self.__class__.__name__)
     
     def on_pause(self):
         """Appelé quand la scène est mise en pause"""
         self.is_paused = True
-        print(f"⏸️ Pause de {self.__class__.__name__}")
+        _log.info("⏸️ Pause de %s", self.__class__.__name__)
     
     def on_resume(self):
         """Appelé quand la scène reprend après une pause"""
         self.is_paused = False
-        print(f"▶️ Reprise de {self.__class__.__name__}")
+        _log.info("▶️ Reprise de %s", self.__class__.__name__)
     
     def handle_event(self, event):
         """Gère les événements pygame"""
@@ -58,18 +64,18 @@ class BaseScene:
         if self.scene_manager:
             self.scene_manager.set_active_scene(scene_name)
         else:
-            print("❌ Aucun gestionnaire de scène disponible")
+            _log.error("❌ Aucun gestionnaire de scène disponible")
     
     def push_scene(self, scene_name):
         """Utilitaire pour empiler une scène"""
         if self.scene_manager:
             self.scene_manager.push_scene(scene_name)
         else:
-            print("❌ Aucun gestionnaire de scène disponible")
+            _log.error("❌ Aucun gestionnaire de scène disponible")
     
     def pop_scene(self):
         """Utilitaire pour dépiler la scène courante"""
         if self.scene_manager:
             self.scene_manager.pop_scene()
         else:
-            print("❌ Aucun gestionnaire de scène disponible")
\ No newline at end of file
+            _log.error("❌ Aucun gestionnaire de scène disponible")
\ No newline at end of file
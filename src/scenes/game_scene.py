@@ -22,18 +22,23 @@ try:
     from ..utils.debug_logger import debug_log, debug_section
 except ImportError:
     # Fallback si debug_logger n'est pas disponible
-    def debug_log(msg): print(msg)
-    def debug_section(title): print(f"=== {title} ===")
+    def debug_log(msg): _log.info("%s", msg)
+    def debug_section(title): _log.info("=== %s ===", title)
 
 from .base_scene import BaseScene
 from ..core.constants import SCREEN_WIDTH, SCREEN_HEIGHT, WORLD_WIDTH, WORLD_HEIGHT, WHITE, BLACK
 from ..systems.entity_manager import EntityManager
 from ..systems.collision_system import CollisionSystem  
+from ..systems.ai_scheduler import AILodScheduler
+from ..systems.wave_director import WaveDirector, resolve_enemy_types
+from ..systems.entity_dispatch import draw_entity, get_update_arity
+from ..systems.visibility import VisibilityPass
 from ..world.level_manager import LevelManager
 
 # Imports des modules restructurés
 from ..entities.player import Player
 from ..gameplay.camera import Camera
+from ..gameplay.pathfinding import NeighborGrid
 from ..systems.experience_system import ExperienceSystem
 from ..ui.ui_manager import UIManager
 from ..ui.hud_manager import HUDManager
@@ -43,6 +48,74 @@ from ..systems.morality_system import MoralitySystem
 from ..systems.sound_system import create_sound_manager
 from ..world.background import GameBackground
 from ..world.difficulty_manager import DifficultyManager
+from ..utils.game_log import advance_frame, get_logger
+from ..utils.profiler import profiler
+from ..core.fixed_timestep import snapshot_positions, interpolate_position
+
+_log = get_logger("scenes.game")
+
+class SimpleWall:
+    """Mur minimal créé à partir des données de niveau"""
+    
+    __slots__ = ("rect", "x", "y", "width", "height")
+    
+    def __init__(self, x, y, width, height):
+        self.rect = pygame.Rect(x, y, width, height)
+        self.x, self.y = x, y
+        self.width, self.height = width, height
+
+class SimpleEnemy:
+    """Ennemi de secours quand le paquet des ennemis ne s'importe pas"""
+    
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+        self.width = 20
+        self.height = 20
+        self.health = 30
+        self.max_health = 30
+        self.speed = 2
+        self.rect = pygame.Rect(x, y, 20, 20)
+        self.color = (255, 0, 0)  # Rouge
+    
+    def update(self, player, walls, other_enemies=None):
+        """Mouvement simple vers le joueur"""
+        if player:
+            # Direction vers le joueur
+            dx = player.x - self.x
+            dy = player.y - self.y
+            
+            # Normaliser et appliquer vitesse
+            distance = math.sqrt(dx*dx + dy*dy)
+            if distance > 0:
+                self.x += (dx/distance) * self.speed
+                self.y += (dy/distance) * self.speed
+                self.rect.x = self.x
+                self.rect.y = self.y
+    
+    def take_damage(self, damage):
+        """Prendre des dégâts"""
+        self.health -= damage
+        return self.health <= 0
+    
+    def draw(self, screen, screen_x=None, screen_y=None):
+        """Dessiner l'ennemi"""
+        if screen_x is not None and screen_y is not None:
+            # Coordonnées d'écran fournies
+            pygame.draw.rect(screen, self.color, (screen_x, screen_y, self.width, self.height))
+        else:
+            # Coordonnées monde
+            pygame.draw.rect(screen, self.color, (self.x, self.y, self.width, self.height))
+
+def _fill_floating_text(text_data, x, y, text, color, duration=60):
+    """Remplit (ou remet à neuf) le dict d'un texte flottant"""
+    text_data['x'] = x
+    text_data['y'] = y
+    text_data['text'] = text
+    text_data['color'] = color
+    text_data['timer'] = duration
+    text_data['start_y'] = y
+    return text_data
 
 class GameScene(BaseScene):
     """Scène principale de jeu"""
@@ -55,8 +128,14 @@ class GameScene(BaseScene):
         
         # === Managers principaux ===
         self.entity_manager = EntityManager()
+        self.entity_manager.enable_projectile_pool()  # Tirs simples en tableaux NumPy
+        self.entity_manager.enable_enemy_batch()  # IA des ennemis simples en une passe NumPy
         self.collision_system = CollisionSystem()
         self.level_manager = LevelManager()
+        self.neighbor_grid = NeighborGrid()  # Voisinage des ennemis, réindexé à chaque tick
+        self.ai_scheduler = AILodScheduler()  # IA moins fréquente pour les ennemis hors écran
+        self.entity_manager.enemy_release_listeners.append(self.ai_scheduler.forget)
+        self.visibility = VisibilityPass(SCREEN_WIDTH, SCREEN_HEIGHT)  # Entités visibles, calculées une fois par frame
         
         # Configurer le système de collision pour qu'il ait accès aux autres systèmes
         self.collision_system.game_scene = self
@@ -80,10 +159,15 @@ class GameScene(BaseScene):
         
         # === Notifications visuelles ===
         self.floating_texts = []  # Pour afficher +XP, +Level, etc.
+        self.floating_text_pool = self.entity_manager.get_object_pool(
+            "floating_texts", lambda *args: _fill_floating_text({}, *args), _fill_floating_text)
         
         # === Contrôles ===
         self.keys_pressed = {}
         
+        # Overlay de profilage (F3) ; F4 exporte les dernières images
+        self.show_profiler_overlay = False
+        
         # === Fontes ===
         self.font = pygame.font.Font(None, 36)
         
@@ -92,7 +176,7 @@ class GameScene(BaseScene):
     
     def initialize_game(self):
         """Initialise tous les systèmes de jeu"""
-        print("🎮 Initialisation de la scène de jeu...")
+        _log.info("🎮 Initialisation de la scène de jeu...")
         
         # Player et caméra
         self.player = Player(WORLD_WIDTH // 2, WORLD_HEIGHT // 2)
@@ -104,18 +188,20 @@ class GameScene(BaseScene):
         
         # CORRECTION: Ajouter le joueur à l'EntityManager
         self.entity_manager.add_player(self.player)
+        if hasattr(self.player, 'weapon_manager') and hasattr(self.player.weapon_manager, 'projectile_pool'):
+            self.entity_manager.register_object_pool("weapon_projectiles", self.player.weapon_manager.projectile_pool)
         
         # Systèmes de jeu
         try:
             self.exp_system = ExperienceSystem()
         except:
-            print("⚠️  ExperienceSystem non disponible")
+            _log.warning("⚠️  ExperienceSystem non disponible")
             self.exp_system = None
         
         try:
             self.ui_manager = UIManager()
         except:
-            print("⚠️  UIManager non disponible")
+            _log.warning("⚠️  UIManager non disponible")
             self.ui_manager = None
         
         # 🎨 NOUVEAU: HUD Manager pour la nouvelle UI
@@ -130,22 +216,33 @@ class GameScene(BaseScene):
         # Gestionnaire de difficulté
         self.difficulty_manager = DifficultyManager()
         
+        # Types d'ennemis résolus une fois ; les vagues sont créées par petits lots
+        enemy_types = resolve_enemy_types()
+        if not enemy_types:
+            _log.error("❌ Aucun ennemi importé, création d'ennemis simples...")
+            enemy_types = [self.create_simple_enemy]
+        self.wave_director = WaveDirector(enemy_types)
+        
         try:
             self.item_manager = ItemManager()
         except:
-            print("⚠️  ItemManager non disponible")
+            _log.warning("⚠️  ItemManager non disponible")
             self.item_manager = None
         
         try:
             self.morality_system = MoralitySystem()
         except:
-            print("⚠️  MoralitySystem non disponible")
+            _log.warning("⚠️  MoralitySystem non disponible")
             self.morality_system = None
         
+        # Signatures des systèmes appelés à chaque frame, résolues une fois
+        self.morality_update_arity = get_update_arity(getattr(self.morality_system, 'update', None), (1, 0))
+        self.level_up_draw_arity = get_update_arity(getattr(self.exp_system, 'draw_level_up_screen', None), (3, 1))
+        
         try:
             self.sound_system = create_sound_manager()
         except:
-            print("⚠️  SoundSystem non disponible")
+            _log.warning("⚠️  SoundSystem non disponible")
             self.sound_system = None
         
         # Configurer les références dans le système de collision
@@ -156,11 +253,11 @@ class GameScene(BaseScene):
         # Générer le niveau
         self.generate_level()
         
-        print("✅ Scène de jeu initialisée")
+        _log.info("✅ Scène de jeu initialisée")
     
     def generate_level(self):
         """Génère un nouveau niveau"""
-        print(f"🏗️  Génération du niveau {self.wave_number}...")
+        _log.info("🏗️  Génération du niveau %s...", self.wave_number)
         
         # Nettoyer les entités existantes
         self.entity_manager.clear_all()
@@ -179,23 +276,20 @@ class GameScene(BaseScene):
                     wall = self.create_wall_from_data(wall_data)
                     self.entity_manager.add_wall(wall)
             
+            # Les murs ne changent plus avant le prochain niveau : indexer une fois
+            self.entity_manager.rebuild_wall_index()
+            
             # Spawner les ennemis pour cette vague
             self.spawn_wave_enemies()
             
         except Exception as e:
-            print(f"⚠️  Erreur génération niveau: {e}")
+            _log.warning("⚠️  Erreur génération niveau: %s", e)
             # Fallback : niveau vide
             self.spawn_wave_enemies()
     
     def create_wall_from_data(self, wall_data):
         """Crée un mur à partir des données"""
         # Implémentation simple - à adapter selon vos classes
-        class SimpleWall:
-            def __init__(self, x, y, width, height):
-                self.rect = pygame.Rect(x, y, width, height)
-                self.x, self.y = x, y
-                self.width, self.height = width, height
-        
         return SimpleWall(
             wall_data.get("x", 0),
             wall_data.get("y", 0), 
@@ -205,60 +299,11 @@ class GameScene(BaseScene):
     
     def create_simple_enemy(self, x, y):
         """Crée un ennemi simple de fallback"""
-        class SimpleEnemy:
-            def __init__(self, x, y):
-                self.x = x
-                self.y = y
-                self.width = 20
-                self.height = 20
-                self.health = 30
-                self.max_health = 30
-                self.speed = 2
-                self.rect = pygame.Rect(x, y, 20, 20)
-                self.color = (255, 0, 0)  # Rouge
-            
-            def update(self, player, walls, other_enemies=None):
-                """Mouvement simple vers le joueur"""
-                if player:
-                    # Direction vers le joueur
-                    dx = player.x - self.x
-                    dy = player.y - self.y
-                    
-                    # Normaliser et appliquer vitesse
-                    import math
-                    distance = math.sqrt(dx*dx + dy*dy)
-                    if distance > 0:
-                        self.x += (dx/distance) * self.speed
-                        self.y += (dy/distance) * self.speed
-                        self.rect.x = self.x
-                        self.rect.y = self.y
-            
-            def take_damage(self, damage):
-                """Prendre des dégâts"""
-                self.health -= damage
-                return self.health <= 0
-            
-            def draw(self, screen, screen_x=None, screen_y=None):
-                """Dessiner l'ennemi"""
-                if screen_x is not None and screen_y is not None:
-                    # Coordonnées d'écran fournies
-                    pygame.draw.rect(screen, self.color, (screen_x, screen_y, self.width, self.height))
-                else:
-                    # Coordonnées monde
-                    pygame.draw.rect(screen, self.color, (self.x, self.y, self.width, self.height))
-        
         return SimpleEnemy(x, y)
     
     def add_floating_text(self, x, y, text, color, duration=60):
         """Ajoute un texte flottant à afficher"""
-        self.floating_texts.append({
-            'x': x,
-            'y': y,
-            'text': text,
-            'color': color,
-            'timer': duration,
-            'start_y': y
-        })
+        self.floating_texts.append(self.floating_text_pool.acquire(x, y, text, color, duration))
     
     def update_floating_texts(self):
         """Met à jour les textes flottants"""
@@ -268,17 +313,22 @@ class GameScene(BaseScene):
             
             if text_data['timer'] <= 0:
                 self.floating_texts.remove(text_data)
+                self.floating_text_pool.release(text_data)
     
     def draw_floating_texts(self, screen):
-        """Dessine les textes flottants"""
+        """Dessine les textes flottants de la zone visible"""
         font = pygame.font.Font(None, 24)
+        visibility = self.visibility
         for text_data in self.floating_texts:
+            if not visibility.contains_point(text_data['x'], text_data['y']):
+                continue
+            
             # Calculer l'alpha pour fade out
             alpha = min(255, text_data['timer'] * 4) if text_data['timer'] < 60 else 255
             
             # Coordonnées écran
-            screen_x = text_data['x'] - self.camera.x
-            screen_y = text_data['y'] - self.camera.y
+            screen_x = text_data['x'] - visibility.camera_x
+            screen_y = text_data['y'] - visibility.camera_y
             
             # Créer surface avec alpha
             text_surface = font.render(text_data['text'], True, text_data['color'])
@@ -340,8 +390,8 @@ class GameScene(BaseScene):
             debug_log(f"✅ Level-up terminé, retour au jeu")
     
     def spawn_wave_enemies(self):
-        """Génère les ennemis pour la vague actuelle"""
-        print(f"🌊 Spawn vague {self.wave_number}...")
+        """Planifie les ennemis de la vague actuelle (créés ensuite par spawn_pending_enemies)"""
+        _log.info("🌊 Spawn vague %s...", self.wave_number)
         
         # Calculer le nombre d'ennemis selon la vague (progression exponentielle)
         base_enemies = min(5 + int(self.wave_number * 1.4), 25)  # Plus d'ennemis, croissance exponentielle
@@ -350,70 +400,33 @@ class GameScene(BaseScene):
         spawn_multiplier = self.difficulty_manager.get_spawn_count_multiplier(self.wave_number)
         actual_enemy_count = int(base_enemies * spawn_multiplier)
         
-        print(f"🎯 Difficulté: {self.difficulty_manager.get_difficulty_description(self.wave_number)}")
-        print(f"📊 Ennemis prévus: {actual_enemy_count} (base: {base_enemies}, mult: {spawn_multiplier:.1f}x)")
-        enemy_types = []
-        
-        # Tenter d'importer les types d'ennemis un par un
-        try:
-            from enemies.basic_enemies import BasicEnemy
-            enemy_types.append(BasicEnemy)
-            print("✅ BasicEnemy importé")
-        except Exception as e:
-            print(f"⚠️  BasicEnemy échoué: {e}")
-        
-        try:
-            from enemies.basic_enemies import ShooterEnemy
-            enemy_types.append(ShooterEnemy)
-            print("✅ ShooterEnemy importé")
-        except Exception as e:
-            print(f"⚠️  ShooterEnemy échoué: {e}")
+        _log.info("🎯 Difficulté: %s", self.difficulty_manager.get_difficulty_description(self.wave_number))
+        _log.info("📊 Ennemis prévus: %s (base: %s, mult: %.1fx)", actual_enemy_count, base_enemies, spawn_multiplier)
         
+        # Composition tirée maintenant, instanciation étalée sur les ticks suivants
+        self.enemies_remaining = self.wave_director.plan_wave(self.wave_number, actual_enemy_count)
+    
+    def spawn_pending_enemies(self):
+        """Crée une partie des ennemis planifiés, dans le budget du tick"""
+        self.wave_director.update(self._spawn_enemy)
+    
+    def _spawn_enemy(self, enemy_type, x, y):
+        """Crée (ou réutilise), met à l'échelle de la vague et enregistre un ennemi planifié"""
         try:
-            from enemies.basic_enemies import FastEnemy
-            enemy_types.append(FastEnemy)
-            print("✅ FastEnemy importé")
+            pool = self.entity_manager.get_object_pool(
+                f"enemies.{getattr(enemy_type, '__name__', 'enemy')}", enemy_type)
+            enemy = pool.acquire(x, y)
+            
+            # Appliquer le scaling de difficulté
+            enemy = self.difficulty_manager.apply_enemy_scaling(enemy, self.wave_number)
+            
+            self.entity_manager.add_enemy(enemy)
+            return True
         except Exception as e:
-            print(f"⚠️  FastEnemy échoué: {e}")
-        
-        # Si aucun ennemi n'a pu être importé, créer des ennemis de base simples
-        if not enemy_types:
-            print("❌ Aucun ennemi importé, création d'ennemis simples...")
-            enemy_types = [self.create_simple_enemy]
-        
-        self.enemies_remaining = base_enemies
-        enemies_created = 0
-        
-        for i in range(actual_enemy_count):
-            try:
-                # Position aléatoire aux bords de la map
-                edge = random.choice(['top', 'bottom', 'left', 'right'])
-                if edge == 'top':
-                    x, y = random.randint(50, WORLD_WIDTH - 50), 50
-                elif edge == 'bottom':
-                    x, y = random.randint(50, WORLD_WIDTH - 50), WORLD_HEIGHT - 50
-                elif edge == 'left':
-                    x, y = 50, random.randint(50, WORLD_HEIGHT - 50)
-                else:  # right
-                    x, y = WORLD_WIDTH - 50, random.randint(50, WORLD_HEIGHT - 50)
-                
-                # Choisir un type d'ennemi
-                enemy_class = random.choice(enemy_types)
-                enemy = enemy_class(x, y)
-                
-                # Appliquer le scaling de difficulté
-                enemy = self.difficulty_manager.apply_enemy_scaling(enemy, self.wave_number)
-                
-                self.entity_manager.add_enemy(enemy)
-                enemies_created += 1
-                
-            except Exception as e:
-                print(f"⚠️  Erreur création ennemi {i}: {e}")
-                continue
-        
-        print(f"✅ {enemies_created}/{actual_enemy_count} ennemis créés avec scaling vague {self.wave_number}")
-        # Ajuster le count si certains ennemis n'ont pas pu être créés
-        self.enemies_remaining = enemies_created
+            _log.warning("⚠️  Erreur création ennemi %s: %s", getattr(enemy_type, '__name__', enemy_type), e)
+            # Ajuster le count si certains ennemis n'ont pas pu être créés
+            self.enemies_remaining -= 1
+            return False
     
     def handle_event(self, event):
         """Gère les événements de jeu"""
@@ -425,10 +438,10 @@ class GameScene(BaseScene):
                     self.game_state = "playing"
                 elif action == "main_menu":
                     # TODO: Retourner au menu principal
-                    print("🔧 TODO: Retour au menu principal")
+                    _log.info("🔧 TODO: Retour au menu principal")
                 elif action == "settings":
                     # TODO: Ouvrir les paramètres
-                    print("🔧 TODO: Ouvrir paramètres")
+                    _log.info("🔧 TODO: Ouvrir paramètres")
                 elif action == "quit":
                     pygame.quit()
                     exit()
@@ -449,13 +462,13 @@ class GameScene(BaseScene):
             
             # Debug: Forcer la vague suivante (N key)
             if event.key == pygame.K_n and self.game_state == "playing":
-                print("🔧 Debug: Forcer vague suivante")
+                _log.info("🔧 Debug: Forcer vague suivante")
                 self.next_wave()
             
             # Debug: Afficher état des ennemis (M key)
             if event.key == pygame.K_m and self.game_state == "playing":
                 actual_count = len(self.entity_manager.get_enemies())
-                print(f"📊 Debug état: enemies_remaining={self.enemies_remaining}, actual_count={actual_count}")
+                _log.info("📊 Debug état: enemies_remaining=%s, actual_count=%s", self.enemies_remaining, actual_count)
                 self.entity_manager.print_status()
             
             # Debug: Ajouter de l'expérience (X key)
@@ -463,13 +476,13 @@ class GameScene(BaseScene):
                 if hasattr(self.exp_system, 'add_experience'):
                     old_level = getattr(self.exp_system, 'level', 0)
                     old_exp = getattr(self.exp_system, 'experience', 0)
-                    print(f"🎯 Debug: +50 XP (avant: {old_exp} XP, niveau {old_level})")
+                    _log.info("🎯 Debug: +50 XP (avant: %s XP, niveau %s)", old_exp, old_level)
                     
                     self.exp_system.add_experience(50)
                     
                     new_level = getattr(self.exp_system, 'level', 0)
                     new_exp = getattr(self.exp_system, 'experience', 0)
-                    print(f"🎯 Debug: après: {new_exp} XP, niveau {new_level}")
+                    _log.info("🎯 Debug: après: %s XP, niveau %s", new_exp, new_level)
                     
                     # Notification
                     self.add_floating_text(self.player.x, self.player.y, "+50 XP", (0, 255, 0))
@@ -477,7 +490,18 @@ class GameScene(BaseScene):
                     if new_level > old_level:
                         self.add_floating_text(self.player.x, self.player.y - 30, "LEVEL UP!", (255, 215, 0))
                 else:
-                    print("❌ exp_system non disponible ou pas de add_experience")
+                    _log.error("❌ exp_system non disponible ou pas de add_experience")
+            
+            # Debug: Overlay de profilage (F3)
+            if event.key == pygame.K_F3:
+                self.show_profiler_overlay = profiler.toggle()
+                _log.info("⏱️ Profilage %s", "activé" if self.show_profiler_overlay else "désactivé")
+            
+            # Debug: Exporter les dernières images profilées (F4)
+            if event.key == pygame.K_F4 and profiler.frames:
+                profiler.export_csv("profiler_frames.csv")
+                profiler.export_json("profiler_frames.json")
+                _log.info("💾 Profilage exporté: profiler_frames.csv / profiler_frames.json (%s images)", len(profiler.frames))
             
             # 🔧 PLUS DE GESTION CLAVIER POUR LEVEL-UP
             # Tous les contrôles level-up sont maintenant à la souris uniquement
@@ -571,7 +595,10 @@ class GameScene(BaseScene):
                 pass
     
     def update(self, dt):
-        """Met à jour la logique de jeu"""
+        """Met à jour la logique de jeu (appelé une fois par tick de durée fixe)"""
+        # Positions de début de tick, aussi en pause : le rendu interpolé reste immobile
+        self.snapshot_positions()
+        
         if self.game_state != "playing":
             return
         
@@ -586,143 +613,175 @@ class GameScene(BaseScene):
         
         # DEBUG - vérifier l'état des systèmes
         if not self.player:
-            print("⚠️  Pas de joueur !")
+            _log.warning("⚠️  Pas de joueur !")
             return
         
         # Mettre à jour le timer de vague
         self.wave_timer += dt
+        advance_frame()  # Horloge des canaux de diagnostic
         
         # === UPDATE INPUT ===
-        self.update_player_input()
+        with profiler.section("update.input"):
+            self.update_player_input()
         
         # === UPDATE ENTITIES ===
+        # Index statique des murs partagé par tous les objets mobiles
+        walls = self.entity_manager.get_wall_index()
+        
+        # Formes d'appel résolues au spawn, par classe (voir EntityManager.dispatch)
+        dispatch = self.entity_manager.dispatch
+        
         # Player - 🔧 CORRECTION: Passer morality_system
-        walls = self.entity_manager.get_walls()
-        if self.player:
-            try:
-                self.player.update(walls, self.morality_system)
-            except TypeError:
-                try:
-                    self.player.update(walls)
-                except TypeError:
-                    try:
-                        self.player.update()
-                    except:
-                        pass  # Ignorer si incompatible
+        with profiler.section("update.player"):
+            if self.player:
+                arity = dispatch.register(self.player, "player").update_arity
+                if arity is not None:
+                    self.player.update(*(walls, self.morality_system)[:arity])
+        
+        # Ennemis planifiés pour la vague : quelques-uns par tick
+        with profiler.section("update.spawns"):
+            self.spawn_pending_enemies()
+        
+        # Champ de flux partagé : recalculé seulement quand le joueur change de case
+        with profiler.section("update.flow_field"):
+            if self.player:
+                walls.get_flow_field().set_target(self.player.x + getattr(self.player, 'width', 0) / 2,
+                                                  self.player.y + getattr(self.player, 'height', 0) / 2)
         
         # Ennemis - 🔧 CORRECTION: Passer tous les paramètres pour l'IA
-        enemies = self.entity_manager.get_enemies()
-        walls = self.entity_manager.get_walls()
-        for enemy in enemies[:]:  # Copie pour éviter les modifications concurrentes
-            if hasattr(enemy, 'update'):
-                try:
-                    # Passer tous les paramètres nécessaires pour l'IA
-                    enemy.update(self.player, walls, enemies)
-                except TypeError:
-                    try:
-                        # Fallback pour compatibilité
-                        enemy.update(self.player, walls)
-                    except TypeError:
-                        try:
-                            enemy.update()
-                        except:
-                            pass  # Ignorer si vraiment incompatible
+        with profiler.section("update.enemies"):
+            enemies = self.entity_manager.get_enemies()
             
-            # Vérifier si l'ennemi est mort (il sera supprimé par le système de collision)
-            # Cette vérification n'est plus nécessaire car le système de collision gère tout
-            pass
+            # Ennemis simples (Basic/Fast/Shooter) : un seul pas vectorisé
+            enemy_batch = self.entity_manager.get_enemy_batch()
+            if enemy_batch is not None and len(enemy_batch):
+                with profiler.section("update.enemy_batch"):
+                    enemy_batch.update(self.player, walls, enemies)
+            
+            # Voisins indexés par case : la séparation n'examine que les ennemis proches
+            # (rien à faire si le lot a déjà avancé tous les ennemis)
+            batched = len(enemy_batch) if enemy_batch is not None else 0
+            self.neighbor_grid.rebuild(enemies[:] if batched < len(enemies) else [])  # Copie pour éviter les modifications concurrentes
+            # Niveau de détail : loin de l'écran, l'IA ne tourne qu'un tick sur 2, 4 ou 8
+            self.ai_scheduler.begin_frame(self.camera, self.neighbor_grid.entities)
+            enemy_calls = dispatch.tables["enemy"]
+            update_args = (self.player, walls, self.neighbor_grid)
+            for enemy in self.neighbor_grid.entities:
+                if enemy_batch is not None and enemy_batch.owns(enemy):
+                    continue  # Déjà avancé par le lot
+                elapsed = self.ai_scheduler.schedule(enemy)
+                if not elapsed:
+                    continue
+                old_x, old_y = enemy.x, enemy.y
+                calls = enemy_calls.get(enemy.__class__) or dispatch.register(enemy, "enemy")
+                if calls.update_arity is not None:
+                    # Joueur, murs et voisins, selon ce que la classe accepte
+                    enemy.update(*update_args[:calls.update_arity])
+                self.ai_scheduler.catch_up(enemy, old_x, old_y, elapsed, walls)
+                self.neighbor_grid.move(enemy)
+                
+                # Vérifier si l'ennemi est mort (il sera supprimé par le système de collision)
+                # Cette vérification n'est plus nécessaire car le système de collision gère tout
+                pass
         
         # Projectiles - CORRECTION: Passer les bons paramètres à update()
-        projectiles = self.entity_manager.get_projectiles()
-        for projectile in projectiles[:]:
-            # Vérifier si la méthode update existe et ses paramètres
-            if hasattr(projectile, 'update'):
-                try:
-                    # La méthode Bullet.update() attend: walls, screen_width, screen_height, enemies
-                    enemies = self.entity_manager.get_enemies()
-                    result = projectile.update(walls, WORLD_WIDTH, WORLD_HEIGHT, enemies)
-                    
-                    # Si update() retourne False, supprimer le projectile
-                    if result is False:
-                        self.entity_manager.remove_projectile(projectile)
-                        continue
-                        
-                except TypeError:
-                    # Fallback pour compatibilité avec d'anciens projectiles
-                    try:
-                        projectile.update(walls)
-                    except:
-                        # Si ça échoue encore, on retire le projectile
-                        self.entity_manager.remove_projectile(projectile)
-                        continue
+        with profiler.section("update.projectiles"):
+            # Les suppressions sont différées : la liste ne change pas pendant la boucle
+            projectiles = self.entity_manager.get_projectiles()
+            projectile_calls = dispatch.tables["projectile"]
+            # Bullet/WeaponProjectile.update() attendent : walls, largeur, hauteur, ennemis
+            update_args = (walls, WORLD_WIDTH, WORLD_HEIGHT, self.entity_manager.get_enemies())
+            for projectile in projectiles:
+                calls = projectile_calls.get(projectile.__class__) or dispatch.register(projectile, "projectile")
+                if calls.update_arity is None:
+                    # Projectile sans update() compatible : retiré
+                    self.entity_manager.remove_projectile(projectile)
+                    continue
+                # Si update() retourne False, supprimer le projectile
+                if projectile.update(*update_args[:calls.update_arity]) is False:
+                    self.entity_manager.remove_projectile(projectile)
+                    continue
+                
+                # Supprimer les projectiles hors limites (sécurité supplémentaire)
+                if (projectile.x < 0 or projectile.x > WORLD_WIDTH or 
+                    projectile.y < 0 or projectile.y > WORLD_HEIGHT):
+                    self.entity_manager.remove_projectile(projectile)
             
-            # Supprimer les projectiles hors limites (sécurité supplémentaire)
-            if (projectile.x < 0 or projectile.x > WORLD_WIDTH or 
-                projectile.y < 0 or projectile.y > WORLD_HEIGHT):
-                self.entity_manager.remove_projectile(projectile)
+            # Projectiles simples du pool : intégration, durée de vie, murs et limites en une passe
+            projectile_pool = self.entity_manager.get_projectile_pool()
+            if projectile_pool is not None:
+                projectile_pool.update(walls)
         
         # === COLLISIONS ===
-        self.collision_system.update(self.entity_manager)
+        with profiler.section("update.collisions"):
+            self.collision_system.update(self.entity_manager)
         
         # === CAMERA === - 🔧 CORRECTION: Passer l'objet player directement
-        if self.camera and self.player:
-            self.camera.update(self.player)
+        with profiler.section("update.camera"):
+            if self.camera and self.player:
+                self.camera.update(self.player)
         
         # === SYSTÈMES ===
         # === SYSTÈMES DE JEU ===
         # Morality system
-        if hasattr(self.morality_system, 'update'):
-            try:
-                self.morality_system.update(dt)
-            except TypeError:
+        with profiler.section("update.morality"):
+            if self.morality_update_arity is not None:
+                self.morality_system.update(*(dt,)[:self.morality_update_arity])
+        
+        # Experience system - ACTIVÉ
+        with profiler.section("update.experience"):
+            if hasattr(self.exp_system, 'update'):
                 try:
-                    self.morality_system.update()
+                    self.exp_system.update()
                 except:
                     pass
-        
-        # Experience system - ACTIVÉ
-        if hasattr(self.exp_system, 'update'):
-            try:
-                self.exp_system.update()
-            except:
-                pass
-        
-        # Générer les choix de level-up si nécessaire
-        if (hasattr(self.exp_system, 'is_leveling_up') and 
-            self.exp_system.is_leveling_up and 
-            not self.exp_system.level_up_choices):
-            print("🎲 Génération des choix de level-up...")
-            if hasattr(self.exp_system, 'generate_level_up_choices'):
-                self.exp_system.generate_level_up_choices(self.morality_system, self.item_manager, self.player)
+            
+            # Générer les choix de level-up si nécessaire
+            if (hasattr(self.exp_system, 'is_leveling_up') and 
+                self.exp_system.is_leveling_up and 
+                not self.exp_system.level_up_choices):
+                _log.info("🎲 Génération des choix de level-up...")
+                if hasattr(self.exp_system, 'generate_level_up_choices'):
+                    self.exp_system.generate_level_up_choices(self.morality_system, self.item_manager, self.player)
         
         # Mettre à jour le système audio
-        if self.sound_system:
-            try:
-                self.sound_system.update()
-            except:
-                pass  # Ignorer si ça échoue
+        with profiler.section("update.sound"):
+            if self.sound_system:
+                try:
+                    self.sound_system.update()
+                except:
+                    pass  # Ignorer si ça échoue
         
         # Mettre à jour les textes flottants
-        self.update_floating_texts()
+        with profiler.section("update.effects"):
+            self.update_floating_texts()
+            
+            # Mettre à jour le fond animé
+            if self.background:
+                self.background.update(dt, self.camera.x, self.camera.y)
         
-        # Mettre à jour le fond animé
-        if self.background:
-            self.background.update(dt, self.camera.x, self.camera.y)
+        # === FIN DE FRAME ===
+        # Retirer en une passe toutes les entités marquées pendant la frame
+        with profiler.section("update.compact"):
+            self.entity_manager.end_of_frame_compact()
         
         # === VÉRIFIER FIN DE VAGUE ===
         # Compter les ennemis réellement présents
-        actual_enemies_count = len(self.entity_manager.get_enemies())
-        
-        # Si pas d'ennemis ET que enemies_remaining est <= 0, passer à la vague suivante
-        if (actual_enemies_count <= 0 and self.enemies_remaining <= 0 and 
-            not (hasattr(self.exp_system, 'is_leveling_up') and self.exp_system.is_leveling_up)):
-            print(f"🏁 Vague {self.wave_number} terminée (ennemis restants: {actual_enemies_count})")
-            self.next_wave()
-        
-        # Correction si enemies_remaining est décalé par rapport à la réalité
-        elif actual_enemies_count == 0 and self.enemies_remaining > 0:
-            print(f"🔧 Correction: enemies_remaining={self.enemies_remaining} mais 0 ennemis présents")
-            self.enemies_remaining = 0
+        with profiler.section("update.waves"):
+            actual_enemies_count = self.entity_manager.get_enemies_count()
+            # Des ennemis encore à créer : la vague n'est pas finie
+            spawning = self.wave_director.has_pending()
+            
+            # Si pas d'ennemis ET que enemies_remaining est <= 0, passer à la vague suivante
+            if (actual_enemies_count <= 0 and self.enemies_remaining <= 0 and not spawning and
+                not (hasattr(self.exp_system, 'is_leveling_up') and self.exp_system.is_leveling_up)):
+                _log.info("🏁 Vague %s terminée (ennemis restants: %s)", self.wave_number, actual_enemies_count)
+                self.next_wave()
+            
+            # Correction si enemies_remaining est décalé par rapport à la réalité
+            elif actual_enemies_count == 0 and self.enemies_remaining > 0 and not spawning:
+                _log.info("🔧 Correction: enemies_remaining=%s mais 0 ennemis présents", self.enemies_remaining)
+                self.enemies_remaining = 0
         
         # === VÉRIFIER GAME OVER ===
         if hasattr(self.player, 'health') and self.player.health <= 0:
@@ -749,7 +808,7 @@ class GameScene(BaseScene):
             dy /= length
         
         # Appliquer le mouvement
-        walls = self.entity_manager.get_walls()
+        walls = self.entity_manager.get_wall_index()
         if hasattr(self.player, 'move'):
             self.player.move(dx, dy, walls)
         
@@ -777,110 +836,84 @@ class GameScene(BaseScene):
     
     def next_wave(self):
         """Passe à la vague suivante"""
-        print(f"✅ Vague {self.wave_number} terminée !")
+        _log.info("✅ Vague %s terminée !", self.wave_number)
         self.wave_number += 1
         self.wave_timer = 0
         
         # Générer la nouvelle vague
         self.generate_level()
         
-        print(f"🌊 Début de la vague {self.wave_number}")
+        _log.info("🌊 Début de la vague %s", self.wave_number)
+    
+    def snapshot_positions(self):
+        """Mémorise les positions du tick précédent pour l'interpolation du rendu"""
+        if self.camera:
+            self.camera.snapshot()
+        if self.player:
+            snapshot_positions((self.player,))
+        snapshot_positions(self.entity_manager.get_enemies())
+        snapshot_positions(self.entity_manager.get_projectiles())
     
     def draw(self, screen):
-        """Dessine la scène de jeu"""
+        """Dessine la scène de jeu (positions interpolées avec render_alpha)"""
+        alpha = self.render_alpha
+        
+        # Passe de visibilité : zone visible et entités à dessiner, pour tous les dessins monde
+        with profiler.section("draw.visibility"):
+            visibility = self.visibility
+            visibility.update(self.camera, self.entity_manager, self.collision_system, alpha)
+        camera_x, camera_y = visibility.camera_x, visibility.camera_y
+        
         # Dessiner le fond animé au lieu du noir uniforme
         if self.background:
-            self.background.draw(screen, self.camera.x, self.camera.y)
+            self.background.draw(screen, camera_x, camera_y)
         else:
             screen.fill(BLACK)
         
         # === MONDE (avec caméra) ===
         
         # Murs
-        wall_color = self.level_manager.get_wall_color()
-        for wall in self.entity_manager.get_walls():
-            wall_rect = wall.rect
-            # Conversion manuelle des coordonnées monde vers écran
-            screen_x = wall_rect.x - self.camera.x
-            screen_y = wall_rect.y - self.camera.y
-            
-            # Ne dessiner que si visible à l'écran
-            if (screen_x + wall_rect.width > 0 and screen_x < SCREEN_WIDTH and
-                screen_y + wall_rect.height > 0 and screen_y < SCREEN_HEIGHT):
-                screen_rect = pygame.Rect(screen_x, screen_y, wall_rect.width, wall_rect.height)
+        with profiler.section("draw.walls"):
+            wall_color = self.level_manager.get_wall_color()
+            for wall in visibility.walls:
+                wall_rect = wall.rect
+                screen_rect = pygame.Rect(wall_rect.x - camera_x, wall_rect.y - camera_y,
+                                          wall_rect.width, wall_rect.height)
                 pygame.draw.rect(screen, wall_color, screen_rect)
         
+        # Entités : draw() appelé selon la forme résolue au spawn, en coordonnées écran
+        dispatch = self.entity_manager.dispatch
+        
         # Joueur
-        if self.player:
-            screen_x = self.player.x - self.camera.x
-            screen_y = self.player.y - self.camera.y
-            if hasattr(self.player, 'draw'):
-                try:
-                    # Essayer avec les coordonnées d'écran
-                    self.player.draw(screen, screen_x, screen_y)
-                except TypeError:
-                    # Si ça échoue, sauvegarder la position originale et dessiner
-                    original_x, original_y = self.player.x, self.player.y
-                    self.player.x, self.player.y = screen_x, screen_y
-                    try:
-                        self.player.draw(screen)
-                    except:
-                        # Fallback : cercle blanc
-                        pygame.draw.circle(screen, WHITE, (int(screen_x), int(screen_y)), 10)
-                    finally:
-                        # Restaurer la position originale
-                        self.player.x, self.player.y = original_x, original_y
-            else:
-                pygame.draw.circle(screen, WHITE, (int(screen_x), int(screen_y)), 10)
+        with profiler.section("draw.player"):
+            if self.player:
+                world_x, world_y = interpolate_position(self.player, alpha)
+                draw_entity(self.player, dispatch.register(self.player, "player"), screen,
+                            world_x - camera_x, world_y - camera_y, WHITE, 10)
         
         # Ennemis
-        for enemy in self.entity_manager.get_enemies():
-            screen_x = enemy.x - self.camera.x
-            screen_y = enemy.y - self.camera.y
-            if hasattr(enemy, 'draw'):
-                try:
-                    # Essayer avec les coordonnées d'écran
-                    enemy.draw(screen, screen_x, screen_y)
-                except TypeError:
-                    # Si ça échoue, sauvegarder la position originale et dessiner
-                    original_x, original_y = enemy.x, enemy.y
-                    enemy.x, enemy.y = screen_x, screen_y
-                    try:
-                        enemy.draw(screen)
-                    except:
-                        # Fallback : cercle rouge
-                        pygame.draw.circle(screen, (255, 0, 0), (int(screen_x), int(screen_y)), 8)
-                    finally:
-                        # Restaurer la position originale
-                        enemy.x, enemy.y = original_x, original_y
-            else:
-                pygame.draw.circle(screen, (255, 0, 0), (int(screen_x), int(screen_y)), 8)
+        with profiler.section("draw.enemies"):
+            enemy_calls = dispatch.tables["enemy"]
+            for enemy in visibility.enemies:
+                world_x, world_y = interpolate_position(enemy, alpha)
+                calls = enemy_calls.get(enemy.__class__) or dispatch.register(enemy, "enemy")
+                draw_entity(enemy, calls, screen, world_x - camera_x, world_y - camera_y, (255, 0, 0), 8)
         
         # Projectiles
-        for projectile in self.entity_manager.get_projectiles():
-            screen_x = projectile.x - self.camera.x
-            screen_y = projectile.y - self.camera.y
-            if hasattr(projectile, 'draw'):
-                try:
-                    # Essayer avec les coordonnées d'écran
-                    projectile.draw(screen, screen_x, screen_y)
-                except TypeError:
-                    # Si ça échoue, sauvegarder la position originale et dessiner
-                    original_x, original_y = projectile.x, projectile.y
-                    projectile.x, projectile.y = screen_x, screen_y
-                    try:
-                        projectile.draw(screen)
-                    except:
-                        # Fallback : cercle jaune
-                        pygame.draw.circle(screen, (255, 255, 0), (int(screen_x), int(screen_y)), 3)
-                    finally:
-                        # Restaurer la position originale
-                        projectile.x, projectile.y = original_x, original_y
-            else:
-                pygame.draw.circle(screen, (255, 255, 0), (int(screen_x), int(screen_y)), 3)
+        with profiler.section("draw.projectiles"):
+            projectile_calls = dispatch.tables["projectile"]
+            for projectile in visibility.projectiles:
+                world_x, world_y = interpolate_position(projectile, alpha)
+                calls = projectile_calls.get(projectile.__class__) or dispatch.register(projectile, "projectile")
+                draw_entity(projectile, calls, screen, world_x - camera_x, world_y - camera_y, (255, 255, 0), 3)
+            
+            projectile_pool = self.entity_manager.get_projectile_pool()
+            if projectile_pool is not None:
+                projectile_pool.draw(screen, (camera_x, camera_y), alpha)
         
         # Textes flottants (+XP, etc.)
-        self.draw_floating_texts(screen)
+        with profiler.section("draw.floating_texts"):
+            self.draw_floating_texts(screen)
         
         # === UI (coordonnées écran) ===
         
@@ -895,29 +928,31 @@ class GameScene(BaseScene):
         # Level-up screen
         if (hasattr(self.exp_system, 'is_leveling_up') and 
             self.exp_system.is_leveling_up):
-            if hasattr(self.exp_system, 'draw_level_up_screen'):
-                try:
-                    self.exp_system.draw_level_up_screen(screen, self.morality_system, self.item_manager)
-                except TypeError:
-                    # Fallback si la signature est différente
-                    try:
-                        self.exp_system.draw_level_up_screen(screen)
-                    except:
-                        # Affichage simple de fallback
-                        self.draw_simple_level_up_screen(screen)
+            if self.level_up_draw_arity is not None:
+                self.exp_system.draw_level_up_screen(
+                    *(screen, self.morality_system, self.item_manager)[:self.level_up_draw_arity])
+            else:
+                # Affichage simple de fallback
+                self.draw_simple_level_up_screen(screen)
         
         # 🎨 NOUVEAU: HUD moderne
         if self.game_state == "playing":
             # HUD principal (barres de vie, XP, moralité)
             self.hud_manager.draw_hud(screen, self.player, self.exp_system, self.morality_system)
             
-            # Barres de vie des ennemis
-            enemies = self.entity_manager.get_enemies()
-            self.hud_manager.draw_enemy_health_bars(screen, enemies, self.camera.x, self.camera.y)
+            # Barres de vie des ennemis visibles
+            self.hud_manager.draw_enemy_health_bars(screen, visibility.enemies, camera_x, camera_y,
+                                                    culled=True, alpha=alpha)
         
         # 🎨 NOUVEAU: Menu de pause moderne
         elif self.game_state == "paused":
             self.pause_menu.draw(screen)
+        
+        # Overlay de profilage par système
+        if self.show_profiler_overlay:
+            self.hud_manager.draw_debug_info(screen, self.player, self.entity_manager.get_enemies(),
+                                             self.wave_number, profiler, origin=(10, 190),
+                                             ai_lod=self.ai_scheduler.get_statistics())
     
     def draw_hud(self, screen):
         """Dessine l'interface utilisateur"""
@@ -932,8 +967,11 @@ class GameScene(BaseScene):
         wave_surface = self.font.render(wave_text, True, WHITE)
         screen.blit(wave_surface, (10, 50))
         
-        # Ennemis restants
+        # Ennemis restants (et encore en approche pendant le début de vague)
         enemies_text = f"Ennemis: {self.enemies_remaining}"
+        pending = self.wave_director.get_pending_count()
+        if pending:
+            enemies_text += f" (+{pending} en approche)"
         enemies_surface = self.font.render(enemies_text, True, WHITE)
         screen.blit(enemies_surface, (10, 90))
         
@@ -1022,8 +1060,8 @@ class GameScene(BaseScene):
         )
         
         if success:
-            print(f"✅ Archétype {archetype_id} appliqué avec succès au joueur")
+            _log.info("✅ Archétype %s appliqué avec succès au joueur", archetype_id)
         else:
-            print(f"❌ Échec de l'application de l'archétype {archetype_id}")
+            _log.error("❌ Échec de l'application de l'archétype %s", archetype_id)
             # Fallback sur l'arme de base si l'archétype échoue
-            print("🔧 Utilisation de l'arme de base en fallback")
\ No newline at end of file
+            _log.info("🔧 Utilisation de l'arme de base en fallback")
\ No newline at end of file
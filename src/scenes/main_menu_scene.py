@@ -4,6 +4,9 @@ Scène du menu principal intégrée au système de scènes
 import pygame
 from .base_scene import BaseScene
 from ..ui.scenes.main_menu import MainMenuScene
+from ..utils.game_log import get_logger
+
+_log = get_logger("scenes.main_menu")
 
 class MainMenuGameScene(BaseScene):
     """Scène de menu principal du jeu"""
@@ -17,22 +20,22 @@ class MainMenuGameScene(BaseScene):
             from ..systems.sound_system import create_sound_manager
             self.sound_system = create_sound_manager()
         except Exception as e:
-            print(f"Erreur initialisation audio: {e}")
+            _log.warning("Erreur initialisation audio: %s", e)
             self.sound_system = None
         
     def handle_event(self, event):
         """Gère les événements du menu"""
         if event.type == pygame.MOUSEBUTTONDOWN:
-            print(f"🖱️ MainMenuGameScene: MOUSEBUTTONDOWN reçu à {event.pos}")
+            _log.debug("🖱️ MainMenuGameScene: MOUSEBUTTONDOWN reçu à %s", event.pos)
         self.menu.handle_event(event)
         
         # Vérifier l'action sélectionnée
         action = self.menu.get_selected_action()
         if action:
-            print(f"🎬 MainMenuGameScene a reçu l'action: {action}")
+            _log.info("🎬 MainMenuGameScene a reçu l'action: %s", action)
         
         if action == "play":
-            print("🚀 Transition vers la sélection d'archétype")
+            _log.info("🚀 Transition vers la sélection d'archétype")
             self.next_scene = "archetype_selection"  # Aller vers la sélection d'archétype
         elif action == "settings":
             self.next_scene = "settings"
@@ -0,0 +1,151 @@
+"""
+Niveau de détail de l'IA - Les ennemis loin de l'écran réfléchissent moins souvent
+Les ennemis sont rangés par distance à la zone visible de la caméra : près
+de l'écran, ils sont mis à jour à chaque tick ; plus loin, tous les 2, 4
+puis 8 ticks. Un ennemi mis à jour après N ticks parcourt N fois son
+déplacement, s'il s'agit d'un pas ordinaire (téléportations, charges et
+poussées ne sont pas répétées), sans quitter le monde ni traverser de mur.
+Ses minuteurs internes avancent en revanche au rythme de ses mises à jour.
+Les classes avec l'attribut `ai_lod = False` (les boss) restent à pleine cadence.
+"""
+import pygame
+
+from ..core.constants import WORLD_WIDTH, WORLD_HEIGHT
+from ..gameplay.pathfinding import PathfindingHelper
+
+# (écart maximal à la zone visible en px, période en ticks), du plus proche au plus lointain
+AI_LOD_TIERS = ((100, 1), (400, 2), (900, 4))
+# Au-delà du dernier palier
+AI_LOD_FAR_PERIOD = 8
+# Pas rattrapable au plus (multiple de la vitesse) : au-delà, saut discontinu non répété
+AI_CATCH_UP_MAX_STEP = 1.5
+
+class AILodScheduler:
+    """Choisit les ennemis à mettre à jour à chaque tick et rattrape leur déplacement"""
+
+    def __init__(self, tiers=AI_LOD_TIERS, far_period=AI_LOD_FAR_PERIOD,
+                 world_width=WORLD_WIDTH, world_height=WORLD_HEIGHT):
+        self.tiers = tiers
+        self.far_period = far_period
+        self.world_width = world_width
+        self.world_height = world_height
+        self.enabled = True
+
+        self.tick = 0
+        self.area = None  # (gauche, haut, droite, bas) de la zone visible
+        self.slots = {}  # id(ennemi) -> [décalage dans la période, dernier tick mis à jour]
+        self.next_slot = 0
+
+        self.periods = (1,) + tuple(period for _, period in tiers[1:]) + (far_period,)
+        self.frame = self._empty_counts()
+        self.totals = self._empty_counts()
+
+    def _empty_counts(self):
+        counts = {"updated": 0, "skipped": 0}
+        for period in self.periods:
+            counts[f"every_{period}"] = 0
+        return counts
+
+    # === PAR TICK ===
+
+    def begin_frame(self, camera, enemies):
+        """Nouveau tick : mémorise la zone visible et oublie les ennemis disparus"""
+        self.tick += 1
+        for name, value in self.frame.items():
+            self.totals[name] += value
+        self.frame = self._empty_counts()
+
+        if camera is not None and hasattr(camera, 'get_visible_area'):
+            area = camera.get_visible_area()
+            self.area = (area.left, area.top, area.right, area.bottom)
+        else:
+            self.area = None
+
+        if len(self.slots) > 2 * len(enemies) + 64:
+            present = {id(enemy) for enemy in enemies}
+            self.slots = {key: slot for key, slot in self.slots.items() if key in present}
+
+    def forget(self, enemies):
+        """Oublie le créneau des ennemis retirés (un ennemi recyclé par son pool garde son id())"""
+        slots = self.slots
+        for enemy in enemies:
+            slots.pop(id(enemy), None)
+
+    def get_period(self, enemy):
+        """Période de mise à jour (en ticks) selon l'écart à la zone visible"""
+        if not self.enabled or self.area is None or not getattr(enemy, 'ai_lod', True):
+            return 1
+        left, top, right, bottom = self.area
+        x, y = enemy.x, enemy.y
+        gap_x = max(left - (x + getattr(enemy, 'width', 0)), x - right, 0)
+        gap_y = max(top - (y + getattr(enemy, 'height', 0)), y - bottom, 0)
+        gap = max(gap_x, gap_y)
+        for margin, period in self.tiers:
+            if gap <= margin:
+                return period
+        return self.far_period
+
+    def schedule(self, enemy):
+        """Nombre de ticks à rattraper si l'ennemi est mis à jour à ce tick, 0 s'il est sauté"""
+        slot = self.slots.get(id(enemy))
+        if slot is None:
+            # Décalages successifs : les ennemis d'un même palier ne réfléchissent pas au même tick
+            slot = [self.next_slot, self.tick - 1]
+            self.next_slot += 1
+            self.slots[id(enemy)] = slot
+
+        period = self.get_period(enemy)
+        self.frame[f"every_{period}"] += 1
+        if period > 1 and (self.tick + slot[0]) % period:
+            self.frame["skipped"] += 1
+            return 0
+
+        elapsed = min(self.tick - slot[1], self.far_period)
+        slot[1] = self.tick
+        self.frame["updated"] += 1
+        return max(1, elapsed)
+
+    def catch_up(self, enemy, old_x, old_y, elapsed, walls):
+        """Étend le déplacement d'une mise à jour aux ticks sautés (annulé si un mur gêne)"""
+        if elapsed <= 1:
+            return False
+        step_x = enemy.x - old_x
+        step_y = enemy.y - old_y
+        if not step_x and not step_y:
+            return False
+        # Téléportation, charge, poussée : le saut n'est pas un pas à répéter
+        if (step_x * step_x + step_y * step_y) ** 0.5 > getattr(enemy, 'speed', 0) * AI_CATCH_UP_MAX_STEP:
+            return False
+
+        width, height = enemy.width, enemy.height
+        new_x = min(max(old_x + step_x * elapsed, 0), self.world_width - width)
+        new_y = min(max(old_y + step_y * elapsed, 0), self.world_height - height)
+        if (new_x, new_y) == (enemy.x, enemy.y):
+            return False
+        # Trajet balayé depuis la position du tick : aucun mur traversé
+        left, top = min(enemy.x, new_x), min(enemy.y, new_y)
+        swept = pygame.Rect(left, top, max(enemy.x, new_x) - left + width, max(enemy.y, new_y) - top + height)
+        if PathfindingHelper.find_wall_collision(swept, walls) is not None:
+            return False
+        enemy.x, enemy.y = new_x, new_y
+        if hasattr(enemy, 'rect'):
+            enemy.rect.x = new_x
+            enemy.rect.y = new_y
+        return True
+
+    # === STATISTIQUES ===
+
+    def get_statistics(self):
+        """Compteurs du dernier tick et cumulés, dont les mises à jour d'IA économisées"""
+        totals = {name: value + self.frame[name] for name, value in self.totals.items()}
+        scheduled = totals["updated"] + totals["skipped"]
+        return {
+            "frame": dict(self.frame),
+            "totals": totals,
+            "saved_ratio": totals["skipped"] / scheduled if scheduled else 0.0,
+        }
+
+    def reset_statistics(self):
+        """Remet les compteurs à zéro"""
+        self.frame = self._empty_counts()
+        self.totals = self._empty_counts()
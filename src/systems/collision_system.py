@@ -4,17 +4,28 @@ Remplace la logique de collision dispersée dans main.py
 """
 import pygame
 import math
+from .spatial_grid import SpatialHashGrid
+from ..core.constants import COLLISION_CELL_SIZE
+from ..utils.game_log import get_logger
+from ..utils.profiler import profiler
+
+_log = get_logger("systems.collision")
+
+# Rayons utilisés par les tests de ramassage d'objets
+PICKUP_RADIUS = 15
+ITEM_RADIUS = 8
 
 class CollisionSystem:
     """Gestionnaire centralisé des collisions"""
     
-    def __init__(self):
+    def __init__(self, cell_size=COLLISION_CELL_SIZE, use_spatial_hash=True):
         self.collision_stats = {
             "projectile_enemy": 0,
             "projectile_wall": 0,
             "player_enemy": 0,
             "player_item": 0,
-            "total_checks": 0
+            "total_checks": 0,
+            "pair_tests": 0
         }
         
         # Références pour les systèmes externes
@@ -22,56 +33,94 @@ class CollisionSystem:
         self.sound_system = None
         self.morality_system = None
         self.game_scene = None
+        
+        # Phase large : grilles spatiales reconstruites à chaque tick
+        self.use_spatial_hash = use_spatial_hash
+        self.cell_size = cell_size
+        self.enemy_grid = SpatialHashGrid(cell_size)
+        self.item_grid = SpatialHashGrid(cell_size)
+        self._broad_phase_ready = False
+        self.enemy_grid_generation = None  # EntityManager.enemy_generation lors de l'indexation
     
+    def set_cell_size(self, cell_size):
+        """Change la taille des cellules de la grille spatiale"""
+        self.cell_size = cell_size
+        self.enemy_grid = SpatialHashGrid(cell_size)
+        self.item_grid = SpatialHashGrid(cell_size)
+        self._broad_phase_ready = False
+        self.enemy_grid_generation = None
     
     def update(self, entity_manager):
         """Met à jour toutes les collisions"""
         self.collision_stats["total_checks"] += 1
         
+        # Phase large : indexer les entités une seule fois pour les quatre passes
+        with profiler.section("collisions.broad_phase"):
+            self.optimize_collision_checks(entity_manager)
+        self._broad_phase_ready = True
+        
         # Collisions projectiles vs ennemis
-        self.check_projectile_enemy_collisions(entity_manager)
+        with profiler.section("collisions.projectiles"):
+            self.check_projectile_enemy_collisions(entity_manager)
+        with profiler.section("collisions.projectile_pool"):
+            self.check_pooled_projectile_collisions(entity_manager)
         
         # Collisions projectiles vs murs
-        self.check_projectile_wall_collisions(entity_manager)
+        with profiler.section("collisions.walls"):
+            self.check_projectile_wall_collisions(entity_manager)
         
         # Collisions joueur vs ennemis
-        self.check_player_enemy_collisions(entity_manager)
+        with profiler.section("collisions.player"):
+            self.check_player_enemy_collisions(entity_manager)
         
         # Collisions joueur vs objets
-        self.check_player_item_collisions(entity_manager)
+        with profiler.section("collisions.items"):
+            self.check_player_item_collisions(entity_manager)
+        
+        self._broad_phase_ready = False
         
         # Nettoyage automatique des entités mortes
-        entity_manager.cleanup_dead_entities()
+        with profiler.section("collisions.cleanup"):
+            entity_manager.cleanup_dead_entities()
     
     def check_projectile_enemy_collisions(self, entity_manager):
         """Vérifie les collisions entre projectiles et ennemis"""
+        self._ensure_broad_phase(entity_manager)
         projectiles = entity_manager.get_projectiles()
         enemies = entity_manager.get_enemies()
+        is_removed = entity_manager.is_removed
         
-        projectiles_to_remove = []
-        enemies_to_remove = []
+        pair_tests = 0
         
         for projectile in projectiles:
             # Ignorer les projectiles ennemis vs ennemis
             if hasattr(projectile, 'is_enemy_projectile') and projectile.is_enemy_projectile:
                 continue
+            # Projectile déjà retiré pendant cette frame
+            if is_removed(projectile):
+                continue
             
-            for enemy in enemies:
-                # Utiliser les attributs radius si disponibles
-                projectile_radius = getattr(projectile, 'radius', 3)
+            # Utiliser les attributs radius si disponibles
+            projectile_radius = getattr(projectile, 'radius', 3)
+            candidates = self._enemy_candidates(enemies, projectile.x, projectile.y, projectile_radius)
+            
+            for enemy in candidates:
+                if is_removed(enemy):
+                    continue
+                pair_tests += 1
                 enemy_radius = getattr(enemy, 'width', 20) // 2
                 
                 # Calculer les positions centrées pour les ennemis
                 enemy_center_x = enemy.x + enemy_radius
                 enemy_center_y = enemy.y + enemy_radius
                 
-                distance = ((projectile.x - enemy_center_x)**2 + (projectile.y - enemy_center_y)**2)**0.5
-                collision_distance = projectile_radius + enemy_radius
-                
-                # Debug collision occasionnel 
-                if distance < collision_distance + 10:  # Zone élargie pour debug
-                    print(f"🔍 Proche collision: projectile({projectile.x:.1f},{projectile.y:.1f}) vs ennemi({enemy_center_x:.1f},{enemy_center_y:.1f})")
-                    print(f"   Distance: {distance:.1f}, Collision si <= {collision_distance}")
+                # Debug collision occasionnel (distance calculée seulement si le canal est actif)
+                if _log.debug_enabled:
+                    distance = ((projectile.x - enemy_center_x)**2 + (projectile.y - enemy_center_y)**2)**0.5
+                    collision_distance = projectile_radius + enemy_radius
+                    if distance < collision_distance + 10:  # Zone élargie pour debug
+                        _log.debug("🔍 Proche collision: projectile(%.1f,%.1f) vs ennemi(%.1f,%.1f)", projectile.x, projectile.y, enemy_center_x, enemy_center_y)
+                        _log.debug("   Distance: %.1f, Collision si <= %s", distance, collision_distance)
                 
                 if self.circle_collision(
                     projectile.x, projectile.y, projectile_radius,
@@ -82,108 +131,153 @@ class CollisionSystem:
                     
                     if hasattr(projectile, 'hit_enemy'):
                         # Nouveau système: WeaponProjectile avec logique de percement
-                        print(f"🚀 WeaponProjectile collision - Perforant: {getattr(projectile, 'piercing', False)}")
+                        if _log.debug_enabled:
+                            _log.debug("🚀 WeaponProjectile collision - Perforant: %s", getattr(projectile, 'piercing', False))
                         should_remove_projectile = projectile.hit_enemy(enemy, self.game_scene)
-                        print(f"🎯 Projectile {'' if should_remove_projectile else 'NOT '}marked for removal")
+                        if _log.debug_enabled:
+                            _log.debug("🎯 Projectile %smarked for removal", '' if should_remove_projectile else 'NOT ')
                     else:
                         # Ancien système: Bullet legacy
                         damage = getattr(projectile, 'damage', 20)
-                        print(f"💥 Legacy Bullet collision ! Dégâts: {damage}")
+                        _log.debug("💥 Legacy Bullet collision ! Dégâts: %s", damage)
                         
                         if hasattr(enemy, 'take_damage'):
-                            print(f"🎯 Ennemi health avant: {getattr(enemy, 'health', '?')}")
+                            if _log.debug_enabled:
+                                _log.debug("🎯 Ennemi health avant: %s", getattr(enemy, 'health', '?'))
                             enemy.take_damage(damage)
-                            print(f"🎯 Ennemi health après: {getattr(enemy, 'health', '?')}")
+                            if _log.debug_enabled:
+                                _log.debug("🎯 Ennemi health après: %s", getattr(enemy, 'health', '?'))
                         elif hasattr(enemy, 'health'):
-                            print(f"🎯 Ennemi health avant: {enemy.health}")
+                            if _log.debug_enabled:
+                                _log.debug("🎯 Ennemi health avant: %s", enemy.health)
                             enemy.health -= damage
-                            print(f"🎯 Ennemi health après: {enemy.health}")
+                            if _log.debug_enabled:
+                                _log.debug("🎯 Ennemi health après: %s", enemy.health)
                     
                     # Marquer le projectile pour suppression seulement si nécessaire
-                    if should_remove_projectile and projectile not in projectiles_to_remove:
-                        projectiles_to_remove.append(projectile)
+                    if should_remove_projectile:
+                        entity_manager.remove_projectile(projectile)
                     
-                    # Si l'ennemi est mort, le marquer pour suppression ET donner XP
+                    # Si l'ennemi est mort, le marquer pour suppression ET donner XP (une seule fois)
                     if hasattr(enemy, 'health') and enemy.health <= 0:
-                        if enemy not in enemies_to_remove:
-                            enemies_to_remove.append(enemy)
-                            
-                            # 🎯 DONNER XP ICI au lieu de dans GameScene
-                            print(f"💀 Ennemi mort par collision ! Donner XP...")
-                            if self.exp_system and hasattr(self.exp_system, 'add_experience'):
-                                old_level = getattr(self.exp_system, 'level', 0)
-                                old_exp = getattr(self.exp_system, 'experience', 0)
-                                print(f"🎯 Avant XP: Level {old_level}, XP {old_exp}")
-                                
-                                self.exp_system.add_experience(10)
-                                
-                                new_level = getattr(self.exp_system, 'level', 0)
-                                new_exp = getattr(self.exp_system, 'experience', 0)
-                                print(f"🎯 Après XP: Level {new_level}, XP {new_exp}")
-                                
-                                # Notification XP
-                                if self.game_scene and hasattr(self.game_scene, 'add_floating_text'):
-                                    self.game_scene.add_floating_text(enemy.x, enemy.y, "+10 XP", (0, 255, 255))
-                                
-                                # Level up notification
-                                if new_level > old_level:
-                                    print(f"🎉 LEVEL UP ! {old_level} -> {new_level}")
-                                    if self.sound_system and hasattr(self.sound_system, 'on_level_up'):
-                                        self.sound_system.on_level_up()
-                                    if self.game_scene and hasattr(self.game_scene, 'add_floating_text'):
-                                        player = entity_manager.get_player()
-                                        if player:
-                                            self.game_scene.add_floating_text(player.x, player.y - 30, "LEVEL UP!", (255, 215, 0))
-                            
-                            # Son de mort
-                            if self.sound_system and hasattr(self.sound_system, 'on_enemy_death'):
-                                player = entity_manager.get_player()
-                                if player:
-                                    self.sound_system.on_enemy_death((enemy.x, enemy.y), (player.x, player.y), enemy.__class__.__name__)
-                            
-                            # Moralité
-                            if self.morality_system and hasattr(self.morality_system, 'process_kill'):
-                                self.morality_system.process_kill(enemy.__class__.__name__)
-                            
-                            # Mettre à jour les compteurs de GameScene
-                            if self.game_scene:
-                                self.game_scene.enemies_killed += 1
-                                self.game_scene.enemies_remaining -= 1
+                        if entity_manager.remove_enemy(enemy):
+                            self.enemy_grid.remove(enemy)
+                            self._on_enemy_killed(enemy, entity_manager)
                     
                     self.collision_stats["projectile_enemy"] += 1
                     break  # Un projectile ne peut toucher qu'un ennemi
         
-        # Supprimer les entités touchées
-        for projectile in projectiles_to_remove:
-            entity_manager.remove_projectile(projectile)
+        self.collision_stats["pair_tests"] += pair_tests
+    
+    def check_pooled_projectile_collisions(self, entity_manager):
+        """Vérifie les collisions entre le pool vectorisé de projectiles et les ennemis"""
+        pool = entity_manager.get_projectile_pool()
+        enemies = entity_manager.get_enemies()
+        if pool is None or not len(pool) or not enemies:
+            return
+        
+        # Les ennemis tués par la passe précédente ne sont plus des cibles
+        if entity_manager.has_pending_removals("enemies"):
+            enemies = [enemy for enemy in enemies if not entity_manager.is_removed(enemy)]
+            if not enemies:
+                return
+        
+        def on_hit(source, enemy, damage):
+            if hasattr(source, 'apply_pooled_hit'):
+                source.apply_pooled_hit(enemy, damage, self.game_scene)
+            elif hasattr(enemy, 'take_damage'):
+                enemy.take_damage(damage)
+            
+            if hasattr(enemy, 'health') and enemy.health <= 0 and entity_manager.remove_enemy(enemy):
+                self.enemy_grid.remove(enemy)
+                self._on_enemy_killed(enemy, entity_manager)
+        
+        hits = pool.collide_enemies(enemies, on_hit)
+        self.collision_stats["projectile_enemy"] += hits
+    
+    def _on_enemy_killed(self, enemy, entity_manager):
+        """Récompenses et compteurs à la mort d'un ennemi tué par un projectile"""
+        # 🎯 DONNER XP ICI au lieu de dans GameScene
+        _log.debug("💀 Ennemi mort par collision ! Donner XP...")
+        if self.exp_system and hasattr(self.exp_system, 'add_experience'):
+            old_level = getattr(self.exp_system, 'level', 0)
+            old_exp = getattr(self.exp_system, 'experience', 0)
+            _log.debug("🎯 Avant XP: Level %s, XP %s", old_level, old_exp)
+        
+            self.exp_system.add_experience(10)
+        
+            new_level = getattr(self.exp_system, 'level', 0)
+            new_exp = getattr(self.exp_system, 'experience', 0)
+            _log.debug("🎯 Après XP: Level %s, XP %s", new_level, new_exp)
+        
+            # Notification XP
+            if self.game_scene and hasattr(self.game_scene, 'add_floating_text'):
+                self.game_scene.add_floating_text(enemy.x, enemy.y, "+10 XP", (0, 255, 255))
+        
+            # Level up notification
+            if new_level > old_level:
+                _log.info("🎉 LEVEL UP ! %s -> %s", old_level, new_level)
+                if self.sound_system and hasattr(self.sound_system, 'on_level_up'):
+                    self.sound_system.on_level_up()
+                if self.game_scene and hasattr(self.game_scene, 'add_floating_text'):
+                    player = entity_manager.get_player()
+                    if player:
+                        self.game_scene.add_floating_text(player.x, player.y - 30, "LEVEL UP!", (255, 215, 0))
+        
+        # Son de mort
+        if self.sound_system and hasattr(self.sound_system, 'on_enemy_death'):
+            player = entity_manager.get_player()
+            if player:
+                self.sound_system.on_enemy_death((enemy.x, enemy.y), (player.x, player.y), enemy.__class__.__name__)
         
-        for enemy in enemies_to_remove:
-            entity_manager.remove_enemy(enemy)
+        # Moralité
+        if self.morality_system and hasattr(self.morality_system, 'process_kill'):
+            self.morality_system.process_kill(enemy.__class__.__name__)
+        
+        # Mettre à jour les compteurs de GameScene
+        if self.game_scene:
+            self.game_scene.enemies_killed += 1
+            self.game_scene.enemies_remaining -= 1
     
     def check_projectile_wall_collisions(self, entity_manager):
         """Vérifie les collisions entre projectiles et murs"""
         projectiles = entity_manager.get_projectiles()
-        walls = entity_manager.get_walls()
+        is_removed = entity_manager.is_removed
         
-        projectiles_to_remove = []
+        pair_tests = 0
         
-        for projectile in projectiles:
-            projectile_rect = pygame.Rect(
-                projectile.x - 3, projectile.y - 3, 6, 6
-            )
-            
-            for wall in walls:
-                wall_rect = wall.rect if hasattr(wall, 'rect') else wall
+        if self.use_spatial_hash:
+            # Index statique du niveau : une requête par projectile
+            wall_index = entity_manager.get_wall_index()
+            for projectile in projectiles:
+                if is_removed(projectile):
+                    continue
+                projectile_rect = pygame.Rect(
+                    projectile.x - 3, projectile.y - 3, 6, 6
+                )
+                pair_tests += 1
+                if wall_index.first_hit(projectile_rect):
+                    entity_manager.remove_projectile(projectile)
+                    self.collision_stats["projectile_wall"] += 1
+        else:
+            walls = entity_manager.get_walls()
+            for projectile in projectiles:
+                if is_removed(projectile):
+                    continue
+                projectile_rect = pygame.Rect(
+                    projectile.x - 3, projectile.y - 3, 6, 6
+                )
                 
-                if projectile_rect.colliderect(wall_rect):
-                    if projectile not in projectiles_to_remove:
-                        projectiles_to_remove.append(projectile)
+                for wall in walls:
+                    pair_tests += 1
+                    wall_rect = wall.rect if hasattr(wall, 'rect') else wall
+                    
+                    if projectile_rect.colliderect(wall_rect):
+                        entity_manager.remove_projectile(projectile)
                         self.collision_stats["projectile_wall"] += 1
-                    break
+                        break
         
-        # Supprimer les projectiles qui ont touché un mur
-        for projectile in projectiles_to_remove:
-            entity_manager.remove_projectile(projectile)
+        self.collision_stats["pair_tests"] += pair_tests
     
     def check_player_enemy_collisions(self, entity_manager):
         """Vérifie les collisions entre le joueur et les ennemis"""
@@ -193,9 +287,19 @@ class CollisionSystem:
         if not player:
             return
         
-        for enemy in enemies:
-            # Utiliser les vraies dimensions du joueur et de l'ennemi
-            player_radius = getattr(player, 'width', 32) // 2
+        self._ensure_broad_phase(entity_manager)
+        
+        # Utiliser les vraies dimensions du joueur
+        player_radius = getattr(player, 'width', 32) // 2
+        candidates = self._enemy_candidates(
+            enemies, player.x + player_radius, player.y + player_radius, player_radius
+        )
+        self.collision_stats["pair_tests"] += len(candidates)
+        
+        for enemy in candidates:
+            # Ennemi tué plus tôt dans la frame (encore dans la liste jusqu'à la compaction)
+            if entity_manager.is_removed(enemy):
+                continue
             enemy_radius = getattr(enemy, 'width', 20) // 2
             
             if self.circle_collision(
@@ -231,24 +335,28 @@ class CollisionSystem:
         if not player:
             return
         
-        items_to_remove = []
+        self._ensure_broad_phase(entity_manager)
         
-        for item in items:
+        if self.use_spatial_hash:
+            candidates = self.item_grid.query_circle(player.x, player.y, PICKUP_RADIUS)
+        else:
+            candidates = items
+        self.collision_stats["pair_tests"] += len(candidates)
+        
+        for item in candidates:
+            if entity_manager.is_removed(item):
+                continue
             if self.circle_collision(
-                player.x, player.y, 15,  # Rayon de ramassage
-                item.x, item.y, 8      # Rayon objet
+                player.x, player.y, PICKUP_RADIUS,  # Rayon de ramassage
+                item.x, item.y, ITEM_RADIUS      # Rayon objet
             ):
                 # Appliquer l'effet de l'objet
                 if hasattr(item, 'apply_effect'):
                     item.apply_effect(player)
                 
-                # Marquer pour suppression
-                items_to_remove.append(item)
+                # Marquer pour suppression (retiré en fin de frame)
+                entity_manager.remove_item(item)
                 self.collision_stats["player_item"] += 1
-        
-        # Supprimer les objets ramassés
-        for item in items_to_remove:
-            entity_manager.remove_item(item)
     
     def circle_collision(self, x1, y1, r1, x2, y2, r2):
         """Détection de collision entre deux cercles"""
@@ -325,23 +433,59 @@ class CollisionSystem:
             "projectile_wall": 0,
             "player_enemy": 0,
             "player_item": 0,
-            "total_checks": 0
+            "total_checks": 0,
+            "pair_tests": 0
         }
     
     def print_statistics(self):
         """Affiche les statistiques de collision"""
         stats = self.collision_stats
-        print("📊 Statistiques de collision:")
-        print(f"  💥 Projectile vs Ennemi: {stats['projectile_enemy']}")
-        print(f"  🧱 Projectile vs Mur: {stats['projectile_wall']}")
-        print(f"  👤 Joueur vs Ennemi: {stats['player_enemy']}")
-        print(f"  📦 Joueur vs Objet: {stats['player_item']}")
-        print(f"  🔄 Vérifications totales: {stats['total_checks']}")
+        _log.info("📊 Statistiques de collision:")
+        _log.info("  💥 Projectile vs Ennemi: %s", stats['projectile_enemy'])
+        _log.info("  🧱 Projectile vs Mur: %s", stats['projectile_wall'])
+        _log.info("  👤 Joueur vs Ennemi: %s", stats['player_enemy'])
+        _log.info("  📦 Joueur vs Objet: %s", stats['player_item'])
+        _log.info("  🔄 Vérifications totales: %s", stats['total_checks'])
+        _log.info("  🔍 Paires testées: %s", stats['pair_tests'])
     
     def optimize_collision_checks(self, entity_manager):
-        """Optimise les vérifications de collision (spatial partitioning basique)"""
-        # Cette méthode peut être implémentée plus tard pour optimiser
-        # les performances avec un système de spatial partitioning
-        pass
+        """Reconstruit les grilles spatiales (phase large) pour le tick courant"""
+        if not self.use_spatial_hash:
+            return
+        
+        # Ennemis : boîte englobante du cercle de collision
+        self.enemy_grid.clear()
+        for enemy in entity_manager.get_enemies():
+            enemy_radius = getattr(enemy, 'width', 20) // 2
+            self.enemy_grid.insert(enemy, enemy.x, enemy.y, enemy_radius * 2, enemy_radius * 2)
+        self.enemy_grid_generation = entity_manager.enemy_generation
+        
+        # Objets ramassables
+        self.item_grid.clear()
+        for item in entity_manager.get_items():
+            self.item_grid.insert(item, item.x - ITEM_RADIUS, item.y - ITEM_RADIUS,
+                                  ITEM_RADIUS * 2, ITEM_RADIUS * 2)
+        
+        # Les murs sont statiques : l'EntityManager fournit un index construit une fois par niveau
+    
+    def _ensure_broad_phase(self, entity_manager):
+        """Construit les grilles si une passe est appelée hors de update()"""
+        if self.use_spatial_hash and not self._broad_phase_ready:
+            self.optimize_collision_checks(entity_manager)
+    
+    def get_enemy_index(self, entity_manager):
+        """Grille des ennemis du dernier tick si aucun ennemi n'a été ajouté depuis, sinon None
+
+        Les ennemis retirés depuis peuvent y rester : filtrer avec EntityManager.is_present().
+        """
+        if self.use_spatial_hash and self.enemy_grid_generation == entity_manager.enemy_generation:
+            return self.enemy_grid
+        return None
+    
+    def _enemy_candidates(self, enemies, center_x, center_y, radius):
+        """Ennemis pouvant toucher le cercle donné (tous si la grille est désactivée)"""
+        if self.use_spatial_hash:
+            return self.enemy_grid.query_circle(center_x, center_y, radius)
+        return enemies
 
     
\ No newline at end of file
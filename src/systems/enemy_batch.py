@@ -0,0 +1,268 @@
+"""
+IA groupée des ennemis simples - Un pas vectorisé (NumPy) par tick
+BasicEnemy, FastEnemy et ShooterEnemy suivent tous la même logique :
+poursuite, séparation, collisions murs. Leur état d'IA (vitesse, minuteurs,
+décalages erratiques, anti-blocage) est rangé dans des tableaux et avancé en
+une passe, au lieu d'un appel update() par ennemi. Les positions restent
+sur les objets, seule vérité partagée avec les collisions et le rendu.
+Les boss et ennemis spéciaux restent sur le chemin objet.
+"""
+import random
+import numpy as np
+from ..core.constants import WORLD_WIDTH, WORLD_HEIGHT
+from ..gameplay.pathfinding import PathfindingHelper, FlockingBehavior
+from ..world.wall_index import WallIndex
+
+# Profils d'IA, choisis par l'attribut de classe `ai_batch` des ennemis
+PROFILE_BASIC = 0
+PROFILE_SHOOTER = 1
+PROFILE_FAST = 2
+
+AI_PROFILES = {
+    # separation : distance, facteur (le tireur applique deux fois la séparation
+    # de BaseEnemy, une seule fois quand il recule)
+    "basic": {"code": PROFILE_BASIC, "separation_distance": 40, "separation_factor": 0.3},
+    "shooter": {"code": PROFILE_SHOOTER, "separation_distance": 40, "separation_factor": 0.6,
+                "retreat_distance": 100},
+    "fast": {"code": PROFILE_FAST, "separation_distance": 30, "separation_factor": 0.4},
+}
+
+# Mouvement erratique de FastEnemy
+ERRATIC_PERIOD = 60
+ERRATIC_OFFSET = 50
+
+# Ticks immobiles avant la téléportation d'urgence (comme BaseEnemy)
+STUCK_TICKS = 120
+
+class EnemyBatch:
+    """Stockage en tableaux et mise à jour vectorisée des ennemis simples"""
+
+    def __init__(self, capacity=256):
+        self.count = 0
+        self.capacity = 0
+        self.enemies = []
+        self.rows = {}  # id(ennemi) -> ligne des tableaux
+
+        self.stats = {"adopted": 0, "updates": 0, "teleports": 0, "grown": 0}
+
+        self._allocate(capacity)
+
+    # === STOCKAGE ===
+
+    def _allocate(self, capacity):
+        """(Ré)alloue les tableaux en conservant les ennemis présents"""
+        old = None
+        if self.capacity:
+            old = (self.profile, self.width, self.height, self.speed, self.separation_distance,
+                   self.separation_factor, self.retreat_distance, self.direction_timer,
+                   self.offset_x, self.offset_y, self.shoot_timer, self.stuck_timer,
+                   self.last_x, self.last_y, self.animation_timer)
+
+        self.profile = np.zeros(capacity, dtype=np.int8)
+        self.width = np.zeros(capacity, dtype=np.float64)
+        self.height = np.zeros(capacity, dtype=np.float64)
+        self.speed = np.zeros(capacity, dtype=np.float64)
+        self.separation_distance = np.zeros(capacity, dtype=np.float64)
+        self.separation_factor = np.zeros(capacity, dtype=np.float64)
+        self.retreat_distance = np.zeros(capacity, dtype=np.float64)
+        self.direction_timer = np.zeros(capacity, dtype=np.int32)
+        self.offset_x = np.zeros(capacity, dtype=np.float64)
+        self.offset_y = np.zeros(capacity, dtype=np.float64)
+        self.shoot_timer = np.zeros(capacity, dtype=np.int32)
+        self.stuck_timer = np.zeros(capacity, dtype=np.int32)
+        self.last_x = np.zeros(capacity, dtype=np.float64)
+        self.last_y = np.zeros(capacity, dtype=np.float64)
+        self.animation_timer = np.zeros(capacity, dtype=np.int32)
+
+        if old is not None:
+            for new_array, old_array in zip((self.profile, self.width, self.height, self.speed,
+                                             self.separation_distance, self.separation_factor,
+                                             self.retreat_distance, self.direction_timer,
+                                             self.offset_x, self.offset_y, self.shoot_timer,
+                                             self.stuck_timer, self.last_x, self.last_y,
+                                             self.animation_timer), old):
+                new_array[:self.count] = old_array[:self.count]
+
+        self.capacity = capacity
+
+    def __len__(self):
+        return self.count
+
+    def owns(self, enemy):
+        """True si l'ennemi est mis à jour par le lot"""
+        return id(enemy) in self.rows
+
+    @staticmethod
+    def can_adopt(enemy):
+        """Seuls les archétypes simples (attribut de classe ai_batch) sont groupés"""
+        return getattr(type(enemy), 'ai_batch', None) in AI_PROFILES
+
+    def adopt(self, enemy):
+        """Prend en charge l'IA d'un ennemi ; False s'il doit garder son update()"""
+        if not self.can_adopt(enemy) or id(enemy) in self.rows:
+            return False
+        if self.count >= self.capacity:
+            self._allocate(self.capacity * 2)
+            self.stats["grown"] += 1
+
+        profile = AI_PROFILES[type(enemy).ai_batch]
+        row = self.count
+        self.profile[row] = profile["code"]
+        self.width[row] = enemy.width
+        self.height[row] = enemy.height
+        # Vitesse déjà multipliée par DifficultyManager.apply_enemy_scaling au spawn
+        self.speed[row] = enemy.speed
+        self.separation_distance[row] = profile["separation_distance"]
+        self.separation_factor[row] = profile["separation_factor"]
+        self.retreat_distance[row] = profile.get("retreat_distance", 0)
+        self.direction_timer[row] = getattr(enemy, 'direction_timer', 0)
+        self.offset_x[row] = getattr(enemy, 'target_offset_x', 0)
+        self.offset_y[row] = getattr(enemy, 'target_offset_y', 0)
+        self.shoot_timer[row] = getattr(enemy, 'shoot_timer', 0)
+        self.stuck_timer[row] = getattr(enemy, 'stuck_timer', 0)
+        self.last_x[row], self.last_y[row] = getattr(enemy, 'last_pos', (enemy.x, enemy.y))
+        self.animation_timer[row] = getattr(enemy, 'animation_timer', 0)
+
+        self.enemies.append(enemy)
+        self.rows[id(enemy)] = row
+        self.count += 1
+        self.stats["adopted"] += 1
+        return True
+
+    def discard(self, enemy_ids):
+        """Retire en une passe les ennemis dont l'id est donné (compaction de fin de frame)"""
+        if not self.count:
+            return 0
+        keep = np.fromiter((id(enemy) not in enemy_ids for enemy in self.enemies),
+                           dtype=bool, count=self.count)
+        removed = self.count - int(keep.sum())
+        if not removed:
+            return 0
+
+        count = self.count
+        for array in (self.profile, self.width, self.height, self.speed, self.separation_distance,
+                      self.separation_factor, self.retreat_distance, self.direction_timer,
+                      self.offset_x, self.offset_y, self.shoot_timer, self.stuck_timer,
+                      self.last_x, self.last_y, self.animation_timer):
+            kept = array[:count][keep]
+            array[:len(kept)] = kept
+        self.enemies = [enemy for enemy, kept in zip(self.enemies, keep) if kept]
+        self.rows = {id(enemy): row for row, enemy in enumerate(self.enemies)}
+        self.count = len(self.enemies)
+        return removed
+
+    def clear(self):
+        """Oublie tous les ennemis du lot"""
+        self.enemies = []
+        self.rows.clear()
+        self.count = 0
+
+    # === MISE À JOUR ===
+
+    def update(self, player, walls, all_enemies=()):
+        """Avance tous les ennemis du lot d'un tick (poursuite, murs, séparation)"""
+        count = self.count
+        if not count or player is None:
+            return
+        if not hasattr(walls, 'overlaps'):
+            walls = WallIndex(walls)
+        enemies = self.enemies
+        self.stats["updates"] += count
+
+        x = np.fromiter((enemy.x for enemy in enemies), dtype=np.float64, count=count)
+        y = np.fromiter((enemy.y for enemy in enemies), dtype=np.float64, count=count)
+        profile = self.profile[:count]
+        width, height, speed = self.width[:count], self.height[:count], self.speed[:count]
+        self.animation_timer[:count] += 1
+
+        # Mouvement erratique (FastEnemy) : nouveau décalage une fois par seconde
+        fast = profile == PROFILE_FAST
+        direction_timer = self.direction_timer[:count]
+        direction_timer[fast] += 1
+        for row in np.flatnonzero(fast & (direction_timer > ERRATIC_PERIOD)):
+            self.offset_x[row] = random.randint(-ERRATIC_OFFSET, ERRATIC_OFFSET)
+            self.offset_y[row] = random.randint(-ERRATIC_OFFSET, ERRATIC_OFFSET)
+            direction_timer[row] = 0
+
+        # Recul des tireurs trop proches (distance coin haut-gauche, comme BaseShooter)
+        to_player_x, to_player_y = player.x - x, player.y - y
+        player_distance = np.sqrt(to_player_x * to_player_x + to_player_y * to_player_y)
+        retreat = (profile == PROFILE_SHOOTER) & (player_distance < self.retreat_distance[:count])
+
+        # Poursuite : champ de flux partagé, direction directe sans chemin connu
+        target_x = player.x + self.offset_x[:count]
+        target_y = player.y + self.offset_y[:count]
+        direct_x, direct_y = target_x - x, target_y - y
+        direct_length = np.sqrt(direct_x * direct_x + direct_y * direct_y)
+        safe_length = np.where(direct_length > 0, direct_length, 1.0)
+        dir_x, dir_y = direct_x / safe_length, direct_y / safe_length
+        flow_field = walls.get_flow_field() if hasattr(walls, 'get_flow_field') else None
+        if flow_field is not None and flow_field.has_target():
+            half_width, half_height = width / 2, height / 2
+            flow_x, flow_y, found = flow_field.directions_at(
+                x + half_width, y + half_height, target_x + half_width, target_y + half_height)
+            dir_x = np.where(found, flow_x, dir_x)
+            dir_y = np.where(found, flow_y, dir_y)
+
+        safe_distance = np.where(player_distance > 0, player_distance, 1.0)
+        dir_x = np.where(retreat, -to_player_x / safe_distance, dir_x)
+        dir_y = np.where(retreat, -to_player_y / safe_distance, dir_y)
+        move_x, move_y = dir_x * speed, dir_y * speed
+
+        # Murs : déplacement complet, sinon glissement sur un axe, sinon immobile
+        new_x, new_y = x + move_x, y + move_y
+        blocked = walls.overlaps(new_x, new_y, width, height)
+        if blocked.any():
+            rows = np.flatnonzero(blocked)
+            slide_x_free = ~walls.overlaps(new_x[rows], y[rows], width[rows], height[rows])
+            slide_y_free = ~walls.overlaps(x[rows], new_y[rows], width[rows], height[rows])
+            new_y[rows] = np.where(slide_x_free, y[rows], np.where(slide_y_free, new_y[rows], y[rows]))
+            new_x[rows] = np.where(slide_x_free, new_x[rows], x[rows])
+            # FastEnemy change de décalage au prochain tick quand il est arrêté net
+            stopped = rows[~slide_x_free & ~slide_y_free]
+            direction_timer[stopped[fast[stopped]]] = ERRATIC_PERIOD
+
+        # Anti-blocage (BasicEnemy et ShooterEnemy en poursuite)
+        tracked = ~fast & ~retreat
+        moved = (np.abs(new_x - self.last_x[:count]) > 1) | (np.abs(new_y - self.last_y[:count]) > 1)
+        stuck_timer = self.stuck_timer[:count]
+        stuck_timer[tracked] = np.where(moved[tracked], 0, stuck_timer[tracked] + 1)
+        for row in np.flatnonzero(tracked & (stuck_timer > STUCK_TICKS)):
+            new_x[row], new_y[row] = PathfindingHelper.find_free_spawn_position(
+                WORLD_WIDTH, WORLD_HEIGHT, int(width[row]), int(height[row]), walls, player, 50)
+            stuck_timer[row] = 0
+            self.stats["teleports"] += 1
+        self.last_x[:count] = np.where(tracked, new_x, self.last_x[:count])
+        self.last_y[:count] = np.where(tracked, new_y, self.last_y[:count])
+
+        # Séparation contre tous les ennemis (les autres gardent leur position actuelle)
+        others = [enemy for enemy in all_enemies if id(enemy) not in self.rows]
+        if others:
+            all_x = np.concatenate((new_x, [enemy.x for enemy in others]))
+            all_y = np.concatenate((new_y, [enemy.y for enemy in others]))
+            distances = np.concatenate((self.separation_distance[:count], np.zeros(len(others))))
+        else:
+            all_x, all_y, distances = new_x, new_y, self.separation_distance[:count]
+        force_x, force_y = FlockingBehavior.get_separation_forces(all_x, all_y, distances)
+        factor = np.where(retreat, self.separation_factor[:count] / 2, self.separation_factor[:count])
+        new_x += force_x[:count] * factor
+        new_y += force_y[:count] * factor
+
+        # Cadence de tir des tireurs
+        shoot_timer = self.shoot_timer[:count]
+        np.subtract(shoot_timer, 1, out=shoot_timer, where=shoot_timer > 0)
+
+        # Écriture sur les objets (collisions, rendu)
+        for enemy, enemy_x, enemy_y in zip(enemies, new_x.tolist(), new_y.tolist()):
+            enemy.x = enemy_x
+            enemy.y = enemy_y
+            enemy.rect.x = enemy_x
+            enemy.rect.y = enemy_y
+        for row in np.flatnonzero(profile == PROFILE_SHOOTER).tolist():
+            enemies[row].shoot_timer = int(shoot_timer[row])
+
+    def get_statistics(self):
+        """Retourne les compteurs du lot"""
+        stats = dict(self.stats)
+        stats["active"] = self.count
+        return stats
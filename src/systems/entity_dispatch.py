@@ -0,0 +1,110 @@
+"""
+Table de dispatch des entités - Signatures update/draw résolues une fois par classe
+Les entités n'ont pas toutes la même signature (ennemis, Bullet,
+WeaponProjectile, ennemi de secours...). Au lieu de deviner à chaque frame avec
+des try/except TypeError, les signatures d'une classe sont inspectées une seule
+fois, quand sa première instance est enregistrée (spawn) ; la boucle de frame
+appelle ensuite directement la bonne forme.
+"""
+import inspect
+import pygame
+
+# Formes de update() par rôle, de la plus complète à la plus simple (nombre d'arguments)
+UPDATE_FORMS = {
+    "player": (2, 1, 0),  # update(walls, morality_system) / update(walls) / update()
+    "enemy": (3, 2, 0),  # update(player, walls, voisins) / update(player, walls) / update()
+    "projectile": (4, 1),  # update(walls, largeur, hauteur, ennemis) / update(walls)
+}
+
+# Formes de draw()
+DRAW_SCREEN = "screen"  # draw(screen, screen_x, screen_y)
+DRAW_OFFSET = "offset"  # draw(screen, camera_offset)
+DRAW_WORLD = "world"  # draw(screen) en coordonnées monde (classes externes)
+
+def get_positional_range(method):
+    """(minimum, maximum) d'arguments positionnels d'un callable ; maximum None avec *args"""
+    try:
+        parameters = inspect.signature(method).parameters.values()
+    except (TypeError, ValueError):
+        return 0, None
+    minimum = maximum = 0
+    for parameter in parameters:
+        if parameter.kind is parameter.VAR_POSITIONAL:
+            return minimum, None
+        if parameter.kind in (parameter.POSITIONAL_ONLY, parameter.POSITIONAL_OR_KEYWORD):
+            maximum += 1
+            if parameter.default is parameter.empty:
+                minimum += 1
+    return minimum, maximum
+
+def get_update_arity(method, forms):
+    """Première forme (nombre d'arguments) acceptée par method, ou None"""
+    if method is None:
+        return None
+    minimum, maximum = get_positional_range(method)
+    for count in forms:
+        if minimum <= count and (maximum is None or count <= maximum):
+            return count
+    return None
+
+def get_draw_mode(method):
+    """Forme de draw() : DRAW_SCREEN, DRAW_OFFSET, DRAW_WORLD ou None"""
+    if method is None:
+        return None
+    try:
+        names = list(inspect.signature(method).parameters)
+    except (TypeError, ValueError):
+        names = []
+    if "camera_offset" in names:
+        return DRAW_OFFSET
+    minimum, maximum = get_positional_range(method)
+    if maximum is None or (minimum <= 3 and maximum >= 3):
+        return DRAW_SCREEN
+    if minimum <= 1:
+        return DRAW_WORLD
+    return None
+
+class EntityCalls:
+    """Formes d'appel résolues pour une classe d'entité"""
+
+    __slots__ = ("update_arity", "draw_mode")
+
+    def __init__(self, update_arity, draw_mode):
+        self.update_arity = update_arity  # None : pas de update() compatible
+        self.draw_mode = draw_mode  # None : pas de draw() compatible
+
+class DispatchTable:
+    """Formes d'appel par rôle et par classe, résolues au premier enregistrement"""
+
+    def __init__(self):
+        self.tables = {role: {} for role in UPDATE_FORMS}  # rôle -> {classe: EntityCalls}
+
+    def register(self, entity, role):
+        """Résout (une fois par classe) et retourne les formes d'appel de l'entité"""
+        table = self.tables[role]
+        calls = table.get(entity.__class__)
+        if calls is None:
+            calls = EntityCalls(get_update_arity(getattr(entity, 'update', None), UPDATE_FORMS[role]),
+                                get_draw_mode(getattr(entity, 'draw', None)))
+            table[entity.__class__] = calls
+        return calls
+
+    def get_statistics(self):
+        """Nombre de classes résolues par rôle"""
+        return {role: len(table) for role, table in self.tables.items()}
+
+def draw_entity(entity, calls, screen, screen_x, screen_y, fallback_color, fallback_radius):
+    """Dessine une entité à sa position écran selon sa forme de draw()"""
+    mode = calls.draw_mode
+    if mode is DRAW_SCREEN:
+        entity.draw(screen, screen_x, screen_y)
+    elif mode is DRAW_OFFSET:
+        entity.draw(screen, (entity.x - screen_x, entity.y - screen_y))
+    elif mode is DRAW_WORLD:
+        # Classe qui ne dessine qu'à sa propre position : translation le temps de l'appel
+        world_x, world_y = entity.x, entity.y
+        entity.x, entity.y = screen_x, screen_y
+        entity.draw(screen)
+        entity.x, entity.y = world_x, world_y
+    else:
+        pygame.draw.circle(screen, fallback_color, (int(screen_x), int(screen_y)), fallback_radius)
@@ -1,7 +1,20 @@
 """
 Gestionnaire d'entités - Centralise la gestion de toutes les entités du jeu
 Remplace la gestion dispersée des listes d'entités dans main.py
+Les suppressions sont différées : remove_*() marque l'entité en O(1) et
+end_of_frame_compact() retire toutes les entités marquées en une passe.
+Pendant la frame, les listes ne changent donc pas sous les boucles qui les
+parcourent ; is_removed() permet d'ignorer les entités déjà marquées.
 """
+from ..core.constants import WORLD_WIDTH, WORLD_HEIGHT
+from ..world.wall_index import WallIndex
+from ..entities.projectile_pool import ProjectilePool
+from .enemy_batch import EnemyBatch
+from .entity_dispatch import DispatchTable
+from ..utils.object_pool import ObjectPool, release_to_pool
+from ..utils.game_log import get_logger
+
+_log = get_logger("systems.entities")
 
 class EntityManager:
     """Gestionnaire centralisé de toutes les entités du jeu"""
@@ -13,6 +26,21 @@ class EntityManager:
         self.projectiles = []
         self.items = []
         self.walls = []
+        self.wall_index = None  # Index statique des murs, construit une fois par niveau
+        self.projectile_pool = None  # Projectiles simples en tableaux NumPy (optionnel)
+        self.enemy_batch = None  # IA vectorisée des ennemis simples (optionnel)
+        self.object_pools = {}  # Pools d'objets réutilisés, par nom (voir get_object_pool)
+        self.dispatch = DispatchTable()  # Signatures update/draw résolues au spawn, par classe
+        
+        # Suppression différée : id des entités présentes et des entités marquées, par liste
+        self._members = {"enemies": set(), "projectiles": set(), "items": set()}
+        self._pending = {"enemies": set(), "projectiles": set(), "items": set()}
+        # Incrémenté à chaque ajout ou vidage d'ennemis : un index construit à une
+        # génération donnée contient encore tous les ennemis tant qu'elle n'a pas changé
+        self.enemy_generation = 0
+        # Appelés avec les ennemis retirés, avant leur retour au pool : un ennemi recyclé
+        # garde son id(), l'état rangé par id() ailleurs (niveau de détail de l'IA...) doit être oublié
+        self.enemy_release_listeners = []
         
         # Statistiques
         self.stats = {
@@ -26,7 +54,8 @@ class EntityManager:
     def add_player(self, player):
         """Définit le joueur principal"""
         self.player = player
-        print(f"👤 Joueur ajouté: {player}")
+        self.dispatch.register(player, "player")
+        _log.info("👤 Joueur ajouté: %s", player)
     
     def get_player(self):
         """Retourne le joueur"""
@@ -37,70 +66,105 @@ class EntityManager:
     def add_enemy(self, enemy):
         """Ajoute un ennemi"""
         self.enemies.append(enemy)
+        self._members["enemies"].add(id(enemy))
+        self.enemy_generation += 1
+        self.dispatch.register(enemy, "enemy")
+        # L'ennemi reste dans la liste ; seul son update() passe au lot vectorisé
+        if self.enemy_batch is not None:
+            self.enemy_batch.adopt(enemy)
         self.stats["enemies_total"] += 1
     
     def remove_enemy(self, enemy):
-        """Supprime un ennemi"""
-        if enemy in self.enemies:
-            self.enemies.remove(enemy)
-            return True
-        return False
+        """Marque un ennemi à retirer en fin de frame (False s'il l'était déjà)"""
+        return self._mark_removed("enemies", enemy)
     
     def get_enemies(self):
-        """Retourne la liste des ennemis"""
+        """Retourne la liste des ennemis (peut contenir des ennemis marqués pendant la frame)"""
         return self.enemies
     
     def get_enemies_count(self):
         """Retourne le nombre d'ennemis vivants"""
-        return len(self.enemies)
+        return len(self.enemies) - len(self._pending["enemies"])
     
     def clear_enemies(self):
         """Supprime tous les ennemis"""
         count = len(self.enemies)
+        self._forget_enemies(self.enemies)
+        self._release_all(self.enemies)
         self.enemies.clear()
-        print(f"🧹 {count} ennemis supprimés")
+        self._members["enemies"].clear()
+        self._pending["enemies"].clear()
+        self.enemy_generation += 1
+        if self.enemy_batch is not None:
+            self.enemy_batch.clear()
+        _log.info("🧹 %s ennemis supprimés", count)
+    
+    def enable_enemy_batch(self, capacity=256):
+        """Active la mise à jour vectorisée des ennemis simples (ajoutés ensuite)"""
+        if self.enemy_batch is None:
+            self.enemy_batch = EnemyBatch(capacity)
+        return self.enemy_batch
+    
+    def get_enemy_batch(self):
+        """Retourne le lot d'ennemis vectorisé (None si désactivé)"""
+        return self.enemy_batch
     
     # === PROJECTILES ===
     
+    def enable_projectile_pool(self, capacity=1024):
+        """Active le pool vectorisé pour les projectiles simples"""
+        if self.projectile_pool is None:
+            self.projectile_pool = ProjectilePool(capacity)
+        return self.projectile_pool
+    
+    def get_projectile_pool(self):
+        """Retourne le pool de projectiles (None si désactivé)"""
+        return self.projectile_pool
+    
     def add_projectile(self, projectile):
-        """Ajoute un projectile"""
-        self.projectiles.append(projectile)
+        """Ajoute un projectile (repris par le pool s'il n'a pas de comportement spécial)"""
         self.stats["projectiles_total"] += 1
+        if self.projectile_pool is not None and self.projectile_pool.adopt(projectile):
+            return
+        self.projectiles.append(projectile)
+        self._members["projectiles"].add(id(projectile))
+        self.dispatch.register(projectile, "projectile")
     
     def remove_projectile(self, projectile):
-        """Supprime un projectile"""
-        if projectile in self.projectiles:
-            self.projectiles.remove(projectile)
-            return True
-        return False
+        """Marque un projectile à retirer en fin de frame (False s'il l'était déjà)"""
+        return self._mark_removed("projectiles", projectile)
     
     def get_projectiles(self):
         """Retourne la liste des projectiles"""
         return self.projectiles
     
     def get_projectiles_count(self):
-        """Retourne le nombre de projectiles actifs"""
-        return len(self.projectiles)
+        """Retourne le nombre de projectiles actifs (objets + pool)"""
+        pooled = len(self.projectile_pool) if self.projectile_pool is not None else 0
+        return len(self.projectiles) - len(self._pending["projectiles"]) + pooled
     
     def clear_projectiles(self):
         """Supprime tous les projectiles"""
-        count = len(self.projectiles)
+        count = self.get_projectiles_count()
+        self._release_all(self.projectiles)
         self.projectiles.clear()
-        print(f"🧹 {count} projectiles supprimés")
+        self._members["projectiles"].clear()
+        self._pending["projectiles"].clear()
+        if self.projectile_pool is not None:
+            self.projectile_pool.clear()
+        _log.info("🧹 %s projectiles supprimés", count)
     
     # === ITEMS ===
     
     def add_item(self, item):
         """Ajoute un objet ramassable"""
         self.items.append(item)
+        self._members["items"].add(id(item))
         self.stats["items_total"] += 1
     
     def remove_item(self, item):
-        """Supprime un objet"""
-        if item in self.items:
-            self.items.remove(item)
-            return True
-        return False
+        """Marque un objet à retirer en fin de frame (False s'il l'était déjà)"""
+        return self._mark_removed("items", item)
     
     def get_items(self):
         """Retourne la liste des objets"""
@@ -108,34 +172,140 @@ class EntityManager:
     
     def get_items_count(self):
         """Retourne le nombre d'objets sur le terrain"""
-        return len(self.items)
+        return len(self.items) - len(self._pending["items"])
     
     def clear_items(self):
         """Supprime tous les objets"""
         count = len(self.items)
+        self._release_all(self.items)
         self.items.clear()
-        print(f"🧹 {count} objets supprimés")
+        self._members["items"].clear()
+        self._pending["items"].clear()
+        _log.info("🧹 %s objets supprimés", count)
     
     # === WALLS ===
     
     def set_walls(self, walls):
         """Définit la liste des murs"""
         self.walls = walls
-        print(f"🧱 {len(walls)} murs définis")
+        self.wall_index = None
+        _log.info("🧱 %s murs définis", len(walls))
     
     def add_wall(self, wall):
         """Ajoute un mur"""
         self.walls.append(wall)
+        self.wall_index = None
     
     def get_walls(self):
         """Retourne la liste des murs"""
         return self.walls
     
+    def rebuild_wall_index(self):
+        """Construit l'index statique des murs (à appeler une fois les murs du niveau posés)"""
+        self.wall_index = WallIndex(self.walls)
+        return self.wall_index
+    
+    def get_wall_index(self):
+        """Retourne l'index statique des murs (construit à la demande si invalide)"""
+        if self.wall_index is None:
+            self.rebuild_wall_index()
+        return self.wall_index
+    
     def clear_walls(self):
         """Supprime tous les murs"""
         count = len(self.walls)
         self.walls.clear()
-        print(f"🧹 {count} murs supprimés")
+        self.wall_index = None
+        _log.info("🧹 %s murs supprimés", count)
+    
+    # === SUPPRESSION DIFFÉRÉE ===
+    
+    def _mark_removed(self, kind, entity):
+        """Marque une entité d'une liste ; False si absente ou déjà marquée"""
+        entity_id = id(entity)
+        pending = self._pending[kind]
+        if entity_id not in self._members[kind] or entity_id in pending:
+            return False
+        pending.add(entity_id)
+        return True
+    
+    def is_removed(self, entity):
+        """True si l'entité est marquée pour suppression à la fin de la frame"""
+        entity_id = id(entity)
+        pending = self._pending
+        return (entity_id in pending["enemies"] or entity_id in pending["projectiles"] or
+                entity_id in pending["items"])
+    
+    def is_present(self, entity, kind):
+        """True si l'entité est dans la liste kind et n'est pas marquée pour suppression"""
+        entity_id = id(entity)
+        return entity_id in self._members[kind] and entity_id not in self._pending[kind]
+    
+    def has_pending_removals(self, kind=None):
+        """True si des entités (de cette liste ou de toutes) attendent la compaction"""
+        if kind is not None:
+            return bool(self._pending[kind])
+        return any(self._pending.values())
+    
+    def end_of_frame_compact(self):
+        """Retire en une passe toutes les entités marquées (ordre conservé) ; retourne leur nombre"""
+        removed = 0
+        for kind, entities in (("enemies", self.enemies), ("projectiles", self.projectiles),
+                               ("items", self.items)):
+            pending = self._pending[kind]
+            if not pending:
+                continue
+            if kind == "enemies" and self.enemy_batch is not None:
+                self.enemy_batch.discard(pending)
+            kept = []
+            released = []
+            for entity in entities:
+                if id(entity) in pending:
+                    released.append(entity)
+                else:
+                    kept.append(entity)
+            entities[:] = kept
+            if kind == "enemies":
+                self._forget_enemies(released)
+            for entity in released:
+                release_to_pool(entity)  # Réutilisable dès la frame suivante
+            self._members[kind] -= pending
+            removed += len(pending)
+            pending.clear()
+        return removed
+    
+    # === POOLS D'OBJETS ===
+    
+    def get_object_pool(self, name, factory, reset=None):
+        """Retourne le pool nommé, créé au premier appel"""
+        pool = self.object_pools.get(name)
+        if pool is None:
+            pool = ObjectPool(factory, reset, name=name)
+            self.object_pools[name] = pool
+        return pool
+    
+    def register_object_pool(self, name, pool):
+        """Déclare un pool tenu par un autre système (statistiques)"""
+        self.object_pools[name] = pool
+        return pool
+    
+    def _forget_enemies(self, enemies):
+        """Efface les touches et l'état par id() des ennemis retirés (avant leur recyclage)"""
+        if not enemies:
+            return
+        if self.projectile_pool is not None:
+            self.projectile_pool.forget_targets(enemies)
+        for projectile in self.projectiles:
+            hit_targets = getattr(projectile, 'has_hit_targets', None)
+            if hit_targets:
+                hit_targets.difference_update(enemies)
+        for listener in self.enemy_release_listeners:
+            listener(enemies)
+    
+    def _release_all(self, entities):
+        """Rend à leur pool les entités d'une liste vidée"""
+        for entity in entities:
+            release_to_pool(entity)
     
     # === UTILITAIRES ===
     
@@ -145,7 +315,7 @@ class EntityManager:
         self.clear_projectiles()
         self.clear_items()
         self.clear_walls()
-        print("🧹 Toutes les entités supprimées")
+        _log.info("🧹 Toutes les entités supprimées")
     
     def reset(self):
         """Remet à zéro toutes les entités y compris le joueur"""
@@ -158,29 +328,32 @@ class EntityManager:
             "projectiles_total": 0,
             "items_total": 0
         }
-        print("🔄 EntityManager réinitialisé")
+        _log.info("🔄 EntityManager réinitialisé")
     
     def get_statistics(self):
         """Retourne les statistiques complètes"""
         current_stats = {
             "player": 1 if self.player else 0,
-            "enemies_current": len(self.enemies),
-            "projectiles_current": len(self.projectiles),
-            "items_current": len(self.items),
+            "enemies_current": self.get_enemies_count(),
+            "projectiles_current": self.get_projectiles_count(),
+            "projectiles_pooled": len(self.projectile_pool) if self.projectile_pool is not None else 0,
+            "enemies_batched": len(self.enemy_batch) if self.enemy_batch is not None else 0,
+            "items_current": self.get_items_count(),
             "walls_current": len(self.walls),
+            "pools": {name: pool.get_statistics() for name, pool in self.object_pools.items()},
         }
         return {**self.stats, **current_stats}
     
     def print_status(self):
         """Affiche l'état actuel du gestionnaire"""
         stats = self.get_statistics()
-        print("📊 État EntityManager:")
-        print(f"  👤 Joueur: {'Oui' if self.player else 'Non'}")
-        print(f"  👹 Ennemis: {stats['enemies_current']}")
-        print(f"  💥 Projectiles: {stats['projectiles_current']}")
-        print(f"  📦 Objets: {stats['items_current']}")
-        print(f"  🧱 Murs: {stats['walls_current']}")
-        print(f"  📈 Total spawné: {stats['enemies_total']} ennemis, {stats['projectiles_total']} projectiles")
+        _log.info("📊 État EntityManager:")
+        _log.info("  👤 Joueur: %s", 'Oui' if self.player else 'Non')
+        _log.info("  👹 Ennemis: %s", stats['enemies_current'])
+        _log.info("  💥 Projectiles: %s", stats['projectiles_current'])
+        _log.info("  📦 Objets: %s", stats['items_current'])
+        _log.info("  🧱 Murs: %s", stats['walls_current'])
+        _log.info("  📈 Total spawné: %s ennemis, %s projectiles", stats['enemies_total'], stats['projectiles_total'])
     
     def find_closest_enemy_to_player(self):
         """Trouve l'ennemi le plus proche du joueur"""
@@ -214,19 +387,18 @@ class EntityManager:
         return enemies_in_radius
     
     def cleanup_dead_entities(self):
-        """Nettoie automatiquement les entités mortes/invalides"""
-        # Nettoyer les ennemis morts
-        initial_enemies = len(self.enemies)
-        self.enemies = [e for e in self.enemies if hasattr(e, 'health') and e.health > 0]
-        
-        # Nettoyer les projectiles hors limites ou invalides
-        initial_projectiles = len(self.projectiles)
-        from ..core.constants import WORLD_WIDTH, WORLD_HEIGHT
-        self.projectiles = [p for p in self.projectiles 
-                          if 0 <= p.x <= WORLD_WIDTH and 0 <= p.y <= WORLD_HEIGHT]
+        """Marque les entités mortes/invalides (retirées par end_of_frame_compact)"""
+        # Ennemis morts
+        cleaned_enemies = 0
+        for e in self.enemies:
+            if not (hasattr(e, 'health') and e.health > 0) and self.remove_enemy(e):
+                cleaned_enemies += 1
         
-        cleaned_enemies = initial_enemies - len(self.enemies)
-        cleaned_projectiles = initial_projectiles - len(self.projectiles)
+        # Projectiles hors limites ou invalides
+        cleaned_projectiles = 0
+        for p in self.projectiles:
+            if not (0 <= p.x <= WORLD_WIDTH and 0 <= p.y <= WORLD_HEIGHT) and self.remove_projectile(p):
+                cleaned_projectiles += 1
         
         if cleaned_enemies > 0 or cleaned_projectiles > 0:
-            print(f"🧹 Nettoyage: {cleaned_enemies} ennemis, {cleaned_projectiles} projectiles")
\ No newline at end of file
+            _log.debug("🧹 Nettoyage: %s ennemis, %s projectiles", cleaned_enemies, cleaned_projectiles)
\ No newline at end of file
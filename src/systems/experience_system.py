@@ -2,13 +2,17 @@ import pygame
 import random
 import math
 
+from ..utils.game_log import get_logger
+
+_log = get_logger("systems.experience")
+
 # Import du debug logger
 try:
     from debug_logger import debug_log, debug_section
 except ImportError:
     # Fallback si debug_logger n'est pas disponible
-    def debug_log(msg): print(msg)
-    def debug_section(title): print(f"=== {title} ===")
+    def debug_log(msg): _log.info("%s", msg)
+    def debug_section(title): _log.info("=== %s ===", title)
 
 class ExperienceSystem:
     """Système d'expérience et de level-up avec choix de cartes"""
@@ -43,14 +47,14 @@ class ExperienceSystem:
         self.is_leveling_up = True
         # Réinitialiser les choix pour forcer une nouvelle génération
         self.level_up_choices = []
-        print(f"LEVEL UP ! Niveau {self.level}")
-        print("Level-up activé, choix réinitialisés")
+        _log.info("LEVEL UP ! Niveau %s", self.level)
+        _log.info("Level-up activé, choix réinitialisés")
     
     def generate_level_up_choices(self, morality_system, item_manager, player=None):
         """Génère 3 choix d'objets pour le level-up"""
         available_items = self.get_available_items_for_morality(morality_system, item_manager, player)
         
-        print(f"Objets disponibles pour foi={morality_system.faith:.0f}, corruption={morality_system.corruption:.0f}: {available_items}")
+        _log.info("Objets disponibles pour foi=%.0f, corruption=%.0f: %s", morality_system.faith, morality_system.corruption, available_items)
         
         # Assurer qu'on a au moins 3 choix
         if len(available_items) < 3:
@@ -62,7 +66,7 @@ class ExperienceSystem:
         self.level_up_choices = random.sample(available_items, min(3, len(available_items)))
         self.selected_choice = -1  # 🔧 AUCUNE SÉLECTION INITIALE
         
-        print(f"Choix générés: {self.level_up_choices}")
+        _log.info("Choix générés: %s", self.level_up_choices)
         
         # Réinitialiser animations
         self.card_animations = [0, 0, 0]
@@ -72,7 +76,7 @@ class ExperienceSystem:
         """Retourne les objets disponibles selon l'état de foi/corruption"""
         available_items = []
         
-        print(f"Vérification des objets pour foi={morality_system.faith}, corruption={morality_system.corruption}")
+        _log.debug("Vérification des objets pour foi=%s, corruption=%s", morality_system.faith, morality_system.corruption)
         
         # Vérifier chaque objet avec ses prérequis
         for item_type in item_manager.item_definitions.keys():
@@ -81,27 +85,27 @@ class ExperienceSystem:
                 if self._is_weapon_upgrade(item_type) and player:
                     weapon_id = self._extract_weapon_id(item_type)
                     if hasattr(player, 'obtained_weapon_ids') and weapon_id in player.obtained_weapon_ids:
-                        print(f"  - {item_type}: DÉJÀ POSSÉDÉE ({weapon_id})")
+                        _log.debug("  - %s: DÉJÀ POSSÉDÉE (%s)", item_type, weapon_id)
                         continue
                 
                 available_items.append(item_type)
-                print(f"  - {item_type}: DISPONIBLE")
+                _log.debug("  - %s: DISPONIBLE", item_type)
             else:
-                print(f"  - {item_type}: NON DISPONIBLE")
+                _log.debug("  - %s: NON DISPONIBLE", item_type)
         
-        print(f"Total objets disponibles: {len(available_items)}")
+        _log.info("Total objets disponibles: %s", len(available_items))
         
         # S'assurer qu'on a au moins quelques objets
         if len(available_items) < 5:
-            print("Pas assez d'objets, ajout des objets de base...")
+            _log.info("Pas assez d'objets, ajout des objets de base...")
             # Ajouter des objets de base qui n'ont pas de prérequis
             base_items = ["speed_boost", "damage_up", "health_up", "fire_rate", "double_shot"]
             for item in base_items:
                 if item not in available_items:
                     available_items.append(item)
-                    print(f"  + Ajouté: {item}")
+                    _log.debug("  + Ajouté: %s", item)
         
-        print(f"Liste finale: {available_items}")
+        _log.info("Liste finale: %s", available_items)
         return available_items
     
     def _is_weapon_upgrade(self, item_type: str) -> bool:
@@ -214,10 +218,10 @@ class ExperienceSystem:
     def draw_level_up_screen(self, screen, morality_system, item_manager):
         """Dessine l'écran de level-up avec les 3 cartes"""
         if not self.is_leveling_up or not self.level_up_choices:
-            print("Pas de level-up ou pas de choix à afficher")
+            _log.info("Pas de level-up ou pas de choix à afficher")
             return
         
-        print(f"Affichage écran level-up avec choix: {self.level_up_choices}")
+        _log.info("Affichage écran level-up avec choix: %s", self.level_up_choices)
         
         # Fond semi-transparent - utiliser vraies dimensions
         screen_width, screen_height = 1200, 800
@@ -0,0 +1,262 @@
+"""
+Système de particules - Émetteurs à tableaux NumPy, mise à jour et dessin groupés
+Chaque émetteur stocke ses particules dans des tableaux de capacité fixe
+(position, vitesse, alpha, atténuation, taille, couleur) : intégration,
+vieillissement, bords et élimination des mortes sont vectorisés. Le dessin
+écarte les particules hors de la zone visible puis envoie tous les sprites
+(carrés translucides d'un SpriteCache dédié) en un seul Surface.fblits
+(pygame-ce ; un seul Surface.blits avec pygame).
+
+Un émetteur est décrit par un dict de définition :
+    "max_particles": capacité (plafond par émetteur)
+    "overflow": "refuse" (défaut, les nouvelles sont ignorées) ou "drop_oldest"
+    "velocity": ((vx_min, vx_max), (vy_min, vy_max)), tirage uniforme
+    "size": (min, max) demi-côté du carré, entier inclus
+    "color": (r, g, b) | "palette": [(r, g, b), ...] | "color_range": ((r_min, r_max), ...)
+        (color_range : palette de PARTICLE_RANGE_COLORS couleurs tirées à la création,
+        pour borner le nombre de sprites distincts)
+    "alpha": (min, max) alpha initial, entier inclus (valeur fixe si min == max)
+    "fade": alpha perdu par unité de temps (0 : immortelle)
+    "edge": None, "wrap" (réapparaît du côté opposé) ou "kill", avec "edge_margin"
+L'unité de temps est celle que passe le propriétaire à update() (ticks ou secondes).
+"""
+import random
+import numpy as np
+
+from ..utils.sprite_cache import SpriteCache
+
+# Couleurs tirées une fois par émetteur défini par "color_range"
+PARTICLE_RANGE_COLORS = 16
+
+# Sprites de particules : petits carrés, cache dédié pour ne pas évincer les auras du cache partagé
+PARTICLE_SPRITE_CACHE_SIZE = 4096
+
+particle_sprites = SpriteCache(max_entries=PARTICLE_SPRITE_CACHE_SIZE)
+
+# Tableaux flottants d'un émetteur, dans l'ordre de compactage
+_FLOAT_FIELDS = ("x", "y", "vx", "vy", "alpha", "fade")
+
+class ParticleEmitter:
+    """Particules d'une même définition, stockées dans des tableaux NumPy"""
+
+    def __init__(self, definition, bounds=None, rng=None):
+        self.definition = definition
+        self.capacity = definition["max_particles"]
+        self.overflow = definition.get("overflow", "refuse")
+        self.edge = definition.get("edge")
+        self.bounds = None
+        self.set_bounds(bounds)
+        # Graine tirée du module random : reproductible avec random.seed()
+        self.rng = rng or np.random.default_rng(random.getrandbits(32))
+        self.palette = None
+        if "palette" in definition:
+            self.palette = np.array(definition["palette"], dtype=np.uint8)
+        elif "color_range" in definition:
+            self.palette = np.stack([self.rng.integers(low, high, PARTICLE_RANGE_COLORS, endpoint=True)
+                                     for low, high in definition["color_range"]], axis=1).astype(np.uint8)
+
+        self.count = 0
+        for name in _FLOAT_FIELDS:
+            setattr(self, name, np.zeros(self.capacity, dtype=np.float64))
+        self.size = np.zeros(self.capacity, dtype=np.int32)
+        self.color = np.zeros((self.capacity, 3), dtype=np.uint8)
+        self.stats = {"emitted": 0, "refused": 0, "dropped": 0}
+        # Clé d'aspect -> sprite ; borné par la définition (couleurs x tailles x paliers d'alpha)
+        self._sprites = {}
+
+    def __len__(self):
+        return self.count
+
+    def set_bounds(self, bounds):
+        """Zone (x, y, largeur, hauteur) dont les bords enroulent ou tuent les particules"""
+        if bounds is None:
+            self.bounds = None
+            return
+        margin = self.definition.get("edge_margin", 0)
+        left, top, width, height = bounds
+        # (gauche, haut, droite, bas), marge comprise
+        self.bounds = (left - margin, top - margin, left + width + margin, top + height + margin)
+
+    def emit(self, count, x, y, width=0, height=0):
+        """Crée count particules, positions tirées dans le rectangle (x, y, width, height)"""
+        count = int(count)
+        if count <= 0:
+            return 0
+        free = self.capacity - self.count
+        if count > free:
+            if self.overflow == "drop_oldest":
+                drop = min(count - free, self.count)
+                self._keep(np.arange(drop, self.count))
+                self.stats["dropped"] += drop
+                count = min(count, self.capacity)
+            else:
+                self.stats["refused"] += count - free
+                count = free
+            if count <= 0:
+                return 0
+
+        definition = self.definition
+        rng = self.rng
+        start, end = self.count, self.count + count
+        # Décalages entiers, bornes incluses, comme random.randint
+        self.x[start:end] = x + rng.integers(0, int(width), count, endpoint=True)
+        self.y[start:end] = y + rng.integers(0, int(height), count, endpoint=True)
+        (vx_min, vx_max), (vy_min, vy_max) = definition.get("velocity", ((0, 0), (0, 0)))
+        self.vx[start:end] = rng.uniform(vx_min, vx_max, count)
+        self.vy[start:end] = rng.uniform(vy_min, vy_max, count)
+        alpha_min, alpha_max = definition.get("alpha", (255, 255))
+        if alpha_min == alpha_max:
+            self.alpha[start:end] = alpha_min
+        else:
+            self.alpha[start:end] = rng.integers(alpha_min, alpha_max, count, endpoint=True)
+        self.fade[start:end] = definition.get("fade", 0)
+        size_min, size_max = definition.get("size", (1, 1))
+        self.size[start:end] = rng.integers(size_min, size_max, count, endpoint=True)
+        if self.palette is not None:
+            self.color[start:end] = self.palette[rng.integers(0, len(self.palette), count)]
+        else:
+            self.color[start:end] = definition.get("color", (255, 255, 255))
+        self.count = end
+        self.stats["emitted"] += count
+        return count
+
+    def update(self, step=1.0):
+        """Avance les particules de step unités de temps, puis retire les mortes"""
+        n = self.count
+        if not n:
+            return
+        x, y = self.x[:n], self.y[:n]
+        x += self.vx[:n] * step
+        y += self.vy[:n] * step
+        alpha = self.alpha[:n]
+        alpha -= self.fade[:n] * step
+        alive = alpha > 0
+
+        if self.bounds is not None and self.edge is not None:
+            left, top, right, bottom = self.bounds
+            if self.edge == "wrap":
+                # Réapparition du côté opposé
+                past_left, past_right = x < left, x > right
+                x[past_left], x[past_right] = right, left
+                past_top, past_bottom = y < top, y > bottom
+                y[past_top], y[past_bottom] = bottom, top
+            else:
+                alive &= (x >= left) & (x <= right) & (y >= top) & (y <= bottom)
+
+        if not alive.all():
+            self._keep(np.flatnonzero(alive))
+
+    def _keep(self, indices):
+        """Compacte les tableaux sur les particules d'indices donnés (ordre conservé)"""
+        kept = len(indices)
+        for name in _FLOAT_FIELDS:
+            array = getattr(self, name)
+            array[:kept] = array[indices]
+        self.size[:kept] = self.size[indices]
+        self.color[:kept] = self.color[indices]
+        self.count = kept
+
+    def clear(self):
+        """Retire toutes les particules"""
+        self.count = 0
+
+    def get_visible(self, left, top, width, height):
+        """Indices des particules dont le carré touche le rectangle donné"""
+        n = self.count
+        x, y, size = self.x[:n], self.y[:n], self.size[:n]
+        return np.flatnonzero((x + size >= left) & (x - size < left + width) &
+                              (y + size >= top) & (y - size < top + height) & (self.alpha[:n] >= 1))
+
+    def build_blits(self, indices, offset_x, offset_y):
+        """Séquence (sprite, position écran) des particules, sprites partagés par aspect"""
+        if not len(indices):
+            return []
+        size = self.size[indices].astype(np.int64)
+        color = self.color[indices].astype(np.int64)
+        step = particle_sprites.alpha_step
+        bucket = (np.clip(self.alpha[indices], 0, 255).astype(np.int64) + step // 2) // step
+        # Une clé entière par aspect (taille, couleur, palier d'alpha) : un sprite par clé distincte
+        keys = (((size * 256 + color[:, 0]) * 256 + color[:, 1]) * 256 + color[:, 2]) * 64 + bucket
+        left = (self.x[indices] - size - offset_x).astype(np.int32).tolist()
+        top = (self.y[indices] - size - offset_y).astype(np.int32).tolist()
+        sprites = self._sprites
+        blits = []
+        for key, px, py in zip(keys.tolist(), left, top):
+            sprite = sprites.get(key)
+            if sprite is None:
+                sprite = sprites[key] = self._get_sprite(key, step)
+            blits.append((sprite, (px, py)))
+        return blits
+
+    def _get_sprite(self, key, step):
+        """Sprite d'une clé d'aspect, pris dans le cache des particules"""
+        bucket, key = key % 64, key // 64
+        blue, key = key % 256, key // 256
+        green, key = key % 256, key // 256
+        red, half = key % 256, key // 256
+        return particle_sprites.rect(half * 2, half * 2, (red, green, blue), bucket * step)
+
+    def get_statistics(self):
+        """Particules vivantes, capacité et compteurs"""
+        stats = dict(self.stats)
+        stats["alive"] = self.count
+        stats["capacity"] = self.capacity
+        return stats
+
+class ParticleSystem:
+    """Ensemble d'émetteurs nommés, mis à jour et dessinés ensemble"""
+
+    def __init__(self, world_space=True):
+        self.world_space = world_space  # False : coordonnées écran (fond, menus)
+        self.emitters = {}
+
+    def add_emitter(self, name, definition, bounds=None, rng=None):
+        """Crée (ou remplace) l'émetteur name"""
+        emitter = ParticleEmitter(definition, bounds=bounds, rng=rng)
+        self.emitters[name] = emitter
+        return emitter
+
+    def emit(self, name, count, x, y, width=0, height=0):
+        """Émet count particules depuis l'émetteur name"""
+        return self.emitters[name].emit(count, x, y, width, height)
+
+    def update(self, step=1.0):
+        """Avance tous les émetteurs"""
+        for emitter in self.emitters.values():
+            emitter.update(step)
+
+    def draw(self, surface, camera_x=0, camera_y=0, visible_area=None):
+        """Dessine les particules visibles de tous les émetteurs en un seul lot
+
+        visible_area : rectangle monde visible (par défaut la surface décalée de
+        la caméra) ; ignoré pour un système en coordonnées écran.
+        """
+        if not self.world_space:
+            camera_x = camera_y = 0
+            visible_area = None
+        if visible_area is None:
+            visible_area = (camera_x, camera_y, surface.get_width(), surface.get_height())
+        blits = []
+        for emitter in self.emitters.values():
+            if emitter.count:
+                blits += emitter.build_blits(emitter.get_visible(*visible_area), camera_x, camera_y)
+        if not blits:
+            return 0
+        fblits = getattr(surface, 'fblits', None)
+        if fblits is not None:
+            fblits(blits)
+        else:
+            surface.blits(blits, doreturn=False)  # pygame sans fblits (pygame-ce seulement)
+        return len(blits)
+
+    def clear(self):
+        """Vide tous les émetteurs"""
+        for emitter in self.emitters.values():
+            emitter.clear()
+
+    def __len__(self):
+        return sum(emitter.count for emitter in self.emitters.values())
+
+    def get_statistics(self):
+        """Statistiques par émetteur"""
+        return {name: emitter.get_statistics() for name, emitter in self.emitters.items()}
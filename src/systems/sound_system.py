@@ -3,6 +3,9 @@ import math
 import random
 from enum import Enum
 import os
+from ..utils.game_log import get_logger
+
+_log = get_logger("systems.sound")
 
 class SoundEvent(Enum):
     """Énumération des événements sonores du jeu"""
@@ -273,10 +276,10 @@ class AudioEngine:
         project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
         sounds_folder = os.path.join(project_root, "assets", "sounds")
         if not os.path.exists(sounds_folder):
-            print("📁 Dossier 'sounds' non trouvé, utilisation des sons générés")
+            _log.info("📁 Dossier 'sounds' non trouvé, utilisation des sons générés")
             return
         
-        print(f"📁 Dossier 'sounds' trouvé, recherche de fichiers audio...")
+        _log.info("📁 Dossier 'sounds' trouvé, recherche de fichiers audio...")
         
         # Mapping étendu avec de nombreuses variantes de noms
         file_mappings = {
@@ -345,16 +348,16 @@ class AudioEngine:
             "holy.wav": SoundEvent.FAITH_GAIN,
             "chaos.wav": SoundEvent.CORRUPTION_GAIN,
         }
-        print("File mappings définis:")
+        _log.info("File mappings définis:")
         for filename, event in file_mappings.items():
-            print(f"  {filename} -> {event.value}")
+            _log.info("  %s -> %s", filename, event.value)
             
         # Lister tous les fichiers du dossier
         try:
             files_in_folder = os.listdir(sounds_folder)
-            print(f"📋 Fichiers trouvés: {', '.join(files_in_folder)}")
+            _log.info("📋 Fichiers trouvés: %s", ', '.join(files_in_folder))
         except:
-            print("❌ Impossible de lire le contenu du dossier sounds")
+            _log.error("❌ Impossible de lire le contenu du dossier sounds")
             return
         
         loaded = 0
@@ -364,17 +367,17 @@ class AudioEngine:
             filepath = os.path.join(sounds_folder, filename)
             if os.path.exists(filepath):
                 try:
-                    print(f"🔄 Tentative de chargement: {filename}")
+                    _log.info("🔄 Tentative de chargement: %s", filename)
                     sound = pygame.mixer.Sound(filepath)
                     self.sounds[event] = sound
                     loaded += 1
-                    print(f"✅ {filename} -> {event.value}")
+                    _log.info("✅ %s -> %s", filename, event.value)
                 except Exception as e:
-                    print(f"❌ Erreur chargement {filename}: {e}")
+                    _log.error("❌ Erreur chargement %s: %s", filename, e)
         
         # Essayer aussi avec les extensions mp3 et ogg
         if loaded == 0:
-            print("🔄 Tentative avec d'autres extensions...")
+            _log.info("🔄 Tentative avec d'autres extensions...")
             for base_name in ["bolter", "shoot", "gun", "laser", "explosion", "death", "level_up", "pickup"]:
                 for ext in [".mp3", ".ogg", ".wav"]:
                     filename = base_name + ext
@@ -399,19 +402,19 @@ class AudioEngine:
                             if event not in self.sounds:  # Ne pas écraser
                                 self.sounds[event] = sound
                                 loaded += 1
-                                print(f"✅ {filename} -> {event.value}")
+                                _log.info("✅ %s -> %s", filename, event.value)
                         except Exception as e:
-                            print(f"❌ Erreur {filename}: {e}")
+                            _log.error("❌ Erreur %s: %s", filename, e)
         
         if loaded > 0:
-            print(f"🎵 {loaded} sons réalistes chargés avec succès!")
+            _log.info("🎵 %s sons réalistes chargés avec succès!", loaded)
         else:
-            print("⚠️ Aucun son réaliste chargé, utilisation des sons générés")
+            _log.warning("⚠️ Aucun son réaliste chargé, utilisation des sons générés")
     
     def preload_sounds(self):
         """Précharge tous les sons de base (seulement ceux qui ne sont pas déjà chargés)"""
         try:
-            print("🔊 Génération des sons manquants...")
+            _log.info("🔊 Génération des sons manquants...")
             created_count = 0
             skipped_count = 0
             total_sounds = 0
@@ -464,7 +467,7 @@ class AudioEngine:
                     # Son déjà chargé (depuis fichier)
                     skipped_count += 1
                     if skipped_count <= 3:
-                        print(f"   ⏭️ {event.value}: Son réel déjà chargé")
+                        _log.info("   ⏭️ %s: Son réel déjà chargé", event.value)
                     continue
                 
                 # Générer le son
@@ -473,21 +476,21 @@ class AudioEngine:
                     self.sounds[event] = sound
                     created_count += 1
                     if created_count <= 3:  # Afficher les premiers pour debug
-                        print(f"   🔊 {event.value}: Généré {frequency}Hz, {duration}ms")
+                        _log.info("   🔊 %s: Généré %sHz, %sms", event.value, frequency, duration)
                 else:
                     if total_sounds <= 3:  # Afficher les échecs pour debug
-                        print(f"   ❌ {event.value}: Échec génération")
+                        _log.error("   ❌ %s: Échec génération", event.value)
             
-            print(f"✅ Sons: {skipped_count} réels + {created_count} générés = {skipped_count + created_count}/{total_sounds} total")
+            _log.info("✅ Sons: %s réels + %s générés = %s/%s total", skipped_count, created_count, skipped_count + created_count, total_sounds)
             
             # Si aucun son n'a été créé, essayer une méthode de fallback
             if created_count == 0 and skipped_count == 0:
-                print("🔧 Tentative de création de sons de fallback...")
+                _log.info("🔧 Tentative de création de sons de fallback...")
                 self._create_fallback_sounds()
             
         except Exception as e:
-            print(f"⚠️ Erreur lors de la génération des sons: {e}")
-            print("🔧 Tentative de création de sons de fallback...")
+            _log.warning("⚠️ Erreur lors de la génération des sons: %s", e)
+            _log.info("🔧 Tentative de création de sons de fallback...")
             self._create_fallback_sounds()
     
     def _create_fallback_sounds(self):
@@ -513,11 +516,11 @@ class AudioEngine:
                     except:
                         continue
             
-            print(f"🔧 {fallback_count} sons de fallback créés")
+            _log.info("🔧 %s sons de fallback créés", fallback_count)
             
         except Exception as e:
-            print(f"⚠️ Impossible de créer des sons de fallback: {e}")
-            print("🔇 Le jeu fonctionnera en mode silencieux")
+            _log.warning("⚠️ Impossible de créer des sons de fallback: %s", e)
+            _log.info("🔇 Le jeu fonctionnera en mode silencieux")
     
     def _create_click_sound(self, frequency):
         """Crée un click très simple"""
@@ -546,7 +549,7 @@ class AudioEngine:
             return pygame.mixer.Sound(buffer=data)
             
         except Exception as e:
-            print(f"⚠️ Erreur création click: {e}")
+            _log.warning("⚠️ Erreur création click: %s", e)
             return None
     
     def play_sound(self, event, volume=1.0, category="sfx"):
@@ -574,7 +577,7 @@ class AudioEngine:
             return True
             
         except Exception as e:
-            print(f"⚠️ Erreur lecture son {event.value}: {e}")
+            _log.warning("⚠️ Erreur lecture son %s: %s", event.value, e)
             return False
     
     def update(self):
@@ -601,9 +604,9 @@ class SoundManager:
             try:
                 pygame.mixer.pre_init(frequency=22050, size=-16, channels=2, buffer=256)
                 pygame.mixer.init()
-                print("🔊 Audio initialisé avec optimisations")
+                _log.info("🔊 Audio initialisé avec optimisations")
             except Exception as e:
-                print(f"⚠️ Impossible d'initialiser l'audio: {e}")
+                _log.warning("⚠️ Impossible d'initialiser l'audio: %s", e)
                 self.audio_enabled = False
                 return
         
@@ -811,7 +814,7 @@ def create_sound_manager():
     try:
         return SoundManager()
     except Exception as e:
-        print(f"⚠️ Impossible de créer le gestionnaire audio: {e}")
+        _log.warning("⚠️ Impossible de créer le gestionnaire audio: %s", e)
         # Retourner un gestionnaire "silencieux"
         manager = SoundManager()
         manager.audio_enabled = False
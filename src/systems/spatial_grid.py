@@ -0,0 +1,135 @@
+"""
+Grille de hachage spatial uniforme - Phase large des collisions
+Découpe le monde en cellules carrées pour ne tester que les paires voisines
+"""
+from ..core.constants import WORLD_WIDTH, WORLD_HEIGHT, COLLISION_CELL_SIZE
+
+class SpatialHashGrid:
+    """Grille uniforme couvrant le monde, indexée par cellule"""
+
+    def __init__(self, cell_size=COLLISION_CELL_SIZE, world_width=WORLD_WIDTH, world_height=WORLD_HEIGHT):
+        if cell_size <= 0:
+            raise ValueError(f"Taille de cellule invalide: {cell_size}")
+
+        self.cell_size = cell_size
+        self.world_width = world_width
+        self.world_height = world_height
+        self.cols = max(1, -(-world_width // cell_size))
+        self.rows = max(1, -(-world_height // cell_size))
+
+        # clé de cellule -> liste de (ordre d'insertion, objet)
+        self.cells = {}
+        # id(objet) -> (ordre d'insertion, clés de cellules occupées)
+        self.entries = {}
+        self._next_order = 0
+
+    def clear(self):
+        """Vide la grille"""
+        self.cells.clear()
+        self.entries.clear()
+        self._next_order = 0
+
+    def _cell_range(self, x, y, width, height):
+        """Retourne les bornes de cellules couvertes par un rectangle (bornées au monde)"""
+        size = self.cell_size
+        max_col = self.cols - 1
+        max_row = self.rows - 1
+
+        col0 = min(max_col, max(0, int(x // size)))
+        col1 = min(max_col, max(0, int((x + width) // size)))
+        row0 = min(max_row, max(0, int(y // size)))
+        row1 = min(max_row, max(0, int((y + height) // size)))
+        return col0, col1, row0, row1
+
+    def insert(self, obj, x, y, width, height):
+        """Ajoute un objet couvrant le rectangle donné"""
+        if id(obj) in self.entries:
+            self.remove(obj)
+
+        order = self._next_order
+        self._next_order += 1
+
+        col0, col1, row0, row1 = self._cell_range(x, y, width, height)
+        cols = self.cols
+        cells = self.cells
+        keys = []
+        entry = (order, obj)
+        for row in range(row0, row1 + 1):
+            base = row * cols
+            for col in range(col0, col1 + 1):
+                key = base + col
+                bucket = cells.get(key)
+                if bucket is None:
+                    cells[key] = [entry]
+                else:
+                    bucket.append(entry)
+                keys.append(key)
+
+        self.entries[id(obj)] = (order, keys)
+
+    def insert_rect(self, obj, rect):
+        """Ajoute un objet à partir d'un pygame.Rect"""
+        self.insert(obj, rect.x, rect.y, rect.width, rect.height)
+
+    def remove(self, obj):
+        """Retire un objet de la grille (mise à jour incrémentale)"""
+        entry = self.entries.pop(id(obj), None)
+        if entry is None:
+            return False
+
+        order, keys = entry
+        for key in keys:
+            bucket = self.cells.get(key)
+            if not bucket:
+                continue
+            for i, (entry_order, _) in enumerate(bucket):
+                if entry_order == order:
+                    del bucket[i]
+                    break
+            if not bucket:
+                del self.cells[key]
+        return True
+
+    def query_rect(self, x, y, width, height):
+        """Retourne les objets des cellules touchées par le rectangle, dans l'ordre d'insertion"""
+        col0, col1, row0, row1 = self._cell_range(x, y, width, height)
+        cells = self.cells
+        cols = self.cols
+
+        # Cas fréquent : une seule cellule, pas de doublons possibles
+        if col0 == col1 and row0 == row1:
+            bucket = cells.get(row0 * cols + col0)
+            return [obj for _, obj in bucket] if bucket else []
+
+        found = {}
+        for row in range(row0, row1 + 1):
+            base = row * cols
+            for col in range(col0, col1 + 1):
+                bucket = cells.get(base + col)
+                if bucket:
+                    for order, obj in bucket:
+                        found[order] = obj
+
+        # Conserver l'ordre d'insertion pour des résultats identiques au parcours complet
+        return [found[order] for order in sorted(found)]
+
+    def query_circle(self, center_x, center_y, radius):
+        """Retourne les candidats dont la boîte peut toucher le cercle"""
+        return self.query_rect(center_x - radius, center_y - radius, radius * 2, radius * 2)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, obj):
+        return id(obj) in self.entries
+
+    def get_statistics(self):
+        """Retourne l'occupation de la grille"""
+        occupied = len(self.cells)
+        return {
+            "cell_size": self.cell_size,
+            "cells_total": self.cols * self.rows,
+            "cells_occupied": occupied,
+            "objects": len(self.entries),
+            "max_bucket": max((len(b) for b in self.cells.values()), default=0),
+        }
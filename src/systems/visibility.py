@@ -0,0 +1,148 @@
+"""
+Passe de visibilité - Entités visibles calculées une fois par frame
+Au début du dessin, la zone monde visible est déduite de la caméra
+(Camera.get_visible_area, étendue à la position interpolée et d'une marge),
+puis les ennemis, projectiles et murs qui la touchent sont rangés dans des
+listes. Tous les dessins en coordonnées monde (entités, barres de vie, textes
+flottants, particules, zones d'alerte) parcourent ces listes ou testent la
+zone, au lieu de refaire chacun leur propre test d'écran.
+
+Les ennemis sont demandés à la grille spatiale des collisions quand elle est
+encore complète (aucun ajout depuis la phase large) et que la zone ne couvre
+qu'une petite part du monde ; sinon la liste entière est parcourue, ce qui
+coûte moins cher qu'une requête sur la plupart des cellules. L'ordre de la
+liste des entités est conservé dans les deux cas.
+"""
+import math
+import pygame
+
+from ..utils.profiler import profiler
+
+# Marge autour de l'écran (px) : sprites plus grands que leur boîte, auras, barres de vie, textes
+VISIBILITY_MARGIN = 64
+# Part maximale du monde couverte par la zone pour interroger la grille plutôt que tout parcourir
+VISIBILITY_INDEX_MAX_SHARE = 0.25
+
+class VisibilityPass:
+    """Zone monde visible de la frame et entités qui la touchent"""
+
+    def __init__(self, screen_width, screen_height, margin=VISIBILITY_MARGIN,
+                 index_max_share=VISIBILITY_INDEX_MAX_SHARE):
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.margin = margin
+        self.index_max_share = index_max_share
+
+        # Position de dessin de la caméra (interpolée)
+        self.camera_x = 0
+        self.camera_y = 0
+        # Zone visible, marge comprise : (x, y, largeur, hauteur) et (gauche, haut, droite, bas)
+        self.area = (-margin, -margin, screen_width + margin * 2, screen_height + margin * 2)
+        self.bounds = (-margin, -margin, screen_width + margin, screen_height + margin)
+
+        self.enemies = []
+        self.projectiles = []
+        self.walls = []
+        self.stats = {"frames": 0, "index_queries": 0, "full_scans": 0,
+                      "enemies": 0, "enemies_total": 0, "projectiles": 0,
+                      "projectiles_total": 0, "walls": 0, "walls_total": 0}
+
+    def update(self, camera, entity_manager, collision_system=None, alpha=1.0):
+        """Nouvelle frame : zone visible de la caméra et entités qui la touchent"""
+        visible = camera.get_visible_area()
+        if hasattr(camera, 'interpolated'):
+            self.camera_x, self.camera_y = camera.interpolated(alpha)
+        else:
+            self.camera_x, self.camera_y = visible.x, visible.y
+
+        # Union de la zone du tick et de la zone interpolée, plus la marge
+        margin = self.margin
+        left = min(visible.left, math.floor(self.camera_x)) - margin
+        top = min(visible.top, math.floor(self.camera_y)) - margin
+        right = max(visible.right, math.ceil(self.camera_x) + visible.width) + margin
+        bottom = max(visible.bottom, math.ceil(self.camera_y) + visible.height) + margin
+        self.bounds = (left, top, right, bottom)
+        self.area = (left, top, right - left, bottom - top)
+
+        self.enemies = self._collect_enemies(entity_manager, collision_system)
+        self.projectiles = self._collect_projectiles(entity_manager)
+        self.walls = self._collect_walls(entity_manager)
+
+        stats = self.stats
+        stats["frames"] += 1
+        stats["enemies"] = len(self.enemies)
+        stats["projectiles"] = len(self.projectiles)
+        stats["walls"] = len(self.walls)
+        profiler.count("visibility.culled", stats["enemies_total"] - stats["enemies"] +
+                       stats["projectiles_total"] - stats["projectiles"] +
+                       stats["walls_total"] - stats["walls"])
+
+    def _collect_enemies(self, entity_manager, collision_system):
+        """Ennemis présents dont la boîte touche la zone, dans l'ordre de la liste"""
+        left, top, right, bottom = self.bounds
+        enemies = entity_manager.get_enemies()
+        self.stats["enemies_total"] = len(enemies)
+
+        grid = collision_system.get_enemy_index(entity_manager) if collision_system is not None else None
+        if grid is not None and ((right - left) * (bottom - top) >
+                                 self.index_max_share * grid.world_width * grid.world_height):
+            grid = None  # Zone trop grande : le parcours complet est plus rapide
+        if grid is not None:
+            # La grille peut encore contenir des ennemis retirés depuis la phase large
+            candidates = grid.query_rect(left, top, right - left, bottom - top)
+            self.stats["index_queries"] += 1
+            check_presence = True
+        else:
+            candidates = enemies
+            self.stats["full_scans"] += 1
+            check_presence = entity_manager.has_pending_removals("enemies")
+
+        visible = []
+        for enemy in candidates:
+            x, y = enemy.x, enemy.y
+            if (x + getattr(enemy, 'width', 20) >= left and x < right and
+                    y + getattr(enemy, 'height', 20) >= top and y < bottom and
+                    (not check_presence or entity_manager.is_present(enemy, "enemies"))):
+                visible.append(enemy)
+        return visible
+
+    def _collect_projectiles(self, entity_manager):
+        """Projectiles objets non marqués dont la position est dans la zone"""
+        left, top, right, bottom = self.bounds
+        projectiles = entity_manager.get_projectiles()
+        self.stats["projectiles_total"] = len(projectiles)
+        visible = [projectile for projectile in projectiles
+                   if left <= projectile.x < right and top <= projectile.y < bottom]
+        if entity_manager.has_pending_removals("projectiles"):
+            visible = [projectile for projectile in visible
+                       if entity_manager.is_present(projectile, "projectiles")]
+        return visible
+
+    def _collect_walls(self, entity_manager):
+        """Murs qui touchent la zone, via l'index statique des murs"""
+        walls = entity_manager.get_walls()
+        self.stats["walls_total"] = len(walls)
+        if not walls:
+            return []
+        left, top, right, bottom = self.bounds
+        return entity_manager.get_wall_index().query_rect(pygame.Rect(left, top, right - left, bottom - top))
+
+    # === TESTS PONCTUELS ===
+
+    def contains_point(self, x, y):
+        """True si le point monde est dans la zone visible"""
+        left, top, right, bottom = self.bounds
+        return left <= x < right and top <= y < bottom
+
+    def contains_rect(self, x, y, width, height):
+        """True si le rectangle monde touche la zone visible"""
+        left, top, right, bottom = self.bounds
+        return x + width >= left and x < right and y + height >= top and y < bottom
+
+    def contains_circle(self, x, y, radius):
+        """True si la boîte du cercle monde touche la zone visible"""
+        return self.contains_rect(x - radius, y - radius, radius * 2, radius * 2)
+
+    def get_statistics(self):
+        """Entités visibles et totales de la dernière frame, passes par index ou complètes"""
+        return dict(self.stats)
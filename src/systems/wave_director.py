@@ -0,0 +1,141 @@
+"""
+Directeur de vagues - Composition planifiée, création étalée sur plusieurs ticks
+Les classes d'ennemis sont résolues une seule fois au démarrage. Au début
+d'une vague, le directeur tire la composition complète (type et position de
+chaque ennemi) dans une file ; les ennemis sont ensuite instanciés quelques-uns
+par tick, dans un budget de temps, au lieu de tous dans generate_level.
+"""
+import time
+import random
+import importlib
+from collections import deque
+from ..core.constants import WORLD_WIDTH, WORLD_HEIGHT
+from ..utils.game_log import get_logger
+
+_log = get_logger("systems.waves")
+
+# Budget de création par tick (ms) ; None = seulement SPAWN_MAX_PER_TICK
+SPAWN_BUDGET_MS = 2.0
+
+# Plafond d'ennemis créés par tick (au moins un est toujours créé)
+SPAWN_MAX_PER_TICK = 8
+
+# Ennemis de vague importés par resolve_enemy_types (module, relatif à src.systems, et classe)
+WAVE_ENEMY_CLASSES = (
+    ("..entities.enemies.basic_enemies", "BasicEnemy"),
+    ("..entities.enemies.basic_enemies", "ShooterEnemy"),
+    ("..entities.enemies.basic_enemies", "FastEnemy"),
+)
+
+def resolve_enemy_types(classes=WAVE_ENEMY_CLASSES):
+    """Importe les classes d'ennemis de vague une fois ; ignore celles qui échouent"""
+    enemy_types = []
+    for module_name, class_name in classes:
+        try:
+            module = importlib.import_module(module_name, __package__)
+            enemy_types.append(getattr(module, class_name))
+            _log.info("✅ %s importé", class_name)
+        except Exception as e:
+            _log.warning("⚠️  %s échoué: %s", class_name, e)
+    return enemy_types
+
+class WaveDirector:
+    """File des ennemis à créer pour la vague en cours"""
+
+    def __init__(self, enemy_types, budget_ms=SPAWN_BUDGET_MS, max_per_tick=SPAWN_MAX_PER_TICK):
+        self.enemy_types = list(enemy_types)
+        self.budget_ms = budget_ms
+        self.max_per_tick = max_per_tick
+        self.queue = deque()  # (classe ou fabrique, x, y)
+        self.wave_number = 0
+        self.planned = 0
+        self.spawned_this_wave = 0
+        self.stats = {"planned": 0, "spawned": 0, "failed": 0, "ticks_spawning": 0, "max_tick_ms": 0.0}
+
+    # === PLANIFICATION ===
+
+    def plan_wave(self, wave_number, count, rng=random):
+        """Tire la composition de la vague (type et position aux bords de la carte) sans rien créer"""
+        self.queue.clear()
+        self.wave_number = wave_number
+        self.spawned_this_wave = 0
+        if not self.enemy_types:
+            self.planned = 0
+            return 0
+
+        for _ in range(count):
+            # Position aléatoire aux bords de la map
+            edge = rng.choice(['top', 'bottom', 'left', 'right'])
+            if edge == 'top':
+                x, y = rng.randint(50, WORLD_WIDTH - 50), 50
+            elif edge == 'bottom':
+                x, y = rng.randint(50, WORLD_WIDTH - 50), WORLD_HEIGHT - 50
+            elif edge == 'left':
+                x, y = 50, rng.randint(50, WORLD_HEIGHT - 50)
+            else:  # right
+                x, y = WORLD_WIDTH - 50, rng.randint(50, WORLD_HEIGHT - 50)
+            self.queue.append((rng.choice(self.enemy_types), x, y))
+
+        self.planned = count
+        self.stats["planned"] += count
+        return count
+
+    def clear(self):
+        """Abandonne les créations en attente"""
+        self.queue.clear()
+
+    # === CRÉATION ===
+
+    def update(self, spawn):
+        """Crée des ennemis de la file dans le budget du tick ; retourne le nombre créé
+
+        spawn(enemy_type, x, y) crée et enregistre l'ennemi ; il retourne
+        False en cas d'échec (l'entrée est alors abandonnée).
+        """
+        if not self.queue:
+            return 0
+        start = time.perf_counter()
+        deadline = start + self.budget_ms / 1000.0 if self.budget_ms is not None else None
+        created = 0
+        processed = 0
+        while self.queue and processed < self.max_per_tick:
+            enemy_type, x, y = self.queue.popleft()
+            processed += 1
+            if spawn(enemy_type, x, y) is False:
+                self.stats["failed"] += 1
+            else:
+                created += 1
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+
+        self.spawned_this_wave += created
+        self.stats["spawned"] += created
+        self.stats["ticks_spawning"] += 1
+        self.stats["max_tick_ms"] = max(self.stats["max_tick_ms"], (time.perf_counter() - start) * 1000.0)
+        if not self.queue:
+            _log.info("✅ %s/%s ennemis créés pour la vague %s", self.spawned_this_wave, self.planned, self.wave_number)
+        return created
+
+    # === REQUÊTES (HUD) ===
+
+    def has_pending(self):
+        """True s'il reste des ennemis à créer"""
+        return bool(self.queue)
+
+    def get_pending_count(self):
+        """Nombre d'ennemis encore à créer"""
+        return len(self.queue)
+
+    def get_pending_by_type(self):
+        """Ennemis encore à créer, par nom de type"""
+        counts = {}
+        for enemy_type, _, _ in self.queue:
+            name = getattr(enemy_type, '__name__', 'Ennemi')
+            counts[name] = counts.get(name, 0) + 1
+        return counts
+
+    def get_statistics(self):
+        """Retourne les compteurs du directeur"""
+        stats = dict(self.stats)
+        stats["pending"] = len(self.queue)
+        return stats
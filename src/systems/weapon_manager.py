@@ -6,8 +6,14 @@ import json
 import os
 import pygame
 import math
+import random
 from typing import Dict, List, Optional, Any
 from ..entities.weapon_projectile import WeaponProjectile
+from ..entities.weapon_blueprint import WeaponBlueprint, upgrades_key
+from ..utils.object_pool import ObjectPool
+from ..utils.game_log import get_logger
+
+_log = get_logger("systems.weapons")
 
 class WeaponManager:
     """Gestionnaire principal du système d'armes"""
@@ -16,22 +22,30 @@ class WeaponManager:
         self.weapons = {}
         self.effects = {}
         
+        # Plans compilés : sans améliorations, et par arme pour les améliorations courantes
+        self.blueprints = {}
+        self._upgraded_blueprints = {}
+        
+        # Projectiles réutilisés (rendus par EntityManager / ProjectilePool à leur retrait)
+        self.projectile_pool = ObjectPool(WeaponProjectile, name="weapon_projectiles")
+        
         # Chemin relatif depuis le dossier racine du projet
         current_dir = os.path.dirname(os.path.abspath(__file__))
         project_root = os.path.dirname(os.path.dirname(current_dir))
         self.weapon_configs_path = os.path.join(project_root, "assets", "weapons")
         
-        print(f"🔍 Recherche armes dans: {self.weapon_configs_path}")
+        _log.info("🔍 Recherche armes dans: %s", self.weapon_configs_path)
         
         # Charger toutes les configurations
         self.load_all_configs()
+        self.compile_blueprints()
     
     def load_all_configs(self):
         """Charge toutes les configurations d'armes et d'effets"""
         
         # Vérifier que le dossier existe
         if not os.path.exists(self.weapon_configs_path):
-            print(f"❌ Dossier d'armes non trouvé: {self.weapon_configs_path}")
+            _log.error("❌ Dossier d'armes non trouvé: %s", self.weapon_configs_path)
             self._load_fallback_config()
             return
         
@@ -41,9 +55,9 @@ class WeaponManager:
             if os.path.exists(effects_file):
                 with open(effects_file, 'r', encoding='utf-8') as f:
                     self.effects = json.load(f)
-                print(f"✅ Effets d'armes chargés: {len(self.effects)} catégories")
+                _log.info("✅ Effets d'armes chargés: %s catégories", len(self.effects))
             else:
-                print(f"⚠️  Fichier d'effets non trouvé: {effects_file}")
+                _log.warning("⚠️  Fichier d'effets non trouvé: %s", effects_file)
             
             # Charger tous les fichiers d'armes
             weapon_files = [
@@ -61,26 +75,26 @@ class WeaponManager:
                     with open(file_path, 'r', encoding='utf-8') as f:
                         weapons_data = json.load(f)
                         self.weapons.update(weapons_data)
-                        print(f"✅ Armes chargées de {weapon_file}: {len(weapons_data)} armes")
+                        _log.info("✅ Armes chargées de %s: %s armes", weapon_file, len(weapons_data))
                         files_found += 1
                 else:
-                    print(f"⚠️  Fichier d'armes non trouvé: {file_path}")
+                    _log.warning("⚠️  Fichier d'armes non trouvé: %s", file_path)
             
             if files_found == 0:
-                print(f"❌ Aucun fichier d'armes trouvé dans {self.weapon_configs_path}")
+                _log.error("❌ Aucun fichier d'armes trouvé dans %s", self.weapon_configs_path)
                 self._load_fallback_config()
             else:
-                print(f"🔫 Total armes disponibles: {len(self.weapons)}")
+                _log.info("🔫 Total armes disponibles: %s", len(self.weapons))
             
         except Exception as e:
-            print(f"❌ Erreur lors du chargement des configurations: {e}")
+            _log.error("❌ Erreur lors du chargement des configurations: %s", e)
             import traceback
             traceback.print_exc()
             self._load_fallback_config()
     
     def _load_fallback_config(self):
         """Charge une configuration de base en cas d'erreur"""
-        print("🔧 Chargement de la configuration de fallback...")
+        _log.info("🔧 Chargement de la configuration de fallback...")
         self.weapons = {
             "bolter_basic": {
                 "name": "Bolter Standard",
@@ -113,7 +127,44 @@ class WeaponManager:
             }
         }
         self.effects = {}
-        print(f"✅ Configuration de fallback chargée: {len(self.weapons)} arme(s)")
+        _log.info("✅ Configuration de fallback chargée: %s arme(s)", len(self.weapons))
+    
+    def compile_blueprints(self):
+        """Compile chaque arme chargée en plan immuable (une seule fois au chargement)"""
+        self.blueprints = {}
+        self._upgraded_blueprints = {}
+        for weapon_id, weapon_data in self.weapons.items():
+            try:
+                self.blueprints[weapon_id] = WeaponBlueprint(weapon_id, weapon_data, self.effects)
+            except (KeyError, TypeError) as e:
+                _log.warning("⚠️  Arme %s non compilée: %s", weapon_id, e)
+        return self.blueprints
+    
+    def get_blueprint(self, weapon_id: str, player=None) -> Optional[WeaponBlueprint]:
+        """Retourne le plan compilé de l'arme pour les améliorations globales du joueur"""
+        key = upgrades_key(player)
+        if key is None:
+            blueprint = self.blueprints.get(weapon_id)
+            if blueprint is None and weapon_id in self.weapons:
+                blueprint = WeaponBlueprint(weapon_id, self.weapons[weapon_id], self.effects)
+                self.blueprints[weapon_id] = blueprint
+            return blueprint
+        
+        # Cache invalidé dès que les améliorations pertinentes du joueur changent
+        cached = self._upgraded_blueprints.get(weapon_id)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        weapon_data = self.weapons.get(weapon_id)
+        if weapon_data is None:
+            return None
+        blueprint = WeaponBlueprint(weapon_id, weapon_data, self.effects, player.global_upgrades)
+        self._upgraded_blueprints[weapon_id] = (key, blueprint)
+        return blueprint
+    
+    def invalidate_blueprints(self):
+        """Oublie les plans dépendant des améliorations globales"""
+        self._upgraded_blueprints.clear()
     
     def get_weapon(self, weapon_id: str) -> Optional[Dict]:
         """Récupère une configuration d'arme"""
@@ -167,9 +218,9 @@ class WeaponManager:
     def create_projectiles(self, weapon_id: str, start_x: float, start_y: float, 
                           target_x: float, target_y: float, player=None) -> List[WeaponProjectile]:
         """Crée les projectiles pour une arme donnée"""
-        weapon_data = self.get_weapon(weapon_id)
-        if not weapon_data:
-            print(f"❌ Arme inconnue: {weapon_id}")
+        blueprint = self.get_blueprint(weapon_id, player)
+        if not blueprint:
+            _log.error("❌ Arme inconnue: %s", weapon_id)
             return []
         
         projectiles = []
@@ -186,9 +237,8 @@ class WeaponManager:
             dy /= length
         
         # Appliquer la précision de l'arme
-        accuracy = weapon_data["stats"].get("accuracy", 1.0)
+        accuracy = blueprint.accuracy
         if accuracy < 1.0:
-            import random
             spread = (1.0 - accuracy) * 0.5  # Convertir en angle de dispersion
             angle_offset = random.uniform(-spread, spread)
             cos_offset = math.cos(angle_offset)
@@ -198,27 +248,11 @@ class WeaponManager:
             new_dy = dx * sin_offset + dy * cos_offset
             dx, dy = new_dx, new_dy
         
-        # Déterminer le nombre de projectiles
-        projectile_count = 1
-        spread_angle = 0
-        
-        # Vérifier les effets de tir multiple de l'arme
-        for effect_name in weapon_data.get("effects", []):
-            if effect_name in ["multi_shot_2", "multi_shot_3"]:
-                effect_data = self.get_effect_data("projectile_effects", effect_name)
-                if effect_data:
-                    projectile_count = effect_data["parameters"]["projectile_count"]
-                    spread_angle = effect_data["parameters"]["spread_angle"]
-        
-        # Ajouter les projectiles bonus des améliorations globales
-        if player and hasattr(player, 'global_upgrades'):
-            bonus_projectiles = player.global_upgrades.get('multi_shot_bonus', 0)
-            projectile_count += bonus_projectiles
-            # Si on ajoute des projectiles bonus et qu'il n'y avait pas de spread, en ajouter un
-            if bonus_projectiles > 0 and spread_angle == 0:
-                spread_angle = 0.4  # Angle de dispersion par défaut pour les projectiles bonus
-            if bonus_projectiles > 0:
-                print(f"🚀 Projectiles bonus: {bonus_projectiles}, Total: {projectile_count}")
+        # Nombre de projectiles et dispersion résolus dans le plan (effets + bonus globaux)
+        projectile_count = blueprint.projectile_count
+        spread_angle = blueprint.spread_angle
+        if blueprint.bonus_projectiles > 0 and _log.debug_enabled:
+            _log.debug("🚀 Projectiles bonus: %s, Total: %s", blueprint.bonus_projectiles, projectile_count)
         
         # Créer les projectiles
         for i in range(projectile_count):
@@ -234,15 +268,16 @@ class WeaponManager:
             else:
                 proj_dx, proj_dy = dx, dy
             
-            # Créer le projectile
-            projectile = WeaponProjectile(
+            # Créer le projectile (référence partagée au plan compilé, objet réutilisé si possible)
+            projectile = self.projectile_pool.acquire(
                 x=start_x,
                 y=start_y,
                 dx=proj_dx,
                 dy=proj_dy,
-                weapon_data=weapon_data,
+                weapon_data=blueprint.weapon_data,
                 effects_data=self.effects,
-                owner=player
+                owner=player,
+                blueprint=blueprint
             )
             
             projectiles.append(projectile)
@@ -314,7 +349,7 @@ class Weapon:
             
             # Si munitions épuisées, déclencher rechargement automatique
             if self.current_ammo == 0 and self.weapon_data["stats"]["ammo_capacity"] > 0:
-                print(f"🔄 Rechargement automatique de {self.weapon_data['name']}")
+                _log.info("🔄 Rechargement automatique de %s", self.weapon_data['name'])
                 self.start_reload()
         
         # Démarrer le timer de cadence
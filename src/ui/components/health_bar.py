@@ -3,6 +3,7 @@ Composant barre de vie réutilisable
 """
 import pygame
 import math
+from ...core.fixed_timestep import interpolate_position
 
 class HealthBar:
     """Barre de vie générique pour joueur et ennemis"""
@@ -84,8 +85,8 @@ class EnemyHealthBar(HealthBar):
         super().__init__(width=40, height=4, show_text=False)
         self.border_color = (200, 200, 200)
         
-    def draw_above_enemy(self, surface, enemy, camera_x=0, camera_y=0):
-        """Dessine la barre au-dessus d'un ennemi"""
+    def draw_above_enemy(self, surface, enemy, camera_x=0, camera_y=0, alpha=1.0):
+        """Dessine la barre au-dessus d'un ennemi (position interpolée avec alpha, comme draw_entity)"""
         if not hasattr(enemy, 'health') or not hasattr(enemy, 'max_health'):
             return
             
@@ -94,9 +95,10 @@ class EnemyHealthBar(HealthBar):
             return
             
         # Position au-dessus de l'ennemi
-        enemy_center_x = enemy.x + (getattr(enemy, 'width', 20) // 2)
+        enemy_x, enemy_y = interpolate_position(enemy, alpha)
+        enemy_center_x = enemy_x + (getattr(enemy, 'width', 20) // 2)
         bar_x = enemy_center_x - (self.width // 2) - camera_x
-        bar_y = enemy.y - 8 - camera_y
+        bar_y = enemy_y - 8 - camera_y
         
         self.draw(surface, bar_x, bar_y, enemy.health, enemy.max_health)
 
@@ -4,6 +4,11 @@ Gestionnaire de l'interface utilisateur du jeu
 import pygame
 from .components.health_bar import PlayerHealthBar, EnemyHealthBar
 from .components.progress_bars import ExperienceBar, MoralityBar
+from ..utils.profiler import profiled
+
+# Overlay de profilage : sections affichées et rafraîchissement des statistiques
+PROFILER_OVERLAY_ROWS = 14
+PROFILER_OVERLAY_REFRESH = 15  # images entre deux recalculs
 
 class HUDManager:
     """Gestionnaire du HUD pendant le jeu"""
@@ -27,11 +32,18 @@ class HUDManager:
         self.exp_pos = (bar_start_x, screen_height - 70) 
         self.morality_pos = (bar_start_x, screen_height - 160)
         
+        # Overlay de profilage (police et statistiques mises en cache)
+        self.debug_small_font = None
+        self.profiler_stats = {}
+        self.profiler_counters = {}
+        self.profiler_stats_age = PROFILER_OVERLAY_REFRESH
+        
     def update(self, dt):
         """Met à jour l'UI"""
         # Mettre à jour les animations des barres
         pass
     
+    @profiled("hud.draw_hud")
     def draw_hud(self, surface, player, exp_system, morality_system):
         """Dessine le HUD principal"""
         if not player:
@@ -230,21 +242,22 @@ class HUDManager:
         help_surface2 = pygame.font.Font(None, 16).render(help_text2, True, (150, 150, 150))
         surface.blit(help_surface2, (x, y))
     
-    def draw_enemy_health_bars(self, surface, enemies, camera_x=0, camera_y=0):
-        """Dessine les barres de vie des ennemis"""
+    @profiled("hud.enemy_health_bars")
+    def draw_enemy_health_bars(self, surface, enemies, camera_x=0, camera_y=0, culled=False, alpha=1.0):
+        """Dessine les barres de vie des ennemis (culled : liste déjà restreinte à l'écran, voir VisibilityPass)"""
         for enemy in enemies:
             if hasattr(enemy, 'health') and hasattr(enemy, 'max_health'):
                 # Ne dessiner que si l'ennemi est blessé et visible
                 if (enemy.health < enemy.max_health and 
-                    -50 <= enemy.x - camera_x <= self.screen_width + 50 and
-                    -50 <= enemy.y - camera_y <= self.screen_height + 50):
+                    (culled or (-50 <= enemy.x - camera_x <= self.screen_width + 50 and
+                                -50 <= enemy.y - camera_y <= self.screen_height + 50))):
                     
-                    self.enemy_health_bar.draw_above_enemy(surface, enemy, camera_x, camera_y)
+                    self.enemy_health_bar.draw_above_enemy(surface, enemy, camera_x, camera_y, alpha)
     
-    def draw_debug_info(self, surface, player, enemies, wave_info=None):
-        """Dessine les informations de debug (optionnel)"""
+    def draw_debug_info(self, surface, player, enemies, wave_info=None, profiler=None, origin=None, ai_lod=None):
+        """Dessine les informations de debug (optionnel) et l'overlay de profilage"""
         debug_font = pygame.font.Font(None, 24)
-        y_offset = 20
+        x, y_offset = origin if origin else (self.screen_width - 300, 20)
         
         # Info joueur
         if player:
@@ -253,18 +266,81 @@ class HUDManager:
                 player_info += f" HP: {player.health}/{getattr(player, 'max_health', '?')}"
             
             debug_surface = debug_font.render(player_info, True, (255, 255, 255))
-            surface.blit(debug_surface, (self.screen_width - 300, y_offset))
+            surface.blit(debug_surface, (x, y_offset))
             y_offset += 25
         
         # Info ennemis
         enemy_count = len(enemies) if enemies else 0
         enemy_info = f"Ennemis: {enemy_count}"
         debug_surface = debug_font.render(enemy_info, True, (255, 255, 255))
-        surface.blit(debug_surface, (self.screen_width - 300, y_offset))
+        surface.blit(debug_surface, (x, y_offset))
         y_offset += 25
         
         # Info vague
         if wave_info:
             wave_text = f"Vague: {wave_info}"
             debug_surface = debug_font.render(wave_text, True, (255, 255, 255))
-            surface.blit(debug_surface, (self.screen_width - 300, y_offset))
\ No newline at end of file
+            surface.blit(debug_surface, (x, y_offset))
+            y_offset += 25
+        
+        # Niveau de détail de l'IA : mises à jour sautées hors écran
+        if ai_lod:
+            frame = ai_lod["frame"]
+            lod_text = (f"IA: {frame['updated']} maj, {frame['skipped']} sautées "
+                        f"({ai_lod['saved_ratio'] * 100:.0f}% économisées)")
+            debug_surface = debug_font.render(lod_text, True, (255, 255, 255))
+            surface.blit(debug_surface, (x, y_offset))
+            y_offset += 25
+        
+        # Profilage par section
+        if profiler is not None:
+            self.draw_profiler_overlay(surface, profiler, x, y_offset + 5)
+    
+    def draw_profiler_overlay(self, surface, profiler, x, y):
+        """Tableau des sections les plus coûteuses : moyenne, p95 et histogramme glissant"""
+        if self.debug_small_font is None:
+            self.debug_small_font = pygame.font.Font(None, 18)
+        font = self.debug_small_font
+        
+        # Les statistiques trient tout l'historique : ne pas les recalculer à chaque image
+        self.profiler_stats_age += 1
+        if self.profiler_stats_age >= PROFILER_OVERLAY_REFRESH:
+            self.profiler_stats = profiler.get_frame_statistics()
+            self.profiler_counters = profiler.get_counter_statistics()
+            self.profiler_stats_age = 0
+        rows = list(self.profiler_stats.items())[:PROFILER_OVERLAY_ROWS]
+        counters = list(self.profiler_counters.items())
+        
+        row_height = 16
+        width = 300
+        height = 22 + row_height * (max(1, len(rows)) + len(counters))
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        surface.blit(panel, (x, y))
+        
+        title = font.render(f"Profilage ({len(profiler.frames)} images)   moy.   p95", True, (255, 215, 0))
+        surface.blit(title, (x + 6, y + 4))
+        
+        row_y = y + 20
+        for name, stats in rows:
+            color = (255, 120, 120) if stats["p95_ms"] > 4.0 else (220, 220, 220)
+            surface.blit(font.render(name[:22], True, color), (x + 6, row_y))
+            surface.blit(font.render(f"{stats['mean_ms']:5.2f}", True, color), (x + 150, row_y))
+            surface.blit(font.render(f"{stats['p95_ms']:5.2f}", True, color), (x + 190, row_y))
+            
+            # Histogramme : une barre par classe de durée
+            histogram = stats["histogram"]
+            peak = max(histogram) or 1
+            for i, count in enumerate(histogram):
+                bar_height = int(12 * count / peak)
+                if bar_height:
+                    pygame.draw.rect(surface, color, (x + 232 + i * 7, row_y + 12 - bar_height, 5, bar_height))
+            row_y += row_height
+        
+        # Compteurs par image (allocations de Surface...)
+        for name, stats in counters:
+            color = (150, 200, 255)
+            surface.blit(font.render(name[:22], True, color), (x + 6, row_y))
+            surface.blit(font.render(f"{stats['per_frame']:5.1f}", True, color), (x + 150, row_y))
+            surface.blit(font.render(f"max {stats['max']}", True, color), (x + 190, row_y))
+            row_y += row_height
\ No newline at end of file
@@ -4,6 +4,19 @@ Menu principal du jeu
 import pygame
 import math
 from ..components.progress_bars import ButtonComponent
+from ...systems.particle_system import ParticleSystem
+
+# Particules d'arrière-plan : montent (pixels/seconde) en s'estompant de 30 alpha/seconde
+MENU_PARTICLES = {
+    "max_particles": 50,
+    "velocity": ((0, 0), (-60, -20)),
+    "size": (1, 3),
+    "alpha": (50, 150),
+    "fade": 30,
+    "color": (100, 150, 255),
+    "edge": "kill",
+    "edge_margin": 10,
+}
 
 class MainMenuScene:
     """Scène du menu principal"""
@@ -34,7 +47,8 @@ class MainMenuScene:
         
         # Effets visuels
         self.title_glow = 0
-        self.particles = []
+        self.particles = ParticleSystem(world_space=False)
+        self.particles.add_emitter("motes", MENU_PARTICLES, bounds=(0, 0, screen_width, screen_height))
         
     def handle_event(self, event):
         """Gère les événements du menu"""
@@ -72,24 +86,11 @@ class MainMenuScene:
     
     def update_particles(self, dt):
         """Met à jour les particules d'arrière-plan"""
-        # Ajouter de nouvelles particules
-        if len(self.particles) < 50:
-            import random
-            self.particles.append({
-                'x': random.randint(0, self.screen_width),
-                'y': self.screen_height + 10,
-                'speed': random.uniform(20, 60),
-                'size': random.randint(1, 3),
-                'alpha': random.randint(50, 150)
-            })
-        
-        # Mettre à jour les particules existantes
-        for particle in self.particles[:]:
-            particle['y'] -= particle['speed'] * dt
-            particle['alpha'] -= dt * 30
-            
-            if particle['y'] < -10 or particle['alpha'] <= 0:
-                self.particles.remove(particle)
+        # Ajouter une nouvelle particule sous l'écran (plafond de l'émetteur : 50)
+        self.particles.emit("motes", 1, 0, self.screen_height + 10, self.screen_width, 0)
+        
+        # Mettre à jour les particules existantes (sorties par le haut ou éteintes : retirées)
+        self.particles.update(dt)
     
     def draw(self, surface):
         """Dessine le menu principal"""
@@ -126,16 +127,7 @@ class MainMenuScene:
     
     def draw_particles(self, surface):
         """Dessine les particules d'arrière-plan"""
-        for particle in self.particles:
-            if particle['alpha'] > 0:
-                # Créer une surface avec alpha
-                particle_surface = pygame.Surface((particle['size'] * 2, particle['size'] * 2))
-                particle_surface.set_alpha(particle['alpha'])
-                particle_surface.fill((100, 150, 255))
-                
-                surface.blit(particle_surface, 
-                           (particle['x'] - particle['size'], 
-                            particle['y'] - particle['size']))
+        self.particles.draw(surface)
     
     def draw_title(self, surface):
         """Dessine le titre principal"""
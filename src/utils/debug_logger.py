@@ -1,13 +1,18 @@
 #!/usr/bin/env python3
 """
 Logger de debug pour tracer le système de level-up
+Les messages passent par le canal "debug.levelup" de game_log : l'écriture
+dans le fichier se fait dans le thread de journalisation, fichier ouvert une fois.
 """
 import datetime
+from .game_log import get_logger, add_file_sink
 
 class DebugLogger:
     def __init__(self, filename="levelup_debug.log"):
         self.filename = filename
+        self._log = get_logger("debug.levelup")
         self.clear_log()
+        add_file_sink("debug.levelup", filename, console=True)
     
     def clear_log(self):
         """Efface le fichier de log"""
@@ -17,22 +22,7 @@ class DebugLogger:
     
     def log(self, message):
         """Ajoute un message au log ET l'affiche en console"""
-        timestamp = datetime.datetime.now().strftime('%H:%M:%S.%f')[:-3]
-        log_line = f"[{timestamp}] {message}"
-        
-        # Écrire dans le fichier avec encodage UTF-8
-        try:
-            with open(self.filename, 'a', encoding='utf-8') as f:
-                f.write(log_line + "\n")
-        except UnicodeEncodeError:
-            # Fallback sans emojis si problème d'encodage
-            clean_message = message.encode('ascii', 'ignore').decode('ascii')
-            clean_log_line = f"[{timestamp}] {clean_message}"
-            with open(self.filename, 'a', encoding='utf-8') as f:
-                f.write(clean_log_line + "\n")
-        
-        # Afficher en console aussi
-        print(log_line)
+        self._log.info("%s", message)
     
     def section(self, title):
         """Crée une section dans le log"""
@@ -0,0 +1,337 @@
+"""
+Journalisation du jeu - Canaux nommés, niveaux et écriture en arrière-plan
+Chaque module obtient son canal avec get_logger("systems.collision") et
+appelle log.debug/info/warning/error avec un format paresseux ("%s", valeur).
+Un niveau désactivé remplace la méthode par une fonction vide : l'appel ne
+formate rien et ne met rien en file. Le formatage et l'écriture (console,
+fichiers) se font dans un thread dédié alimenté par une file bornée.
+"""
+import os
+import sys
+import time
+import queue
+import atexit
+import threading
+
+# Niveaux
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+OFF = 100
+
+LEVEL_NAMES = {"debug": DEBUG, "info": INFO, "warning": WARNING, "error": ERROR, "off": OFF}
+
+# Niveau par défaut des canaux sans configuration propre
+DEFAULT_LEVEL = INFO
+
+# Taille de la file du thread d'écriture (messages au-delà : comptés comme perdus)
+LOG_QUEUE_SIZE = 4096
+
+# Configuration par variable d'environnement, ex: RL40K_LOG="collision=debug,weapons=off"
+LOG_ENV_VAR = "RL40K_LOG"
+
+def _noop(*args, **kwargs):
+    """Méthode d'un niveau désactivé"""
+    return None
+
+# === ÉCRITURE EN ARRIÈRE-PLAN ===
+
+class LogWriter:
+    """Thread d'écriture : formate les messages et les envoie vers la console et les fichiers"""
+
+    def __init__(self, maxsize=LOG_QUEUE_SIZE):
+        self.queue = queue.Queue(maxsize)
+        self.thread = None
+        self.lock = threading.Lock()
+        self.async_mode = True
+        self.dropped = 0
+        self.written = 0
+
+        # préfixe de canal -> [nom de fichier, fichier ouvert ou None, console aussi]
+        self.file_sinks = {}
+        self.console = True
+
+    def start(self):
+        """Démarre le thread d'écriture à la première utilisation"""
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self._run, name="game-log-writer", daemon=True)
+                self.thread.start()
+
+    def submit(self, record):
+        """Met un enregistrement en file (jamais bloquant)"""
+        if not self.async_mode:
+            self._write(record)
+            return
+        if self.thread is None:
+            self.start()
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self):
+        while True:
+            record = self.queue.get()
+            try:
+                if record is None:
+                    return
+                self._write(record)
+            finally:
+                self.queue.task_done()
+
+    def _write(self, record):
+        name, level, timestamp, message, args = record
+        if args:
+            try:
+                message = message % args
+            except (TypeError, ValueError):
+                message = f"{message} {args}"
+
+        sink = self._find_sink(name)
+        if sink is not None:
+            # Canaux avec fichier : horodatés en console comme dans le fichier
+            stamp = time.strftime('%H:%M:%S', time.localtime(timestamp)) + f".{int(timestamp * 1000) % 1000:03d}"
+            message = f"[{stamp}] {message}"
+        if sink is None or sink[2]:
+            if self.console:
+                try:
+                    print(message)
+                except UnicodeEncodeError:
+                    print(message.encode('ascii', 'ignore').decode('ascii'))
+        if sink is not None:
+            if sink[1] is None:
+                sink[1] = open(sink[0], 'a', encoding='utf-8', errors='replace')
+            sink[1].write(message + "\n")
+            sink[1].flush()
+        self.written += 1
+
+    def _find_sink(self, name):
+        sinks = self.file_sinks
+        if not sinks:
+            return None
+        while True:
+            sink = sinks.get(name)
+            if sink is not None:
+                return sink
+            if "." not in name:
+                return None
+            name = name.rsplit(".", 1)[0]
+
+    def add_file_sink(self, prefix, filename, console=True):
+        """Écrit les canaux commençant par prefix dans un fichier (ouvert une seule fois)"""
+        self.flush()
+        self.file_sinks[prefix] = [filename, None, console]
+
+    def flush(self, timeout=2.0):
+        """Attend que la file soit vide (utile pour les tests et à la fermeture)"""
+        if self.thread is None or not self.thread.is_alive():
+            return
+        deadline = time.time() + timeout
+        while self.queue.unfinished_tasks and time.time() < deadline:
+            time.sleep(0.001)
+        for sink in self.file_sinks.values():
+            if sink[1] is not None:
+                sink[1].flush()
+
+    def shutdown(self):
+        """Vide la file, arrête le thread et ferme les fichiers"""
+        if self.thread is not None and self.thread.is_alive():
+            self.flush()
+            try:
+                self.queue.put(None, timeout=0.5)
+            except queue.Full:
+                pass
+            self.thread.join(timeout=1.0)
+        for sink in self.file_sinks.values():
+            if sink[1] is not None:
+                sink[1].close()
+                sink[1] = None
+
+_writer = LogWriter()
+atexit.register(_writer.shutdown)
+
+# === CANAUX ===
+
+class LogChannel:
+    """Canal nommé ; les méthodes des niveaux désactivés sont des fonctions vides
+
+    debug_enabled protège les appels debug dont les arguments coûtent à
+    calculer : une méthode vide ne formate rien, mais ses arguments sont
+    quand même évalués par l'appelant.
+    """
+
+    def __init__(self, name, level):
+        self.name = name
+        self.level = OFF
+        self.debug_enabled = False
+        self.set_level(level)
+
+    def set_level(self, level):
+        """Change le niveau et (re)lie les méthodes actives ou vides"""
+        self.level = level
+        self.debug_enabled = DEBUG >= level
+        for method_name, method_level in (("debug", DEBUG), ("info", INFO),
+                                          ("warning", WARNING), ("error", ERROR)):
+            if method_level >= level:
+                setattr(self, method_name, self._make_emitter(method_level))
+            else:
+                setattr(self, method_name, _noop)
+
+    def _make_emitter(self, level):
+        name = self.name
+        submit = _writer.submit
+        now = time.time
+
+        def emit(message, *args):
+            submit((name, level, now(), message, args))
+        return emit
+
+    def enabled_for(self, level):
+        """True si un message de ce niveau serait émis (pour protéger un calcul coûteux)"""
+        return level >= self.level
+
+    def __repr__(self):
+        return f"LogChannel({self.name!r}, level={self.level})"
+
+_channels = {}
+_configured_levels = {}
+
+def _resolve_level(name):
+    """Niveau configuré pour le canal ou son plus proche parent"""
+    while True:
+        level = _configured_levels.get(name)
+        if level is not None:
+            return level
+        if "." not in name:
+            return DEFAULT_LEVEL
+        name = name.rsplit(".", 1)[0]
+
+def get_logger(name):
+    """Retourne (en le créant si besoin) le canal portant ce nom"""
+    channel = _channels.get(name)
+    if channel is None:
+        channel = LogChannel(name, _resolve_level(name))
+        _channels[name] = channel
+    return channel
+
+def set_level(name, level):
+    """Configure le niveau d'un canal et de tous ses sous-canaux"""
+    if isinstance(level, str):
+        level = LEVEL_NAMES[level.lower()]
+    _configured_levels[name] = level
+    for channel_name, channel in _channels.items():
+        if channel_name == name or channel_name.startswith(name + "."):
+            channel.set_level(_resolve_level(channel_name))
+    for channel in _rate_limited.values():
+        channel.refresh()
+
+def configure_from_env(value=None):
+    """Applique une configuration "canal=niveau,..." (variable RL40K_LOG par défaut)"""
+    value = os.environ.get(LOG_ENV_VAR, "") if value is None else value
+    for entry in value.split(","):
+        if "=" in entry:
+            name, level = entry.split("=", 1)
+            if level.strip().lower() in LEVEL_NAMES:
+                set_level(name.strip(), level.strip())
+
+def add_file_sink(prefix, filename, console=True):
+    """Redirige (et duplique en console si demandé) un canal vers un fichier"""
+    _writer.add_file_sink(prefix, filename, console)
+
+def set_async(enabled):
+    """Active ou non l'écriture en arrière-plan (synchrone : utile pour les tests)"""
+    _writer.flush()
+    _writer.async_mode = enabled
+
+def set_console(enabled):
+    """Active ou non la sortie console (les fichiers restent alimentés)"""
+    _writer.flush()
+    _writer.console = enabled
+
+def flush():
+    """Attend l'écriture des messages en file"""
+    _writer.flush()
+
+def get_log_statistics():
+    """Retourne les compteurs du thread d'écriture et des canaux limités"""
+    return {
+        "written": _writer.written,
+        "dropped": _writer.dropped,
+        "queued": _writer.queue.qsize(),
+        "channels": {name: channel.level for name, channel in _channels.items()},
+        "rate_limited": {name: {"emitted": channel.emitted, "suppressed": channel.suppressed}
+                         for name, channel in _rate_limited.items()},
+    }
+
+# === CANAUX LIMITÉS EN FRÉQUENCE ===
+
+# Compteur de frames de jeu, avancé une fois par tick par la scène active
+_frame = 0
+
+def advance_frame():
+    """Avance le compteur global de frames (appelé une fois par tick)"""
+    global _frame
+    _frame += 1
+    return _frame
+
+def current_frame():
+    """Retourne le numéro de la frame courante"""
+    return _frame
+
+class RateLimitedChannel:
+    """Canal de diagnostic émettant au plus un message toutes les N frames"""
+
+    def __init__(self, name, interval_frames=6, enabled=True, level=DEBUG):
+        self.name = name
+        self.interval_frames = interval_frames
+        self.level = level
+        self.logger = get_logger(name)
+        self._requested = enabled
+        self.enabled = enabled and self.logger.enabled_for(level)
+        self.last_frame = None
+        self.emitted = 0
+        self.suppressed = 0
+
+    def refresh(self):
+        """Recalcule l'activation après un changement de niveau"""
+        self.enabled = self._requested and self.logger.enabled_for(self.level)
+
+    def ready(self):
+        """True si un message peut être émis à cette frame (à tester avant de formater)"""
+        if not self.enabled:
+            return False
+        frame = _frame
+        last_frame = self.last_frame
+        if last_frame is not None and frame - last_frame < self.interval_frames:
+            self.suppressed += 1
+            return False
+        self.last_frame = frame
+        self.emitted += 1
+        return True
+
+    def emit(self, message, *args):
+        """Émet un message déjà autorisé par ready()"""
+        _writer.submit((self.name, self.level, time.time(), message, args))
+
+    def reset(self):
+        """Oublie la dernière émission"""
+        self.last_frame = None
+
+# Registre des canaux limités partagés entre modules
+_rate_limited = {}
+
+def get_channel(name, interval_frames=6):
+    """Retourne (en le créant si besoin) le canal limité portant ce nom"""
+    channel = _rate_limited.get(name)
+    if channel is None:
+        channel = RateLimitedChannel(name, interval_frames)
+        _rate_limited[name] = channel
+    return channel
+
+def get_channel_statistics():
+    """Retourne les compteurs émis/supprimés de chaque canal limité"""
+    return get_log_statistics()["rate_limited"]
+
+configure_from_env()
@@ -0,0 +1,87 @@
+"""
+Pools d'objets - Réutilise les entités au lieu de les réallouer
+acquire() ressort un objet libéré (hit) et le remet à neuf par son crochet
+de réinitialisation, ou en crée un nouveau (miss). release() le rend au pool
+quand le jeu n'en a plus besoin. Les compteurs montrent ce qui passe encore
+par l'allocateur et le ramasse-miettes.
+"""
+
+# Objets libres gardés au plus par pool (au-delà, laissés au ramasse-miettes)
+OBJECT_POOL_MAX_FREE = 512
+
+class ObjectPool:
+    """Objets créés par factory(*args) et remis à neuf par reset(objet, *args)
+
+    Sans fonction reset, l'objet est réinitialisé par sa méthode reset(*args),
+    à défaut par son __init__. Un objet qui a une méthode on_release() est
+    prévenu à sa libération (lâcher ses références). Les objets sortis du
+    pool portent l'attribut object_pool (voir release_to_pool).
+    """
+
+    def __init__(self, factory, reset=None, name=None, max_free=OBJECT_POOL_MAX_FREE):
+        self.factory = factory
+        self.reset = reset
+        self.name = name or getattr(factory, '__name__', 'pool')
+        self.max_free = max_free
+        self.free = []
+        self._free_ids = set()  # Garde contre les doubles libérations
+        self.stats = {"hits": 0, "misses": 0, "released": 0, "dropped": 0}
+
+    def acquire(self, *args, **kwargs):
+        """Retourne un objet prêt à l'emploi (réutilisé si possible)"""
+        if self.free:
+            obj = self.free.pop()
+            self._free_ids.discard(id(obj))
+            if self.reset is not None:
+                self.reset(obj, *args, **kwargs)
+            elif hasattr(obj, 'reset'):
+                obj.reset(*args, **kwargs)
+            else:
+                obj.__init__(*args, **kwargs)
+            self.stats["hits"] += 1
+            return obj
+
+        obj = self.factory(*args, **kwargs)
+        try:
+            obj.object_pool = self
+        except AttributeError:
+            pass  # dict, tuple... : libération explicite par le propriétaire
+        self.stats["misses"] += 1
+        return obj
+
+    def release(self, obj):
+        """Rend un objet au pool ; False s'il y était déjà ou si le pool est plein"""
+        if id(obj) in self._free_ids:
+            return False
+        if len(self.free) >= self.max_free:
+            self.stats["dropped"] += 1
+            return False
+        if hasattr(obj, 'on_release'):
+            obj.on_release()
+        self.free.append(obj)
+        self._free_ids.add(id(obj))
+        self.stats["released"] += 1
+        return True
+
+    def clear(self):
+        """Oublie les objets libres"""
+        self.free.clear()
+        self._free_ids.clear()
+
+    def __len__(self):
+        return len(self.free)
+
+    def get_statistics(self):
+        """Compteurs du pool et taux de réutilisation"""
+        stats = dict(self.stats)
+        acquired = stats["hits"] + stats["misses"]
+        stats["free"] = len(self.free)
+        stats["hit_ratio"] = stats["hits"] / acquired if acquired else 0.0
+        return stats
+
+def release_to_pool(obj):
+    """Rend un objet à son pool d'origine ; False s'il ne vient pas d'un pool"""
+    pool = getattr(obj, 'object_pool', None)
+    if pool is None:
+        return False
+    return pool.release(obj)
@@ -0,0 +1,224 @@
+"""
+Profileur par section - Mesure le temps passé dans chaque système du jeu
+Les sections s'écrivent "with profiler.section("update.collisions"):" ou
+avec le décorateur @profiled("hud.draw_hud"). Désactivé (par défaut),
+section() retourne un contexte vide partagé : aucun appel d'horloge,
+aucune allocation.
+Chaque image (end_frame) range les temps de ses sections dans un
+historique glissant : histogrammes, percentiles et export CSV/JSON.
+Les compteurs (profiler.count("surfaces.allocated")) suivent des quantités
+par image, comme les allocations de Surface.
+"""
+import csv
+import json
+import time
+import functools
+from collections import deque
+
+# Nombre d'images gardées dans l'historique glissant
+PROFILER_HISTORY = 300
+
+# Bornes (ms) des classes d'histogramme ; la dernière classe compte le reste
+HISTOGRAM_BOUNDS_MS = (0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0)
+
+class _NullSection:
+    """Contexte vide utilisé quand le profileur est désactivé"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+_NULL_SECTION = _NullSection()
+
+class _Section:
+    """Contexte chronométrant une section (pile de départs : imbrication et récursion)"""
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.starts = []
+
+    def __enter__(self):
+        self.starts.append(time.perf_counter())
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler.record(self.name, time.perf_counter() - self.starts.pop())
+        return False
+
+class Profiler:
+    """Cumule le temps de chaque section, au total et image par image"""
+
+    def __init__(self, enabled=False, history=PROFILER_HISTORY):
+        self.enabled = enabled
+        self.totals = {}  # nom -> secondes cumulées
+        self.calls = {}  # nom -> nombre de passages
+        self._sections = {}  # nom -> contexte réutilisé
+
+        # Historique : (numéro d'image, {nom: ms}) des dernières images
+        self.frames = deque(maxlen=history)
+        self.current_frame = {}
+        self.frame_number = 0
+
+        # Compteurs : total et valeurs des dernières images (y compris à zéro)
+        self.counter_totals = {}
+        self.counter_frames = deque(maxlen=history)
+        self.current_counters = {}
+
+    def section(self, name):
+        """Contexte chronométrant le bloc (vide si désactivé)"""
+        if not self.enabled:
+            return _NULL_SECTION
+        section = self._sections.get(name)
+        if section is None:
+            section = _Section(self, name)
+            self._sections[name] = section
+        return section
+
+    def record(self, name, elapsed):
+        """Ajoute une mesure (secondes) à une section"""
+        self.totals[name] = self.totals.get(name, 0.0) + elapsed
+        self.calls[name] = self.calls.get(name, 0) + 1
+        current = self.current_frame
+        current[name] = current.get(name, 0.0) + elapsed * 1000.0
+
+    def count(self, name, amount=1):
+        """Incrémente un compteur de l'image en cours (rien si désactivé)"""
+        if not self.enabled:
+            return
+        self.counter_totals[name] = self.counter_totals.get(name, 0) + amount
+        current = self.current_counters
+        current[name] = current.get(name, 0) + amount
+
+    def end_frame(self):
+        """Clôt l'image en cours et la range dans l'historique"""
+        if not self.enabled:
+            return
+        if self.current_frame:
+            self.frames.append((self.frame_number, self.current_frame))
+            self.current_frame = {}
+        self.counter_frames.append(self.current_counters)
+        self.current_counters = {}
+        self.frame_number += 1
+
+    def enable(self, enabled=True):
+        """Active ou désactive les mesures"""
+        self.enabled = enabled
+        self.current_frame = {}
+        self.current_counters = {}
+
+    def toggle(self):
+        """Inverse l'activation ; retourne le nouvel état"""
+        self.enable(not self.enabled)
+        return self.enabled
+
+    def reset(self):
+        """Oublie toutes les mesures"""
+        self.totals.clear()
+        self.calls.clear()
+        self.frames.clear()
+        self.current_frame = {}
+        self.counter_totals.clear()
+        self.counter_frames.clear()
+        self.current_counters = {}
+
+    def get_statistics(self):
+        """Retourne, par section, le temps total, le nombre d'appels et la moyenne (ms)"""
+        return {
+            name: {
+                "total_ms": total * 1000.0,
+                "calls": self.calls[name],
+                "mean_ms": total * 1000.0 / self.calls[name]
+            }
+            for name, total in sorted(self.totals.items(), key=lambda item: -item[1])
+        }
+
+    # === HISTORIQUE GLISSANT ===
+
+    def get_samples(self, name):
+        """Temps (ms) de la section pour chaque image récente où elle a tourné"""
+        return [sections[name] for _, sections in self.frames if name in sections]
+
+    def get_histogram(self, name, bounds=HISTOGRAM_BOUNDS_MS):
+        """Nombre d'images récentes par classe de durée (len(bounds) + 1 classes)"""
+        counts = [0] * (len(bounds) + 1)
+        for value in self.get_samples(name):
+            index = 0
+            while index < len(bounds) and value > bounds[index]:
+                index += 1
+            counts[index] += 1
+        return counts
+
+    def get_frame_statistics(self):
+        """Par section sur l'historique : moyenne, p50, p95, max (ms/image) et histogramme"""
+        names = set()
+        for _, sections in self.frames:
+            names.update(sections)
+        stats = {}
+        for name in names:
+            samples = sorted(self.get_samples(name))
+            count = len(samples)
+            stats[name] = {
+                "frames": count,
+                "mean_ms": sum(samples) / count,
+                "p50_ms": samples[count // 2],
+                "p95_ms": samples[min(count - 1, int(count * 0.95))],
+                "max_ms": samples[-1],
+                "histogram": self.get_histogram(name)
+            }
+        return dict(sorted(stats.items(), key=lambda item: -item[1]["mean_ms"]))
+
+    def get_counter_statistics(self):
+        """Par compteur sur l'historique : moyenne et maximum par image, total cumulé"""
+        frames = len(self.counter_frames)
+        stats = {}
+        for name in sorted(self.counter_totals):
+            values = [counters.get(name, 0) for counters in self.counter_frames]
+            stats[name] = {
+                "per_frame": sum(values) / frames if frames else 0.0,
+                "max": max(values, default=0),
+                "total": self.counter_totals[name]
+            }
+        return stats
+
+    # === EXPORT ===
+
+    def export_json(self, filename):
+        """Écrit les statistiques et le détail des dernières images en JSON"""
+        data = {
+            "histogram_bounds_ms": list(HISTOGRAM_BOUNDS_MS),
+            "sections": self.get_frame_statistics(),
+            "counters": self.get_counter_statistics(),
+            "frames": [{"frame": number, "sections": sections} for number, sections in self.frames]
+        }
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        return filename
+
+    def export_csv(self, filename):
+        """Écrit une ligne par image récente, une colonne (ms) par section"""
+        names = sorted({name for _, sections in self.frames for name in sections})
+        with open(filename, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame"] + names)
+            for number, sections in self.frames:
+                writer.writerow([number] + [f"{sections[name]:.4f}" if name in sections else ""
+                                            for name in names])
+        return filename
+
+# Profileur global partagé par le moteur, la scène et les outils de mesure
+profiler = Profiler()
+
+def profiled(name):
+    """Décorateur : chronomètre chaque appel de la fonction dans la section name"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not profiler.enabled:
+                return func(*args, **kwargs)
+            with profiler.section(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
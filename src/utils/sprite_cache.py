@@ -0,0 +1,96 @@
+"""
+Cache de sprites translucides - Carrés et disques pré-rendus pour les effets
+Particules, auras et zones d'alerte dessinaient un carré ou un disque
+translucide en créant une Surface par élément et par image. Le cache garde
+ces Surfaces, indexées par (forme, taille, couleur, palier d'alpha), et
+évince les moins récemment utilisées au-delà de sa capacité. Chaque Surface
+réellement créée est comptée par le profileur ("surfaces.allocated").
+"""
+from collections import OrderedDict
+
+import pygame
+
+from .profiler import profiler
+
+# Sprites gardés au plus dans le cache partagé
+SPRITE_CACHE_MAX_ENTRIES = 256
+
+# Largeur d'un palier d'alpha : 255 / 8 -> 33 niveaux au plus par sprite
+SPRITE_ALPHA_STEP = 8
+
+SHAPE_RECT = "rect"  # taille (largeur, hauteur), rectangle plein
+SHAPE_CIRCLE = "circle"  # taille rayon, disque dans un carré de 2 * rayon, coins transparents
+
+# Clé de transparence des coins des disques (couleur jamais demandée en pratique)
+_COLORKEY = (255, 0, 254)
+
+class SpriteCache:
+    """Surfaces translucides partagées, évincées par ordre d'utilisation (LRU)"""
+
+    def __init__(self, max_entries=SPRITE_CACHE_MAX_ENTRIES, alpha_step=SPRITE_ALPHA_STEP):
+        self.max_entries = max_entries
+        self.alpha_step = alpha_step
+        self.sprites = OrderedDict()  # (forme, taille, couleur, palier) -> Surface
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def get_alpha_bucket(self, alpha):
+        """Alpha arrondi au palier le plus proche, borné à [0, 255]"""
+        step = self.alpha_step
+        return max(0, min(255, (int(alpha) + step // 2) // step * step))
+
+    def get(self, shape, size, color, alpha=255):
+        """Sprite translucide prêt à blitter (créé au premier usage)"""
+        key = (shape, size, tuple(color), self.get_alpha_bucket(alpha))
+        sprite = self.sprites.get(key)
+        if sprite is not None:
+            self.sprites.move_to_end(key)
+            self.stats["hits"] += 1
+            return sprite
+
+        sprite = self._render(*key)
+        self.sprites[key] = sprite
+        self.stats["misses"] += 1
+        profiler.count("surfaces.allocated")
+        if len(self.sprites) > self.max_entries:
+            self.sprites.popitem(last=False)
+            self.stats["evictions"] += 1
+        return sprite
+
+    def rect(self, width, height, color, alpha=255):
+        """Rectangle plein translucide"""
+        return self.get(SHAPE_RECT, (max(1, int(width)), max(1, int(height))), color, alpha)
+
+    def circle(self, radius, color, alpha=255):
+        """Disque translucide de rayon radius (Surface de 2 * radius de côté)"""
+        return self.get(SHAPE_CIRCLE, max(1, int(radius)), color, alpha)
+
+    def _render(self, shape, size, color, alpha):
+        """Crée la Surface d'un sprite"""
+        if shape == SHAPE_CIRCLE:
+            sprite = pygame.Surface((size * 2, size * 2))
+            sprite.fill(_COLORKEY)
+            sprite.set_colorkey(_COLORKEY)
+            pygame.draw.circle(sprite, color, (size, size), size)
+        else:
+            sprite = pygame.Surface(size)
+            sprite.fill(color)
+        sprite.set_alpha(alpha)
+        return sprite
+
+    def clear(self):
+        """Oublie tous les sprites"""
+        self.sprites.clear()
+
+    def __len__(self):
+        return len(self.sprites)
+
+    def get_statistics(self):
+        """Compteurs du cache et taux de réutilisation"""
+        stats = dict(self.stats)
+        requests = stats["hits"] + stats["misses"]
+        stats["entries"] = len(self.sprites)
+        stats["hit_ratio"] = stats["hits"] / requests if requests else 0.0
+        return stats
+
+# Cache partagé par les effets, les auras et les zones d'alerte
+sprite_cache = SpriteCache()
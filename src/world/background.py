@@ -4,76 +4,155 @@ Système de fond animé pour donner l'impression de mouvement
 import pygame
 import random
 import math
+import numpy as np
+from ..utils.profiler import profiler, profiled
+from ..systems.particle_system import ParticleSystem
+
+# Nombre d'étoiles par couche (lointaines, moyennes, proches)
+STAR_COUNTS = (200, 100, 50)
+
+# Marge hors écran avant qu'une étoile ne réapparaisse de l'autre côté
+STAR_WRAP_MARGIN = 50
+
+def get_disc_offsets(radius):
+    """Décalages (dx, dy) des pixels d'un disque tel que le trace pygame.draw.circle"""
+    size = radius * 2 + 1
+    stamp = pygame.Surface((size, size))
+    stamp.fill((0, 0, 0))
+    pygame.draw.circle(stamp, (255, 255, 255), (radius, radius), radius)
+    return [(x - radius, y - radius) for x in range(size) for y in range(size)
+            if stamp.get_at((x, y))[0]]
+
+def map_colors(surface, colors):
+    """Couleurs RGB (N, 3) converties en valeurs de pixels du format de surface"""
+    shifts, losses = surface.get_shifts(), surface.get_losses()
+    mapped = np.full(len(colors), surface.get_masks()[3], dtype=np.uint32)
+    for channel in range(3):
+        mapped |= (colors[:, channel].astype(np.uint32) >> losses[channel]) << shifts[channel]
+    return mapped
 
 class StarField:
-    """Champ d'étoiles animé avec parallaxe"""
+    """Champ d'étoiles animé avec parallaxe
     
-    def __init__(self, screen_width, screen_height):
+    Chaque couche stocke ses étoiles dans des tableaux NumPy (x, y, couleur) :
+    le défilement et la réapparition sont vectorisés, et le dessin écrit tous
+    les pixels d'une couche d'un coup via surfarray.
+    """
+    
+    def __init__(self, screen_width, screen_height, star_counts=STAR_COUNTS, rng=None):
         self.screen_width = screen_width
         self.screen_height = screen_height
+        # Graine tirée du module random : reproductible avec random.seed()
+        self.rng = rng or np.random.default_rng(random.getrandbits(32))
         
         # Créer plusieurs couches d'étoiles pour l'effet de parallaxe
         self.star_layers = [
-            {"stars": [], "speed": 0.1, "color": (100, 100, 100), "size": 1},  # Étoiles lointaines
-            {"stars": [], "speed": 0.3, "color": (150, 150, 150), "size": 1},  # Étoiles moyennes
-            {"stars": [], "speed": 0.6, "color": (200, 200, 200), "size": 2},  # Étoiles proches
+            {"speed": 0.1, "color": (100, 100, 100), "size": 1},  # Étoiles lointaines
+            {"speed": 0.3, "color": (150, 150, 150), "size": 1},  # Étoiles moyennes
+            {"speed": 0.6, "color": (200, 200, 200), "size": 2},  # Étoiles proches
         ]
         
+        # Pixels des étoiles de chaque taille et couleurs converties par format de surface
+        self._stamps = {}
+        self._mapped_colors = {}
+        
         # Générer les étoiles
-        self.generate_stars()
+        self.generate_stars(star_counts)
     
-    def generate_stars(self):
+    def generate_stars(self, star_counts=STAR_COUNTS):
         """Génère les étoiles pour chaque couche"""
-        star_counts = [200, 100, 50]  # Nombre d'étoiles par couche
-        
-        for layer_idx, layer in enumerate(self.star_layers):
-            for _ in range(star_counts[layer_idx]):
-                star = {
-                    "x": random.randint(0, self.screen_width * 2),  # Zone plus large pour le défilement
-                    "y": random.randint(0, self.screen_height * 2),
-                    "brightness": random.uniform(0.3, 1.0)  # Variation de luminosité
-                }
-                layer["stars"].append(star)
+        for layer, count in zip(self.star_layers, star_counts):
+            # Zone plus large pour le défilement
+            layer["x"] = self.rng.integers(0, self.screen_width * 2, count, endpoint=True).astype(np.float64)
+            layer["y"] = self.rng.integers(0, self.screen_height * 2, count, endpoint=True).astype(np.float64)
+            brightness = self.rng.uniform(0.3, 1.0, count)  # Variation de luminosité
+            layer["colors"] = (np.outer(brightness, layer["color"])).astype(np.uint8)
+        self._mapped_colors.clear()
+    
+    def get_star_count(self):
+        """Nombre total d'étoiles"""
+        return sum(len(layer["x"]) for layer in self.star_layers)
     
     def update(self, camera_x, camera_y):
         """Met à jour la position des étoiles selon la caméra"""
+        width, height = self.screen_width, self.screen_height
         for layer in self.star_layers:
-            for star in layer["stars"]:
-                # Déplacement parallaxe basé sur la vitesse de la couche
-                star["x"] -= camera_x * layer["speed"] * 0.01
-                star["y"] -= camera_y * layer["speed"] * 0.01
-                
-                # Réapparition des étoiles qui sortent de l'écran
-                if star["x"] < -50:
-                    star["x"] = self.screen_width + 50
-                    star["y"] = random.randint(0, self.screen_height)
-                elif star["x"] > self.screen_width + 50:
-                    star["x"] = -50
-                    star["y"] = random.randint(0, self.screen_height)
-                
-                if star["y"] < -50:
-                    star["y"] = self.screen_height + 50
-                    star["x"] = random.randint(0, self.screen_width)
-                elif star["y"] > self.screen_height + 50:
-                    star["y"] = -50
-                    star["x"] = random.randint(0, self.screen_width)
+            x, y = layer["x"], layer["y"]
+            # Déplacement parallaxe basé sur la vitesse de la couche
+            x -= camera_x * layer["speed"] * 0.01
+            y -= camera_y * layer["speed"] * 0.01
+            
+            # Réapparition des étoiles qui sortent de l'écran
+            left = x < -STAR_WRAP_MARGIN
+            right = x > width + STAR_WRAP_MARGIN
+            self._respawn(x, y, left, width + STAR_WRAP_MARGIN, height)
+            self._respawn(x, y, right, -STAR_WRAP_MARGIN, height)
+            
+            top = y < -STAR_WRAP_MARGIN
+            bottom = y > height + STAR_WRAP_MARGIN
+            self._respawn(y, x, top, height + STAR_WRAP_MARGIN, width)
+            self._respawn(y, x, bottom, -STAR_WRAP_MARGIN, width)
+    
+    def _respawn(self, axis, other, mask, edge, other_extent):
+        """Replace les étoiles masquées sur le bord opposé, au hasard le long de l'autre axe"""
+        count = np.count_nonzero(mask)
+        if count:
+            axis[mask] = edge
+            other[mask] = self.rng.integers(0, other_extent, count, endpoint=True)
+    
+    def _get_stamp(self, size):
+        """Décalages (dx, dy) des pixels d'une étoile de cette taille, en tableaux (1, n)"""
+        stamp = self._stamps.get(size)
+        if stamp is None:
+            offsets = np.array([(0, 0)] if size == 1 else get_disc_offsets(size), dtype=np.int32)
+            stamp = self._stamps[size] = (offsets[None, :, 0], offsets[None, :, 1])
+        return stamp
+    
+    def _get_mapped_colors(self, surface, layer_index):
+        """Couleurs de la couche au format de la surface (calculées une fois par format)"""
+        key = (layer_index, surface.get_bitsize(), surface.get_masks())
+        mapped = self._mapped_colors.get(key)
+        if mapped is None:
+            mapped = self._mapped_colors[key] = map_colors(surface, self.star_layers[layer_index]["colors"])
+        return mapped
     
     def draw(self, surface):
         """Dessine le champ d'étoiles"""
+        if surface.get_bytesize() not in (2, 4):
+            self._draw_per_star(surface)
+            return
+        
+        width, height = surface.get_size()
+        pixels = pygame.surfarray.pixels2d(surface)
+        try:
+            for layer_index, layer in enumerate(self.star_layers):
+                # Troncature vers zéro, comme int() ; une ligne par étoile, une colonne par pixel
+                dx, dy = self._get_stamp(layer["size"])
+                px = (layer["x"].astype(np.int32)[:, None] + dx).ravel()
+                py = (layer["y"].astype(np.int32)[:, None] + dy).ravel()
+                colors = np.repeat(self._get_mapped_colors(surface, layer_index), dx.shape[1])
+                visible = (px >= 0) & (px < width) & (py >= 0) & (py < height)
+                # Écriture groupée dans l'ordre des étoiles : la dernière recouvre, comme avant
+                pixels[px[visible], py[visible]] = colors[visible]
+        finally:
+            del pixels  # Déverrouille la surface
+    
+    def _draw_per_star(self, surface):
+        """Dessin étoile par étoile pour les formats sans accès surfarray 2D (8 et 24 bits)"""
         for layer in self.star_layers:
-            for star in layer["stars"]:
-                # Calculer la couleur avec la luminosité
-                color = tuple(int(c * star["brightness"]) for c in layer["color"])
-                
-                # Dessiner l'étoile
+            for x, y, color in zip(layer["x"].astype(int), layer["y"].astype(int), layer["colors"].tolist()):
                 if layer["size"] == 1:
-                    surface.set_at((int(star["x"]), int(star["y"])), color)
+                    surface.set_at((x, y), color)
                 else:
-                    pygame.draw.circle(surface, color, 
-                                     (int(star["x"]), int(star["y"])), layer["size"])
+                    pygame.draw.circle(surface, color, (x, y), layer["size"])
 
 class GridBackground:
-    """Grille de fond pour accentuer le mouvement"""
+    """Grille de fond pour accentuer le mouvement
+    
+    La grille est rendue une seule fois (à la création et au changement de
+    résolution) sur une couche plus grande que l'écran d'une cellule ; chaque
+    frame se contente de la blitter décalée de l'offset caméra modulo grid_size.
+    """
     
     def __init__(self, screen_width, screen_height):
         self.screen_width = screen_width
@@ -81,29 +160,48 @@ class GridBackground:
         self.grid_size = 100  # Taille des cellules de la grille
         self.color = (30, 30, 40)  # Couleur subtile
         self.alpha = 80  # Transparence
+        self.layer = None
+        self.render_layer()
+    
+    def render_layer(self):
+        """Pré-rend la couche de grille (écran + une cellule de débord)"""
+        width = self.screen_width + self.grid_size
+        height = self.screen_height + self.grid_size
+        self.layer = pygame.Surface((width, height))
+        self.layer.set_alpha(self.alpha)
+        self.layer.fill((0, 0, 0))  # Fond transparent
+        
+        # Lignes verticales et horizontales sur toute la couche
+        for x in range(0, width, self.grid_size):
+            pygame.draw.line(self.layer, self.color, (x, 0), (x, height), 1)
+        for y in range(0, height, self.grid_size):
+            pygame.draw.line(self.layer, self.color, (0, y), (width, y), 1)
+    
+    def resize(self, screen_width, screen_height):
+        """Adapte la couche à une nouvelle résolution"""
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.render_layer()
     
     def draw(self, surface, camera_x, camera_y):
         """Dessine la grille avec défilement"""
-        # Créer une surface transparente pour la grille
-        grid_surface = pygame.Surface((self.screen_width, self.screen_height))
-        grid_surface.set_alpha(self.alpha)
-        grid_surface.fill((0, 0, 0))  # Fond transparent
-        
         # Calculer l'offset de la grille basé sur la caméra
         offset_x = int(camera_x) % self.grid_size
         offset_y = int(camera_y) % self.grid_size
         
-        # Dessiner les lignes verticales
-        for x in range(-offset_x, self.screen_width + self.grid_size, self.grid_size):
-            pygame.draw.line(grid_surface, self.color, 
-                           (x, 0), (x, self.screen_height), 1)
-        
-        # Dessiner les lignes horizontales
-        for y in range(-offset_y, self.screen_height + self.grid_size, self.grid_size):
-            pygame.draw.line(grid_surface, self.color, 
-                           (0, y), (self.screen_width, y), 1)
-        
-        surface.blit(grid_surface, (0, 0))
+        surface.blit(self.layer, (-offset_x, -offset_y))
+
+# Particules d'ambiance : immortelles, elles dérivent et réapparaissent de l'autre côté
+FLOATING_PARTICLES = {
+    "max_particles": 30,
+    "velocity": ((-0.5, 0.5), (-0.5, 0.5)),  # Pixels par frame à 60 FPS
+    "size": (1, 3),
+    "alpha": (50, 150),
+    "fade": 0,
+    "palette": [(100, 100, 150), (80, 120, 100), (120, 100, 100)],
+    "edge": "wrap",
+    "edge_margin": 10,
+}
 
 class FloatingParticles:
     """Particules flottantes pour plus d'ambiance"""
@@ -111,52 +209,26 @@ class FloatingParticles:
     def __init__(self, screen_width, screen_height):
         self.screen_width = screen_width
         self.screen_height = screen_height
-        self.particles = []
+        self.particles = ParticleSystem(world_space=False)
+        self.emitter = self.particles.add_emitter("ambient", FLOATING_PARTICLES,
+                                                  bounds=(0, 0, screen_width, screen_height))
         
         # Générer des particules initiales
-        for _ in range(30):
-            self.create_particle()
-    
-    def create_particle(self):
-        """Crée une nouvelle particule"""
-        particle = {
-            "x": random.randint(0, self.screen_width),
-            "y": random.randint(0, self.screen_height),
-            "size": random.randint(1, 3),
-            "speed_x": random.uniform(-0.5, 0.5),
-            "speed_y": random.uniform(-0.5, 0.5),
-            "alpha": random.randint(50, 150),
-            "color": random.choice([(100, 100, 150), (80, 120, 100), (120, 100, 100)])
-        }
-        return particle
+        self.emitter.emit(FLOATING_PARTICLES["max_particles"], 0, 0, screen_width, screen_height)
+    
+    def resize(self, screen_width, screen_height):
+        """Adapte la zone de réapparition à une nouvelle résolution"""
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.emitter.set_bounds((0, 0, screen_width, screen_height))
     
     def update(self, dt):
         """Met à jour les particules"""
-        for particle in self.particles:
-            particle["x"] += particle["speed_x"] * dt * 60
-            particle["y"] += particle["speed_y"] * dt * 60
-            
-            # Réapparition des particules qui sortent
-            if particle["x"] < -10:
-                particle["x"] = self.screen_width + 10
-            elif particle["x"] > self.screen_width + 10:
-                particle["x"] = -10
-            
-            if particle["y"] < -10:
-                particle["y"] = self.screen_height + 10
-            elif particle["y"] > self.screen_height + 10:
-                particle["y"] = -10
+        self.particles.update(dt * 60)
     
     def draw(self, surface):
         """Dessine les particules"""
-        for particle in self.particles:
-            # Créer une surface transparente pour la particule
-            particle_surface = pygame.Surface((particle["size"] * 2, particle["size"] * 2))
-            particle_surface.set_alpha(particle["alpha"])
-            particle_surface.fill(particle["color"])
-            
-            surface.blit(particle_surface, 
-                        (int(particle["x"]), int(particle["y"])))
+        self.particles.draw(surface)
 
 class GameBackground:
     """Gestionnaire principal du fond de jeu"""
@@ -173,21 +245,35 @@ class GameBackground:
         # Couleur de fond de base
         self.base_color = (10, 10, 15)  # Bleu très sombre
     
+    def resize(self, screen_width, screen_height):
+        """Adapte le fond à une nouvelle résolution"""
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.star_field.screen_width = screen_width
+        self.star_field.screen_height = screen_height
+        self.grid.resize(screen_width, screen_height)
+        self.particles.resize(screen_width, screen_height)
+    
+    @profiled("background.update")
     def update(self, dt, camera_x, camera_y):
         """Met à jour tous les éléments de fond"""
         self.star_field.update(camera_x, camera_y)
         self.particles.update(dt)
     
+    @profiled("background.draw")
     def draw(self, surface, camera_x, camera_y):
         """Dessine le fond complet"""
         # Fond de base
         surface.fill(self.base_color)
         
         # Champ d'étoiles (arrière-plan)
-        self.star_field.draw(surface)
+        with profiler.section("background.stars"):
+            self.star_field.draw(surface)
         
         # Grille (pour accentuer le mouvement)
-        self.grid.draw(surface, camera_x, camera_y)
+        with profiler.section("background.grid"):
+            self.grid.draw(surface, camera_x, camera_y)
         
         # Particules flottantes (avant-plan)
-        self.particles.draw(surface)
\ No newline at end of file
+        with profiler.section("background.particles"):
+            self.particles.draw(surface)
\ No newline at end of file
@@ -0,0 +1,246 @@
+"""
+Champ de flux vers le joueur - Une carte de Dijkstra partagée par tous les ennemis
+La grille de navigation (cases de FLOW_FIELD_CELL_SIZE px) est dérivée une
+seule fois des murs du niveau. Le champ n'est recalculé que lorsque la cible
+change de case ; chaque ennemi lit ensuite sa direction en O(1) au lieu de
+sonder lui-même plusieurs déplacements contre les murs.
+"""
+import math
+import numpy as np
+import pygame
+from ..core.constants import WORLD_WIDTH, WORLD_HEIGHT
+
+# Cases un peu plus petites que les ennemis : contourne les coins sans trop de cases
+FLOW_FIELD_CELL_SIZE = 32
+
+# Coûts entiers des déplacements droits et diagonaux (rapport 1.5, proche de √2) :
+# assez petits pour une file à seaux circulaire au lieu d'un tas
+STRAIGHT_COST = 2
+DIAGONAL_COST = 3
+
+UNREACHABLE = -1
+
+class FlowField:
+    """Carte de distances vers une cible sur une grille de navigation fixe"""
+
+    # Coûts exposés aux autres parcours de la même grille (PathPlanner)
+    straight_cost = STRAIGHT_COST
+    diagonal_cost = DIAGONAL_COST
+
+    def __init__(self, walls, world_width=WORLD_WIDTH, world_height=WORLD_HEIGHT,
+                 cell_size=FLOW_FIELD_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cols = max(1, int(math.ceil(world_width / cell_size)))
+        self.rows = max(1, int(math.ceil(world_height / cell_size)))
+
+        self.blocked = self._build_blocked(walls)
+        self.straight_neighbors, self.diagonal_neighbors = self._build_neighbors()
+        self.wall_exits = self._build_wall_exits()
+
+        # Résultat du dernier calcul : distance et case suivante vers la cible
+        size = self.cols * self.rows
+        self.distance = [UNREACHABLE] * size
+        self.next_cell = [UNREACHABLE] * size
+        self._next_array = None  # Copie NumPy de next_cell pour directions_at
+
+        self.target_cell = None
+        self.target_x = 0.0
+        self.target_y = 0.0
+        self.rebuilds = 0
+
+    def _build_blocked(self, walls):
+        """Marque les cases qui touchent un mur"""
+        size = self.cell_size
+        blocked = [False] * (self.cols * self.rows)
+        for wall in walls:
+            rect = pygame.Rect(wall.rect if hasattr(wall, 'rect') else wall)
+            col0, col1 = max(0, rect.left // size), min(self.cols - 1, (rect.right - 1) // size)
+            row0, row1 = max(0, rect.top // size), min(self.rows - 1, (rect.bottom - 1) // size)
+            for row in range(row0, row1 + 1):
+                for col in range(col0, col1 + 1):
+                    blocked[row * self.cols + col] = True
+        return blocked
+
+    def _build_neighbors(self):
+        """Voisins libres de chaque case, droits et diagonaux (sans couper les coins des murs)"""
+        cols, rows, blocked = self.cols, self.rows, self.blocked
+        straight, diagonal = [], []
+        for row in range(rows):
+            for col in range(cols):
+                links = []
+                for d_col, d_row in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+                    n_col, n_row = col + d_col, row + d_row
+                    if 0 <= n_col < cols and 0 <= n_row < rows and not blocked[n_row * cols + n_col]:
+                        links.append(n_row * cols + n_col)
+                straight.append(tuple(links))
+
+                links = []
+                for d_col, d_row in ((1, 1), (1, -1), (-1, 1), (-1, -1)):
+                    n_col, n_row = col + d_col, row + d_row
+                    if not (0 <= n_col < cols and 0 <= n_row < rows):
+                        continue
+                    if (blocked[n_row * cols + n_col] or blocked[row * cols + n_col] or
+                            blocked[n_row * cols + col]):
+                        continue
+                    links.append(n_row * cols + n_col)
+                diagonal.append(tuple(links))
+        return straight, diagonal
+
+    def _build_wall_exits(self):
+        """Pour chaque case bloquée, ses voisines libres (toutes directions)"""
+        cols, rows, blocked = self.cols, self.rows, self.blocked
+        exits = {}
+        for cell, is_blocked in enumerate(blocked):
+            if not is_blocked:
+                continue
+            col, row = cell % cols, cell // cols
+            exits[cell] = tuple(
+                (row + d_row) * cols + col + d_col
+                for d_col, d_row in ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1))
+                if 0 <= col + d_col < cols and 0 <= row + d_row < rows
+                and not blocked[(row + d_row) * cols + col + d_col]
+            )
+        return exits
+
+    def cell_at(self, x, y):
+        """Index de la case contenant le point (bornée à la grille)"""
+        size = self.cell_size
+        col = min(self.cols - 1, max(0, int(x // size)))
+        row = min(self.rows - 1, max(0, int(y // size)))
+        return row * self.cols + col
+
+    # === CALCUL ===
+
+    def set_target(self, x, y):
+        """Déplace la cible ; recalcule le champ seulement si elle change de case"""
+        self.target_x, self.target_y = x, y
+        cell = self.cell_at(x, y)
+        if cell == self.target_cell:
+            return False
+        self.target_cell = cell
+        self._rebuild(cell)
+        return True
+
+    def has_target(self):
+        """True si un champ a été calculé"""
+        return self.target_cell is not None
+
+    def _rebuild(self, target_cell):
+        """Dijkstra depuis la case cible sur toute la grille (file à seaux circulaire)"""
+        size = self.cols * self.rows
+        distance = [UNREACHABLE] * size
+        next_cell = [UNREACHABLE] * size
+        straight_neighbors, diagonal_neighbors = self.straight_neighbors, self.diagonal_neighbors
+
+        distance[target_cell] = 0
+        next_cell[target_cell] = target_cell
+        # Coûts ≤ DIAGONAL_COST : DIAGONAL_COST + 1 seaux suffisent
+        ring_size = DIAGONAL_COST + 1
+        ring = [[] for _ in range(ring_size)]
+        ring[0].append(target_cell)
+        pending = 1
+        cost = 0
+        while pending:
+            bucket = ring[cost % ring_size]
+            ring[cost % ring_size] = []
+            pending -= len(bucket)
+            straight_cost, diagonal_cost = cost + STRAIGHT_COST, cost + DIAGONAL_COST
+            straight_bucket = ring[straight_cost % ring_size]
+            diagonal_bucket = ring[diagonal_cost % ring_size]
+            for cell in bucket:
+                if distance[cell] != cost:
+                    continue  # Entrée périmée
+                # Boucles déroulées : c'est le cœur du recalcul
+                for neighbor in straight_neighbors[cell]:
+                    old_cost = distance[neighbor]
+                    if old_cost == UNREACHABLE or straight_cost < old_cost:
+                        distance[neighbor] = straight_cost
+                        next_cell[neighbor] = cell
+                        straight_bucket.append(neighbor)
+                        pending += 1
+                for neighbor in diagonal_neighbors[cell]:
+                    old_cost = distance[neighbor]
+                    if old_cost == UNREACHABLE or diagonal_cost < old_cost:
+                        distance[neighbor] = diagonal_cost
+                        next_cell[neighbor] = cell
+                        diagonal_bucket.append(neighbor)
+                        pending += 1
+            cost += 1
+
+        # Une case qui touche un mur peut contenir le centre d'un ennemi collé
+        # à ce mur : elle se vide vers sa meilleure voisine libre
+        for cell, exits in self.wall_exits.items():
+            if cell == target_cell:
+                continue
+            best, best_cost = UNREACHABLE, None
+            for neighbor in exits:
+                neighbor_cost = distance[neighbor]
+                if neighbor_cost != UNREACHABLE and (best_cost is None or neighbor_cost < best_cost):
+                    best, best_cost = neighbor, neighbor_cost
+            next_cell[cell] = best
+
+        self.distance = distance
+        self.next_cell = next_cell
+        self._next_array = None
+        self.rebuilds += 1
+
+    # === LECTURE ===
+
+    def direction_at(self, x, y, goal_x=None, goal_y=None):
+        """Direction unitaire à suivre depuis (x, y), ou None sans chemin connu
+
+        Loin de la cible, le point vise le centre de la case suivante ; une
+        fois à une case de la cible, il vise directement (goal_x, goal_y),
+        la cible du champ par défaut.
+        """
+        if self.target_cell is None:
+            return None
+        cell = self.cell_at(x, y)
+        following = self.next_cell[cell]
+        if following == UNREACHABLE:
+            return None
+
+        if following == self.target_cell:
+            aim_x = self.target_x if goal_x is None else goal_x
+            aim_y = self.target_y if goal_y is None else goal_y
+        else:
+            size = self.cell_size
+            aim_x = (following % self.cols + 0.5) * size
+            aim_y = (following // self.cols + 0.5) * size
+
+        dx, dy = aim_x - x, aim_y - y
+        length = math.sqrt(dx * dx + dy * dy)
+        if length == 0:
+            return 0.0, 0.0
+        return dx / length, dy / length
+
+    def directions_at(self, xs, ys, goal_xs, goal_ys):
+        """Version vectorisée de direction_at : retourne (dx, dy, trouvé) en tableaux"""
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        count = len(xs)
+        if self.target_cell is None:
+            return np.zeros(count), np.zeros(count), np.zeros(count, dtype=bool)
+        if self._next_array is None:
+            self._next_array = np.asarray(self.next_cell, dtype=np.int64)
+
+        size = self.cell_size
+        cols = np.clip((xs // size).astype(np.int64), 0, self.cols - 1)
+        rows = np.clip((ys // size).astype(np.int64), 0, self.rows - 1)
+        following = self._next_array[rows * self.cols + cols]
+        found = following != UNREACHABLE
+
+        at_target = following == self.target_cell
+        aim_x = np.where(at_target, goal_xs, (following % self.cols + 0.5) * size)
+        aim_y = np.where(at_target, goal_ys, (following // self.cols + 0.5) * size)
+        dx, dy = aim_x - xs, aim_y - ys
+        length = np.sqrt(dx * dx + dy * dy)
+        moving = found & (length > 0)
+        safe_length = np.where(moving, length, 1.0)
+        return np.where(moving, dx / safe_length, 0.0), np.where(moving, dy / safe_length, 0.0), found
+
+    def get_distance(self, x, y):
+        """Coût du chemin (unités de STRAIGHT_COST par case) jusqu'à la cible, -1 si inaccessible"""
+        if self.target_cell is None:
+            return UNREACHABLE
+        return self.distance[self.cell_at(x, y)]
@@ -4,6 +4,8 @@ Contient LevelManager avec toute la logique de génération de niveaux
 """
 import pygame
 from .world_generator import SimpleWorldGenerator, WallWrapper
+from .wall_index import WallIndex
+from ..gameplay.pathfinding import path_planner
 from ..core.constants import WORLD_WIDTH, WORLD_HEIGHT
 
 class LevelManager:
@@ -12,6 +14,7 @@ class LevelManager:
     def __init__(self):
         self.world_generator = SimpleWorldGenerator()
         self.current_walls = []
+        self.wall_index = WallIndex([])
         self.current_spawn_positions = []
         self.current_environment = "neutral"
         
@@ -40,8 +43,17 @@ class LevelManager:
             wall_obj = WallWrapper(wall_rect)
             self.current_walls.append(wall_obj)
         
+        # Les murs ne bougent plus jusqu'au prochain niveau : indexer une seule fois
+        self.wall_index = WallIndex(self.current_walls)
+        # Les chemins en cache traversent les murs de l'ancien niveau
+        path_planner.invalidate()
+        
         return self.current_walls
     
+    def get_wall_index(self):
+        """Retourne l'index statique des murs du niveau courant"""
+        return self.wall_index
+    
     def get_environment_info(self):
         """Retourne les informations sur l'environnement actuel"""
         env_descriptions = {
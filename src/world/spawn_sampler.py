@@ -0,0 +1,165 @@
+"""
+Positions libres précalculées - Tirage des positions de spawn et de téléportation
+Pour chaque classe de taille d'entité, les positions (coin haut-gauche, pas
+de SPAWN_SAMPLE_STEP px) où un carré de cette taille ne touche aucun mur sont
+calculées une seule fois par niveau, en une passe vectorisée. Un tirage ne
+teste ensuite plus les murs : il choisit parmi les positions des cases
+proches, filtrées par distance au joueur.
+"""
+import math
+import random
+import numpy as np
+from ..core.constants import WORLD_WIDTH, WORLD_HEIGHT
+
+# Pas de la grille des positions candidates
+SPAWN_SAMPLE_STEP = 16
+
+# Tailles d'entités regroupées : une entité utilise la plus petite classe qui la contient
+SPAWN_SIZE_CLASSES = (16, 24, 32, 48, 64, 96)
+
+# Cases de regroupement des positions (requêtes autour d'un point)
+SPAWN_BUCKET_SIZE = 128
+
+# Tirages au hasard avant de filtrer toutes les positions d'un coup
+SPAWN_RANDOM_TRIES = 8
+
+class SpawnSampler:
+    """Positions libres d'un niveau par classe de taille, tirables avec filtre de distance"""
+
+    def __init__(self, wall_index, world_width=WORLD_WIDTH, world_height=WORLD_HEIGHT,
+                 step=SPAWN_SAMPLE_STEP, bucket_size=SPAWN_BUCKET_SIZE):
+        self.wall_index = wall_index
+        self.world_width = world_width
+        self.world_height = world_height
+        self.step = step
+        self.bucket_size = bucket_size
+        self.classes = {}  # taille -> positions libres (voir _build_class)
+        self.stats = {"samples": 0, "misses": 0, "classes_built": 0}
+
+    @staticmethod
+    def size_class(width, height):
+        """Classe de taille couvrant une entité width × height"""
+        size = max(width, height)
+        for size_class in SPAWN_SIZE_CLASSES:
+            if size <= size_class:
+                return size_class
+        return int(math.ceil(size / SPAWN_SIZE_CLASSES[-1])) * SPAWN_SIZE_CLASSES[-1]
+
+    def get_positions(self, width, height):
+        """Positions libres (xs, ys) pour une entité width × height, calculées au premier appel"""
+        size = self.size_class(width, height)
+        positions = self.classes.get(size)
+        if positions is None:
+            positions = self._build_class(size)
+            self.classes[size] = positions
+        return positions["xs"], positions["ys"]
+
+    def _build_class(self, size):
+        """Teste toute la grille de positions contre les murs, une seule fois"""
+        xs = np.arange(0, max(1, self.world_width - size + 1), self.step, dtype=np.float64)
+        ys = np.arange(0, max(1, self.world_height - size + 1), self.step, dtype=np.float64)
+        grid_x, grid_y = np.meshgrid(xs, ys)
+        grid_x, grid_y = grid_x.ravel(), grid_y.ravel()
+        if hasattr(self.wall_index, 'overlaps'):
+            blocked = self.wall_index.overlaps(grid_x, grid_y, np.full(len(grid_x), size), np.full(len(grid_x), size))
+            grid_x, grid_y = grid_x[~blocked], grid_y[~blocked]
+
+        # Tri par case de regroupement : chaque case devient une tranche contiguë
+        buckets_x = (grid_x // self.bucket_size).astype(np.int64)
+        buckets_y = (grid_y // self.bucket_size).astype(np.int64)
+        keys = buckets_y * (self.world_width // self.bucket_size + 1) + buckets_x
+        order = np.argsort(keys, kind='stable')
+        grid_x, grid_y, keys = grid_x[order], grid_y[order], keys[order]
+        unique_keys, starts, counts = np.unique(keys, return_index=True, return_counts=True)
+        buckets = {int(key): (int(start), int(start + count))
+                   for key, start, count in zip(unique_keys, starts, counts)}
+
+        self.stats["classes_built"] += 1
+        return {"xs": grid_x, "ys": grid_y, "buckets": buckets, "size": size}
+
+    def _candidates(self, positions, near, max_distance):
+        """Indices des positions dans les cases qui touchent le disque (near, max_distance)"""
+        bucket_size = self.bucket_size
+        stride = self.world_width // bucket_size + 1
+        col0 = max(0, int((near[0] - max_distance) // bucket_size))
+        col1 = min(stride - 1, int((near[0] + max_distance) // bucket_size))
+        row0 = max(0, int((near[1] - max_distance) // bucket_size))
+        row1 = int((near[1] + max_distance) // bucket_size)
+        slices = []
+        for row in range(row0, row1 + 1):
+            for col in range(col0, col1 + 1):
+                bounds = positions["buckets"].get(row * stride + col)
+                if bounds:
+                    slices.append(np.arange(bounds[0], bounds[1]))
+        return np.concatenate(slices) if slices else np.zeros(0, dtype=np.int64)
+
+    def sample(self, width, height, near=None, min_distance=0, max_distance=None,
+               margin=0, edge_band=None, rng=random):
+        """Tire une position libre (x, y) entière pour une entité width × height, ou None
+
+        near : point (x, y) à tenir entre min_distance et max_distance
+        (coins haut-gauche, comme les entités) ; margin : distance minimale
+        aux bords du monde ; edge_band : ne garder que la bande de cette
+        largeur le long des bords, au-delà de margin.
+        """
+        self.stats["samples"] += 1
+        size = self.size_class(width, height)
+        self.get_positions(width, height)
+        positions = self.classes[size]
+        xs, ys = positions["xs"], positions["ys"]
+
+        if near is not None and max_distance is not None:
+            indices = self._candidates(positions, near, max_distance)
+            if not len(indices):
+                self.stats["misses"] += 1
+                return None
+            xs, ys = xs[indices], ys[indices]
+        if not len(xs):
+            self.stats["misses"] += 1
+            return None
+
+        right = self.world_width - margin - size
+        bottom = self.world_height - margin - size
+
+        def accepted(x, y):
+            if x < margin or y < margin or x > right or y > bottom:
+                return False
+            if edge_band is not None and min(x - margin, y - margin, right - x, bottom - y) >= edge_band:
+                return False
+            if near is not None:
+                distance_sq = (x - near[0]) ** 2 + (y - near[1]) ** 2
+                if distance_sq < min_distance * min_distance:
+                    return False
+                if max_distance is not None and distance_sq > max_distance * max_distance:
+                    return False
+            return True
+
+        # La plupart des tirages passent du premier coup
+        for _ in range(SPAWN_RANDOM_TRIES):
+            index = rng.randrange(len(xs))
+            x, y = int(xs[index]), int(ys[index])
+            if accepted(x, y):
+                return x, y
+
+        # Contraintes serrées : filtrer toutes les positions candidates d'un coup
+        mask = (xs >= margin) & (ys >= margin) & (xs <= right) & (ys <= bottom)
+        if edge_band is not None:
+            mask &= np.minimum(np.minimum(xs - margin, ys - margin),
+                               np.minimum(right - xs, bottom - ys)) < edge_band
+        if near is not None:
+            distance_sq = (xs - near[0]) ** 2 + (ys - near[1]) ** 2
+            mask &= distance_sq >= min_distance * min_distance
+            if max_distance is not None:
+                mask &= distance_sq <= max_distance * max_distance
+        remaining = np.flatnonzero(mask)
+        if not len(remaining):
+            self.stats["misses"] += 1
+            return None
+        index = remaining[rng.randrange(len(remaining))]
+        return int(xs[index]), int(ys[index])
+
+    def get_statistics(self):
+        """Retourne les compteurs de tirage et le nombre de positions par classe"""
+        stats = dict(self.stats)
+        stats["positions"] = {size: len(positions["xs"]) for size, positions in self.classes.items()}
+        return stats
@@ -34,8 +34,8 @@ class SpawnSystem:
         # Récupérer les positions de spawn
         spawn_positions = level_manager.current_spawn_positions.copy()
         
-        # Les murs sont déjà wrappés par le LevelManager
-        walls = level_manager.current_walls
+        # Index statique des murs construit par le LevelManager
+        walls = level_manager.get_wall_index()
         
         # === BOSS WAVES ===
         if wave_number == 5:
@@ -0,0 +1,169 @@
+"""
+Index statique des murs - Construit une seule fois par niveau
+Remplace les parcours linéaires de la liste des murs par une grille de cases
+Porte aussi le champ de flux vers le joueur et les positions libres de
+spawn, construits à la demande
+"""
+import itertools
+import numpy as np
+import pygame
+from .flow_field import FlowField
+from .spawn_sampler import SpawnSampler
+
+# Les murs sont grands et peu nombreux : des cases larges suffisent
+WALL_INDEX_CELL_SIZE = 128
+
+# Chaque index reçoit un identifiant de niveau unique (clé du cache de chemins)
+_level_ids = itertools.count(1)
+
+class WallIndex:
+    """Index immuable des murs d'un niveau (grille de cases)"""
+
+    def __init__(self, walls, cell_size=WALL_INDEX_CELL_SIZE):
+        self.cell_size = cell_size
+        self.walls = tuple(walls)
+        # Copie des rectangles : l'index ne doit pas suivre d'éventuelles mutations
+        self.rects = tuple(pygame.Rect(wall.rect if hasattr(wall, 'rect') else wall)
+                           for wall in self.walls)
+
+        cells = {}
+        for index, rect in enumerate(self.rects):
+            col0, col1, row0, row1 = self._cell_range(rect.x, rect.y, rect.width, rect.height)
+            for row in range(row0, row1 + 1):
+                for col in range(col0, col1 + 1):
+                    cells.setdefault((col, row), []).append(index)
+
+        # Cases figées en tuples (index triés = ordre de la liste d'origine)
+        self.cells = {key: tuple(indices) for key, indices in cells.items()}
+
+        self.level_id = next(_level_ids)
+        self.flow_field = None  # Champ de flux du niveau (voir get_flow_field)
+        self.spawn_sampler = None  # Positions libres par taille (voir get_spawn_sampler)
+        self._bounds = None  # Bornes des murs en tableaux (voir overlaps)
+
+    def _cell_range(self, x, y, width, height):
+        """Retourne les bornes de cases couvertes par un rectangle"""
+        size = self.cell_size
+        return (int(x // size), int((x + width) // size),
+                int(y // size), int((y + height) // size))
+
+    def _candidate_indices(self, x, y, width, height):
+        """Index des murs partageant une case avec le rectangle"""
+        col0, col1, row0, row1 = self._cell_range(x, y, width, height)
+        cells = self.cells
+        if col0 == col1 and row0 == row1:
+            return cells.get((col0, row0), ())
+
+        found = set()
+        for row in range(row0, row1 + 1):
+            for col in range(col0, col1 + 1):
+                bucket = cells.get((col, row))
+                if bucket:
+                    found.update(bucket)
+        return sorted(found)
+
+    # === REQUÊTES ===
+
+    def first_hit(self, rect):
+        """Retourne le premier mur (ordre de la liste) touché par le rectangle, ou None"""
+        rects = self.rects
+        for index in self._candidate_indices(rect.x, rect.y, rect.width, rect.height):
+            if rects[index].colliderect(rect):
+                return self.walls[index]
+        return None
+
+    def query_rect(self, rect):
+        """Retourne tous les murs touchés par le rectangle"""
+        rects = self.rects
+        return [self.walls[index]
+                for index in self._candidate_indices(rect.x, rect.y, rect.width, rect.height)
+                if rects[index].colliderect(rect)]
+
+    def query_point(self, x, y):
+        """Retourne les murs contenant le point"""
+        rects = self.rects
+        bucket = self.cells.get((int(x // self.cell_size), int(y // self.cell_size)), ())
+        return [self.walls[index] for index in bucket if rects[index].collidepoint(x, y)]
+
+    def segment_hits(self, x1, y1, x2, y2):
+        """Retourne les murs traversés par le segment, du plus proche au plus lointain"""
+        left, right = min(x1, x2), max(x1, x2)
+        top, bottom = min(y1, y2), max(y1, y2)
+
+        hits = []
+        rects = self.rects
+        for index in self._candidate_indices(left, top, right - left, bottom - top):
+            clipped = rects[index].clipline(x1, y1, x2, y2)
+            if clipped:
+                entry_x, entry_y = clipped[0]
+                distance_sq = (entry_x - x1) ** 2 + (entry_y - y1) ** 2
+                hits.append((distance_sq, index))
+
+        hits.sort()
+        return [self.walls[index] for _, index in hits]
+
+    def candidate_rects(self, lefts, tops, rights, bottoms):
+        """Rectangles des murs partageant une case avec l'un des rectangles donnés (tableaux)
+
+        Version groupée de _candidate_indices pour des rectangles plus petits
+        qu'une case : les cases de leurs quatre coins suffisent.
+        """
+        size = self.cell_size
+        keys = set()
+        for xs, ys in ((lefts, tops), (rights, tops), (lefts, bottoms), (rights, bottoms)):
+            corners = np.stack((np.floor_divide(xs, size), np.floor_divide(ys, size)), axis=1)
+            keys.update(map(tuple, np.unique(corners.astype(np.int64), axis=0).tolist()))
+        cells = self.cells
+        found = set()
+        for key in keys:
+            bucket = cells.get(key)
+            if bucket:
+                found.update(bucket)
+        return [self.rects[index] for index in sorted(found)]
+
+    def is_free(self, x, y, width, height):
+        """Vérifie qu'aucun mur ne touche le rectangle donné"""
+        return self.first_hit(pygame.Rect(x, y, width, height)) is None
+
+    def overlaps(self, xs, ys, widths, heights):
+        """Version vectorisée de is_free inversée : True pour chaque rectangle qui touche un mur"""
+        xs = np.asarray(xs, dtype=np.float64)
+        hits = np.zeros(len(xs), dtype=bool)
+        if not self.rects or not len(xs):
+            return hits
+        if self._bounds is None:
+            self._bounds = np.array([(r.left, r.top, r.right, r.bottom) for r in self.rects],
+                                    dtype=np.float64).T
+        wall_left, wall_top, wall_right, wall_bottom = self._bounds
+
+        # Mêmes arrondis que pygame.Rect (troncature) et même test que colliderect
+        left = np.trunc(xs)[:, None]
+        top = np.trunc(np.asarray(ys, dtype=np.float64))[:, None]
+        right = left + np.trunc(np.asarray(widths, dtype=np.float64))[:, None]
+        bottom = top + np.trunc(np.asarray(heights, dtype=np.float64))[:, None]
+        touching = (left < wall_right) & (wall_left < right) & (top < wall_bottom) & (wall_top < bottom)
+        np.any(touching, axis=1, out=hits)
+        return hits
+
+    def get_flow_field(self):
+        """Champ de flux partagé par tous les ennemis, construit au premier appel"""
+        if self.flow_field is None:
+            self.flow_field = FlowField(self.rects)
+        return self.flow_field
+
+    def get_spawn_sampler(self):
+        """Positions libres de spawn et de téléportation, construites au premier appel"""
+        if self.spawn_sampler is None:
+            self.spawn_sampler = SpawnSampler(self)
+        return self.spawn_sampler
+
+    # === COMPATIBILITÉ LISTE ===
+
+    def __iter__(self):
+        return iter(self.walls)
+
+    def __len__(self):
+        return len(self.walls)
+
+    def __bool__(self):
+        return bool(self.walls)
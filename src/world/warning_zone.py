@@ -1,6 +1,7 @@
 # Nouveau fichier: warning_system.py
 import pygame
 import math
+from ..utils.sprite_cache import sprite_cache
 
 class WarningZone:
     def __init__(self, x, y, radius, duration, warning_time):
@@ -21,18 +22,16 @@ class WarningZone:
             return "remove"  # Signal pour supprimer la zone
         return False
     
-    def draw(self, screen, camera):
+    def draw(self, screen, camera, visibility=None):
+        # Zone hors de la passe de visibilité de la frame : rien à dessiner
+        if visibility is not None and not visibility.contains_circle(self.x, self.y, self.radius):
+            return
         screen_x, screen_y = camera.apply_pos(self.x, self.y)
         
         if not self.active:
             # Phase d'avertissement
             alpha = int(100 + 50 * math.sin(self.timer * 0.3))
-            warning_surface = pygame.Surface((self.radius * 2, self.radius * 2))
-            warning_surface.set_alpha(alpha)
-            warning_surface.fill((255, 255, 0))
-            
-            pygame.draw.circle(warning_surface, (255, 255, 0), 
-                             (self.radius, self.radius), self.radius)
+            warning_surface = sprite_cache.circle(self.radius, (255, 255, 0), alpha)
             screen.blit(warning_surface, (screen_x - self.radius, screen_y - self.radius))
         else:
             # Phase active
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Tests du niveau de détail de l'IA (AILodScheduler)
+"""
+import pygame
+
+from src.systems.ai_scheduler import AILodScheduler
+from src.world.wall_index import WallIndex
+
+class MockCamera:
+    def get_visible_area(self):
+        return pygame.Rect(0, 0, 800, 600)
+
+class MockEnemy:
+    def __init__(self, x, y, size=20):
+        self.x, self.y = x, y
+        self.width = self.height = size
+        self.speed = 2
+        self.rect = pygame.Rect(x, y, size, size)
+
+class MockBoss(MockEnemy):
+    ai_lod = False
+
+class MockWall:
+    def __init__(self, x, y, width, height):
+        self.rect = pygame.Rect(x, y, width, height)
+
+def run(scheduler, enemies, ticks):
+    updates = {id(enemy): [] for enemy in enemies}
+    for _ in range(ticks):
+        scheduler.begin_frame(MockCamera(), enemies)
+        for enemy in enemies:
+            elapsed = scheduler.schedule(enemy)
+            if elapsed:
+                updates[id(enemy)].append(elapsed)
+    return [updates[id(enemy)] for enemy in enemies]
+
+def test_update_rate_drops_with_distance_to_view():
+    on_screen, near, middle, far = (MockEnemy(400, 300), MockEnemy(1000, 300),
+                                    MockEnemy(1400, 300), MockEnemy(3000, 300))
+    scheduler = AILodScheduler()
+    counts = [len(updates) for updates in run(scheduler, [on_screen, near, middle, far], 64)]
+    assert counts == [64, 32, 16, 8]
+
+    stats = scheduler.get_statistics()
+    assert stats["totals"]["updated"] == 120
+    assert stats["totals"]["skipped"] == 4 * 64 - 120
+    assert stats["frame"]["every_8"] == 1
+
+def test_bosses_and_disabled_scheduler_run_every_tick():
+    boss = MockBoss(3000, 3000)
+    assert len(run(AILodScheduler(), [boss], 16)[0]) == 16
+
+    scheduler = AILodScheduler()
+    scheduler.enabled = False
+    assert len(run(scheduler, [MockEnemy(3000, 3000)], 16)[0]) == 16
+
+def test_skipped_ticks_are_caught_up():
+    far = [MockEnemy(3000, 300 + 40 * i) for i in range(8)]
+    updates = run(AILodScheduler(), far, 40)
+    # Décalages différents : les ennemis lointains ne réfléchissent pas tous au même tick
+    assert len({tuple(enemy_updates) for enemy_updates in updates}) > 1
+    assert all(elapsed == 8 for enemy_updates in updates for elapsed in enemy_updates[1:])
+
+    scheduler = AILodScheduler()
+    enemy = MockEnemy(2000, 300)
+    enemy.x += 2
+    assert scheduler.catch_up(enemy, 2000, 300, 8, [])
+    assert (enemy.x, enemy.rect.x) == (2016, 2016)
+
+    # Un mur sur le trajet rattrapé : on garde le pas simple
+    walls = WallIndex([MockWall(2030, 280, 20, 60)])
+    enemy = MockEnemy(2000, 300)
+    enemy.x += 2
+    assert not scheduler.catch_up(enemy, 2000, 300, 8, walls)
+    assert enemy.x == 2002
+
+def test_catch_up_only_repeats_ordinary_steps():
+    scheduler = AILodScheduler(world_width=2400, world_height=1600)
+    walls = WallIndex([MockWall(2006, 280, 4, 60)])
+
+    # Téléportation (saut bien plus grand que la vitesse) : jamais répétée
+    enemy = MockEnemy(600, 400)
+    assert not scheduler.catch_up(enemy, 2000, 1400, 8, walls)
+    assert (enemy.x, enemy.y) == (600, 400)
+
+    # Mur fin traversé entre la position du tick et l'arrivée (arrivée libre)
+    enemy = MockEnemy(2002, 300)
+    assert not scheduler.catch_up(enemy, 2000, 300, 8, walls)
+    assert enemy.x == 2002
+
+    # Bord du monde : le rattrapage s'arrête contre la limite
+    enemy = MockEnemy(2372, 300)
+    assert scheduler.catch_up(enemy, 2370, 300, 8, [])
+    assert enemy.x == 2400 - enemy.width
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Tests du fond de jeu (couche de grille pré-rendue, champ d'étoiles vectorisé)
+"""
+import numpy as np
+import pygame
+
+from src.world.background import GridBackground, GameBackground, StarField
+
+def legacy_grid(grid, camera_x, camera_y):
+    """Rendu de l'ancienne grille, redessinée à chaque frame"""
+    surface = pygame.Surface((grid.screen_width, grid.screen_height))
+    surface.fill((40, 20, 10))
+    grid_surface = pygame.Surface((grid.screen_width, grid.screen_height))
+    grid_surface.set_alpha(grid.alpha)
+    grid_surface.fill((0, 0, 0))
+    offset_x = int(camera_x) % grid.grid_size
+    offset_y = int(camera_y) % grid.grid_size
+    for x in range(-offset_x, grid.screen_width + grid.grid_size, grid.grid_size):
+        pygame.draw.line(grid_surface, grid.color, (x, 0), (x, grid.screen_height), 1)
+    for y in range(-offset_y, grid.screen_height + grid.grid_size, grid.grid_size):
+        pygame.draw.line(grid_surface, grid.color, (0, y), (grid.screen_width, y), 1)
+    surface.blit(grid_surface, (0, 0))
+    return pygame.image.tostring(surface, "RGB")
+
+def cached_grid(grid, camera_x, camera_y):
+    surface = pygame.Surface((grid.screen_width, grid.screen_height))
+    surface.fill((40, 20, 10))
+    grid.draw(surface, camera_x, camera_y)
+    return pygame.image.tostring(surface, "RGB")
+
+def test_cached_layer_matches_the_per_frame_grid():
+    grid = GridBackground(320, 240)
+    for camera in ((0, 0), (37.6, 99), (-251, -13.2), (1000, 4321)):
+        assert cached_grid(grid, *camera) == legacy_grid(grid, *camera)
+
+def test_layer_is_rendered_once_and_follows_resolution_changes():
+    background = GameBackground(320, 240)
+    layer = background.grid.layer
+    assert layer.get_size() == (420, 340)
+    background.draw(pygame.Surface((320, 240)), 55, 12)
+    assert background.grid.layer is layer
+
+    background.resize(640, 480)
+    assert background.grid.layer.get_size() == (740, 580)
+    assert cached_grid(background.grid, 12, 345) == legacy_grid(background.grid, 12, 345)
+
+def draw_stars_per_star(star_field, surface):
+    """Dessin de référence : set_at / draw.circle étoile par étoile, dans l'ordre"""
+    for layer in star_field.star_layers:
+        for x, y, color in zip(layer["x"], layer["y"], layer["colors"].tolist()):
+            if layer["size"] == 1:
+                surface.set_at((int(x), int(y)), color)
+            else:
+                pygame.draw.circle(surface, color, (int(x), int(y)), layer["size"])
+
+def test_star_field_bulk_draw_matches_per_star_draw():
+    star_field = StarField(200, 150, star_counts=(800, 400, 300), rng=np.random.default_rng(4))
+    for frame in range(20):
+        star_field.update(300 - frame * 40, frame * 25 - 200)
+    for flags, depth in ((0, 32), (pygame.SRCALPHA, 32), (0, 16), (0, 24)):
+        expected, actual = pygame.Surface((200, 150), flags, depth), pygame.Surface((200, 150), flags, depth)
+        draw_stars_per_star(star_field, expected)
+        star_field.draw(actual)
+        assert pygame.image.tostring(actual, "RGBA") == pygame.image.tostring(expected, "RGBA")
+
+def test_star_field_parallax_and_wraparound():
+    star_field = StarField(200, 150, star_counts=(50, 50, 50), rng=np.random.default_rng(5))
+    assert star_field.get_star_count() == 150
+    for layer in star_field.star_layers:
+        layer["x"][:] = 100
+        layer["y"][:] = 75
+        layer["x"][0] = -49.5  # Sortira par la gauche
+    star_field.update(1000, 0)
+    for layer in star_field.star_layers:
+        assert layer["x"][0] == 250 and 0 <= layer["y"][0] <= 150
+        assert np.allclose(layer["x"][1:], 100 - 1000 * layer["speed"] * 0.01)
+        assert np.all(layer["y"][1:] == 75)
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Tests de la phase large du CollisionSystem (grille de hachage spatial)
+"""
+import random
+
+from src.systems.entity_manager import EntityManager
+from src.systems.collision_system import CollisionSystem
+from src.systems.spatial_grid import SpatialHashGrid
+
+class MockEnemy:
+    def __init__(self, x, y, width=24):
+        self.x, self.y = x, y
+        self.width, self.height = width, width
+        self.health = 30
+        self.damage = 10
+
+    def take_damage(self, damage):
+        self.health -= damage
+
+class MockProjectile:
+    def __init__(self, x, y):
+        self.x, self.y = x, y
+        self.radius = 3
+        self.damage = 20
+
+class MockPlayer:
+    def __init__(self, x, y):
+        self.x, self.y = x, y
+        self.width, self.height = 32, 32
+        self.health = 1000
+
+    def take_damage(self, damage):
+        self.health -= damage
+
+def _populate(seed):
+    rng = random.Random(seed)
+    entity_manager = EntityManager()
+    entity_manager.add_player(MockPlayer(1200, 800))
+    for _ in range(60):
+        entity_manager.add_enemy(MockEnemy(rng.uniform(1000, 1400), rng.uniform(600, 1000)))
+    for _ in range(200):
+        entity_manager.add_projectile(MockProjectile(rng.uniform(1000, 1400), rng.uniform(600, 1000)))
+    return entity_manager
+
+def test_grid_query_matches_brute_force():
+    rng = random.Random(1)
+    grid = SpatialHashGrid(cell_size=50)
+    boxes = []
+    for i in range(300):
+        box = (rng.uniform(-50, 2400), rng.uniform(-50, 1600), rng.uniform(1, 120), rng.uniform(1, 120))
+        boxes.append((i, box))
+        grid.insert(i, *box)
+
+    for _ in range(200):
+        qx, qy, qw, qh = rng.uniform(0, 2400), rng.uniform(0, 1600), rng.uniform(1, 200), rng.uniform(1, 200)
+        expected = [i for i, (x, y, w, h) in boxes
+                    if x <= qx + qw and qx <= x + w and y <= qy + qh and qy <= y + h]
+        found = grid.query_rect(qx, qy, qw, qh)
+        # La grille peut renvoyer des faux positifs, jamais de faux négatifs, et garde l'ordre
+        assert set(expected) <= set(found)
+        assert found == sorted(found)
+
+def test_grid_remove():
+    grid = SpatialHashGrid(cell_size=32)
+    grid.insert("a", 0, 0, 100, 100)
+    grid.insert("b", 10, 10, 5, 5)
+    assert grid.remove("a")
+    assert not grid.remove("a")
+    assert grid.query_rect(0, 0, 100, 100) == ["b"]
+    assert len(grid) == 1
+
+def test_spatial_hash_matches_brute_force_outcome():
+    results = []
+    for use_spatial_hash in (False, True):
+        entity_manager = _populate(seed=7)
+        collision_system = CollisionSystem(use_spatial_hash=use_spatial_hash)
+        collision_system.update(entity_manager)
+        entity_manager.end_of_frame_compact()
+        results.append((
+            [(e.x, e.y, e.health) for e in entity_manager.get_enemies()],
+            [(p.x, p.y) for p in entity_manager.get_projectiles()],
+            entity_manager.get_player().health,
+            collision_system.get_collision_statistics(),
+        ))
+
+    brute, grid = results
+    assert brute[:3] == grid[:3]
+    assert brute[3]["projectile_enemy"] == grid[3]["projectile_enemy"]
+    assert grid[3]["pair_tests"] < brute[3]["pair_tests"]
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Tests de l'IA groupée des ennemis simples (EnemyBatch)
+"""
+import random
+
+import pygame
+
+from src.systems.entity_manager import EntityManager
+from src.systems.enemy_batch import EnemyBatch
+from src.world.wall_index import WallIndex
+
+class MockEnemy:
+    ai_batch = "basic"
+
+    def __init__(self, x, y, size=24, speed=2):
+        self.x, self.y = x, y
+        self.width = self.height = size
+        self.speed = speed
+        self.health = 30
+        self.rect = pygame.Rect(x, y, size, size)
+
+class MockFastEnemy(MockEnemy):
+    ai_batch = "fast"
+
+class MockShooterEnemy(MockEnemy):
+    ai_batch = "shooter"
+
+    def __init__(self, x, y):
+        super().__init__(x, y, size=20, speed=1.5)
+        self.shoot_timer = 5
+
+class MockBoss(MockEnemy):
+    ai_batch = None
+
+class MockPlayer:
+    def __init__(self, x, y):
+        self.x, self.y = x, y
+        self.width = self.height = 32
+
+class MockWall:
+    def __init__(self, x, y, width, height):
+        self.rect = pygame.Rect(x, y, width, height)
+
+def test_only_simple_archetypes_are_batched():
+    entity_manager = EntityManager()
+    batch = entity_manager.enable_enemy_batch(capacity=2)
+    enemies = [MockEnemy(0, 0), MockFastEnemy(50, 0), MockShooterEnemy(100, 0), MockBoss(150, 0)]
+    for enemy in enemies:
+        entity_manager.add_enemy(enemy)
+    assert len(batch) == 3 and batch.stats["grown"] == 1
+    assert not batch.owns(enemies[3])
+    assert entity_manager.get_enemies() == enemies
+
+    # La compaction de fin de frame retire aussi la ligne du lot
+    entity_manager.remove_enemy(enemies[1])
+    entity_manager.end_of_frame_compact()
+    assert batch.enemies == [enemies[0], enemies[2]]
+    assert batch.rows == {id(enemies[0]): 0, id(enemies[2]): 1}
+    assert batch.shoot_timer[1] == 5
+
+def test_wall_overlaps_match_pygame():
+    rng = random.Random(4)
+    walls = WallIndex([MockWall(rng.randint(0, 800), rng.randint(0, 600), rng.randint(10, 200), rng.randint(10, 200))
+                       for _ in range(12)])
+    boxes = [(rng.uniform(-20, 900), rng.uniform(-20, 700), 24, 16) for _ in range(300)]
+    hits = walls.overlaps(*zip(*boxes))
+    assert list(hits) == [not walls.is_free(*box) for box in boxes]
+
+def test_batch_chases_player_around_walls():
+    random.seed(2)
+    walls = WallIndex([MockWall(400, 800, 600, 40), MockWall(400, 300, 40, 540), MockWall(960, 300, 40, 540)])
+    player = MockPlayer(700, 1100)
+    walls.get_flow_field().set_target(player.x + 16, player.y + 16)
+    batch = EnemyBatch()
+    enemies = [MockEnemy(600 + 30 * i, 500) for i in range(6)] + [MockFastEnemy(650, 600)]
+    for enemy in enemies:
+        batch.adopt(enemy)
+
+    for _ in range(900):
+        batch.update(player, walls, enemies)
+        assert all(walls.is_free(e.x, e.y, e.width, e.height) for e in enemies)
+    assert all(abs(e.x - player.x) < 80 and abs(e.y - player.y) < 80 for e in enemies)
+    assert batch.stats["teleports"] == 0
+
+def test_shooter_retreats_and_cools_down():
+    shooter = MockShooterEnemy(100, 100)
+    batch = EnemyBatch()
+    batch.adopt(shooter)
+    batch.update(MockPlayer(150, 100), WallIndex([]), [shooter])
+    assert shooter.x < 100
+    assert shooter.shoot_timer == 4
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Tests de la table de dispatch update/draw des entités
+"""
+import pygame
+
+from src.systems.entity_dispatch import (DispatchTable, draw_entity, get_update_arity, get_draw_mode,
+                                         DRAW_SCREEN, DRAW_OFFSET, DRAW_WORLD)
+from src.systems.entity_manager import EntityManager
+from src.entities.bullet import Bullet
+from src.entities.weapon_projectile import WeaponProjectile
+from src.scenes.game_scene import SimpleEnemy
+
+WEAPON_DATA = {
+    "name": "Bolter",
+    "stats": {"damage": 5, "projectile_speed": 4},
+    "projectile": {"size": 3, "color": [255, 255, 0], "lifetime": 60},
+}
+
+class LegacyEnemy:
+    """Ancienne signature : update(player, walls) et dessin en coordonnées monde"""
+    def __init__(self, x, y):
+        self.x, self.y = x, y
+        self.drawn_at = None
+
+    def update(self, player, walls):
+        self.x += 1
+
+    def draw(self, screen):
+        self.drawn_at = (self.x, self.y)
+
+class Inert:
+    x, y = 0, 0
+
+def test_update_arity_picks_the_most_complete_accepted_form():
+    forms = (3, 2, 0)
+    assert get_update_arity(SimpleEnemy(0, 0).update, forms) == 3
+    assert get_update_arity(LegacyEnemy(0, 0).update, forms) == 2
+    assert get_update_arity(lambda: None, forms) == 0
+    assert get_update_arity(lambda *args: None, forms) == 3
+    assert get_update_arity(lambda a: None, forms) is None
+    assert get_update_arity(None, forms) is None
+
+def test_draw_modes():
+    assert get_draw_mode(SimpleEnemy(0, 0).draw) == DRAW_SCREEN
+    assert get_draw_mode(Bullet(0, 0, 1, 0).draw) == DRAW_SCREEN
+    assert get_draw_mode(WeaponProjectile(0, 0, 1, 0, WEAPON_DATA, {}).draw) == DRAW_OFFSET
+    assert get_draw_mode(LegacyEnemy(0, 0).draw) == DRAW_WORLD
+    assert get_draw_mode(None) is None
+
+def test_calls_are_resolved_once_per_class_at_spawn():
+    manager = EntityManager()
+    for i in range(3):
+        manager.add_enemy(SimpleEnemy(i, i))
+    manager.add_enemy(LegacyEnemy(0, 0))
+    manager.add_projectile(Bullet(0, 0, 1, 0))
+    assert manager.dispatch.get_statistics() == {"player": 0, "enemy": 2, "projectile": 1}
+    calls = manager.dispatch.tables["enemy"][LegacyEnemy]
+    assert calls.update_arity == 2 and calls.draw_mode == DRAW_WORLD
+    assert manager.dispatch.register(Inert(), "enemy").update_arity is None
+
+def test_draw_entity_uses_screen_coordinates_without_moving_entities():
+    screen = pygame.Surface((200, 200))
+    table = DispatchTable()
+
+    projectile = WeaponProjectile(1000, 800, 1, 0, WEAPON_DATA, {})
+    draw_entity(projectile, table.register(projectile, "projectile"), screen, 50, 60, (255, 255, 0), 3)
+    assert (projectile.x, projectile.y) == (1000, 800)
+    assert screen.get_at((50, 60))[:3] == (255, 255, 0)
+
+    legacy = LegacyEnemy(500, 500)
+    draw_entity(legacy, table.register(legacy, "enemy"), screen, 10, 20, (255, 0, 0), 8)
+    assert legacy.drawn_at == (10, 20) and (legacy.x, legacy.y) == (500, 500)
+
+    inert = Inert()
+    draw_entity(inert, table.register(inert, "enemy"), screen, 100, 100, (255, 0, 0), 8)
+    assert screen.get_at((100, 100))[:3] == (255, 0, 0)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Tests de la suppression différée de l'EntityManager
+"""
+from src.systems.entity_manager import EntityManager
+from src.systems.collision_system import CollisionSystem
+
+class MockEnemy:
+    def __init__(self, x, y, health=30):
+        self.x, self.y = x, y
+        self.width, self.height = 24, 24
+        self.health = health
+
+    def take_damage(self, damage):
+        self.health -= damage
+
+class MockProjectile:
+    def __init__(self, x, y):
+        self.x, self.y = x, y
+        self.radius = 3
+        self.damage = 20
+
+class MockScene:
+    def __init__(self):
+        self.enemies_killed = 0
+        self.enemies_remaining = 0
+
+def test_removal_is_deferred_until_compaction():
+    entity_manager = EntityManager()
+    enemies = [MockEnemy(i * 10, 0) for i in range(5)]
+    for enemy in enemies:
+        entity_manager.add_enemy(enemy)
+
+    # Retirer pendant l'itération ne décale pas la boucle
+    seen = []
+    for enemy in entity_manager.get_enemies():
+        seen.append(enemy)
+        if enemy in (enemies[1], enemies[2]):
+            assert entity_manager.remove_enemy(enemy)
+    assert seen == enemies
+
+    assert not entity_manager.remove_enemy(enemies[1])  # Déjà marqué
+    assert not entity_manager.remove_enemy(MockEnemy(0, 0))  # Jamais ajouté
+    assert entity_manager.is_removed(enemies[2])
+    assert entity_manager.get_enemies_count() == 3
+    assert len(entity_manager.get_enemies()) == 5
+
+    assert entity_manager.end_of_frame_compact() == 2
+    assert entity_manager.get_enemies() == [enemies[0], enemies[3], enemies[4]]
+    assert not entity_manager.is_removed(enemies[2])
+    assert entity_manager.end_of_frame_compact() == 0
+
+def test_compaction_keeps_list_identity_and_clear_drops_marks():
+    entity_manager = EntityManager()
+    projectiles = entity_manager.get_projectiles()
+    first, second = MockProjectile(0, 0), MockProjectile(5, 5)
+    entity_manager.add_projectile(first)
+    entity_manager.add_projectile(second)
+    entity_manager.remove_projectile(first)
+    entity_manager.end_of_frame_compact()
+    assert entity_manager.get_projectiles() is projectiles
+    assert projectiles == [second]
+
+    entity_manager.remove_projectile(second)
+    entity_manager.clear_projectiles()
+    assert not entity_manager.has_pending_removals()
+    entity_manager.add_projectile(second)
+    assert entity_manager.end_of_frame_compact() == 0
+    assert projectiles == [second]
+
+def test_enemy_killed_twice_in_a_frame_is_credited_once():
+    entity_manager = EntityManager()
+    enemy = MockEnemy(100, 100, health=20)
+    entity_manager.add_enemy(enemy)
+    # Deux projectiles sur le même ennemi : le second frappe un ennemi déjà mort
+    entity_manager.add_projectile(MockProjectile(112, 112))
+    entity_manager.add_projectile(MockProjectile(112, 112))
+
+    scene = MockScene()
+    scene.enemies_remaining = 1
+    collision_system = CollisionSystem()
+    collision_system.game_scene = scene
+    collision_system.check_projectile_enemy_collisions(entity_manager)
+
+    assert scene.enemies_killed == 1
+    assert scene.enemies_remaining == 0
+    assert entity_manager.get_projectiles_count() == 1  # Le second projectile continue sa route
+    entity_manager.end_of_frame_compact()
+    assert entity_manager.get_enemies() == []
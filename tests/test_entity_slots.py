@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Tests des entités à attributs déclarés (__slots__)
+"""
+import pytest
+
+from src.entities.bullet import Bullet
+from src.entities.weapon_projectile import WeaponProjectile
+from src.gameplay.items import Item
+from src.scenes.game_scene import SimpleWall
+from src.core.fixed_timestep import snapshot_positions
+from src.utils.object_pool import ObjectPool
+
+WEAPON_DATA = {
+    "name": "Lance-plasma",
+    "stats": {"damage": 100, "projectile_speed": 6},
+    "projectile": {"size": 4, "color": [0, 200, 255], "lifetime": 60},
+    "effects": ["energy_damage", "suppression"]
+}
+
+EFFECTS_DATA = {
+    "damage_effects": {"energy_damage": {"parameters": {"armor_penetration": 0.5}}},
+    "special_effects": {"suppression": {"parameters": {"speed_reduction": 0.3, "duration": 90}}}
+}
+
+class PlainEnemy:
+    def __init__(self):
+        self.x, self.y = 0, 0
+
+class ArmoredEnemy(PlainEnemy):
+    armor = 40
+
+    def __init__(self):
+        super().__init__()
+        self.slowed = None
+
+    def apply_slow(self, reduction, duration):
+        self.slowed = (reduction, duration)
+
+def test_entities_have_no_instance_dict():
+    entities = [
+        WeaponProjectile(0, 0, 1, 0, WEAPON_DATA, EFFECTS_DATA),
+        Bullet(0, 0, 1, 0),
+        Item(0, 0, "health", "Medikit", "Soigne"),
+        SimpleWall(0, 0, 32, 32),
+    ]
+    for entity in entities:
+        assert not hasattr(entity, '__dict__')
+    with pytest.raises(AttributeError):
+        entities[0].undeclared = True
+
+def test_system_attributes_are_declared():
+    projectile = ObjectPool(WeaponProjectile).acquire(5, 6, 1, 0, WEAPON_DATA, EFFECTS_DATA)
+    bullet = Bullet(1, 2, 0, 1)
+    snapshot_positions([projectile, bullet])
+    assert (projectile.prev_x, bullet.prev_y) == (5, 2)
+    assert projectile.object_pool is not None
+    assert not hasattr(bullet, 'object_pool')  # Slot déclaré mais non posé
+
+def test_optional_capabilities_are_probed_without_hasattr():
+    projectile = WeaponProjectile(0, 0, 1, 0, WEAPON_DATA, EFFECTS_DATA)
+    assert projectile._calculate_damage(PlainEnemy()) == 100
+    armored = ArmoredEnemy()
+    assert projectile._calculate_damage(armored) == 80  # 40 d'armure, moitié pénétrée
+    projectile._apply_hit_effects(armored, None)
+    assert armored.slowed == (0.3, 90)
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Tests de la boucle à pas fixe et de l'interpolation du rendu
+"""
+import pytest
+
+from src.core.fixed_timestep import FixedTimestep, snapshot_positions, interpolate_position
+from src.gameplay.camera import Camera
+
+class Mover:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+def test_ticks_follow_real_time_not_frame_rate():
+    # 120 images/s ou 30 images/s : toujours 60 ticks par seconde simulée
+    for frame_rate in (120, 30):
+        timestep = FixedTimestep(tick_rate=60)
+        ticks = sum(timestep.advance(1.0 / frame_rate) for _ in range(frame_rate))
+        assert ticks == 60
+        assert timestep.dropped_ticks == 0
+
+def test_leftover_time_becomes_render_alpha():
+    timestep = FixedTimestep(tick_rate=50)  # tick de 20 ms
+    assert timestep.advance(0.030) == 1
+    assert timestep.alpha == pytest.approx(0.5)
+    assert timestep.advance(0.010) == 1
+    assert timestep.alpha == pytest.approx(0.0, abs=1e-6)
+
+def test_catch_up_budget_drops_time_instead_of_spiralling():
+    timestep = FixedTimestep(tick_rate=60, max_catch_up_ticks=4, max_frame_time=1.0)
+    assert timestep.advance(0.5) == 4
+    assert timestep.dropped_ticks == 26
+    assert timestep.alpha == 0.0
+    # Une image très longue est d'abord bornée par max_frame_time
+    assert FixedTimestep(tick_rate=60, max_catch_up_ticks=100, max_frame_time=0.1).advance(10.0) == 6
+
+def test_interpolated_positions_between_ticks():
+    mover = Mover(0.0, 10.0)
+    assert interpolate_position(mover, 0.5) == (0.0, 10.0)  # Jamais mémorisé : position courante
+    snapshot_positions([mover])
+    mover.x, mover.y = 8.0, 14.0
+    assert interpolate_position(mover, 0.25) == (2.0, 11.0)
+    assert interpolate_position(mover, 1.0) == (8.0, 14.0)
+
+    camera = Camera(100, 100, 1000, 1000)
+    camera.snapshot()
+    camera.x, camera.y = 40, 20
+    assert camera.interpolated(0.5) == (20, 10)
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Tests de la séparation entre ennemis (grille de voisinage et version NumPy)
+"""
+import random
+
+import numpy as np
+
+from src.gameplay.pathfinding import FlockingBehavior, NeighborGrid
+
+class Mover:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+def crowd(seed, count=150):
+    rng = random.Random(seed)
+    movers = [Mover(rng.uniform(0, 400), rng.uniform(0, 300)) for _ in range(count)]
+    movers.append(Mover(movers[0].x, movers[0].y))  # Positions confondues : ignorées
+    return movers
+
+def test_neighbor_grid_matches_full_list():
+    movers = crowd(3)
+    grid = NeighborGrid(movers)
+    for distance in (30, 40, 50):
+        for mover in movers:
+            expected = FlockingBehavior.get_separation_force(mover, movers, distance)
+            assert FlockingBehavior.get_separation_force(mover, grid, distance) == expected
+
+def test_neighbor_grid_follows_moves():
+    movers = [Mover(0, 0), Mover(500, 500)]
+    grid = NeighborGrid(movers)
+    assert grid.query_radius(10, 10, 40) == [movers[0]]
+    movers[1].x, movers[1].y = 20, 5
+    assert grid.move(movers[1])
+    assert grid.query_radius(10, 10, 40) == movers
+    assert not grid.move(Mover(0, 0))
+    assert list(grid) == movers and len(grid) == 2
+
+def test_batched_forces_match_scalar_formula():
+    movers = crowd(5)
+    distances = np.array([30.0 if index % 3 else 50.0 for index in range(len(movers))])
+    force_x, force_y = FlockingBehavior.get_separation_forces(
+        [m.x for m in movers], [m.y for m in movers], distances)
+    assert np.count_nonzero(force_x) > len(movers) // 2
+    for index, mover in enumerate(movers):
+        expected = FlockingBehavior.get_separation_force(mover, movers, distances[index])
+        assert abs(force_x[index] - expected[0]) < 1e-9
+        assert abs(force_y[index] - expected[1]) < 1e-9
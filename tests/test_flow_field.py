@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Tests du champ de flux partagé (poursuite du joueur autour des murs)
+"""
+import math
+
+import pygame
+
+from src.world.wall_index import WallIndex
+from src.world.flow_field import FlowField, UNREACHABLE
+from src.gameplay.pathfinding import PathfindingHelper
+
+class MockWall:
+    def __init__(self, x, y, width, height):
+        self.rect = pygame.Rect(x, y, width, height)
+
+def cup_walls():
+    """Coupe ouverte vers le haut : le fond sépare l'ennemi du joueur"""
+    return [MockWall(400, 800, 600, 40), MockWall(400, 300, 40, 540), MockWall(960, 300, 40, 540)]
+
+def chase(direction_function, walls, steps=900):
+    x, y, size, speed = 690.0, 600.0, 24, 3
+    target_x, target_y = 700.0, 1100.0
+    for _ in range(steps):
+        dx, dy = direction_function(x, y, target_x, target_y, size, size, walls, speed)
+        if walls.is_free(x + dx, y + dy, size, size):
+            x, y = x + dx, y + dy
+        if math.hypot(target_x - x, target_y - y) < 40:
+            return True
+    return False
+
+def test_field_is_rebuilt_only_when_target_changes_cell():
+    field = FlowField([MockWall(100, 100, 64, 64)], world_width=640, world_height=480)
+    assert field.direction_at(10, 10) is None
+    assert field.set_target(300, 300)
+    assert not field.set_target(310, 305)  # Même case
+    assert field.set_target(340, 300)
+    assert field.rebuilds == 2
+
+def test_distances_go_around_walls():
+    field = FlowField([wall.rect for wall in cup_walls()])
+    field.set_target(700, 1100)
+    inside, outside = field.get_distance(700, 600), field.get_distance(200, 600)
+    assert inside != UNREACHABLE and outside != UNREACHABLE
+    # Sortir par le haut de la coupe coûte plus que de contourner depuis l'extérieur
+    assert inside > outside
+    # Une case qui touche un mur renvoie vers une case libre
+    dx, dy = field.direction_at(420, 600)
+    assert dx > 0
+
+def test_chase_escapes_concave_obstacle():
+    walls = WallIndex(cup_walls())
+    # Sans champ ciblé : sondage local, bloqué au fond de la coupe
+    assert not chase(PathfindingHelper.get_chase_direction, walls)
+    walls.get_flow_field().set_target(712, 1112)
+    assert chase(PathfindingHelper.get_chase_direction, walls)
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Tests de la journalisation (canaux, niveaux, écriture en arrière-plan)
+"""
+import threading
+
+import pytest
+
+from src.utils import game_log
+from src.utils.game_log import (RateLimitedChannel, LogWriter, advance_frame, get_logger,
+                                set_level, INFO)
+from src.entities.weapon_projectile import WeaponProjectile
+
+WEAPON_DATA = {
+    "name": "Test",
+    "stats": {"damage": 10, "projectile_speed": 5},
+    "projectile": {"size": 3, "color": [255, 255, 0], "lifetime": 60},
+    "effects": []
+}
+
+class CountingArg:
+    """Argument qui compte ses formatages"""
+    def __init__(self):
+        self.formatted = 0
+
+    def __str__(self):
+        self.formatted += 1
+        return "arg"
+
+@pytest.fixture(autouse=True)
+def restore_levels():
+    """Remet les niveaux globaux des canaux tels qu'avant le test"""
+    configured = dict(game_log._configured_levels)
+    yield
+    game_log._configured_levels.clear()
+    game_log._configured_levels.update(configured)
+    for name, channel in game_log._channels.items():
+        channel.set_level(game_log._resolve_level(name))
+    for channel in game_log._rate_limited.values():
+        channel.refresh()
+
+def test_channel_emits_once_per_interval():
+    channel = RateLimitedChannel("test.rate", interval_frames=3, level=INFO)
+    emitted = []
+    for _ in range(9):
+        emitted.append(channel.ready())
+        advance_frame()
+    assert emitted == [True, False, False] * 3
+    assert (channel.emitted, channel.suppressed) == (3, 6)
+
+def test_disabled_channel_never_emits():
+    channel = RateLimitedChannel("test.rate", enabled=False)
+    assert not channel.ready()
+    assert channel.suppressed == 0
+
+def test_disabled_level_is_a_noop_without_formatting():
+    log = get_logger("test.levels")
+    set_level("test.levels", "warning")
+    arg = CountingArg()
+    log.debug("valeur %s", arg)
+    log.info("valeur %s", arg)
+    assert log.debug is game_log._noop and log.info is game_log._noop
+    assert arg.formatted == 0
+
+    set_level("test", "debug")  # Le parent le plus proche s'applique aux sous-canaux non configurés
+    assert get_logger("test.other").enabled_for(game_log.DEBUG)
+    assert not get_logger("test.levels").enabled_for(game_log.DEBUG)
+    assert get_logger("test.other").debug_enabled and not log.debug_enabled
+
+def test_writer_formats_lazily_in_background(capsys, tmp_path):
+    writer = LogWriter(maxsize=8)
+    log_file = tmp_path / "channel.log"
+    writer.add_file_sink("test.file", str(log_file), console=False)
+    arg = CountingArg()
+    writer.submit(("test.console", INFO, 0.0, "console %s", (arg,)))
+    writer.submit(("test.file.sub", INFO, 0.0, "fichier %d%%", (42,)))
+    writer.flush()
+
+    assert arg.formatted == 1
+    assert capsys.readouterr().out == "console arg\n"
+    assert log_file.read_text(encoding="utf-8").endswith("fichier 42%\n")
+    writer.shutdown()
+    assert not writer.thread.is_alive()
+
+def test_file_channel_is_timestamped_on_console(capsys, tmp_path):
+    writer = LogWriter(maxsize=8)
+    log_file = tmp_path / "channel.log"
+    writer.add_file_sink("test.file", str(log_file), console=True)
+    writer.submit(("test.file", INFO, 0.0, "message", ()))
+    writer.flush()
+
+    console = capsys.readouterr().out
+    assert console.startswith("[") and console.endswith("] message\n")
+    assert log_file.read_text(encoding="utf-8") == console
+    writer.shutdown()
+
+def test_full_queue_drops_instead_of_blocking():
+    writer = LogWriter(maxsize=2)
+    writer.thread = threading.current_thread()  # Thread factice : rien ne vide la file
+    for _ in range(5):
+        writer.submit(("test", INFO, 0.0, "x", ()))
+    assert writer.dropped == 3
+
+def test_projectile_creation_starts_no_thread():
+    WeaponProjectile(0, 0, 1, 0, WEAPON_DATA, {})  # Démarre le thread d'écriture si besoin
+    threads_before = threading.active_count()
+    for _ in range(50):
+        WeaponProjectile(0, 0, 1, 0, WEAPON_DATA, {})
+    assert threading.active_count() == threads_before
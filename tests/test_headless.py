@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Tests du mode sans fenêtre (HeadlessRunner)
+"""
+from src.core.headless import HeadlessRunner
+
+def play(seed, ticks=240):
+    report = HeadlessRunner(seed=seed, invulnerable=True).run(ticks=ticks)
+    report.pop("sim_seconds")
+    report.pop("ticks_per_second")
+    report.pop("ms_per_tick")
+    return report
+
+def test_same_seed_plays_the_same_game():
+    first = play(7)
+    second = play(7)
+    first_systems, second_systems = first.pop("systems"), second.pop("systems")
+    first.pop("recent_frames"), second.pop("recent_frames")
+    assert first == second
+    assert first["ticks"] == 240
+    assert first["entities"]["enemies"]["max"] > 0
+    assert {"update.enemies", "update.collisions", "collisions.projectile_pool"} <= set(first_systems)
+    assert first_systems["update.collisions"]["calls"] == second_systems["update.collisions"]["calls"] == 240
+
+def test_run_stops_after_requested_waves():
+    runner = HeadlessRunner(seed=1, invulnerable=True)
+    runner.set_enemies([])
+    report = runner.run(waves=1, ticks=600)
+    assert report["waves_completed"] == 1
+    assert report["ticks"] < 600
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Tests des pools d'objets (réutilisation des entités)
+"""
+from src.utils.object_pool import ObjectPool, release_to_pool
+from src.systems.entity_manager import EntityManager
+from src.entities.weapon_projectile import WeaponProjectile
+
+def weapon_data(damage):
+    return {"name": "Bolter", "stats": {"damage": damage, "projectile_speed": 4},
+            "projectile": {"size": 3, "lifetime": 60, "color": [255, 255, 0]}}
+
+class Dummy:
+    def __init__(self, x, y):
+        self.x, self.y = x, y
+        self.released = False
+        self.is_alive = True
+
+    def on_release(self):
+        self.released = True
+
+def test_acquire_reuses_released_objects():
+    pool = ObjectPool(Dummy, name="dummies")
+    first = pool.acquire(1, 2)
+    assert first.object_pool is pool
+    assert pool.release(first)
+    assert first.released
+
+    second = pool.acquire(3, 4)
+    assert second is first
+    assert (second.x, second.y, second.released) == (3, 4, False)  # __init__ rejoué
+    stats = pool.get_statistics()
+    assert (stats["hits"], stats["misses"], stats["hit_ratio"]) == (1, 1, 0.5)
+
+def test_reset_hook_and_double_release():
+    pool = ObjectPool(lambda value: {"value": value}, lambda data, value: data.update(value=value))
+    data = pool.acquire(1)
+    assert pool.release(data)
+    assert not pool.release(data)
+    assert pool.acquire(2) is data and data["value"] == 2
+    assert not release_to_pool(data)  # Un dict ne connaît pas son pool
+
+def test_full_pool_drops_objects():
+    pool = ObjectPool(Dummy, max_free=1)
+    pool.release(pool.acquire(0, 0))
+    assert not pool.release(Dummy(0, 0))
+    assert pool.get_statistics()["dropped"] == 1
+
+def test_projectile_reset_clears_previous_state():
+    pool = ObjectPool(WeaponProjectile)
+    projectile = pool.acquire(0, 0, 1, 0, weapon_data(5), {})
+    projectile.has_hit_targets.add(42)
+    projectile.homing_target = object()
+    pool.release(projectile)
+    assert projectile.homing_target is None and not projectile.has_hit_targets
+
+    again = pool.acquire(10, 20, 0, 1, weapon_data(7), {})
+    assert again is projectile
+    assert (again.x, again.y, again.damage) == (10, 20, 7)
+    assert again.is_alive and (again.rect.center) == (10, 20)
+
+def test_recycled_entities_interpolate_from_their_new_position():
+    from src.core.fixed_timestep import snapshot_positions, interpolate_position
+    from src.entities.enemies.basic_enemies import BasicEnemy
+
+    enemy_pool = ObjectPool(BasicEnemy)
+    projectile_pool = ObjectPool(WeaponProjectile)
+    enemy = enemy_pool.acquire(2000, 1400)
+    projectile = projectile_pool.acquire(800, 600, 1, 0, weapon_data(5), {})
+    snapshot_positions([enemy, projectile])
+    enemy.x, projectile.x = 1990, 804
+    enemy_pool.release(enemy)
+    projectile_pool.release(projectile)
+
+    # Recyclés après le snapshot du tick : aucune traînée depuis leur ancienne vie
+    assert enemy_pool.acquire(50, 50) is enemy
+    assert interpolate_position(enemy, 0.5) == (50, 50)
+    assert projectile_pool.acquire(10, 20, 0, 1, weapon_data(5), {}) is projectile
+    assert interpolate_position(projectile, 0.5) == (10, 20)
+
+def test_entity_manager_releases_compacted_entities():
+    manager = EntityManager()
+    pool = manager.get_object_pool("enemies.Dummy", Dummy)
+    assert manager.get_object_pool("enemies.Dummy", Dummy) is pool
+    enemies = [pool.acquire(i, i) for i in range(3)]
+    for enemy in enemies:
+        manager.add_enemy(enemy)
+
+    manager.remove_enemy(enemies[1])
+    manager.end_of_frame_compact()
+    assert len(pool) == 1 and enemies[1].released
+
+    manager.clear_enemies()
+    assert len(pool) == 3
+    assert manager.get_statistics()["pools"]["enemies.Dummy"]["released"] == 3
+
+def test_recycled_enemy_is_not_already_hit():
+    from src.entities.projectile_pool import ProjectilePool
+    from src.systems.ai_scheduler import AILodScheduler
+
+    manager = EntityManager()
+    manager.projectile_pool = ProjectilePool()
+    scheduler = AILodScheduler()
+    manager.enemy_release_listeners.append(scheduler.forget)
+    pool = manager.get_object_pool("enemies.Dummy", Dummy)
+    enemy = pool.acquire(0, 0)
+    manager.add_enemy(enemy)
+
+    piercing = WeaponProjectile(0, 0, 1, 0, weapon_data(5), {})
+    piercing.has_hit_targets.add(enemy)
+    manager.projectiles.append(piercing)  # Objet gardé hors du pool NumPy
+    slot = manager.projectile_pool.spawn(0, 0, 1, 0, 3, 5, 60)
+    manager.projectile_pool.last_hit[slot] = id(enemy)
+    scheduler.schedule(enemy)
+
+    manager.remove_enemy(enemy)
+    manager.end_of_frame_compact()
+    assert pool.acquire(5, 5) is enemy
+    assert enemy not in piercing.has_hit_targets
+    assert manager.projectile_pool.last_hit[slot] == 0
+    assert id(enemy) not in scheduler.slots
+
+def test_picked_up_items_are_not_recycled():
+    from src.gameplay.items import ItemManager
+
+    class Player:
+        def __init__(self, rect):
+            self.rect = rect
+            self.speed = 5
+
+    manager = ItemManager()
+    manager.item_definitions = {"speed_boost": manager.item_definitions["speed_boost"]}
+    manager.spawn_item(4, 4)
+    picked = manager.items_on_ground[0]
+    picked_type = picked.item_type
+    manager.check_pickup(Player(picked.rect.copy()))
+    assert manager.player_items == [picked]
+
+    # Un objet recyclé prendrait le type des nouveaux objets
+    manager.item_definitions = {"damage_up": ItemManager().item_definitions["damage_up"]}
+    for _ in range(20):
+        manager.spawn_item(500, 500)
+    assert all(item is not picked for item in manager.items_on_ground)
+    assert picked.item_type == picked_type
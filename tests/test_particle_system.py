@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Tests du système de particules (émetteurs NumPy) et des effets portés dessus
+"""
+import numpy as np
+import pygame
+
+from src.systems.particle_system import ParticleSystem, ParticleEmitter
+from src.world.environment_effects import EnvironmentEffects
+from src.world.background import FloatingParticles
+
+SPARK = {
+    "max_particles": 4,
+    "velocity": ((1, 1), (0, 0)),
+    "size": (2, 2),
+    "alpha": (255, 255),
+    "fade": 255 / 10,  # Vie de 10 unités
+    "color": (255, 0, 0),
+}
+
+def make_emitter(**overrides):
+    return ParticleEmitter(dict(SPARK, **overrides), rng=np.random.default_rng(1))
+
+def test_caps_refuse_or_drop_the_oldest():
+    emitter = make_emitter()
+    assert emitter.emit(6, 0, 0) == 4
+    assert len(emitter) == 4 and emitter.stats["refused"] == 2
+
+    emitter = make_emitter(overflow="drop_oldest")
+    emitter.emit(3, 0, 0)
+    emitter.update()  # Les trois premières ont avancé d'un pixel
+    emitter.emit(3, 100, 0)
+    assert len(emitter) == 4 and emitter.stats["dropped"] == 2
+    assert emitter.x[:4].tolist() == [1, 100, 100, 100]
+
+def test_update_integrates_fades_and_removes_dead_particles():
+    emitter = make_emitter()
+    emitter.emit(1, 10, 20)
+    for _ in range(3):
+        emitter.update()
+    assert (emitter.x[0], emitter.y[0]) == (13, 20)
+    assert int(emitter.alpha[0]) == int(255 * 7 / 10)  # Comme alpha = 255 * vie / vie max
+    for _ in range(7):
+        emitter.update()
+    assert len(emitter) == 0
+
+def test_edges_wrap_or_kill():
+    wrapping = make_emitter(fade=0, edge="wrap", edge_margin=10, velocity=((-5, -5), (0, 0)))
+    wrapping.set_bounds((0, 0, 100, 100))
+    wrapping.emit(1, -8, 50)
+    wrapping.update()
+    assert wrapping.x[0] == 110
+
+    killing = ParticleEmitter(dict(SPARK, fade=0, edge="kill", velocity=((0, 0), (-5, -5))),
+                              bounds=(0, 0, 100, 100))
+    killing.emit(1, 50, 3)
+    killing.update()
+    assert len(killing) == 0
+
+def test_draw_culls_against_the_visible_area_and_blits_at_screen_position():
+    system = ParticleSystem()
+    system.add_emitter("sparks", dict(SPARK, fade=0), rng=np.random.default_rng(2))
+    system.emit("sparks", 1, 1050, 2040)
+    system.emit("sparks", 1, 5000, 5000)  # Hors écran
+    screen = pygame.Surface((100, 100))
+    assert system.draw(screen, 1000, 2000) == 1
+    assert screen.get_at((50, 40))[:3] == (255, 0, 0)
+    assert screen.get_at((48, 38))[:3] == (255, 0, 0) and screen.get_at((52, 42))[:3] == (0, 0, 0)
+
+    # Système en coordonnées écran : la caméra est ignorée
+    overlay = ParticleSystem(world_space=False)
+    overlay.add_emitter("sparks", dict(SPARK, fade=0))
+    overlay.emit("sparks", 1, 10, 10)
+    assert overlay.draw(pygame.Surface((100, 100)), 1000, 2000) == 1
+
+def test_environment_particles_spawn_every_15_ticks_and_fade_out():
+    effects = EnvironmentEffects()
+    for _ in range(30):
+        effects.update("imperial_shrine")
+    assert len(effects.particles) == 2
+    for _ in range(120):
+        effects.update("nowhere")
+    assert len(effects.particles) == 0
+
+def test_floating_particles_start_populated_and_stay_on_screen():
+    particles = FloatingParticles(200, 100)
+    for _ in range(600):
+        particles.update(1 / 60)
+    emitter = particles.emitter
+    assert len(emitter) == 30
+    assert np.all((emitter.x[:30] >= -10) & (emitter.x[:30] <= 210))
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Tests du planificateur A* et de son cache de chemins
+"""
+import math
+
+import pygame
+
+from src.world.wall_index import WallIndex
+from src.world.level_manager import LevelManager
+from src.gameplay.pathfinding import PathPlanner, PathfindingHelper, path_planner
+
+class MockWall:
+    def __init__(self, x, y, width, height):
+        self.rect = pygame.Rect(x, y, width, height)
+
+class Walker:
+    def __init__(self, x, y, size=24):
+        self.x, self.y = x, y
+        self.width = self.height = size
+
+def cup_walls():
+    """Coupe ouverte vers le haut : le fond sépare le départ du but"""
+    return [MockWall(400, 800, 600, 40), MockWall(400, 300, 40, 540), MockWall(960, 300, 40, 540)]
+
+def test_path_goes_around_walls():
+    walls = WallIndex(cup_walls())
+    path = PathPlanner().find_path(walls, 700, 600, 700, 1100)
+    assert path[-1] == (700, 1100)
+    # Il faut remonter au-dessus des bords de la coupe avant de redescendre
+    assert min(y for _, y in path) < 300
+    # Seuls les virages sont gardés
+    assert len(path) < 10
+    # Aucun segment entre points de passage ne traverse un mur
+    points = [(700, 600)] + path
+    for (x1, y1), (x2, y2) in zip(points, points[1:]):
+        assert not walls.segment_hits(x1, y1, x2, y2)
+
+def test_unreachable_goal_returns_none():
+    walls = WallIndex([MockWall(600, 600, 200, 20), MockWall(600, 780, 200, 20),
+                       MockWall(600, 600, 20, 200), MockWall(780, 600, 20, 200)])
+    assert PathPlanner().find_path(walls, 100, 100, 700, 700) is None
+
+def test_cache_hits_and_lru_eviction():
+    walls = WallIndex(cup_walls())
+    planner = PathPlanner(capacity=2)
+    planner.find_path(walls, 700, 600, 700, 1100)
+    planner.find_path(walls, 695, 605, 702, 1102)  # Mêmes cases
+    assert (planner.hits, planner.misses) == (1, 1)
+
+    planner.find_path(walls, 100, 100, 1500, 1000)
+    planner.find_path(walls, 100, 1400, 1500, 100)  # Évince le plus ancien
+    assert planner.evictions == 1
+    planner.find_path(walls, 700, 600, 700, 1100)
+    assert planner.misses == 4
+
+def test_cache_is_dropped_for_a_new_level():
+    planner = PathPlanner()
+    planner.find_path(WallIndex(cup_walls()), 700, 600, 700, 1100)
+    planner.find_path(WallIndex(cup_walls()), 700, 600, 700, 1100)
+    assert planner.misses == 2
+
+    invalidations = path_planner.invalidations
+    path_planner.find_path(WallIndex(cup_walls()), 700, 600, 700, 1100)
+    LevelManager().generate_level(1, None)
+    assert path_planner.invalidations == invalidations + 1
+    assert not path_planner.cache
+
+def test_follow_path_escapes_concave_obstacle():
+    walls = WallIndex(cup_walls())
+    walker = Walker(690.0, 600.0)
+    for _ in range(900):
+        dx, dy = PathfindingHelper.follow_path(walker, 700.0, 1100.0, walls, 3)
+        assert walls.is_free(walker.x + dx, walker.y + dy, walker.width, walker.height)
+        walker.x += dx
+        walker.y += dy
+        if math.hypot(700.0 - walker.x, 1100.0 - walker.y) < 5:
+            break
+    assert math.hypot(700.0 - walker.x, 1100.0 - walker.y) < 5
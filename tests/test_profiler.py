@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Tests du profileur par section (historique, histogrammes, export)
+"""
+import csv
+import json
+
+from src.utils import profiler as profiler_module
+from src.utils.profiler import Profiler, HISTOGRAM_BOUNDS_MS
+
+def test_disabled_profiler_records_nothing():
+    profiler = Profiler()
+    with profiler.section("a"):
+        pass
+    profiler.end_frame()
+    assert profiler.section("a") is profiler.section("b")
+    assert profiler.get_statistics() == {}
+    assert len(profiler.frames) == 0
+
+def test_nested_sections_of_the_same_name_keep_their_own_start(monkeypatch):
+    profiler = Profiler(enabled=True)
+    clock = iter([1.0, 2.0, 5.0, 10.0])
+    monkeypatch.setattr(profiler_module.time, "perf_counter", lambda: next(clock))
+    with profiler.section("update.ai"):
+        with profiler.section("update.ai"):  # Appel récursif
+            pass
+    monkeypatch.undo()
+    # Intérieur : 5 - 2 = 3 s ; extérieur : 10 - 1 = 9 s (et non 10 - 2)
+    assert profiler.totals["update.ai"] == 12.0
+    assert profiler.calls["update.ai"] == 2
+
+def test_frames_feed_rolling_histogram_and_percentiles():
+    profiler = Profiler(enabled=True, history=4)
+    for elapsed_ms in (0.05, 3.0, 3.0, 20.0, 30.0):
+        profiler.record("update.collisions", elapsed_ms / 1000.0)
+        profiler.end_frame()
+    profiler.end_frame()  # Image sans section : pas d'entrée dans l'historique
+
+    assert [number for number, _ in profiler.frames] == [1, 2, 3, 4]
+    stats = profiler.get_frame_statistics()["update.collisions"]
+    assert stats["frames"] == 4
+    assert stats["max_ms"] == stats["p95_ms"] == 30.0
+    histogram = profiler.get_histogram("update.collisions")
+    assert len(histogram) == len(HISTOGRAM_BOUNDS_MS) + 1
+    assert histogram[HISTOGRAM_BOUNDS_MS.index(4.0)] == 2 and histogram[-1] == 2
+    assert profiler.get_statistics()["update.collisions"]["calls"] == 5
+
+def test_export_last_frames(tmp_path):
+    profiler = Profiler(enabled=True)
+    for frame in range(3):
+        with profiler.section("draw.enemies"):
+            pass
+        if frame == 1:
+            profiler.record("update.waves", 0.001)
+        profiler.end_frame()
+
+    rows = list(csv.reader(open(profiler.export_csv(tmp_path / "frames.csv"), encoding="utf-8")))
+    assert rows[0] == ["frame", "draw.enemies", "update.waves"]
+    assert [row[2] for row in rows[1:]] == ["", "1.0000", ""]
+
+    data = json.load(open(profiler.export_json(tmp_path / "frames.json"), encoding="utf-8"))
+    assert len(data["frames"]) == 3
+    assert data["sections"]["update.waves"]["frames"] == 1
+
+def test_counters_are_kept_per_frame():
+    profiler = Profiler(enabled=True, history=3)
+    for amount in (4, 0, 2, 6):
+        if amount:
+            profiler.count("surfaces.allocated", amount)
+        profiler.end_frame()
+    stats = profiler.get_counter_statistics()["surfaces.allocated"]
+    assert stats == {"per_frame": 8 / 3, "max": 6, "total": 12}
+
+    profiler.enable(False)
+    profiler.count("surfaces.allocated")
+    assert profiler.counter_totals["surfaces.allocated"] == 12
+    profiler.reset()
+    assert profiler.get_counter_statistics() == {}
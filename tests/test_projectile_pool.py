@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Tests du pool de projectiles vectorisé
+"""
+import random
+
+import pygame
+
+from src.entities.projectile_pool import ProjectilePool, FLAG_PIERCING
+from src.entities.weapon_projectile import WeaponProjectile
+from src.systems.entity_manager import EntityManager
+from src.world.wall_index import WallIndex
+from src.world.world_generator import WallWrapper
+
+class DummyEnemy:
+    def __init__(self, x, y, width=20, health=1000):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.health = health
+
+    def take_damage(self, damage):
+        self.health -= damage
+
+def _weapon_data(effects=None):
+    return {
+        "name": "Test",
+        "stats": {"damage": 10, "projectile_speed": 5},
+        "projectile": {"size": 3, "color": [255, 255, 0], "lifetime": 60},
+        "effects": effects or []
+    }
+
+def test_update_expires_culls_and_hits_walls():
+    pool = ProjectilePool(capacity=2, world_width=1000, world_height=1000)
+    pool.spawn(500, 500, 1, 0, 3, 10, lifetime=2)    # Expire
+    pool.spawn(1098, 500, 5, 0, 3, 10, lifetime=100) # Sort du monde (marge de 100 px)
+    pool.spawn(100, 100, 5, 0, 3, 10, lifetime=100)  # Entre dans un mur
+    pool.spawn(300, 300, 0, 1, 3, 10, lifetime=100)  # Survit
+    assert pool.capacity >= 4
+
+    walls = WallIndex([WallWrapper(pygame.Rect(110, 90, 20, 20))])
+    pool.update(walls)
+    assert len(pool) == 3
+    pool.update(walls)
+
+    assert len(pool) == 1
+    assert (pool.x[0], pool.y[0]) == (300, 302)
+    stats = pool.get_statistics()
+    assert (stats["expired"], stats["culled"], stats["wall_hits"]) == (1, 1, 1)
+
+def test_wall_index_matches_wall_list():
+    rng = random.Random(5)
+    walls = [WallWrapper(pygame.Rect(rng.randint(0, 2300), rng.randint(0, 1500),
+                                     rng.randint(10, 300), rng.randint(10, 300)))
+             for _ in range(40)]
+    indexed, scanned = ProjectilePool(capacity=64), ProjectilePool(capacity=64)
+    for _ in range(500):
+        shot = (rng.uniform(0, 2400), rng.uniform(0, 1600), rng.uniform(-8, 8), rng.uniform(-8, 8),
+                rng.choice([2, 3, 8]), 10)
+        indexed.spawn(*shot, lifetime=100)
+        scanned.spawn(*shot, lifetime=100)
+    indexed.update(WallIndex(walls))
+    scanned.update(walls)
+
+    assert 0 < indexed.get_statistics()["wall_hits"] == scanned.get_statistics()["wall_hits"]
+    assert list(indexed.x[:len(indexed)]) == list(scanned.x[:len(scanned)])
+
+def test_collide_enemies_matches_brute_force():
+    rng = random.Random(7)
+    enemies = [DummyEnemy(rng.uniform(0, 2300), rng.uniform(0, 1500), rng.choice([20, 30, 60]))
+               for _ in range(150)]
+    pool = ProjectilePool(capacity=64)
+    positions = [(rng.uniform(0, 2400), rng.uniform(0, 1600), rng.choice([2, 3, 8]))
+                 for _ in range(2000)]
+    for x, y, r in positions:
+        pool.spawn(x, y, 0, 0, r, 1, lifetime=100)
+
+    expected = []
+    for x, y, r in positions:
+        for enemy in enemies:
+            er = enemy.width // 2
+            if ((x - enemy.x - er) ** 2 + (y - enemy.y - er) ** 2) ** 0.5 < r + er:
+                expected.append(enemy)
+                break
+
+    hits = []
+    count = pool.collide_enemies(enemies, lambda source, enemy, damage: hits.append(enemy))
+    assert count == len(expected) == len(hits)
+    assert sorted(map(id, hits)) == sorted(map(id, expected))
+    assert len(pool) == len(positions) - count
+
+def test_piercing_projectile_survives_until_count_exhausted():
+    pool = ProjectilePool()
+    pool.spawn(110, 110, 0, 0, 3, 10, lifetime=100, flags=FLAG_PIERCING, max_pierce=1,
+               damage_reduction=0.5)
+    first = DummyEnemy(100, 100)
+    second = DummyEnemy(100, 100)
+    damages = []
+
+    def on_hit(source, enemy, damage):
+        damages.append(damage)
+
+    pool.collide_enemies([first], on_hit)
+    pool.collide_enemies([first], on_hit)  # Même ennemi : pas de second impact
+    assert len(pool) == 1
+    pool.collide_enemies([second], on_hit)
+    assert len(pool) == 0
+    assert damages == [10, 5]
+
+def test_entity_manager_adopts_only_simple_projectiles():
+    manager = EntityManager()
+    manager.enable_projectile_pool()
+    simple = WeaponProjectile(50, 50, 1, 0, _weapon_data(), {})
+    homing = WeaponProjectile(50, 50, 1, 0, _weapon_data(["homing"]),
+                              {"special_effects": {"homing": {"parameters": {}}}})
+    manager.add_projectile(simple)
+    manager.add_projectile(homing)
+
+    assert manager.get_projectiles() == [homing]
+    assert len(manager.get_projectile_pool()) == 1
+    assert manager.get_projectiles_count() == 2
+
+    enemy = DummyEnemy(48, 40)
+    manager.get_projectile_pool().collide_enemies(
+        [enemy], lambda source, target, damage: source.apply_pooled_hit(target, damage))
+    assert enemy.health == 990
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Tests des positions libres précalculées (spawn et téléportation)
+"""
+import math
+import random
+
+import pygame
+
+from src.world.wall_index import WallIndex
+from src.world.spawn_sampler import SpawnSampler
+from src.gameplay.pathfinding import PathfindingHelper
+
+class MockWall:
+    def __init__(self, x, y, width, height):
+        self.rect = pygame.Rect(x, y, width, height)
+
+class MockPlayer:
+    def __init__(self, x, y):
+        self.x, self.y = x, y
+
+def level_walls():
+    return WallIndex([MockWall(0, 0, 2048, 40), MockWall(0, 1496, 2048, 40),
+                      MockWall(300, 300, 400, 400), MockWall(1200, 700, 60, 600)])
+
+def test_positions_are_built_once_per_size_class():
+    walls = level_walls()
+    sampler = walls.get_spawn_sampler()
+    assert sampler is walls.get_spawn_sampler()
+    xs, ys = sampler.get_positions(20, 20)
+    sampler.get_positions(24, 18)  # Même classe (24)
+    sampler.get_positions(30, 30)
+    assert sampler.stats["classes_built"] == 2
+    assert SpawnSampler.size_class(200, 10) == 288
+    for x, y in zip(xs[::97], ys[::97]):
+        assert walls.is_free(x, y, 24, 24)
+
+def test_samples_respect_walls_and_player_distance():
+    walls = level_walls()
+    sampler = walls.get_spawn_sampler()
+    rng = random.Random(3)
+    for _ in range(200):
+        x, y = sampler.sample(30, 30, near=(500, 800), min_distance=80, max_distance=160, rng=rng)
+        assert walls.is_free(x, y, 30, 30)
+        assert 80 <= math.hypot(x - 500, y - 800) <= 160
+
+    # Bande le long des bords, loin du joueur
+    for _ in range(200):
+        x, y = sampler.sample(24, 24, near=(100, 100), min_distance=300, margin=60, edge_band=32, rng=rng)
+        assert min(x - 60, y - 60, 2048 - 60 - 24 - x, 1536 - 60 - 24 - y) < 32
+        assert math.hypot(x - 100, y - 100) >= 300
+
+    # Disque entièrement dans un mur
+    assert sampler.sample(20, 20, near=(480, 480), max_distance=40, rng=rng) is None
+
+def test_helpers_sample_from_wall_index():
+    walls = level_walls()
+    random.seed(5)
+    x, y = PathfindingHelper.find_free_spawn_position(2048, 1536, 24, 24, walls, MockPlayer(1000, 700), 150)
+    assert walls.is_free(x, y, 24, 24)
+    assert walls.get_spawn_sampler().stats["samples"] == 1
+
+    position = PathfindingHelper.find_free_position_near(500, 250, 60, 120, 20, 20, walls)
+    assert walls.is_free(position[0], position[1], 20, 20)
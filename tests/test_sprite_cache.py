@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Tests du cache de sprites translucides
+"""
+import pygame
+
+from src.utils.profiler import Profiler
+from src.utils.sprite_cache import SpriteCache
+import src.utils.sprite_cache as sprite_cache_module
+
+def test_sprites_are_shared_per_alpha_bucket():
+    cache = SpriteCache(alpha_step=8)
+    sprite = cache.rect(4, 4, (255, 215, 0), 100)
+    assert sprite.get_size() == (4, 4) and sprite.get_alpha() == 104
+    assert cache.rect(4, 4, [255, 215, 0], 102) is sprite
+    assert cache.rect(4, 4, (255, 215, 0), 90) is not sprite
+    assert cache.get_alpha_bucket(-20) == 0 and cache.get_alpha_bucket(300) == 255
+    stats = cache.get_statistics()
+    assert stats["hits"] == 1 and stats["misses"] == 2 and stats["entries"] == 2
+
+def test_least_recently_used_sprite_is_evicted():
+    cache = SpriteCache(max_entries=2)
+    first = cache.circle(10, (255, 0, 0), 80)
+    second = cache.circle(12, (255, 0, 0), 80)
+    assert cache.circle(10, (255, 0, 0), 80) is first  # first redevient le plus récent
+    cache.circle(14, (255, 0, 0), 80)
+    assert len(cache) == 2
+    assert cache.circle(10, (255, 0, 0), 80) is first
+    assert cache.circle(12, (255, 0, 0), 80) is not second
+    assert cache.get_statistics()["evictions"] == 2
+
+def test_circle_corners_stay_transparent():
+    screen = pygame.Surface((40, 40))
+    screen.fill((0, 0, 255))
+    screen.blit(SpriteCache().circle(20, (255, 255, 0), 255), (0, 0))
+    assert screen.get_at((0, 0))[:3] == (0, 0, 255)
+    assert screen.get_at((20, 20))[:3] == (255, 255, 0)
+
+def test_allocations_are_counted_per_frame(monkeypatch):
+    profiler = Profiler(enabled=True)
+    monkeypatch.setattr(sprite_cache_module, "profiler", profiler)
+    cache = SpriteCache()
+    for frame in range(3):
+        for _ in range(5):
+            cache.rect(4, 4, (150, 0, 150), 255 - frame * 40)
+        profiler.end_frame()
+    profiler.end_frame()
+    stats = profiler.get_counter_statistics()["surfaces.allocated"]
+    assert stats == {"per_frame": 0.75, "max": 1, "total": 3}
+
+def test_divine_glow_reuses_its_full_screen_sprites():
+    from src.gameplay import morality_effects
+
+    glow_sprites = morality_effects.divine_glow_sprites
+    glow_sprites.clear()
+    misses = glow_sprites.stats["misses"]
+    effects = morality_effects.MoralityEffects()
+    screen = pygame.Surface((1024, 768))
+    for timer in range(200):
+        effects.particle_timer = timer
+        effects.draw_divine_glow(screen)
+    # Alpha de 0 à 15 : paliers 8 et 16 seulement, le palier nul n'est pas dessiné
+    assert glow_sprites.stats["misses"] - misses == len(glow_sprites) == 2
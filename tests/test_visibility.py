@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Tests de la passe de visibilité (VisibilityPass)
+"""
+import random
+import pygame
+
+from src.gameplay.camera import Camera
+from src.systems.entity_manager import EntityManager
+from src.systems.collision_system import CollisionSystem
+from src.systems.visibility import VisibilityPass
+from src.ui.hud_manager import HUDManager
+
+class MockEnemy:
+    def __init__(self, x, y, width=24):
+        self.x, self.y = x, y
+        self.width, self.height = width, width
+        self.health = 30
+
+class MockProjectile:
+    def __init__(self, x, y):
+        self.x, self.y = x, y
+
+class MockWall:
+    def __init__(self, x, y, width, height):
+        self.rect = pygame.Rect(x, y, width, height)
+
+def _camera(x, y):
+    camera = Camera(800, 600, 4000, 3000)
+    camera.x = camera.prev_x = x
+    camera.y = camera.prev_y = y
+    return camera
+
+def _brute_force(visibility, enemies):
+    left, top, right, bottom = visibility.bounds
+    return [enemy for enemy in enemies
+            if enemy.x + enemy.width >= left and enemy.x < right and
+            enemy.y + enemy.height >= top and enemy.y < bottom]
+
+def _populate(seed, count=300):
+    rng = random.Random(seed)
+    entity_manager = EntityManager()
+    for _ in range(count):
+        entity_manager.add_enemy(MockEnemy(rng.uniform(0, 3900), rng.uniform(0, 2900)))
+    return entity_manager
+
+def test_area_covers_interpolated_camera_with_margin():
+    camera = _camera(1000, 800)
+    camera.prev_x, camera.prev_y = 980, 790
+    visibility = VisibilityPass(800, 600, margin=50)
+    visibility.update(camera, EntityManager(), alpha=0.5)
+    assert (visibility.camera_x, visibility.camera_y) == (990, 795)
+    assert visibility.bounds == (990 - 50, 795 - 50, 1800 + 50, 1400 + 50)
+    assert visibility.contains_point(1799, 1000)
+    assert not visibility.contains_point(2000, 1000)
+    assert visibility.contains_circle(1880, 1000, 40)
+
+def test_grid_and_full_scan_find_the_same_enemies_in_list_order():
+    entity_manager = _populate(3)
+    collision_system = CollisionSystem()
+    camera = _camera(1500, 1000)
+
+    scan = VisibilityPass(800, 600)
+    scan.update(camera, entity_manager)
+    assert scan.stats["full_scans"] == 1
+
+    collision_system.optimize_collision_checks(entity_manager)
+    indexed = VisibilityPass(800, 600)
+    indexed.update(camera, entity_manager, collision_system)
+    assert indexed.stats["index_queries"] == 1
+
+    expected = _brute_force(scan, entity_manager.get_enemies())
+    assert 0 < len(expected) < len(entity_manager.get_enemies())
+    assert scan.enemies == expected
+    assert indexed.enemies == expected
+
+def test_stale_grid_falls_back_to_full_scan():
+    entity_manager = _populate(4)
+    collision_system = CollisionSystem()
+    collision_system.optimize_collision_checks(entity_manager)
+
+    # Ajouté après la phase large : absent de la grille, mais visible
+    late = MockEnemy(1700, 1200)
+    entity_manager.add_enemy(late)
+    assert collision_system.get_enemy_index(entity_manager) is None
+
+    visibility = VisibilityPass(800, 600)
+    visibility.update(_camera(1500, 1000), entity_manager, collision_system)
+    assert late in visibility.enemies
+    assert visibility.stats["full_scans"] == 1
+
+def test_large_area_scans_instead_of_querying_grid():
+    entity_manager = _populate(5)
+    collision_system = CollisionSystem()
+    collision_system.optimize_collision_checks(entity_manager)
+
+    visibility = VisibilityPass(800, 600, index_max_share=0.1)
+    visibility.update(_camera(1500, 1000), entity_manager, collision_system)
+    assert visibility.stats["full_scans"] == 1
+    assert visibility.enemies == _brute_force(visibility, entity_manager.get_enemies())
+
+def test_removed_enemies_are_not_visible():
+    entity_manager = EntityManager()
+    kept, marked, compacted = MockEnemy(1600, 1100), MockEnemy(1700, 1100), MockEnemy(1800, 1100)
+    for enemy in (kept, marked, compacted):
+        entity_manager.add_enemy(enemy)
+    collision_system = CollisionSystem()
+    collision_system.optimize_collision_checks(entity_manager)
+
+    # Retiré hors de la passe de collisions : toujours dans la grille
+    entity_manager.remove_enemy(compacted)
+    entity_manager.end_of_frame_compact()
+    entity_manager.remove_enemy(marked)
+
+    visibility = VisibilityPass(800, 600)
+    visibility.update(_camera(1500, 1000), entity_manager, collision_system)
+    assert visibility.stats["index_queries"] == 1
+    assert visibility.enemies == [kept]
+
+def test_projectiles_and_walls_are_culled():
+    entity_manager = EntityManager()
+    inside, outside = MockProjectile(1600, 1100), MockProjectile(3500, 2500)
+    entity_manager.add_projectile(inside)
+    entity_manager.add_projectile(outside)
+    near, far = MockWall(1400, 950, 200, 40), MockWall(100, 100, 40, 40)
+    entity_manager.add_wall(near)
+    entity_manager.add_wall(far)
+
+    visibility = VisibilityPass(800, 600)
+    visibility.update(_camera(1500, 1000), entity_manager)
+    assert visibility.projectiles == [inside]
+    assert visibility.walls == [near]
+    assert visibility.get_statistics()["walls_total"] == 2
+
+def test_enemy_health_bars_follow_interpolated_camera_and_enemy():
+    camera = _camera(1000, 800)
+    camera.prev_x, camera.prev_y = 980, 790
+    enemy = MockEnemy(1220, 1000, width=20)
+    enemy.max_health = 50
+    enemy.prev_x, enemy.prev_y = 1200, 990
+    entity_manager = EntityManager()
+    entity_manager.add_enemy(enemy)
+    visibility = VisibilityPass(800, 600)
+    visibility.update(camera, entity_manager, alpha=0.5)
+
+    hud = HUDManager(800, 600)
+    drawn = []
+    hud.enemy_health_bar.draw = lambda surface, x, y, health, max_health: drawn.append((x, y))
+    hud.draw_enemy_health_bars(None, visibility.enemies, visibility.camera_x, visibility.camera_y,
+                               culled=True, alpha=0.5)
+    # Ennemi dessiné en (1210, 995), caméra en (990, 795) : barre centrée au-dessus
+    assert drawn == [(1210 + 10 - 20 - 990, 995 - 8 - 795)]
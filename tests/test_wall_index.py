@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Tests de l'index statique des murs
+"""
+import random
+
+import pygame
+
+from src.world.wall_index import WallIndex
+from src.world.world_generator import WallWrapper
+from src.systems.entity_manager import EntityManager
+from src.gameplay.pathfinding import PathfindingHelper
+
+def _random_walls(seed, count=40):
+    rng = random.Random(seed)
+    return [WallWrapper(pygame.Rect(rng.randint(0, 2300), rng.randint(0, 1500),
+                                    rng.randint(10, 300), rng.randint(10, 300)))
+            for _ in range(count)]
+
+def test_query_rect_matches_linear_scan():
+    walls = _random_walls(3)
+    index = WallIndex(walls)
+    rng = random.Random(4)
+    for _ in range(500):
+        rect = pygame.Rect(rng.randint(-50, 2400), rng.randint(-50, 1600), rng.randint(1, 80), rng.randint(1, 80))
+        expected = [w for w in walls if rect.colliderect(w.rect)]
+        assert index.query_rect(rect) == expected
+        assert index.first_hit(rect) is (expected[0] if expected else None)
+        assert PathfindingHelper.find_wall_collision(rect, walls) is index.first_hit(rect)
+
+def test_query_point_and_segment():
+    left = WallWrapper(pygame.Rect(100, 0, 20, 200))
+    right = WallWrapper(pygame.Rect(400, 0, 20, 200))
+    index = WallIndex([right, left])
+
+    assert index.query_point(110, 50) == [left]
+    assert index.query_point(300, 50) == []
+    # Du plus proche au plus lointain depuis le point de départ
+    assert index.segment_hits(0, 100, 600, 100) == [left, right]
+    assert index.segment_hits(600, 100, 0, 100) == [right, left]
+    assert index.segment_hits(0, 300, 600, 300) == []
+
+def test_entity_manager_rebuilds_index_when_walls_change():
+    entity_manager = EntityManager()
+    entity_manager.add_wall(WallWrapper(pygame.Rect(0, 0, 50, 50)))
+    first = entity_manager.get_wall_index()
+    assert entity_manager.get_wall_index() is first
+    assert len(first) == 1
+
+    entity_manager.add_wall(WallWrapper(pygame.Rect(500, 500, 50, 50)))
+    second = entity_manager.get_wall_index()
+    assert second is not first
+    assert not second.is_free(510, 510, 5, 5)
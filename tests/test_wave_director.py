@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Tests du directeur de vagues (création étalée des ennemis)
+"""
+import random
+
+from src.systems.wave_director import WaveDirector, resolve_enemy_types
+
+class Grunt:
+    def __init__(self, x, y):
+        self.x, self.y = x, y
+
+class Brute(Grunt):
+    pass
+
+def test_missing_enemy_modules_are_skipped():
+    assert resolve_enemy_types((("module_absent", "Enemy"),)) == []
+    assert resolve_enemy_types((("collections", "deque"),))[0].__name__ == "deque"
+
+def test_wave_enemy_classes_resolve_to_real_archetypes():
+    from src.entities.enemies import BasicEnemy, ShooterEnemy, FastEnemy
+    assert resolve_enemy_types() == [BasicEnemy, ShooterEnemy, FastEnemy]
+
+def test_wave_is_planned_then_spawned_over_several_ticks():
+    director = WaveDirector([Grunt, Brute], budget_ms=None, max_per_tick=4)
+    assert director.plan_wave(3, 10, rng=random.Random(1)) == 10
+    assert director.get_pending_count() == 10
+    assert sum(director.get_pending_by_type().values()) == 10
+
+    spawned = []
+    ticks = 0
+    while director.has_pending():
+        director.update(lambda enemy_type, x, y: spawned.append(enemy_type(x, y)))
+        ticks += 1
+    assert ticks == 3
+    assert len(spawned) == 10
+    assert director.get_statistics()["spawned"] == 10
+
+def test_time_budget_still_spawns_one_per_tick_and_failures_are_dropped():
+    director = WaveDirector([Grunt], budget_ms=0.0, max_per_tick=8)
+    director.plan_wave(1, 3, rng=random.Random(2))
+    assert director.update(lambda enemy_type, x, y: None) == 1
+    assert director.update(lambda enemy_type, x, y: False) == 0
+    assert director.get_statistics()["failed"] == 1
+    director.clear()
+    assert not director.has_pending()
+
+def test_planning_a_new_wave_replaces_the_queue():
+    director = WaveDirector([Grunt], budget_ms=None)
+    director.plan_wave(1, 5)
+    director.plan_wave(2, 2)
+    assert director.get_pending_count() == 2
+    assert WaveDirector([]).plan_wave(1, 5) == 0
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Tests des plans d'armes compilés
+"""
+import contextlib
+import io
+
+import pytest
+
+from src.entities.weapon_blueprint import FLAG_PIERCING, FLAG_MELEE
+from src.systems.weapon_manager import WeaponManager
+
+class UpgradedPlayer:
+    def __init__(self):
+        self.global_upgrades = {
+            "damage_bonus": 0,
+            "multi_shot_bonus": 0,
+            "piercing": False,
+            "explosive": False,
+            "homing": False,
+            "bullet_size_multiplier": 1.0
+        }
+
+@pytest.fixture(scope="module")
+def weapon_manager():
+    with contextlib.redirect_stdout(io.StringIO()):
+        return WeaponManager()
+
+def test_every_weapon_is_compiled_with_resolved_effects(weapon_manager):
+    assert set(weapon_manager.blueprints) == set(weapon_manager.weapons)
+    for weapon_id, weapon_data in weapon_manager.weapons.items():
+        blueprint = weapon_manager.blueprints[weapon_id]
+        known = [name for name in weapon_data.get("effects", [])
+                 if any(name in category for category in weapon_manager.effects.values())]
+        assert [effect["name"] for effect in blueprint.effects] == known
+        assert blueprint.color == tuple(weapon_data["projectile"]["color"])
+        assert blueprint.is_melee == (weapon_data["stats"]["projectile_speed"] == 0)
+        with pytest.raises(AttributeError):
+            blueprint.damage = 0
+
+def test_projectiles_share_the_cached_blueprint(weapon_manager):
+    player = UpgradedPlayer()
+    with contextlib.redirect_stdout(io.StringIO()):
+        first = weapon_manager.create_projectiles("bolter_basic", 0, 0, 10, 0, player)
+        second = weapon_manager.create_projectiles("bolter_basic", 0, 0, 10, 0, player)
+    assert first[0].blueprint is second[0].blueprint
+    assert first[0].blueprint is weapon_manager.get_blueprint("bolter_basic", player)
+
+def test_blueprint_recompiled_when_upgrades_change(weapon_manager):
+    player = UpgradedPlayer()
+    before = weapon_manager.get_blueprint("bolter_basic", player)
+    player.global_upgrades["damage_bonus"] += 5
+    player.global_upgrades["piercing"] = True
+    player.global_upgrades["multi_shot_bonus"] = 2
+    after = weapon_manager.get_blueprint("bolter_basic", player)
+
+    assert after is not before
+    assert after.damage == before.damage + 5
+    assert after.flags & FLAG_PIERCING
+    with contextlib.redirect_stdout(io.StringIO()):
+        projectiles = weapon_manager.create_projectiles("bolter_basic", 0, 0, 10, 0, player)
+    assert len(projectiles) == before.projectile_count + 2
+    assert all(p.piercing and p.damage == after.damage for p in projectiles)
+    assert not (after.flags & FLAG_MELEE)
+
+def test_recompiling_keeps_the_projectile_pool():
+    with contextlib.redirect_stdout(io.StringIO()):
+        manager = WeaponManager()
+        pool = manager.projectile_pool
+        manager.compile_blueprints()
+        projectile = manager.create_projectiles("bolter_basic", 0, 0, 10, 0, UpgradedPlayer())[0]
+    assert manager.projectile_pool is pool
+    assert projectile.object_pool is pool
+
+def test_owner_without_upgrades_keeps_integer_radius(weapon_manager):
+    class EmptyUpgrades:
+        global_upgrades = {}
+
+    weapon_data = dict(weapon_manager.weapons["bolter_basic"])
+    weapon_data["projectile"] = dict(weapon_data["projectile"], size=3.5)
+    weapon_manager.weapons["odd_size"] = weapon_data
+    try:
+        # Comme l'ancien WeaponProjectile : taille tronquée dès que le tireur a global_upgrades
+        assert weapon_manager.get_blueprint("odd_size", EmptyUpgrades()).radius == 3
+        assert weapon_manager.get_blueprint("odd_size").radius == 3.5
+    finally:
+        del weapon_manager.weapons["odd_size"]
+        weapon_manager.blueprints.pop("odd_size", None)
+        weapon_manager._upgraded_blueprints.pop("odd_size", None)